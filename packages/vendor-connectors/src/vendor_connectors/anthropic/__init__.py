@@ -14,6 +14,11 @@ Usage:
         messages=[{"role": "user", "content": "Hello"}]
     )
 
+    # Streaming
+    for event in connector.stream_message(model=..., max_tokens=1024, messages=[...]):
+        if event.text:
+            print(event.text, end="")
+
     # Agent execution (sandbox mode)
     result = connector.execute_agent_task(
         task="Implement feature X",
@@ -25,13 +30,22 @@ Reference: https://docs.anthropic.com/claude/reference
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
+import threading
+import time
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+import httpx
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from lifecyclelogging import Logging
@@ -39,7 +53,7 @@ from vendor_connectors.base import VendorConnectorBase
 
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
 
 __all__ = [
     "AgentExecutionResult",
@@ -47,9 +61,13 @@ __all__ = [
     "AnthropicError",
     "ContentBlock",
     "Message",
+    "MessageBatch",
+    "MessageBatchResult",
     "MessageRole",
+    "MessageStreamEvent",
     "Model",
     "Usage",
+    "add_cache_breakpoints",
 ]
 
 
@@ -62,6 +80,24 @@ DEFAULT_API_VERSION = "2023-06-01"
 DEFAULT_TIMEOUT = 60.0
 DEFAULT_MAX_TOKENS = 4096
 
+# Message Batches API limits and polling
+MAX_BATCH_REQUESTS = 100_000
+DEFAULT_BATCH_POLL_INTERVAL = 30.0
+
+# Default number of concurrent requests for create_messages
+DEFAULT_MESSAGE_CONCURRENCY = 8
+
+# Longest wait for a rate limit window to reset before sending anyway
+MAX_RATE_LIMIT_WAIT = 60.0
+
+# Shortest tool/system prefix (in characters, ~4 per token) worth a cache breakpoint.
+# Prompts below the models' minimum cacheable length (1024-2048 tokens) are not cached.
+PROMPT_CACHE_MIN_CHARS = 4096
+CACHE_CONTROL_EPHEMERAL = {"type": "ephemeral"}
+
+# Number of count_tokens results memoized per connector
+TOKEN_COUNT_CACHE_SIZE = 1024
+
 # Available Claude models
 # SOURCE OF TRUTH: https://docs.anthropic.com/en/docs/about-claude/models
 # API verification: curl https://api.anthropic.com/v1/models -H "x-api-key: $KEY" -H "anthropic-version: 2023-06-01"
@@ -167,6 +203,47 @@ class Message(BaseModel):
         return "".join(text_blocks)
 
 
+class MessageBatch(BaseModel):
+    """Message Batches API batch."""
+
+    model_config = ConfigDict(extra="allow")
+
+    id: str = Field(description="Batch ID")
+    type: str = Field(default="message_batch", description="Object type")
+    processing_status: str = Field(description="Processing status (in_progress, canceling, ended)")
+    request_counts: dict[str, int] = Field(default_factory=dict, description="Request counts by outcome")
+    results_url: str | None = Field(default=None, description="URL of the results JSONL once ended")
+    created_at: datetime | None = Field(default=None, description="Creation timestamp")
+    ended_at: datetime | None = Field(default=None, description="Processing end timestamp")
+    expires_at: datetime | None = Field(default=None, description="Expiry timestamp")
+
+    @property
+    def ended(self) -> bool:
+        """Whether processing has ended and results can be fetched."""
+        return self.processing_status == "ended"
+
+
+class MessageBatchResult(BaseModel):
+    """Result of one request in a message batch."""
+
+    model_config = ConfigDict(extra="allow")
+
+    custom_id: str = Field(description="Caller-supplied request ID")
+    result: dict[str, Any] = Field(description="Result payload (succeeded, errored, canceled, expired)")
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the request produced a message."""
+        return self.result.get("type") == "succeeded"
+
+    @property
+    def message(self) -> Message | None:
+        """The generated message for succeeded requests."""
+        if not self.succeeded:
+            return None
+        return Message.model_validate(self.result["message"])
+
+
 class Model(BaseModel):
     """Claude model information."""
 
@@ -188,6 +265,57 @@ class AgentExecutionResult:
     tokens_used: int | None = None
 
 
+# =============================================================================
+# Prompt Caching
+# =============================================================================
+
+
+def _has_cache_control(value: Any) -> bool:
+    """Check whether a request fragment already sets cache_control anywhere."""
+    if isinstance(value, dict):
+        return "cache_control" in value or any(_has_cache_control(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_cache_control(v) for v in value)
+    return False
+
+
+def add_cache_breakpoints(body: dict[str, Any], min_chars: int = PROMPT_CACHE_MIN_CHARS) -> dict[str, Any]:
+    """Mark long, stable request prefixes for prompt caching.
+
+    The API caches the prompt prefix up to each ``cache_control`` breakpoint,
+    in the order tools, system, messages. A breakpoint goes on the last tool
+    when the tool definitions alone are long enough to cache, and on the last
+    system block when tools plus system are. Requests that already place
+    their own breakpoints are left untouched. Caller-owned lists and blocks
+    are copied, never modified.
+
+    Args:
+        body: Messages API request body, updated in place.
+        min_chars: Shortest prefix, in characters, worth caching.
+
+    Returns:
+        The same body, for chaining.
+    """
+    tools = body.get("tools")
+    system = body.get("system")
+    if _has_cache_control([tools, system, body.get("messages")]):
+        return body
+
+    prefix_chars = 0
+    if tools:
+        prefix_chars = len(json.dumps(tools, default=str))
+        if prefix_chars >= min_chars:
+            body["tools"] = [*tools[:-1], {**tools[-1], "cache_control": CACHE_CONTROL_EPHEMERAL}]
+
+    if system:
+        blocks = [{"type": "text", "text": system}] if isinstance(system, str) else system
+        prefix_chars += sum(len(block.get("text", "")) for block in blocks)
+        if prefix_chars >= min_chars:
+            body["system"] = [*blocks[:-1], {**blocks[-1], "cache_control": CACHE_CONTROL_EPHEMERAL}]
+
+    return body
+
+
 # =============================================================================
 # Connector
 # =============================================================================
@@ -204,6 +332,8 @@ class AnthropicConnector(VendorConnectorBase):
         api_version: API version string. Default "2023-06-01".
         timeout: Request timeout in seconds. Default 60s.
         logger: Optional logger instance.
+        cache_prompts: Add prompt caching breakpoints to long tool/system
+            prefixes of message requests. Default True.
         **kwargs: Additional DirectedInputsClass arguments.
 
     Example:
@@ -225,6 +355,7 @@ class AnthropicConnector(VendorConnectorBase):
         api_version: str = DEFAULT_API_VERSION,
         timeout: float = DEFAULT_TIMEOUT,
         logger: Logging | None = None,
+        cache_prompts: bool = True,
         **kwargs,
     ):
         super().__init__(api_key=api_key, logger=logger, timeout=timeout, **kwargs)
@@ -235,6 +366,15 @@ class AnthropicConnector(VendorConnectorBase):
             raise AnthropicError(msg)
 
         self.api_version = api_version
+        self.cache_prompts = cache_prompts
+
+        # Memoized count_tokens results keyed by request content hash
+        self._token_counts: OrderedDict[str, int] = OrderedDict()
+        self._token_counts_lock = threading.Lock()
+
+        # Time (epoch seconds) before which requests wait for the rate limit window to reset
+        self._rate_limit_resume_at = 0.0
+        self._rate_limit_lock = threading.Lock()
 
         self.logger.info(f"Initialized AnthropicConnector with API version: {self.api_version}")
 
@@ -331,6 +471,201 @@ class AnthropicConnector(VendorConnectorBase):
         """
         self.logger.info(f"Creating message with model: {model}")
 
+        body = self._build_message_body(
+            model=model,
+            max_tokens=max_tokens,
+            messages=messages,
+            system=system,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            stop_sequences=stop_sequences,
+            tools=tools,
+            tool_choice=tool_choice,
+            metadata=metadata,
+            cache_prompt=self.cache_prompts,
+        )
+
+        self._wait_for_rate_limit()
+        response = self.post("/v1/messages", json=body)
+        self._observe_rate_limits(response.headers)
+
+        if not response.is_success:
+            self._handle_error(response)
+
+        return Message.model_validate(response.json())
+
+    def stream_message(
+        self,
+        model: str,
+        max_tokens: int,
+        messages: list[dict[str, Any]],
+        system: str | list[dict[str, Any]] | None = None,
+        temperature: float | None = None,
+        top_p: float | None = None,
+        top_k: int | None = None,
+        stop_sequences: list[str] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> Iterator[MessageStreamEvent]:
+        """Create a message, streaming it as it is generated.
+
+        Takes the same arguments as create_message. Events are yielded as the
+        server sends them, so text and tool input deltas arrive long before the
+        response is complete, and the request timeout applies between events
+        rather than to the whole generation.
+
+        Args:
+            model: Model ID.
+            max_tokens: Maximum tokens to generate.
+            messages: List of message dicts with role and content.
+            system: Optional system prompt.
+            temperature: Sampling temperature (0-1).
+            top_p: Nucleus sampling parameter.
+            top_k: Top-k sampling parameter.
+            stop_sequences: Custom stop sequences.
+            tools: Tool definitions for function calling.
+            tool_choice: Tool selection configuration.
+            metadata: Request metadata.
+
+        Yields:
+            MessageStreamEvent for each event. Text deltas carry ``text``, tool
+            input deltas carry ``partial_json``, and the final ``message_stop``
+            event carries the assembled ``message``.
+
+        Raises:
+            AnthropicError: If the request fails or the stream reports an error.
+        """
+        self.logger.info(f"Streaming message with model: {model}")
+
+        body = self._build_message_body(
+            model=model,
+            max_tokens=max_tokens,
+            messages=messages,
+            system=system,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            stop_sequences=stop_sequences,
+            tools=tools,
+            tool_choice=tool_choice,
+            metadata=metadata,
+            cache_prompt=self.cache_prompts,
+        )
+        body["stream"] = True
+
+        self._wait_for_rate_limit()
+        self._rate_limit()
+        with self.client.stream(
+            "POST", self._build_url("/v1/messages"), headers=self._build_headers(), json=body
+        ) as response:
+            self._observe_rate_limits(response.headers)
+            if not response.is_success:
+                response.read()
+                self._handle_error(response)
+
+            assembler = MessageAssembler()
+            for event_type, data in iter_sse_events(response.iter_lines()):
+                event = assembler.feed(event_type, data)
+                if event is not None:
+                    yield event
+
+    async def astream_message(
+        self,
+        model: str,
+        max_tokens: int,
+        messages: list[dict[str, Any]],
+        system: str | list[dict[str, Any]] | None = None,
+        temperature: float | None = None,
+        top_p: float | None = None,
+        top_k: int | None = None,
+        stop_sequences: list[str] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> AsyncIterator[MessageStreamEvent]:
+        """Async variant of stream_message.
+
+        Args:
+            model: Model ID.
+            max_tokens: Maximum tokens to generate.
+            messages: List of message dicts with role and content.
+            system: Optional system prompt.
+            temperature: Sampling temperature (0-1).
+            top_p: Nucleus sampling parameter.
+            top_k: Top-k sampling parameter.
+            stop_sequences: Custom stop sequences.
+            tools: Tool definitions for function calling.
+            tool_choice: Tool selection configuration.
+            metadata: Request metadata.
+
+        Yields:
+            MessageStreamEvent for each event (see stream_message).
+
+        Raises:
+            AnthropicError: If the request fails or the stream reports an error.
+        """
+        self.logger.info(f"Streaming message with model: {model}")
+
+        body = self._build_message_body(
+            model=model,
+            max_tokens=max_tokens,
+            messages=messages,
+            system=system,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            stop_sequences=stop_sequences,
+            tools=tools,
+            tool_choice=tool_choice,
+            metadata=metadata,
+            cache_prompt=self.cache_prompts,
+        )
+        body["stream"] = True
+
+        delay = self._rate_limit_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        async with (
+            httpx.AsyncClient(timeout=self._timeout) as client,
+            client.stream(
+                "POST", self._build_url("/v1/messages"), headers=self._build_headers(), json=body
+            ) as response,
+        ):
+            self._observe_rate_limits(response.headers)
+            if not response.is_success:
+                await response.aread()
+                self._handle_error(response)
+
+            assembler = MessageAssembler()
+            async for event_type, data in aiter_sse_events(response.aiter_lines()):
+                event = assembler.feed(event_type, data)
+                if event is not None:
+                    yield event
+
+    @staticmethod
+    def _build_message_body(
+        model: str,
+        max_tokens: int,
+        messages: list[dict[str, Any]],
+        *,
+        system: str | list[dict[str, Any]] | None = None,
+        temperature: float | None = None,
+        top_p: float | None = None,
+        top_k: int | None = None,
+        stop_sequences: list[str] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+        cache_prompt: bool = False,
+    ) -> dict[str, Any]:
+        """Build a Messages API request body, omitting unset parameters.
+
+        With cache_prompt, long tool and system prefixes get prompt caching
+        breakpoints (see add_cache_breakpoints).
+        """
         body: dict[str, Any] = {
             "model": model,
             "max_tokens": max_tokens,
@@ -353,28 +688,254 @@ class AnthropicConnector(VendorConnectorBase):
             body["tool_choice"] = tool_choice
         if metadata:
             body["metadata"] = metadata
+        if cache_prompt:
+            add_cache_breakpoints(body)
 
-        response = self.post("/v1/messages", json=body)
+        return body
+
+    def create_messages(
+        self,
+        requests: Iterable[Mapping[str, Any]],
+        max_concurrency: int = DEFAULT_MESSAGE_CONCURRENCY,
+    ) -> list[Message | AnthropicError]:
+        """Create many messages concurrently.
+
+        Requests share the connector's rate limit tracking: once a response
+        reports an exhausted `anthropic-ratelimit-*` budget, new requests wait
+        for the reported reset instead of running into 429s.
+
+        Args:
+            requests: create_message keyword arguments for each message.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            Message for each request that succeeded, or the AnthropicError it
+            failed with, in request order.
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+
+        self.logger.info(f"Creating {len(requests)} messages with concurrency {max_concurrency}")
+
+        def create(request: Mapping[str, Any]) -> Message | AnthropicError:
+            try:
+                return self.create_message(**request)
+            except AnthropicError as e:
+                return e
+            except Exception as e:
+                return AnthropicAPIError(str(e), status_code=getattr(e, "status_code", None))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(requests)))) as executor:
+            return list(executor.map(create, requests))
+
+    def _observe_rate_limits(self, headers: Mapping[str, str]) -> None:
+        """Record when an exhausted rate limit budget resets.
+
+        Args:
+            headers: Response headers carrying `anthropic-ratelimit-*` values.
+        """
+        resume_at = 0.0
+        for limit in ("requests", "tokens", "input-tokens", "output-tokens"):
+            remaining = headers.get(f"anthropic-ratelimit-{limit}-remaining")
+            reset = headers.get(f"anthropic-ratelimit-{limit}-reset")
+            if not isinstance(remaining, str) or not isinstance(reset, str):
+                continue
+            try:
+                if int(remaining) > 0:
+                    continue
+                resume_at = max(resume_at, datetime.fromisoformat(reset.replace("Z", "+00:00")).timestamp())
+            except ValueError:
+                continue
+
+        if resume_at:
+            with self._rate_limit_lock:
+                self._rate_limit_resume_at = max(self._rate_limit_resume_at, resume_at)
+
+    def _rate_limit_delay(self) -> float:
+        """Seconds to wait for an exhausted rate limit window to reset."""
+        delay = min(self._rate_limit_resume_at - time.time(), MAX_RATE_LIMIT_WAIT)
+        if delay > 0:
+            self.logger.info(f"Anthropic rate limit exhausted, waiting {delay:.1f}s for reset")
+        return delay
+
+    def _wait_for_rate_limit(self) -> None:
+        """Wait for an exhausted rate limit window to reset, if any."""
+        delay = self._rate_limit_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    # =========================================================================
+    # Message Batches
+    # =========================================================================
+
+    @classmethod
+    def batch_request(cls, custom_id: str, **kwargs) -> dict[str, Any]:
+        """Build a Message Batches API request entry.
+
+        Args:
+            custom_id: Caller-supplied ID used to match results to requests.
+            **kwargs: create_message keyword arguments.
+
+        Returns:
+            Request entry for create_message_batch.
+        """
+        return {"custom_id": custom_id, "params": cls._build_message_body(**kwargs)}
+
+    def create_message_batch(self, requests: Iterable[Mapping[str, Any]]) -> MessageBatch:
+        """Submit a batch of message requests for asynchronous processing.
+
+        Args:
+            requests: Entries with custom_id and params (see batch_request).
+
+        Returns:
+            The created MessageBatch.
+
+        Raises:
+            ValueError: If the batch is empty or too large.
+            AnthropicError: If the API request fails.
+        """
+        requests = list(requests)
+        if not requests:
+            msg = "A message batch needs at least one request"
+            raise ValueError(msg)
+        if len(requests) > MAX_BATCH_REQUESTS:
+            msg = f"A message batch holds at most {MAX_BATCH_REQUESTS} requests, got {len(requests)}"
+            raise ValueError(msg)
+
+        self.logger.info(f"Creating message batch with {len(requests)} requests")
+
+        response = self.post("/v1/messages/batches", json={"requests": requests})
 
         if not response.is_success:
             self._handle_error(response)
 
-        return Message.model_validate(response.json())
+        return MessageBatch.model_validate(response.json())
+
+    def get_message_batch(self, batch_id: str) -> MessageBatch:
+        """Get the current state of a message batch.
+
+        Args:
+            batch_id: Batch ID.
+
+        Returns:
+            MessageBatch with its processing status.
+
+        Raises:
+            AnthropicError: If the API request fails.
+        """
+        response = self.get(f"/v1/messages/batches/{batch_id}")
+
+        if not response.is_success:
+            self._handle_error(response)
+
+        return MessageBatch.model_validate(response.json())
+
+    def cancel_message_batch(self, batch_id: str) -> MessageBatch:
+        """Cancel a message batch that is still processing.
+
+        Args:
+            batch_id: Batch ID.
+
+        Returns:
+            MessageBatch, typically in the canceling state.
+
+        Raises:
+            AnthropicError: If the API request fails.
+        """
+        self.logger.info(f"Canceling message batch: {batch_id}")
+
+        response = self.post(f"/v1/messages/batches/{batch_id}/cancel")
+
+        if not response.is_success:
+            self._handle_error(response)
+
+        return MessageBatch.model_validate(response.json())
+
+    def wait_for_message_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+        timeout: float | None = None,
+    ) -> MessageBatch:
+        """Poll a message batch until processing ends.
+
+        Args:
+            batch_id: Batch ID.
+            poll_interval: Seconds between polls.
+            timeout: Maximum seconds to wait (None = no limit).
+
+        Returns:
+            The ended MessageBatch.
+
+        Raises:
+            TimeoutError: If the batch does not end within timeout.
+            AnthropicError: If an API request fails.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            batch = self.get_message_batch(batch_id)
+            if batch.ended:
+                self.logger.info(f"Message batch {batch_id} ended: {batch.request_counts}")
+                return batch
+
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                msg = f"Message batch {batch_id} did not end within {timeout}s"
+                raise TimeoutError(msg)
+
+            self.logger.debug(f"Message batch {batch_id} is {batch.processing_status}, polling again")
+            time.sleep(poll_interval)
+
+    def iter_message_batch_results(self, batch: str | MessageBatch) -> Iterator[MessageBatchResult]:
+        """Stream the results of an ended message batch.
+
+        Results are read line by line from the JSONL results file, so large
+        batches never have to fit in memory.
+
+        Args:
+            batch: Batch ID or MessageBatch.
+
+        Yields:
+            MessageBatchResult for each request, in results-file order.
+
+        Raises:
+            AnthropicError: If the batch has not ended or the download fails.
+        """
+        if isinstance(batch, str):
+            batch = self.get_message_batch(batch)
+        if not batch.results_url:
+            msg = f"Message batch {batch.id} has no results yet (status: {batch.processing_status})"
+            raise AnthropicAPIError(msg)
+
+        with self.client.stream("GET", self._build_url(batch.results_url), headers=self._build_headers()) as response:
+            if not response.is_success:
+                response.read()
+                self._handle_error(response)
+
+            for line in response.iter_lines():
+                if line.strip():
+                    yield MessageBatchResult.model_validate(json.loads(line))
 
     def count_tokens(
         self,
         model: str,
         messages: list[dict[str, Any]],
-        system: str | None = None,
+        system: str | list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
+        use_cache: bool = True,
     ) -> int:
         """Count tokens for a set of messages.
 
+        Counts are memoized per connector, keyed by a hash of the request
+        content, so sizing the same prompt again does not call the API.
+
         Args:
             model: Model ID.
             messages: List of message dicts.
             system: Optional system prompt.
             tools: Optional tool definitions.
+            use_cache: Reuse a memoized count for identical content. Defaults to True.
 
         Returns:
             Token count.
@@ -382,8 +943,6 @@ class AnthropicConnector(VendorConnectorBase):
         Raises:
             AnthropicError: If the API request fails.
         """
-        self.logger.info(f"Counting tokens for model: {model}")
-
         body: dict[str, Any] = {
             "model": model,
             "messages": messages,
@@ -394,13 +953,30 @@ class AnthropicConnector(VendorConnectorBase):
         if tools:
             body["tools"] = tools
 
+        key = hashlib.sha256(json.dumps(body, sort_keys=True, default=str).encode()).hexdigest()
+        if use_cache:
+            with self._token_counts_lock:
+                if key in self._token_counts:
+                    self._token_counts.move_to_end(key)
+                    return self._token_counts[key]
+
+        self.logger.info(f"Counting tokens for model: {model}")
+
         response = self.post("/v1/messages/count_tokens", json=body)
 
         if not response.is_success:
             self._handle_error(response)
 
         data = response.json()
-        return data.get("input_tokens", 0)
+        input_tokens = data.get("input_tokens", 0)
+
+        with self._token_counts_lock:
+            self._token_counts[key] = input_tokens
+            self._token_counts.move_to_end(key)
+            while len(self._token_counts) > TOKEN_COUNT_CACHE_SIZE:
+                self._token_counts.popitem(last=False)
+
+        return input_tokens
 
     # =========================================================================
     # Model Operations
@@ -552,3 +1128,11 @@ If the task requires code changes, describe exactly what changes should be made.
             "powerful": "claude-opus-4-5-20251101",  # Claude Opus 4.5 - most capable
         }
         return recommendations.get(use_case, recommendations["general"])
+
+
+from vendor_connectors.anthropic.streaming import (
+    MessageAssembler,
+    MessageStreamEvent,
+    aiter_sse_events,
+    iter_sse_events,
+)
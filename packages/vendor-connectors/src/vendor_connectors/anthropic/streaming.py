@@ -0,0 +1,206 @@
+"""Server-sent event streaming for the Anthropic Messages API.
+
+With ``"stream": true`` the Messages API sends the response as server-sent
+events: a ``message_start`` carrying the message envelope, then
+``content_block_start``/``content_block_delta``/``content_block_stop`` for
+each content block, a ``message_delta`` with the stop reason and final usage,
+and a closing ``message_stop``. ``SSEParser`` decodes the event stream line by
+line and ``MessageAssembler`` folds the events back into a ``Message`` while
+exposing every delta as it arrives.
+"""
+
+from __future__ import annotations
+
+import json
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from vendor_connectors.anthropic import AnthropicAPIError, AnthropicRateLimitError, Message
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+
+# Stream error types that mean the request may be retried later
+RETRYABLE_STREAM_ERRORS = frozenset({"overloaded_error", "rate_limit_error"})
+
+
+@dataclass
+class MessageStreamEvent:
+    """One event of a streamed message.
+
+    ``text`` and ``partial_json`` carry the incremental content of
+    ``content_block_delta`` events; ``message`` is set on the final
+    ``message_stop`` event.
+    """
+
+    type: str
+    data: dict[str, Any] = field(default_factory=dict)
+    index: int | None = None
+    text: str | None = None
+    partial_json: str | None = None
+    message: Message | None = None
+
+
+class SSEParser:
+    """Incremental server-sent events decoder."""
+
+    def __init__(self):
+        """Initialize the parser."""
+        self._event: str | None = None
+        self._data: list[str] = []
+
+    def feed(self, line: str) -> tuple[str, dict[str, Any]] | None:
+        """Consume one line of the stream.
+
+        Args:
+            line: Line without its trailing newline.
+
+        Returns:
+            (event type, decoded data) once a blank line completes an event,
+            otherwise None.
+        """
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None
+
+        name, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        return None
+
+    def flush(self) -> tuple[str, dict[str, Any]] | None:
+        """Dispatch an event left pending when the stream ended without a blank line."""
+        return self._dispatch()
+
+    def _dispatch(self) -> tuple[str, dict[str, Any]] | None:
+        if not self._data:
+            self._event = None
+            return None
+
+        data = json.loads("\n".join(self._data))
+        event_type = self._event or data.get("type", "message")
+        self._event = None
+        self._data = []
+        return event_type, data
+
+
+def iter_sse_events(lines: Iterable[str]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Decode server-sent events from an iterable of lines.
+
+    Args:
+        lines: Response lines, e.g. ``httpx.Response.iter_lines()``.
+
+    Yields:
+        (event type, decoded data) tuples.
+    """
+    parser = SSEParser()
+    for line in lines:
+        event = parser.feed(line)
+        if event is not None:
+            yield event
+
+    event = parser.flush()
+    if event is not None:
+        yield event
+
+
+async def aiter_sse_events(lines: AsyncIterable[str]) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """Decode server-sent events from an async iterable of lines.
+
+    Args:
+        lines: Response lines, e.g. ``httpx.Response.aiter_lines()``.
+
+    Yields:
+        (event type, decoded data) tuples.
+    """
+    parser = SSEParser()
+    async for line in lines:
+        event = parser.feed(line)
+        if event is not None:
+            yield event
+
+    event = parser.flush()
+    if event is not None:
+        yield event
+
+
+class MessageAssembler:
+    """Fold streamed message events into a ``Message``."""
+
+    def __init__(self):
+        """Initialize the assembler."""
+        self._message: dict[str, Any] = {}
+        self._blocks: dict[int, dict[str, Any]] = {}
+        self._partial_json: dict[int, list[str]] = {}
+        self.message: Message | None = None
+
+    def feed(self, event_type: str, data: dict[str, Any]) -> MessageStreamEvent | None:
+        """Apply one event to the message being assembled.
+
+        Args:
+            event_type: SSE event type.
+            data: Decoded event data.
+
+        Returns:
+            MessageStreamEvent for the caller, or None for keep-alive pings.
+
+        Raises:
+            AnthropicRateLimitError: If the stream reports an overload or rate limit.
+            AnthropicAPIError: If the stream reports any other error.
+        """
+        if event_type == "ping":
+            return None
+        if event_type == "error":
+            error = data.get("error", {})
+            error_type = error.get("type", "unknown")
+            error_class = AnthropicRateLimitError if error_type in RETRYABLE_STREAM_ERRORS else AnthropicAPIError
+            raise error_class(error.get("message", "Stream error"), error_type=error_type)
+
+        event = MessageStreamEvent(type=event_type, data=data, index=data.get("index"))
+
+        if event_type == "message_start":
+            self._message = dict(data["message"])
+        elif event_type == "content_block_start":
+            self._blocks[event.index] = dict(data["content_block"])
+            if self._blocks[event.index].get("type") == "tool_use":
+                self._partial_json[event.index] = []
+        elif event_type == "content_block_delta":
+            self._apply_delta(event, data["delta"])
+        elif event_type == "content_block_stop":
+            chunks = self._partial_json.pop(event.index, None)
+            if chunks is not None:
+                self._blocks[event.index]["input"] = json.loads("".join(chunks)) if chunks else {}
+        elif event_type == "message_delta":
+            self._message.update(data.get("delta", {}))
+            self._message["usage"] = {**self._message.get("usage", {}), **data.get("usage", {})}
+        elif event_type == "message_stop":
+            self.message = Message.model_validate(
+                {**self._message, "content": [self._blocks[index] for index in sorted(self._blocks)]}
+            )
+            event.message = self.message
+
+        return event
+
+    def _apply_delta(self, event: MessageStreamEvent, delta: dict[str, Any]) -> None:
+        block = self._blocks[event.index]
+        delta_type = delta.get("type")
+
+        if delta_type == "text_delta":
+            event.text = delta["text"]
+            block["text"] = block.get("text", "") + event.text
+        elif delta_type == "input_json_delta":
+            event.partial_json = delta["partial_json"]
+            self._partial_json[event.index].append(event.partial_json)
+        elif delta_type == "thinking_delta":
+            block["thinking"] = block.get("thinking", "") + delta["thinking"]
+        elif delta_type == "signature_delta":
+            block["signature"] = delta["signature"]
+        elif delta_type == "citations_delta":
+            block.setdefault("citations", []).append(delta["citation"])
@@ -45,6 +45,7 @@ from tenacity import (
 
 from directed_inputs_class import DirectedInputsClass
 from lifecyclelogging import Logging
+from vendor_connectors.downloads import Downloader
 
 
 if TYPE_CHECKING:
@@ -140,6 +141,7 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
 
         # Lazy-initialized HTTP client
         self._client: httpx.Client | None = None
+        self._downloader: Downloader | None = None
 
         # Tool registry for LangChain/MCP
         self._tools: list[StructuredTool] = []
@@ -166,6 +168,9 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
         if self._client:
             self._client.close()
             self._client = None
+        if self._downloader:
+            self._downloader.close()
+            self._downloader = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -300,30 +305,49 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
     # File Downloads
     # -------------------------------------------------------------------------
 
-    def download(self, url: str, output_path: str) -> int:
+    @property
+    def downloader(self) -> Downloader:
+        """Streaming downloader with its own pooled client (long read timeout)."""
+        if self._downloader is None:
+            self._downloader = Downloader()
+        return self._downloader
+
+    def download(
+        self,
+        url: str,
+        output_path: str,
+        expected_size: int | None = None,
+        sha256: str | None = None,
+    ) -> int:
         """Download file from URL.
 
+        The file is streamed to disk in chunks and resumed with a Range
+        request if the connection drops.
+
         Args:
             url: URL to download from
             output_path: Local path to save to
+            expected_size: Optional expected size in bytes
+            sha256: Optional expected SHA-256 hex digest
 
         Returns:
             File size in bytes
         """
-        import os
+        return self.downloader.download(url, output_path, expected_size=expected_size, sha256=sha256)
 
-        dirname = os.path.dirname(output_path)
-        if dirname:
-            os.makedirs(dirname, exist_ok=True)
+    def download_many(
+        self, items: list[tuple[str, str] | tuple[str, str, int | None, str | None]], max_workers: int | None = None
+    ) -> dict[str, int | Exception]:
+        """Download many files concurrently.
 
-        # Use a separate client for downloads (different timeout)
-        response = httpx.get(url, timeout=600.0)
-        response.raise_for_status()
-
-        with open(output_path, "wb") as f:
-            f.write(response.content)
+        Args:
+            items: (url, output_path) pairs, or (url, output_path, expected_size, sha256) tuples
+            max_workers: Maximum concurrent downloads
 
-        return len(response.content)
+        Returns:
+            Mapping of output path to file size, or to the exception that download failed with
+        """
+        return self.downloader.download_many(items, max_workers=max_workers)
 
     # -------------------------------------------------------------------------
     # LangChain Tool Registration
@@ -0,0 +1,346 @@
+"""Streaming, resumable file downloads.
+
+``Downloader`` streams responses to disk in fixed-size chunks over a pooled
+``httpx.Client``, so memory use stays flat no matter how large the artifact
+is. Data is written to ``<output>.part`` first; after a dropped connection or
+server error the download resumes from the bytes already on disk with an
+HTTP ``Range`` request. The URL and the response's ETag or Last-Modified are
+kept beside the partial file and sent back as ``If-Range``, so a partial file
+from another URL or an older version of the artifact is never extended;
+without a validator the download starts over instead. Completed files are
+checked against the expected size and optional SHA-256 before being moved
+into place, and ``download_many`` fetches many files concurrently on a
+bounded pool.
+
+Usage:
+    from vendor_connectors.downloads import Downloader
+
+    with Downloader() as downloader:
+        size = downloader.download(url, "out/model.glb", sha256="...")
+        results = downloader.download_many([(url1, "a.glb"), (url2, "b.png")])
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import httpx
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DEFAULT_DOWNLOAD_TIMEOUT = 600.0
+DEFAULT_DOWNLOAD_RETRIES = 3
+DEFAULT_DOWNLOAD_WORKERS = 8
+MAX_DOWNLOAD_BACKOFF = 30.0
+
+PARTIAL_SUFFIX = ".part"
+# Sidecar of a partial file recording where its bytes came from
+PARTIAL_META_SUFFIX = ".json"
+
+_CONTENT_RANGE_TOTAL = re.compile(r"/(\d+)\s*$")
+
+
+class DownloadError(Exception):
+    """Raised when a download cannot be completed or fails verification."""
+
+
+class _IncompleteDownloadError(Exception):
+    """Connection ended before the expected number of bytes arrived."""
+
+
+class _ServerError(Exception):
+    """Retryable 5xx response."""
+
+
+def file_sha256(path: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> str:
+    """Compute the SHA-256 of a file without loading it into memory.
+
+    Args:
+        path: File path.
+        chunk_size: Bytes read at a time.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Downloader:
+    """Download files by streaming them to disk, resuming after failures."""
+
+    def __init__(
+        self,
+        client: httpx.Client | None = None,
+        timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        retries: int = DEFAULT_DOWNLOAD_RETRIES,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    ):
+        """Initialize the downloader.
+
+        Args:
+            client: Optional client to download with. The downloader creates
+                (and closes) its own pooled client when omitted.
+            timeout: Timeout in seconds for connecting and for each read.
+            chunk_size: Bytes written to disk at a time.
+            retries: Resume attempts after a failed or truncated transfer.
+            max_workers: Default concurrency for download_many.
+        """
+        self._client = client
+        self._owns_client = client is None
+        self._client_lock = threading.Lock()
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.max_workers = max_workers
+
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled HTTP client used for downloads."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        follow_redirects=True,
+                        limits=httpx.Limits(
+                            max_connections=self.max_workers, max_keepalive_connections=self.max_workers
+                        ),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        """Close the client if the downloader created it."""
+        if self._client is not None and self._owns_client:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close client."""
+        self.close()
+
+    def download(
+        self,
+        url: str,
+        output_path: str,
+        expected_size: int | None = None,
+        sha256: str | None = None,
+    ) -> int:
+        """Download a file, resuming a previous partial download if present.
+
+        Args:
+            url: URL to download from.
+            output_path: Local path to save to.
+            expected_size: Optional expected size in bytes.
+            sha256: Optional expected SHA-256 hex digest.
+
+        Returns:
+            File size in bytes.
+
+        Raises:
+            DownloadError: If the transfer still fails after all retries or
+                the file fails verification.
+            httpx.HTTPStatusError: If the server rejects the request (4xx).
+        """
+        dirname = os.path.dirname(output_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        partial_path = output_path + PARTIAL_SUFFIX
+        attempt = 0
+        while True:
+            try:
+                size = self._transfer(url, partial_path)
+                break
+            except (httpx.TransportError, _IncompleteDownloadError, _ServerError) as e:
+                attempt += 1
+                if attempt > self.retries:
+                    msg = f"Failed to download {url} after {attempt} attempts: {e!r}"
+                    raise DownloadError(msg) from e
+                time.sleep(min(2 ** (attempt - 1), MAX_DOWNLOAD_BACKOFF))
+
+        if expected_size is not None and size != expected_size:
+            _discard_partial(partial_path)
+            msg = f"Downloaded {size} bytes from {url}, expected {expected_size}"
+            raise DownloadError(msg)
+
+        if sha256 is not None:
+            actual = file_sha256(partial_path, self.chunk_size)
+            if actual != sha256.lower():
+                _discard_partial(partial_path)
+                msg = f"Checksum mismatch for {url}: got {actual}, expected {sha256}"
+                raise DownloadError(msg)
+
+        os.replace(partial_path, output_path)
+        _remove_if_exists(partial_path + PARTIAL_META_SUFFIX)
+        return size
+
+    def download_many(
+        self,
+        items: Iterable[tuple[str, str] | tuple[str, str, int | None, str | None]],
+        max_workers: int | None = None,
+    ) -> dict[str, int | Exception]:
+        """Download many files concurrently.
+
+        Args:
+            items: (url, output_path) pairs, or (url, output_path,
+                expected_size, sha256) tuples to verify each file.
+            max_workers: Maximum concurrent downloads (default: the downloader's).
+
+        Returns:
+            Mapping of output path to file size, or to the exception that
+            download failed with.
+
+        Raises:
+            ValueError: If two items share an output path.
+        """
+        items = list(items)
+        if not items:
+            return {}
+
+        # Concurrent downloads to one path would share its partial file
+        seen: set[str] = set()
+        for item in items:
+            path = os.path.abspath(item[1])
+            if path in seen:
+                msg = f"Duplicate output path in download_many: {item[1]}"
+                raise ValueError(msg)
+            seen.add(path)
+
+        def fetch(item: tuple) -> int | Exception:
+            try:
+                return self.download(*item)
+            except Exception as e:
+                return e
+
+        workers = max(1, min(max_workers or self.max_workers, len(items)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="download") as executor:
+            return {item[1]: result for item, result in zip(items, executor.map(fetch, items), strict=True)}
+
+    def _transfer(self, url: str, partial_path: str) -> int:
+        """Stream url into partial_path, continuing from its current size.
+
+        A partial file is only continued if its sidecar shows it came from the
+        same URL and holds a validator; the validator is sent as If-Range so the
+        server sends the whole file instead if the artifact has changed.
+
+        Returns:
+            Size of the completed partial file.
+        """
+        meta_path = partial_path + PARTIAL_META_SUFFIX
+        offset = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+        validator = _read_validator(meta_path, url) if offset else None
+        # Ranges refer to the encoded body, so ask for it unencoded
+        headers = {"Accept-Encoding": "identity"}
+        if validator is not None:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+        else:
+            # Unknown origin or version: do not append to it
+            offset = 0
+
+        with self.client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 416 and offset:
+                # Nothing left to send: the partial file is complete if it matches the total
+                total = _content_range_total(response.headers.get("Content-Range"))
+                if total == offset:
+                    return offset
+                _discard_partial(partial_path)
+                raise _IncompleteDownloadError(url)
+
+            if response.status_code >= 500:
+                raise _ServerError(response.status_code)
+            response.raise_for_status()
+
+            if response.status_code != 206:
+                # Server ignored the range: start over
+                offset = 0
+                total = _int_header(response.headers.get("Content-Length"))
+            else:
+                total = _content_range_total(response.headers.get("Content-Range"))
+
+            if not offset:
+                _write_validator(meta_path, url, response.headers)
+
+            written = offset
+            with open(partial_path, "ab" if offset else "wb") as f:
+                for chunk in response.iter_bytes(self.chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+
+        if total is not None and written < total:
+            raise _IncompleteDownloadError(url)
+        return written
+
+
+def _response_validator(headers: httpx.Headers) -> str | None:
+    """Strong validator usable in If-Range: the ETag, else Last-Modified."""
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+def _write_validator(meta_path: str, url: str, headers: httpx.Headers) -> None:
+    """Record the origin of a partial file, or drop the record if it has no validator."""
+    validator = _response_validator(headers)
+    if validator is None:
+        _remove_if_exists(meta_path)
+        return
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "validator": validator}, f)
+
+
+def _read_validator(meta_path: str, url: str) -> str | None:
+    """Validator of a partial file downloaded from url, if one was recorded."""
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get("url") != url:
+        return None
+    return meta.get("validator") or None
+
+
+def _discard_partial(partial_path: str) -> None:
+    _remove_if_exists(partial_path)
+    _remove_if_exists(partial_path + PARTIAL_META_SUFFIX)
+
+
+def _remove_if_exists(path: str) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def _int_header(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _content_range_total(value: str | None) -> int | None:
+    match = _CONTENT_RANGE_TOTAL.search(value or "")
+    return int(match.group(1)) if match else None
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import json
+import threading
 
-from collections.abc import Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
 from typing import Any
 
 from google.oauth2 import service_account
@@ -12,6 +13,7 @@ from googleapiclient.discovery import build
 
 from lifecyclelogging import Logging
 from vendor_connectors.base import VendorConnectorBase
+from vendor_connectors.google.pagination import iter_items
 
 
 # Default Google scopes
@@ -25,6 +27,8 @@ DEFAULT_SCOPES = [
     "https://www.googleapis.com/auth/admin.directory.orgunit.readonly",
 ]
 
+LICENSING_SCOPE = "https://www.googleapis.com/auth/apps.licensing"
+
 
 class GoogleConnector(VendorConnectorBase):
     """Google Cloud and Workspace base connector.
@@ -75,6 +79,8 @@ class GoogleConnector(VendorConnectorBase):
         self.service_account_info = service_account_info
         self._credentials: service_account.Credentials | None = None
         self._services: dict[str, Any] = {}
+        self._services_owner = threading.get_ident()
+        self._thread_services = threading.local()
 
         self.logger.info("Initialized Google connector")
 
@@ -144,23 +150,52 @@ class GoogleConnector(VendorConnectorBase):
     # Service Client Creation
     # =========================================================================
 
-    def get_service(self, service_name: str, version: str, subject: str | None = None) -> Any:
+    def _get_service_cache(self) -> dict[str, Any]:
+        """Return the service client cache for the calling thread.
+
+        googleapiclient clients wrap a non-thread-safe httplib2 transport, so
+        worker threads (e.g. concurrent resource sweeps) get their own clients.
+        """
+        if threading.get_ident() == self._services_owner:
+            return self._services
+
+        cache = getattr(self._thread_services, "services", None)
+        if cache is None:
+            cache = self._thread_services.services = {}
+        return cache
+
+    def get_service(
+        self,
+        service_name: str,
+        version: str,
+        subject: str | None = None,
+        scopes: list[str] | None = None,
+    ) -> Any:
         """Get a Google API service client.
 
         Args:
             service_name: Google API service name (e.g., 'admin', 'cloudresourcemanager').
             version: API version (e.g., 'v1', 'directory_v1').
             subject: Optional subject to impersonate for this service.
+            scopes: Optional OAuth scopes for this service. Defaults to the connector's scopes.
 
         Returns:
             Google API service client.
         """
+        services = self._get_service_cache()
         cache_key = f"{service_name}:{version}:{subject or ''}"
-        if cache_key not in self._services:
-            creds = self.get_credentials_for_subject(subject) if subject else self.credentials
-            self._services[cache_key] = build(service_name, version, credentials=creds)
+        if scopes:
+            cache_key = f"{cache_key}:{','.join(scopes)}"
+        if cache_key not in services:
+            if scopes:
+                creds = service_account.Credentials.from_service_account_info(self.service_account_info, scopes=scopes)
+                if subject:
+                    creds = creds.with_subject(subject)
+            else:
+                creds = self.get_credentials_for_subject(subject) if subject else self.credentials
+            services[cache_key] = build(service_name, version, credentials=creds)
             self.logger.debug(f"Created Google service: {service_name} v{version}")
-        return self._services[cache_key]
+        return services[cache_key]
 
     # =========================================================================
     # Convenience Service Getters
@@ -210,6 +245,10 @@ class GoogleConnector(VendorConnectorBase):
         """Get the Cloud KMS API service."""
         return self.get_service("cloudkms", "v1")
 
+    def get_licensing_service(self, subject: str | None = None) -> Any:
+        """Get the Enterprise License Manager API service."""
+        return self.get_service("licensing", "v1", subject=subject, scopes=[LICENSING_SCOPE])
+
     # =========================================================================
     # Directory Filtering Helpers (from PR #241)
     # =========================================================================
@@ -294,8 +333,8 @@ class GoogleConnector(VendorConnectorBase):
     def _is_org_unit_allowed(
         self,
         entry: dict[str, Any],
-        allow_list: list[str] | None,
-        deny_list: list[str] | None,
+        allow_list: Collection[str] | None,
+        deny_list: Collection[str] | None,
     ) -> bool:
         """Check whether an entry's org unit is permitted by allow/deny lists."""
         if not allow_list and not deny_list:
@@ -331,48 +370,88 @@ class GoogleConnector(VendorConnectorBase):
         entry["given_name"] = name_block.get("givenName")
         entry["family_name"] = name_block.get("familyName")
 
-    @staticmethod
-    def _key_results_by_email(
-        entries: list[dict[str, Any]],
-        *,
-        primary_field: str,
-        fallback_field: str | None = None,
-    ) -> dict[str, dict[str, Any]]:
-        """Convert a list of directory entries into a dictionary keyed by email."""
-        keyed: dict[str, dict[str, Any]] = {}
-        for entry in entries:
-            email = entry.get(primary_field) or (entry.get(fallback_field) if fallback_field else None)
-            if not email:
-                continue
-            keyed[email] = entry
-        return keyed
-
-    def _filter_directory_entries(
+    def _compile_directory_filter(
         self,
-        entries: list[dict[str, Any]],
         *,
         ou_allow_list: list[str] | None,
         ou_deny_list: list[str] | None,
         include_suspended: bool,
         exclude_bots: bool,
         flatten_names: bool,
-    ) -> list[dict[str, Any]]:
-        """Apply filtering and optional name flattening to directory results."""
-        filtered: list[dict[str, Any]] = []
-        for entry in entries:
+    ) -> Callable[[dict[str, Any]], dict[str, Any] | None]:
+        """Compile directory filters into a single per-entry stage.
+
+        Returns:
+            Function returning the processed entry, or None if it is filtered out.
+        """
+        allow = frozenset(ou_allow_list) if ou_allow_list else None
+        deny = frozenset(ou_deny_list) if ou_deny_list else None
+
+        def stage(entry: dict[str, Any]) -> dict[str, Any] | None:
             if not include_suspended and entry.get("suspended"):
-                continue
+                return None
             if exclude_bots and self._is_bot_entry(entry):
-                continue
-            if not self._is_org_unit_allowed(entry, ou_allow_list, ou_deny_list):
-                continue
+                return None
+            if not self._is_org_unit_allowed(entry, allow, deny):
+                return None
 
             processed = dict(entry)
             if flatten_names:
                 self._flatten_user_name(processed)
-            filtered.append(processed)
+            return processed
+
+        return stage
+
+    @staticmethod
+    def _build_user_query(ou_allow_list: list[str] | None, include_suspended: bool) -> str | None:
+        """Build a Directory API users query that pushes filters server-side.
+
+        Query terms are ANDed and ``orgUnitPath`` also matches child OUs, so
+        only a single allowed OU is pushed down and entries are still filtered
+        locally for the exact match.
+        """
+        terms: list[str] = []
+        if not include_suspended:
+            terms.append("isSuspended=false")
+        if ou_allow_list and len(ou_allow_list) == 1:
+            escaped = ou_allow_list[0].replace("'", "\\'")
+            terms.append(f"orgUnitPath='{escaped}'")
+        return " ".join(terms) or None
+
+    def _collect_directory_entries(
+        self,
+        entries: Iterable[dict[str, Any]],
+        stage: Callable[[dict[str, Any]], dict[str, Any] | None],
+        *,
+        key_by_email: bool,
+        primary_field: str,
+        fallback_field: str,
+    ) -> tuple[list[dict[str, Any]] | dict[str, dict[str, Any]], int]:
+        """Run directory entries through a compiled filter stage in one pass.
+
+        Returns:
+            The kept entries (keyed by email if requested) and the number of
+            entries seen before filtering.
+        """
+        seen = 0
+        kept: list[dict[str, Any]] = []
+        keyed: dict[str, dict[str, Any]] = {}
+
+        for entry in entries:
+            seen += 1
+            processed = stage(entry)
+            if processed is None:
+                continue
+
+            if not key_by_email:
+                kept.append(processed)
+                continue
+
+            email = processed.get(primary_field) or processed.get(fallback_field)
+            if email:
+                keyed[email] = processed
 
-        return filtered
+        return (keyed if key_by_email else kept), seen
 
     # =========================================================================
     # Directory Listing with Filtering (from PR #241)
@@ -405,23 +484,6 @@ class GoogleConnector(VendorConnectorBase):
         Returns:
             List of user dicts, or dict keyed by email if key_by_email=True.
         """
-        service = self.get_admin_directory_service()
-        users: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            request = service.users().list(
-                customer="my_customer",
-                domain=domain,
-                maxResults=max_results,
-                pageToken=page_token,
-            )
-            response = request.execute()
-            users.extend(response.get("users", []))
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
-
         ou_allow = self._normalize_org_unit_list(self._resolve_sequence_option(ou_allow_list, "ou_allow_list"))
         ou_deny = self._normalize_org_unit_list(self._resolve_sequence_option(ou_deny_list, "ou_deny_list"))
         include_inactive = self._resolve_bool_option(include_suspended, "include_suspended", False)
@@ -429,8 +491,7 @@ class GoogleConnector(VendorConnectorBase):
         should_flatten_names = self._resolve_bool_option(flatten_names, "flatten_names", False)
         return_keyed = self._resolve_bool_option(key_by_email, "key_by_email", False)
 
-        filtered_users = self._filter_directory_entries(
-            users,
+        stage = self._compile_directory_filter(
             ou_allow_list=ou_allow,
             ou_deny_list=ou_deny,
             include_suspended=include_inactive,
@@ -438,15 +499,29 @@ class GoogleConnector(VendorConnectorBase):
             flatten_names=should_flatten_names,
         )
 
+        service = self.get_admin_directory_service()
+        users = iter_items(
+            service.users().list,
+            "users",
+            customer="my_customer",
+            domain=domain,
+            maxResults=max_results,
+            query=self._build_user_query(ou_allow, include_inactive),
+        )
+
+        filtered_users, total = self._collect_directory_entries(
+            users,
+            stage,
+            key_by_email=return_keyed,
+            primary_field="primaryEmail",
+            fallback_field="email",
+        )
+
         self.logger.info(
             "Retrieved %d users from Google Workspace (filtered to %d)",
-            len(users),
+            total,
             len(filtered_users),
         )
-
-        if return_keyed:
-            return self._key_results_by_email(filtered_users, primary_field="primaryEmail", fallback_field="email")
-
         return filtered_users
 
     def list_groups(
@@ -476,23 +551,6 @@ class GoogleConnector(VendorConnectorBase):
         Returns:
             List of group dicts, or dict keyed by email if key_by_email=True.
         """
-        service = self.get_admin_directory_service()
-        groups: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            request = service.groups().list(
-                customer="my_customer",
-                domain=domain,
-                maxResults=max_results,
-                pageToken=page_token,
-            )
-            response = request.execute()
-            groups.extend(response.get("groups", []))
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
-
         ou_allow = self._normalize_org_unit_list(self._resolve_sequence_option(ou_allow_list, "ou_allow_list"))
         ou_deny = self._normalize_org_unit_list(self._resolve_sequence_option(ou_deny_list, "ou_deny_list"))
         include_inactive = self._resolve_bool_option(include_suspended, "include_suspended", False)
@@ -500,8 +558,7 @@ class GoogleConnector(VendorConnectorBase):
         should_flatten_names = self._resolve_bool_option(flatten_names, "flatten_names", False)
         return_keyed = self._resolve_bool_option(key_by_email, "key_by_email", False)
 
-        filtered_groups = self._filter_directory_entries(
-            groups,
+        stage = self._compile_directory_filter(
             ou_allow_list=ou_allow,
             ou_deny_list=ou_deny,
             include_suspended=include_inactive,
@@ -509,15 +566,30 @@ class GoogleConnector(VendorConnectorBase):
             flatten_names=should_flatten_names,
         )
 
+        # The groups query language has no suspension or OU terms, so all
+        # filtering happens locally.
+        service = self.get_admin_directory_service()
+        groups = iter_items(
+            service.groups().list,
+            "groups",
+            customer="my_customer",
+            domain=domain,
+            maxResults=max_results,
+        )
+
+        filtered_groups, total = self._collect_directory_entries(
+            groups,
+            stage,
+            key_by_email=return_keyed,
+            primary_field="email",
+            fallback_field="primaryEmail",
+        )
+
         self.logger.info(
             "Retrieved %d groups from Google Workspace (filtered to %d)",
-            len(groups),
+            total,
             len(filtered_groups),
         )
-
-        if return_keyed:
-            return self._key_results_by_email(filtered_groups, primary_field="email", fallback_field="primaryEmail")
-
         return filtered_groups
 
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import Any
 
 from extended_data_types import unhump_map
+from vendor_connectors.google.pagination import iter_items
 
 
 class GoogleBillingMixin:
@@ -36,28 +37,13 @@ class GoogleBillingMixin:
         self.logger.info("Listing Google Cloud billing accounts")
         service = self.get_billing_service()
 
-        accounts: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {}
-            if filter_query:
-                params["filter"] = filter_query
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.billingAccounts().list(**params).execute()
-            accounts.extend(response.get("billingAccounts", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        accounts = [
+            unhump_map(a) if unhump_accounts else a
+            for a in iter_items(service.billingAccounts().list, "billingAccounts", filter=filter_query)
+        ]
 
         self.logger.info(f"Retrieved {len(accounts)} billing accounts")
 
-        if unhump_accounts:
-            accounts = [unhump_map(a) for a in accounts]
-
         return accounts
 
     def get_billing_account(self, billing_account_id: str) -> dict[str, Any] | None:
@@ -84,27 +70,38 @@ class GoogleBillingMixin:
                 return None
             raise
 
-    def get_project_billing_info(self, project_id: str) -> dict[str, Any] | None:
+    def get_project_billing_info(self, project_id: str, use_cache: bool = False) -> dict[str, Any] | None:
         """Get billing info for a project.
 
+        Fetched billing info is cached per project, and updates made through
+        this connector refresh the cache.
+
         Args:
             project_id: The project ID.
+            use_cache: Return the cached billing info if there is any. Defaults to False.
 
         Returns:
             Billing info dictionary or None if not set.
         """
         from googleapiclient.errors import HttpError
 
+        cache = self._get_project_billing_cache()
+        if use_cache and project_id in cache:
+            return dict(cache[project_id])
+
         service = self.get_billing_service()
 
         try:
-            return service.projects().getBillingInfo(name=f"projects/{project_id}").execute()
+            result = service.projects().getBillingInfo(name=f"projects/{project_id}").execute()
         except HttpError as e:
             if e.resp.status == 404:
                 self.logger.warning(f"Project billing info not found: {project_id}")
                 return None
             raise
 
+        cache[project_id] = dict(result)
+        return result
+
     def update_project_billing_info(
         self,
         project_id: str,
@@ -134,6 +131,7 @@ class GoogleBillingMixin:
             .execute()
         )
 
+        self._get_project_billing_cache()[project_id] = dict(result)
         self.logger.info(f"Linked project {project_id} to billing account")
         return result
 
@@ -158,6 +156,7 @@ class GoogleBillingMixin:
             .execute()
         )
 
+        self._get_project_billing_cache()[project_id] = dict(result)
         self.logger.info(f"Disabled billing for project {project_id}")
         return result
 
@@ -182,28 +181,22 @@ class GoogleBillingMixin:
         if not name.startswith("billingAccounts/"):
             name = f"billingAccounts/{billing_account_id}"
 
-        projects: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {"name": name}
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.billingAccounts().projects().list(**params).execute()
-            projects.extend(response.get("projectBillingInfo", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        projects = [
+            unhump_map(p) if unhump_projects else p
+            for p in iter_items(service.billingAccounts().projects().list, "projectBillingInfo", name=name)
+        ]
 
         self.logger.info(f"Retrieved {len(projects)} projects")
 
-        if unhump_projects:
-            projects = [unhump_map(p) for p in projects]
-
         return projects
 
+    def _get_project_billing_cache(self) -> dict[str, dict[str, Any]]:
+        """Get the project billing info cache keyed by project ID."""
+        cache = getattr(self, "_project_billing_cache", None)
+        if cache is None:
+            cache = self._project_billing_cache = {}
+        return cache
+
     def get_billing_account_iam_policy(
         self,
         billing_account_id: str,
@@ -6,9 +6,52 @@ folders, projects, and IAM.
 
 from __future__ import annotations
 
-from typing import Any
+import copy
+
+from typing import TYPE_CHECKING, Any
 
 from extended_data_types import unhump_map
+from vendor_connectors.google.pagination import iter_items, project_fields
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+def _apply_binding_changes(
+    policy: dict[str, Any],
+    additions: list[tuple[str, str]],
+    removals: list[tuple[str, str]],
+) -> bool:
+    """Apply role/member changes to a policy in place.
+
+    Conditional bindings are left untouched.
+
+    Returns:
+        True if the policy changed.
+    """
+    bindings = policy.setdefault("bindings", [])
+    role_bindings = {b.get("role"): b for b in bindings if not b.get("condition")}
+    changed = False
+
+    for role, member in additions:
+        binding = role_bindings.get(role)
+        if binding is None:
+            binding = role_bindings[role] = {"role": role, "members": []}
+            bindings.append(binding)
+        members = binding.setdefault("members", [])
+        if member not in members:
+            members.append(member)
+            changed = True
+
+    for role, member in removals:
+        binding = role_bindings.get(role)
+        if binding is not None and member in binding.get("members", []):
+            binding["members"].remove(member)
+            changed = True
+
+    policy["bindings"] = [b for b in bindings if b.get("members")]
+    return changed
 
 
 class GoogleCloudMixin:
@@ -65,11 +108,40 @@ class GoogleCloudMixin:
 
         return organizations[0]
 
+    def iter_projects(
+        self,
+        parent: str | None = None,
+        filter_query: str | None = None,
+        fields: str | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate Google Cloud projects, one page at a time.
+
+        Args:
+            parent: Parent resource (organizations/ORG_ID or folders/FOLDER_ID).
+            filter_query: Optional filter query string.
+            fields: Comma-separated project fields to return (e.g. 'projectId,state').
+            prefetch: Fetch the next page while the current one is processed.
+
+        Returns:
+            Iterator of project dictionaries.
+        """
+        service = self.get_cloud_resource_manager_service()
+        return iter_items(
+            service.projects().search,
+            "projects",
+            fields=project_fields("projects", fields),
+            prefetch=prefetch,
+            parent=parent,
+            filter=filter_query,
+        )
+
     def list_projects(
         self,
         parent: str | None = None,
         filter_query: str | None = None,
         unhump_projects: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """List Google Cloud projects.
 
@@ -77,37 +149,19 @@ class GoogleCloudMixin:
             parent: Parent resource (organizations/ORG_ID or folders/FOLDER_ID).
             filter_query: Optional filter query string.
             unhump_projects: Convert keys to snake_case. Defaults to False.
+            fields: Comma-separated project fields to return (e.g. 'projectId,state').
 
         Returns:
             List of project dictionaries.
         """
         self.logger.info("Listing Google Cloud projects")
-        service = self.get_cloud_resource_manager_service()
-
-        projects: list[dict[str, Any]] = []
-        page_token = None
 
-        while True:
-            params: dict[str, Any] = {}
-            if parent:
-                params["parent"] = parent
-            if filter_query:
-                params["filter"] = filter_query
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.projects().search(**params).execute()
-            projects.extend(response.get("projects", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        projects = [
+            unhump_map(p) if unhump_projects else p
+            for p in self.iter_projects(parent=parent, filter_query=filter_query, fields=fields)
+        ]
 
         self.logger.info(f"Retrieved {len(projects)} projects")
-
-        if unhump_projects:
-            projects = [unhump_map(p) for p in projects]
-
         return projects
 
     def get_project(self, project_id: str) -> dict[str, Any] | None:
@@ -210,43 +264,52 @@ class GoogleCloudMixin:
         self.logger.info(f"Moved project {project_id}")
         return result
 
+    def iter_folders(
+        self,
+        parent: str,
+        fields: str | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate folders under a parent, one page at a time.
+
+        Args:
+            parent: Parent resource (organizations/ORG_ID or folders/FOLDER_ID).
+            fields: Comma-separated folder fields to return (e.g. 'name,displayName').
+            prefetch: Fetch the next page while the current one is processed.
+
+        Returns:
+            Iterator of folder dictionaries.
+        """
+        service = self.get_cloud_resource_manager_service()
+        return iter_items(
+            service.folders().list,
+            "folders",
+            fields=project_fields("folders", fields),
+            prefetch=prefetch,
+            parent=parent,
+        )
+
     def list_folders(
         self,
         parent: str,
         unhump_folders: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """List folders under a parent.
 
         Args:
             parent: Parent resource (organizations/ORG_ID or folders/FOLDER_ID).
             unhump_folders: Convert keys to snake_case. Defaults to False.
+            fields: Comma-separated folder fields to return (e.g. 'name,displayName').
 
         Returns:
             List of folder dictionaries.
         """
         self.logger.info(f"Listing folders under {parent}")
-        service = self.get_cloud_resource_manager_service()
-
-        folders: list[dict[str, Any]] = []
-        page_token = None
 
-        while True:
-            params: dict[str, Any] = {"parent": parent}
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.folders().list(**params).execute()
-            folders.extend(response.get("folders", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        folders = [unhump_map(f) if unhump_folders else f for f in self.iter_folders(parent, fields=fields)]
 
         self.logger.info(f"Retrieved {len(folders)} folders")
-
-        if unhump_folders:
-            folders = [unhump_map(f) for f in folders]
-
         return folders
 
     def get_org_policy(
@@ -311,16 +374,27 @@ class GoogleCloudMixin:
         self,
         resource: str,
         resource_type: str = "projects",
+        use_cache: bool = False,
     ) -> dict[str, Any]:
         """Get IAM policy for a resource.
 
+        Every fetched or written policy is cached with its etag. Writes send
+        the etag back, so a stale cached policy is rejected by the API rather
+        than silently overwriting newer changes.
+
         Args:
             resource: Resource ID.
             resource_type: Type of resource (projects, folders, organizations).
+            use_cache: Return the cached policy if there is one. Defaults to False.
 
         Returns:
             IAM policy dictionary.
         """
+        cache = self._get_iam_policy_cache()
+        cache_key = (resource_type, resource)
+        if use_cache and cache_key in cache:
+            return copy.deepcopy(cache[cache_key])
+
         service = self.get_cloud_resource_manager_service()
 
         if resource_type == "projects":
@@ -351,6 +425,7 @@ class GoogleCloudMixin:
                 .execute()
             )
 
+        cache[cache_key] = copy.deepcopy(result)
         return result
 
     def set_iam_policy(
@@ -402,6 +477,7 @@ class GoogleCloudMixin:
                 .execute()
             )
 
+        self._get_iam_policy_cache()[(resource_type, resource)] = copy.deepcopy(result)
         self.logger.info(f"Set IAM policy on {resource_type}/{resource}")
         return result
 
@@ -424,63 +500,150 @@ class GoogleCloudMixin:
             Updated IAM policy dictionary.
         """
         self.logger.info(f"Adding IAM binding: {role} -> {member} on {resource}")
+        return self.modify_iam_bindings(resource, add=[(role, member)], resource_type=resource_type)
+
+    def modify_iam_bindings(
+        self,
+        resource: str,
+        add: Iterable[tuple[str, str]] = (),
+        remove: Iterable[tuple[str, str]] = (),
+        resource_type: str = "projects",
+        max_attempts: int = 3,
+    ) -> dict[str, Any]:
+        """Apply many IAM binding changes to a resource in a single write.
+
+        The cached policy is edited locally and written back with its etag.
+        If the policy changed since it was read, the API rejects the write
+        (409/412); the policy is then refetched and the changes reapplied.
+
+        Args:
+            resource: Resource ID.
+            add: (role, member) pairs to grant.
+            remove: (role, member) pairs to revoke.
+            resource_type: Type of resource (projects, folders, organizations).
+            max_attempts: Maximum write attempts on concurrent modification. Defaults to 3.
+
+        Returns:
+            Updated IAM policy dictionary.
+        """
+        from googleapiclient.errors import HttpError
+
+        additions = list(add)
+        removals = list(remove)
+        cache_key = (resource_type, resource)
+        use_cache = True
+        attempts = 0
+
+        while True:
+            from_cache = use_cache and cache_key in self._get_iam_policy_cache()
+            policy = self.get_iam_policy(resource, resource_type, use_cache=use_cache)
+            use_cache = False
+
+            if not _apply_binding_changes(policy, additions, removals):
+                if from_cache:
+                    # Confirm against the live policy before skipping the write
+                    continue
+                self.logger.info(f"IAM policy on {resource_type}/{resource} already up to date")
+                return policy
+
+            attempts += 1
+            try:
+                return self.set_iam_policy(resource, policy, resource_type)
+            except HttpError as e:
+                if e.resp.status not in (409, 412) or attempts >= max_attempts:
+                    raise
+                self.logger.warning(
+                    f"IAM policy on {resource_type}/{resource} changed concurrently, "
+                    f"retrying ({attempts}/{max_attempts})"
+                )
+
+    def bulk_add_iam_bindings(
+        self,
+        bindings: Iterable[tuple[str, str, str]],
+        resource_type: str = "projects",
+        max_attempts: int = 3,
+    ) -> dict[str, dict[str, Any]]:
+        """Add many IAM bindings, writing each resource's policy once.
 
-        policy = self.get_iam_policy(resource, resource_type)
-        bindings = policy.get("bindings", [])
+        Args:
+            bindings: (resource, role, member) triples to grant.
+            resource_type: Type of resource (projects, folders, organizations).
+            max_attempts: Maximum write attempts per resource on concurrent modification.
+
+        Returns:
+            Dictionary mapping resource IDs to their updated IAM policies.
+        """
+        by_resource: dict[str, list[tuple[str, str]]] = {}
+        for resource, role, member in bindings:
+            by_resource.setdefault(resource, []).append((role, member))
+
+        self.logger.info(f"Applying IAM bindings to {len(by_resource)} {resource_type}")
+
+        return {
+            resource: self.modify_iam_bindings(
+                resource,
+                add=changes,
+                resource_type=resource_type,
+                max_attempts=max_attempts,
+            )
+            for resource, changes in by_resource.items()
+        }
 
-        # Find existing binding for role
-        role_binding = None
-        for binding in bindings:
-            if binding.get("role") == role:
-                role_binding = binding
-                break
+    def _get_iam_policy_cache(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """Get the IAM policy cache keyed by (resource type, resource ID)."""
+        cache = getattr(self, "_iam_policy_cache", None)
+        if cache is None:
+            cache = self._iam_policy_cache = {}
+        return cache
 
-        if role_binding:
-            if member not in role_binding.get("members", []):
-                role_binding["members"].append(member)
-        else:
-            bindings.append({"role": role, "members": [member]})
+    def iter_service_accounts(
+        self,
+        project_id: str,
+        fields: str | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate service accounts in a project, one page at a time.
 
-        policy["bindings"] = bindings
-        return self.set_iam_policy(resource, policy, resource_type)
+        Args:
+            project_id: The project ID.
+            fields: Comma-separated account fields to return (e.g. 'email,disabled').
+            prefetch: Fetch the next page while the current one is processed.
+
+        Returns:
+            Iterator of service account dictionaries.
+        """
+        service = self.get_iam_service()
+        return iter_items(
+            service.projects().serviceAccounts().list,
+            "accounts",
+            fields=project_fields("accounts", fields),
+            prefetch=prefetch,
+            name=f"projects/{project_id}",
+        )
 
     def list_service_accounts(
         self,
         project_id: str,
         unhump_accounts: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """List service accounts in a project.
 
         Args:
             project_id: The project ID.
             unhump_accounts: Convert keys to snake_case. Defaults to False.
+            fields: Comma-separated account fields to return (e.g. 'email,disabled').
 
         Returns:
             List of service account dictionaries.
         """
         self.logger.info(f"Listing service accounts in {project_id}")
-        service = self.get_iam_service()
 
-        accounts: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {"name": f"projects/{project_id}"}
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.projects().serviceAccounts().list(**params).execute()
-            accounts.extend(response.get("accounts", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        accounts = [
+            unhump_map(a) if unhump_accounts else a for a in self.iter_service_accounts(project_id, fields=fields)
+        ]
 
         self.logger.info(f"Retrieved {len(accounts)} service accounts")
-
-        if unhump_accounts:
-            accounts = [unhump_map(a) for a in accounts]
-
         return accounts
 
     def create_service_account(
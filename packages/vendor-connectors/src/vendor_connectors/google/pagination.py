@@ -0,0 +1,127 @@
+"""Lazy pagination for Google API list methods.
+
+Google list methods return one page per call and a ``nextPageToken`` for the
+next one. ``iter_items`` turns such a method into a generator of items, so
+callers can filter and transform results page by page and stop early without
+holding the whole listing in memory.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+
+def project_fields(items_path: str, fields: str | None) -> str | None:
+    """Build a partial-response selector for the items of a list response.
+
+    Args:
+        items_path: Path of the items in the response (e.g. 'users').
+        fields: Comma-separated item fields to keep (e.g. 'primaryEmail,name').
+
+    Returns:
+        Selector that keeps the page token and the requested item fields, or
+        None when no projection was requested.
+    """
+    if not fields:
+        return None
+    return f"nextPageToken,{items_path}({fields})"
+
+
+def _isolated_http(request: Any) -> Any:
+    """Build a private authorized transport for executing a request off-thread.
+
+    httplib2 transports are not thread-safe, so background page fetches must
+    not share the service's transport with the caller.
+    """
+    credentials = getattr(request.http, "credentials", None)
+    if credentials is None:
+        return None
+
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.http import build_http
+
+    return AuthorizedHttp(credentials, http=build_http())
+
+
+def iter_items(
+    method: Callable[..., Any],
+    items_key: str,
+    *,
+    fields: str | None = None,
+    prefetch: bool = False,
+    extract: Callable[[dict[str, Any]], Iterable[dict[str, Any]]] | None = None,
+    **params: Any,
+) -> Iterator[dict[str, Any]]:
+    """Lazily yield items from a paginated Google API list method.
+
+    Pages are only requested as the caller consumes items, so abandoning the
+    generator stops pagination. With ``prefetch`` the next page is requested
+    in the background while the caller works through the current one.
+
+    Args:
+        method: Bound list method, e.g. ``service.users().list``.
+        items_key: Response key holding the items of each page.
+        fields: Full partial-response selector (see ``project_fields``).
+            ``nextPageToken`` is always kept.
+        prefetch: Fetch the next page in the background. Defaults to False.
+            Ignored when the request's transport has no credentials to build
+            a private one from, since httplib2 transports are not thread-safe.
+        extract: Optional function pulling the items out of a response, for
+            responses that do not keep them in a flat list under items_key.
+        **params: Parameters passed to every list call. None and empty-string
+            values are dropped, like unset optional filters.
+
+    Yields:
+        Item dictionaries in API order.
+    """
+    base_params = {key: value for key, value in params.items() if value is not None and value != ""}
+    if fields:
+        base_params["fields"] = fields if "nextPageToken" in fields else f"nextPageToken,{fields}"
+
+    def build_request(page_token: str | None) -> Any:
+        request_params = dict(base_params)
+        if page_token:
+            request_params["pageToken"] = page_token
+        return method(**request_params)
+
+    def page_items(response: dict[str, Any]) -> Iterable[dict[str, Any]]:
+        if extract is not None:
+            return extract(response)
+        return response.get(items_key, [])
+
+    request = build_request(None)
+    # Without a private transport the next page cannot be fetched off-thread
+    http = _isolated_http(request) if prefetch else None
+    if http is None:
+        while True:
+            response = request.execute()
+            yield from page_items(response)
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return
+            request = build_request(page_token)
+
+    def fetch(page_token: str) -> dict[str, Any]:
+        return build_request(page_token).execute(http=http)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        response = request.execute()
+
+        while True:
+            page_token = response.get("nextPageToken")
+            pending = executor.submit(fetch, page_token) if page_token else None
+
+            yield from page_items(response)
+
+            if pending is None:
+                return
+            response = pending.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -6,9 +6,33 @@ services like GKE, Compute Engine, Cloud Storage, Cloud SQL, Pub/Sub, etc.
 
 from __future__ import annotations
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
 
 from extended_data_types import unhump_map
+from vendor_connectors.google.pagination import iter_items, project_fields
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+
+# Resource types checked by is_project_empty, in check order
+PROJECT_RESOURCE_TYPES = ("compute", "gke", "storage", "sql", "pubsub")
+
+_RESOURCE_PROBES = {
+    "compute": "_probe_compute_instances",
+    "gke": "_probe_gke_clusters",
+    "storage": "_probe_storage_buckets",
+    "sql": "_probe_sql_instances",
+    "pubsub": "_probe_pubsub_topics",
+}
+
+
+def _aggregated_instances(response: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Flatten the per-zone instance lists of an aggregatedList response."""
+    for zone_data in response.get("items", {}).values():
+        yield from zone_data.get("instances", [])
 
 
 class GoogleServicesMixin:
@@ -29,11 +53,53 @@ class GoogleServicesMixin:
     # Compute Engine
     # =========================================================================
 
+    def iter_compute_instances(
+        self,
+        project_id: str,
+        zone: str | None = None,
+        fields: str | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate Compute Engine instances in a project, one page at a time.
+
+        Args:
+            project_id: The project ID.
+            zone: Optional zone filter. If not provided, iterates all zones.
+            fields: Comma-separated instance fields to return (e.g. 'name,status').
+            prefetch: Fetch the next page while the current one is processed.
+
+        Returns:
+            Iterator of instance dictionaries.
+        """
+        service = self.get_compute_service()
+
+        if zone:
+            # List instances in specific zone
+            return iter_items(
+                service.instances().list,
+                "items",
+                fields=project_fields("items", fields),
+                prefetch=prefetch,
+                project=project_id,
+                zone=zone,
+            )
+
+        # Aggregate list across all zones
+        return iter_items(
+            service.instances().aggregatedList,
+            "items",
+            fields=project_fields("items/*/instances", fields),
+            prefetch=prefetch,
+            extract=_aggregated_instances,
+            project=project_id,
+        )
+
     def list_compute_instances(
         self,
         project_id: str,
         zone: str | None = None,
         unhump_instances: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """List Compute Engine instances in a project.
 
@@ -41,50 +107,19 @@ class GoogleServicesMixin:
             project_id: The project ID.
             zone: Optional zone filter. If not provided, lists all zones.
             unhump_instances: Convert keys to snake_case. Defaults to False.
+            fields: Comma-separated instance fields to return (e.g. 'name,status').
 
         Returns:
             List of instance dictionaries.
         """
         self.logger.info(f"Listing Compute Engine instances in {project_id}")
-        service = self.get_compute_service()
 
-        instances: list[dict[str, Any]] = []
-
-        if zone:
-            # List instances in specific zone
-            page_token = None
-            while True:
-                params: dict[str, Any] = {"project": project_id, "zone": zone}
-                if page_token:
-                    params["pageToken"] = page_token
-
-                response = service.instances().list(**params).execute()
-                instances.extend(response.get("items", []))
-
-                page_token = response.get("nextPageToken")
-                if not page_token:
-                    break
-        else:
-            # Aggregate list across all zones
-            page_token = None
-            while True:
-                params: dict[str, Any] = {"project": project_id}
-                if page_token:
-                    params["pageToken"] = page_token
-
-                response = service.instances().aggregatedList(**params).execute()
-                for zone_data in response.get("items", {}).values():
-                    instances.extend(zone_data.get("instances", []))
-
-                page_token = response.get("nextPageToken")
-                if not page_token:
-                    break
+        instances = [
+            unhump_map(i) if unhump_instances else i
+            for i in self.iter_compute_instances(project_id, zone=zone, fields=fields)
+        ]
 
         self.logger.info(f"Retrieved {len(instances)} instances")
-
-        if unhump_instances:
-            instances = [unhump_map(i) for i in instances]
-
         return instances
 
     # =========================================================================
@@ -154,43 +189,52 @@ class GoogleServicesMixin:
     # Cloud Storage
     # =========================================================================
 
+    def iter_storage_buckets(
+        self,
+        project_id: str,
+        fields: str | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate Cloud Storage buckets in a project, one page at a time.
+
+        Args:
+            project_id: The project ID.
+            fields: Comma-separated bucket fields to return (e.g. 'name,location').
+            prefetch: Fetch the next page while the current one is processed.
+
+        Returns:
+            Iterator of bucket dictionaries.
+        """
+        service = self.get_storage_service()
+        return iter_items(
+            service.buckets().list,
+            "items",
+            fields=project_fields("items", fields),
+            prefetch=prefetch,
+            project=project_id,
+        )
+
     def list_storage_buckets(
         self,
         project_id: str,
         unhump_buckets: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """List Cloud Storage buckets in a project.
 
         Args:
             project_id: The project ID.
             unhump_buckets: Convert keys to snake_case. Defaults to False.
+            fields: Comma-separated bucket fields to return (e.g. 'name,location').
 
         Returns:
             List of bucket dictionaries.
         """
         self.logger.info(f"Listing Cloud Storage buckets in {project_id}")
-        service = self.get_storage_service()
-
-        buckets: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {"project": project_id}
-            if page_token:
-                params["pageToken"] = page_token
 
-            response = service.buckets().list(**params).execute()
-            buckets.extend(response.get("items", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        buckets = [unhump_map(b) if unhump_buckets else b for b in self.iter_storage_buckets(project_id, fields=fields)]
 
         self.logger.info(f"Retrieved {len(buckets)} buckets")
-
-        if unhump_buckets:
-            buckets = [unhump_map(b) for b in buckets]
-
         return buckets
 
     # =========================================================================
@@ -214,26 +258,13 @@ class GoogleServicesMixin:
         self.logger.info(f"Listing Cloud SQL instances in {project_id}")
         service = self.get_sqladmin_service()
 
-        instances: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {"project": project_id}
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.instances().list(**params).execute()
-            instances.extend(response.get("items", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        instances = [
+            unhump_map(i) if unhump_instances else i
+            for i in iter_items(service.instances().list, "items", project=project_id)
+        ]
 
         self.logger.info(f"Retrieved {len(instances)} SQL instances")
 
-        if unhump_instances:
-            instances = [unhump_map(i) for i in instances]
-
         return instances
 
     # =========================================================================
@@ -257,26 +288,13 @@ class GoogleServicesMixin:
         self.logger.info(f"Listing Pub/Sub topics in {project_id}")
         service = self.get_pubsub_service()
 
-        topics: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {"project": f"projects/{project_id}"}
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.projects().topics().list(**params).execute()
-            topics.extend(response.get("topics", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        topics = [
+            unhump_map(t) if unhump_topics else t
+            for t in iter_items(service.projects().topics().list, "topics", project=f"projects/{project_id}")
+        ]
 
         self.logger.info(f"Retrieved {len(topics)} Pub/Sub topics")
 
-        if unhump_topics:
-            topics = [unhump_map(t) for t in topics]
-
         return topics
 
     def list_pubsub_subscriptions(
@@ -296,26 +314,17 @@ class GoogleServicesMixin:
         self.logger.info(f"Listing Pub/Sub subscriptions in {project_id}")
         service = self.get_pubsub_service()
 
-        subscriptions: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {"project": f"projects/{project_id}"}
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.projects().subscriptions().list(**params).execute()
-            subscriptions.extend(response.get("subscriptions", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        subscriptions = [
+            unhump_map(s) if unhump_subscriptions else s
+            for s in iter_items(
+                service.projects().subscriptions().list,
+                "subscriptions",
+                project=f"projects/{project_id}",
+            )
+        ]
 
         self.logger.info(f"Retrieved {len(subscriptions)} Pub/Sub subscriptions")
 
-        if unhump_subscriptions:
-            subscriptions = [unhump_map(s) for s in subscriptions]
-
         return subscriptions
 
     # =========================================================================
@@ -339,29 +348,18 @@ class GoogleServicesMixin:
         self.logger.info(f"Listing enabled services in {project_id}")
         service = self.get_serviceusage_service()
 
-        services: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {
-                "parent": f"projects/{project_id}",
-                "filter": "state:ENABLED",
-            }
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.services().list(**params).execute()
-            services.extend(response.get("services", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        services = [
+            unhump_map(s) if unhump_services else s
+            for s in iter_items(
+                service.services().list,
+                "services",
+                parent=f"projects/{project_id}",
+                filter="state:ENABLED",
+            )
+        ]
 
         self.logger.info(f"Retrieved {len(services)} enabled services")
 
-        if unhump_services:
-            services = [unhump_map(s) for s in services]
-
         return services
 
     def enable_service(
@@ -469,27 +467,17 @@ class GoogleServicesMixin:
         self.logger.info(f"Listing KMS key rings in {project_id}/{location}")
         service = self.get_cloudkms_service()
 
-        keyrings: list[dict[str, Any]] = []
-        page_token = None
-        parent = f"projects/{project_id}/locations/{location}"
-
-        while True:
-            params: dict[str, Any] = {"parent": parent}
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.projects().locations().keyRings().list(**params).execute()
-            keyrings.extend(response.get("keyRings", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        keyrings = [
+            unhump_map(k) if unhump_keyrings else k
+            for k in iter_items(
+                service.projects().locations().keyRings().list,
+                "keyRings",
+                parent=f"projects/{project_id}/locations/{location}",
+            )
+        ]
 
         self.logger.info(f"Retrieved {len(keyrings)} key rings")
 
-        if unhump_keyrings:
-            keyrings = [unhump_map(k) for k in keyrings]
-
         return keyrings
 
     def create_kms_keyring(
@@ -578,6 +566,45 @@ class GoogleServicesMixin:
     # Project Resource Summary
     # =========================================================================
 
+    def project_has_resources(self, project_id: str, resource_type: str) -> bool:
+        """Probe whether a project holds at least one resource of a given type.
+
+        Probes request single-item pages and stop at the first hit, so the cost
+        does not grow with the number of resources in the project. A 403 (API
+        disabled or access denied) is remembered per project and API, and the
+        API is treated as having no resources.
+
+        Args:
+            project_id: The project ID.
+            resource_type: One of PROJECT_RESOURCE_TYPES.
+
+        Returns:
+            True if at least one resource of the given type exists.
+
+        Raises:
+            ValueError: If the resource type is unknown.
+        """
+        from googleapiclient.errors import HttpError
+
+        probe_name = _RESOURCE_PROBES.get(resource_type)
+        if probe_name is None:
+            msg = f"Unknown resource type: {resource_type}"
+            raise ValueError(msg)
+
+        denied = self._get_denied_resource_probes()
+        if (project_id, resource_type) in denied:
+            return False
+
+        try:
+            return getattr(self, probe_name)(project_id)
+        except HttpError as e:
+            # API might not be enabled, treat as empty for that service
+            if e.resp.status == 403:
+                self.logger.debug(f"API access denied for {resource_type} in {project_id}, skipping check: {e}")
+                denied.add((project_id, resource_type))
+                return False
+            raise
+
     def is_project_empty(
         self,
         project_id: str,
@@ -602,49 +629,123 @@ class GoogleServicesMixin:
         """
         self.logger.info(f"Checking if project {project_id} is empty")
 
-        from googleapiclient.errors import HttpError
+        checks = {
+            "compute": check_compute,
+            "gke": check_gke,
+            "storage": check_storage,
+            "sql": check_sql,
+            "pubsub": check_pubsub,
+        }
 
-        try:
-            if check_compute:
-                instances = self.list_compute_instances(project_id)
-                if instances:
-                    self.logger.info(f"Project {project_id} has {len(instances)} compute instances")
-                    return False
-
-            if check_gke:
-                clusters = self.list_gke_clusters(project_id)
-                if clusters:
-                    self.logger.info(f"Project {project_id} has {len(clusters)} GKE clusters")
-                    return False
-
-            if check_storage:
-                buckets = self.list_storage_buckets(project_id)
-                if buckets:
-                    self.logger.info(f"Project {project_id} has {len(buckets)} storage buckets")
-                    return False
-
-            if check_sql:
-                sql_instances = self.list_sql_instances(project_id)
-                if sql_instances:
-                    self.logger.info(f"Project {project_id} has {len(sql_instances)} SQL instances")
-                    return False
-
-            if check_pubsub:
-                topics = self.list_pubsub_topics(project_id)
-                if topics:
-                    self.logger.info(f"Project {project_id} has {len(topics)} Pub/Sub topics")
-                    return False
-
-        except HttpError as e:
-            # API might not be enabled, treat as empty for that service
-            if e.resp.status == 403:
-                self.logger.debug(f"API access denied, skipping check: {e}")
-            else:
-                raise
+        for resource_type in PROJECT_RESOURCE_TYPES:
+            if checks[resource_type] and self.project_has_resources(project_id, resource_type):
+                self.logger.info(f"Project {project_id} has {resource_type} resources")
+                return False
 
         self.logger.info(f"Project {project_id} appears to be empty")
         return True
 
+    def sweep_empty_projects(
+        self,
+        project_ids: Iterable[str],
+        resource_types: Sequence[str] = PROJECT_RESOURCE_TYPES,
+        max_workers: int = 16,
+    ) -> dict[str, bool]:
+        """Check many projects for resources concurrently.
+
+        Every (project, resource type) probe runs on a bounded thread pool.
+        Once a probe finds a resource in a project, the probes still queued
+        for that project are skipped.
+
+        Args:
+            project_ids: Project IDs to check.
+            resource_types: Resource types to probe. Defaults to all.
+            max_workers: Maximum number of concurrent probes. Defaults to 16.
+
+        Returns:
+            Dictionary mapping project IDs to True if the project is empty.
+        """
+        project_ids = list(project_ids)
+        self.logger.info(f"Sweeping {len(project_ids)} projects for resources")
+
+        # Initialize the shared 403 cache before any worker touches it
+        self._get_denied_resource_probes()
+        occupied: set[str] = set()
+
+        def probe(project_id: str, resource_type: str) -> None:
+            if project_id in occupied:
+                return
+            if self.project_has_resources(project_id, resource_type):
+                occupied.add(project_id)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(probe, project_id, resource_type)
+                for project_id in project_ids
+                for resource_type in resource_types
+            ]
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        results = {project_id: project_id not in occupied for project_id in project_ids}
+        self.logger.info(f"Found {sum(results.values())} empty projects out of {len(project_ids)}")
+        return results
+
+    def _get_denied_resource_probes(self) -> set[tuple[str, str]]:
+        """Get the (project, resource type) pairs that returned 403."""
+        denied = getattr(self, "_denied_resource_probes", None)
+        if denied is None:
+            denied = self._denied_resource_probes = set()
+        return denied
+
+    def _probe_compute_instances(self, project_id: str) -> bool:
+        """Check for at least one Compute Engine instance in any zone."""
+        service = self.get_compute_service()
+        page_token = None
+
+        while True:
+            params: dict[str, Any] = {"project": project_id, "maxResults": 1}
+            if page_token:
+                params["pageToken"] = page_token
+
+            response = service.instances().aggregatedList(**params).execute()
+            if any(zone_data.get("instances") for zone_data in response.get("items", {}).values()):
+                return True
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return False
+
+    def _probe_gke_clusters(self, project_id: str) -> bool:
+        """Check for at least one GKE cluster in any location."""
+        service = self.get_container_service()
+        parent = f"projects/{project_id}/locations/-"
+        response = service.projects().locations().clusters().list(parent=parent).execute()
+        return bool(response.get("clusters"))
+
+    def _probe_storage_buckets(self, project_id: str) -> bool:
+        """Check for at least one Cloud Storage bucket."""
+        service = self.get_storage_service()
+        response = service.buckets().list(project=project_id, maxResults=1).execute()
+        return bool(response.get("items"))
+
+    def _probe_sql_instances(self, project_id: str) -> bool:
+        """Check for at least one Cloud SQL instance."""
+        service = self.get_sqladmin_service()
+        response = service.instances().list(project=project_id, maxResults=1).execute()
+        return bool(response.get("items"))
+
+    def _probe_pubsub_topics(self, project_id: str) -> bool:
+        """Check for at least one Pub/Sub topic."""
+        service = self.get_pubsub_service()
+        response = service.projects().topics().list(project=f"projects/{project_id}", pageSize=1).execute()
+        return bool(response.get("topics"))
+
     def get_project_iam_users(
         self,
         project_id: str,
@@ -719,6 +820,7 @@ class GoogleServicesMixin:
         projects: dict[str, dict[str, Any]] | None = None,
         check_resources: bool = True,
         days_since_activity: int = 90,
+        max_workers: int = 16,
     ) -> list[dict[str, Any]]:
         """Find projects that appear to be inactive or dead.
 
@@ -730,12 +832,11 @@ class GoogleServicesMixin:
             projects: Pre-fetched projects dict. Fetched if not provided.
             check_resources: Check if projects have resources. Defaults to True.
             days_since_activity: Days threshold for activity (not implemented yet).
+            max_workers: Maximum number of concurrent resource probes. Defaults to 16.
 
         Returns:
             List of inactive project dictionaries.
         """
-        from googleapiclient.errors import HttpError
-
         self.logger.info("Finding inactive projects")
 
         if projects is None:
@@ -747,6 +848,7 @@ class GoogleServicesMixin:
                 return []
 
         inactive: list[dict[str, Any]] = []
+        active_project_ids: list[str] = []
 
         for project_id, project_data in projects.items():
             lifecycle_state = project_data.get("lifecycleState", "ACTIVE")
@@ -757,19 +859,15 @@ class GoogleServicesMixin:
                 inactive.append(project_data)
                 continue
 
-            # Check if project has resources
-            if check_resources:
-                try:
-                    is_empty = self.is_project_empty(project_id)
-                    if is_empty:
-                        project_data["inactive_reason"] = "no_resources"
-                        inactive.append(project_data)
-                except HttpError as e:
-                    if e.resp.status == 403:
-                        # Can't check, skip
-                        self.logger.debug(f"Cannot check resources for {project_id}: {e}")
-                    else:
-                        raise
+            active_project_ids.append(project_id)
+
+        # Check if projects have resources
+        if check_resources and active_project_ids:
+            empty_projects = self.sweep_empty_projects(active_project_ids, max_workers=max_workers)
+            for project_id in active_project_ids:
+                if empty_projects[project_id]:
+                    projects[project_id]["inactive_reason"] = "no_resources"
+                    inactive.append(projects[project_id])
 
         self.logger.info(f"Found {len(inactive)} inactive projects out of {len(projects)}")
         return inactive
@@ -6,9 +6,25 @@ through the Admin Directory API.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from extended_data_types import unhump_map
+from vendor_connectors.google.pagination import iter_items, project_fields
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+# Common license product IDs checked when no product is given
+WORKSPACE_LICENSE_PRODUCT_IDS = [
+    "Google-Apps",
+    "101031",  # Google Workspace Enterprise Plus
+    "101034",  # Google Workspace Business Starter
+    "101037",  # Google Workspace Business Standard
+    "101038",  # Google Workspace Business Plus
+    "Google-Vault",
+]
 
 
 class GoogleWorkspaceMixin:
@@ -16,16 +32,49 @@ class GoogleWorkspaceMixin:
 
     This mixin requires the base GoogleConnector class to provide:
     - get_admin_directory_service()
+    - get_licensing_service()
     - get_service()
     - logger
     """
 
+    def iter_users(
+        self,
+        domain: str | None = None,
+        max_results: int = 500,
+        subject: str | None = None,
+        fields: str | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate users from Google Workspace, one page at a time.
+
+        Args:
+            domain: Optional domain to filter users.
+            max_results: Maximum results per page. Defaults to 500.
+            subject: Email to impersonate for domain-wide delegation.
+            fields: Comma-separated user fields to return (e.g. 'primaryEmail,name').
+            prefetch: Fetch the next page while the current one is processed.
+
+        Returns:
+            Iterator of user dictionaries.
+        """
+        service = self.get_admin_directory_service(subject=subject)
+        return iter_items(
+            service.users().list,
+            "users",
+            fields=project_fields("users", fields),
+            prefetch=prefetch,
+            customer="my_customer",
+            maxResults=max_results,
+            domain=domain,
+        )
+
     def list_users(
         self,
         domain: str | None = None,
         max_results: int = 500,
         unhump_users: bool = False,
         subject: str | None = None,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """List users from Google Workspace.
 
@@ -34,33 +83,17 @@ class GoogleWorkspaceMixin:
             max_results: Maximum results per page. Defaults to 500.
             unhump_users: Convert keys to snake_case. Defaults to False.
             subject: Email to impersonate for domain-wide delegation.
+            fields: Comma-separated user fields to return (e.g. 'primaryEmail,name').
 
         Returns:
             List of user dictionaries.
         """
-        service = self.get_admin_directory_service(subject=subject)
-        users: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {"customer": "my_customer", "maxResults": max_results}
-            if domain:
-                params["domain"] = domain
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.users().list(**params).execute()
-            users.extend(response.get("users", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        users = [
+            unhump_map(u) if unhump_users else u
+            for u in self.iter_users(domain=domain, max_results=max_results, subject=subject, fields=fields)
+        ]
 
         self.logger.info(f"Retrieved {len(users)} users from Google Workspace")
-
-        if unhump_users:
-            users = [unhump_map(u) for u in users]
-
         return users
 
     def get_user(
@@ -174,12 +207,44 @@ class GoogleWorkspaceMixin:
         service.users().delete(userKey=user_key).execute()
         self.logger.info(f"Deleted user: {user_key}")
 
+    def iter_groups(
+        self,
+        domain: str | None = None,
+        max_results: int = 200,
+        subject: str | None = None,
+        fields: str | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate groups from Google Workspace, one page at a time.
+
+        Args:
+            domain: Optional domain to filter groups.
+            max_results: Maximum results per page. Defaults to 200.
+            subject: Email to impersonate for domain-wide delegation.
+            fields: Comma-separated group fields to return (e.g. 'email,name').
+            prefetch: Fetch the next page while the current one is processed.
+
+        Returns:
+            Iterator of group dictionaries.
+        """
+        service = self.get_admin_directory_service(subject=subject)
+        return iter_items(
+            service.groups().list,
+            "groups",
+            fields=project_fields("groups", fields),
+            prefetch=prefetch,
+            customer="my_customer",
+            maxResults=max_results,
+            domain=domain,
+        )
+
     def list_groups(
         self,
         domain: str | None = None,
         max_results: int = 200,
         unhump_groups: bool = False,
         subject: str | None = None,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """List groups from Google Workspace.
 
@@ -188,33 +253,17 @@ class GoogleWorkspaceMixin:
             max_results: Maximum results per page. Defaults to 200.
             unhump_groups: Convert keys to snake_case. Defaults to False.
             subject: Email to impersonate for domain-wide delegation.
+            fields: Comma-separated group fields to return (e.g. 'email,name').
 
         Returns:
             List of group dictionaries.
         """
-        service = self.get_admin_directory_service(subject=subject)
-        groups: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {"customer": "my_customer", "maxResults": max_results}
-            if domain:
-                params["domain"] = domain
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.groups().list(**params).execute()
-            groups.extend(response.get("groups", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        groups = [
+            unhump_map(g) if unhump_groups else g
+            for g in self.iter_groups(domain=domain, max_results=max_results, subject=subject, fields=fields)
+        ]
 
         self.logger.info(f"Retrieved {len(groups)} groups from Google Workspace")
-
-        if unhump_groups:
-            groups = [unhump_map(g) for g in groups]
-
         return groups
 
     def get_group(
@@ -288,12 +337,43 @@ class GoogleWorkspaceMixin:
         service.groups().delete(groupKey=group_key).execute()
         self.logger.info(f"Deleted group: {group_key}")
 
+    def iter_group_members(
+        self,
+        group_key: str,
+        roles: list[str] | None = None,
+        subject: str | None = None,
+        fields: str | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate members of a Google Workspace group, one page at a time.
+
+        Args:
+            group_key: Email or unique ID of the group.
+            roles: Filter by roles (OWNER, MANAGER, MEMBER). Defaults to all.
+            subject: Email to impersonate for domain-wide delegation.
+            fields: Comma-separated member fields to return (e.g. 'email,role').
+            prefetch: Fetch the next page while the current one is processed.
+
+        Returns:
+            Iterator of member dictionaries.
+        """
+        service = self.get_admin_directory_service(subject=subject)
+        return iter_items(
+            service.members().list,
+            "members",
+            fields=project_fields("members", fields),
+            prefetch=prefetch,
+            groupKey=group_key,
+            roles=",".join(roles) if roles else None,
+        )
+
     def list_group_members(
         self,
         group_key: str,
         roles: list[str] | None = None,
         unhump_members: bool = False,
         subject: str | None = None,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """List members of a Google Workspace group.
 
@@ -302,33 +382,17 @@ class GoogleWorkspaceMixin:
             roles: Filter by roles (OWNER, MANAGER, MEMBER). Defaults to all.
             unhump_members: Convert keys to snake_case. Defaults to False.
             subject: Email to impersonate for domain-wide delegation.
+            fields: Comma-separated member fields to return (e.g. 'email,role').
 
         Returns:
             List of member dictionaries.
         """
-        service = self.get_admin_directory_service(subject=subject)
-        members: list[dict[str, Any]] = []
-        page_token = None
-
-        while True:
-            params: dict[str, Any] = {"groupKey": group_key}
-            if roles:
-                params["roles"] = ",".join(roles)
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = service.members().list(**params).execute()
-            members.extend(response.get("members", []))
-
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        members = [
+            unhump_map(m) if unhump_members else m
+            for m in self.iter_group_members(group_key, roles=roles, subject=subject, fields=fields)
+        ]
 
         self.logger.info(f"Retrieved {len(members)} members from group {group_key}")
-
-        if unhump_members:
-            members = [unhump_map(m) for m in members]
-
         return members
 
     def add_group_member(
@@ -535,6 +599,87 @@ class GoogleWorkspaceMixin:
         self.logger.info(f"Created group: {email}")
         return result
 
+    def iter_license_assignments(
+        self,
+        customer_id: str = "my_customer",
+        product_id: str | None = None,
+        subject: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream Google Workspace license assignments across products.
+
+        All products are paged together: each round sends the next page of
+        every product that still has results as one batch request, and the
+        items are yielded as soon as the round completes. Products that return
+        404 are remembered per customer and skipped on later calls; a 403 only
+        skips the product for this call, since it may be transient or specific
+        to the impersonated subject.
+
+        Args:
+            customer_id: Customer ID. Defaults to 'my_customer'.
+            product_id: Filter by product (e.g., 'Google-Apps', 'Google-Vault').
+            subject: Email to impersonate for domain-wide delegation.
+
+        Yields:
+            License assignment dictionaries, tagged with their productId.
+        """
+        from googleapiclient.errors import HttpError
+
+        service = self.get_licensing_service(subject=subject)
+        unavailable = self._get_unavailable_license_products(customer_id)
+
+        product_ids = [product_id] if product_id else WORKSPACE_LICENSE_PRODUCT_IDS
+        pending: dict[str, str | None] = {prod_id: None for prod_id in product_ids if prod_id not in unavailable}
+
+        responses: dict[str, dict[str, Any]] = {}
+        errors: dict[str, Exception] = {}
+
+        def collect(request_id: str, response: dict[str, Any], exception: Exception | None) -> None:
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                responses[request_id] = response
+
+        while pending:
+            responses.clear()
+            errors.clear()
+
+            batch = service.new_batch_http_request(callback=collect)
+            for prod_id, page_token in pending.items():
+                params: dict[str, Any] = {
+                    "productId": prod_id,
+                    "customerId": customer_id,
+                }
+                if page_token:
+                    params["pageToken"] = page_token
+
+                batch.add(service.licenseAssignments().listForProduct(**params), request_id=prod_id)
+            batch.execute()
+
+            next_pending: dict[str, str | None] = {}
+            for prod_id in pending:
+                error = errors.get(prod_id)
+                if error is not None:
+                    if isinstance(error, HttpError) and error.resp.status == 404:
+                        # Product not available
+                        self.logger.debug(f"Product {prod_id} not available")
+                        unavailable.add(prod_id)
+                    elif isinstance(error, HttpError) and error.resp.status == 403:
+                        self.logger.debug(f"No access to product {prod_id}")
+                    else:
+                        self.logger.warning(f"Error listing licenses for {prod_id}: {error}")
+                    continue
+
+                response = responses.get(prod_id, {})
+                for item in response.get("items", []):
+                    item["productId"] = prod_id
+                    yield item
+
+                page_token = response.get("nextPageToken")
+                if page_token:
+                    next_pending[prod_id] = page_token
+
+            pending = next_pending
+
     def list_available_licenses(
         self,
         customer_id: str = "my_customer",
@@ -551,73 +696,26 @@ class GoogleWorkspaceMixin:
         Returns:
             List of license dictionaries.
         """
-        from googleapiclient.errors import HttpError
-
         self.logger.info("Listing available Google Workspace licenses")
 
-        # Get licensing service
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
-
-        credentials = service_account.Credentials.from_service_account_info(
-            self.service_account_info,
-            scopes=["https://www.googleapis.com/auth/apps.licensing"],
-        )
-
-        if subject:
-            credentials = credentials.with_subject(subject)
-
-        service = build("licensing", "v1", credentials=credentials, cache_discovery=False)
-
-        licenses: list[dict[str, Any]] = []
-
-        # Common product IDs to check
-        product_ids = (
-            [product_id]
-            if product_id
-            else [
-                "Google-Apps",
-                "101031",  # Google Workspace Enterprise Plus
-                "101034",  # Google Workspace Business Starter
-                "101037",  # Google Workspace Business Standard
-                "101038",  # Google Workspace Business Plus
-                "Google-Vault",
-            ]
+        licenses = list(
+            self.iter_license_assignments(
+                customer_id=customer_id,
+                product_id=product_id,
+                subject=subject,
+            )
         )
 
-        for prod_id in product_ids:
-            try:
-                page_token = None
-                while True:
-                    params: dict[str, Any] = {
-                        "productId": prod_id,
-                        "customerId": customer_id,
-                    }
-                    if page_token:
-                        params["pageToken"] = page_token
-
-                    response = service.licenseAssignments().listForProduct(**params).execute()
-
-                    for item in response.get("items", []):
-                        item["productId"] = prod_id
-                        licenses.append(item)
-
-                    page_token = response.get("nextPageToken")
-                    if not page_token:
-                        break
-
-            except HttpError as e:
-                if e.resp.status == 404:
-                    # Product not available
-                    self.logger.debug(f"Product {prod_id} not available")
-                elif e.resp.status == 403:
-                    self.logger.debug(f"No access to product {prod_id}")
-                else:
-                    self.logger.warning(f"Error listing licenses for {prod_id}: {e}")
-
         self.logger.info(f"Retrieved {len(licenses)} license assignments")
         return licenses
 
+    def _get_unavailable_license_products(self, customer_id: str) -> set[str]:
+        """Get the product IDs known to be unavailable for a customer."""
+        cache = getattr(self, "_unavailable_license_products", None)
+        if cache is None:
+            cache = self._unavailable_license_products = {}
+        return cache.setdefault(customer_id, set())
+
     def get_license_summary(
         self,
         customer_id: str = "my_customer",
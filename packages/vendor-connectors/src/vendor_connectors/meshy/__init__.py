@@ -37,7 +37,7 @@ Usage:
 
 from __future__ import annotations
 
-from vendor_connectors.meshy import animate, base, image3d, retexture, rigging, text3d
+from vendor_connectors.meshy import animate, base, image3d, poller, retexture, rigging, text3d
 from vendor_connectors.meshy.base import MeshyAPIError, RateLimitError
 from vendor_connectors.meshy.connector import MeshyConnector
 from vendor_connectors.meshy.tools import (
@@ -63,6 +63,7 @@ __all__ = [
     # Tools
     "get_tools",
     "image3d",
+    "poller",
     "retexture",
     "rigging",
     "text3d",
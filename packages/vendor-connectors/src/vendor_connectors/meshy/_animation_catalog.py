@@ -0,0 +1,725 @@
+"""Meshy animation catalog data - Auto-generated from API docs.
+
+Each row is (id, name, category, subcategory, preview file); the preview URL
+is PREVIEW_URL_PREFIX followed by the preview file. Loaded on first use by
+vendor_connectors.meshy.animations.
+"""
+
+from __future__ import annotations
+
+
+# This file is auto-generated by scripts/sync_animations.py
+# Do not edit manually - run the script to update.
+
+PREVIEW_URL_PREFIX = "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/"
+
+CATALOG: tuple[tuple[int, str, str, str, str], ...] = (
+    (0, "Idle", "DailyActions", "Idle", "Idle.gif"),
+    (1, "Walking_Woman", "WalkAndRun", "Walking", "Walking_Woman_woman.gif"),
+    (2, "Alert", "DailyActions", "LookingAround", "Alert.gif"),
+    (3, "Arise", "DailyActions", "LookingAround", "Arise.gif"),
+    (4, "Attack", "Fighting", "AttackingwithWeapon", "Attack.gif"),
+    (5, "BackLeft_run", "WalkAndRun", "Running", "BackLeft_run.gif"),
+    (6, "BackRight_Run", "WalkAndRun", "Running", "BackRight_Run.gif"),
+    (7, "BeHit_FlyUp", "Fighting", "GettingHit", "BeHit_FlyUp.gif"),
+    (8, "Dead", "Fighting", "Dying", "Dead.gif"),
+    (9, "ForwardLeft_Run_Fight", "Fighting", "Transitioning", "ForwardLeft_Run_Fight.gif"),
+    (10, "ForwardRight_Run_Fight", "Fighting", "Transitioning", "ForwardRight_Run_Fight.gif"),
+    (11, "Idle_02", "DailyActions", "Idle", "Idle_02.gif"),
+    (12, "Idle_03", "DailyActions", "Idle", "Idle_03.gif"),
+    (13, "Jump_Run", "WalkAndRun", "Running", "Jump_Run.gif"),
+    (14, "Run_02", "WalkAndRun", "Running", "Run_02.gif"),
+    (15, "Run_03", "WalkAndRun", "Running", "Run_03.gif"),
+    (16, "RunFast", "WalkAndRun", "Running", "RunFast.gif"),
+    (17, "Skill_01", "BodyMovements", "Acting", "Skill_01.gif"),
+    (18, "Skill_02", "BodyMovements", "Acting", "Skill_02.gif"),
+    (19, "Skill_03", "BodyMovements", "Acting", "Skill_03.gif"),
+    (20, "Walk_Fight_Back", "WalkAndRun", "Walking", "Walk_Fight_Back.gif"),
+    (21, "Walk_Fight_Forward", "WalkAndRun", "Walking", "Walk_Fight_Forward.gif"),
+    (22, "FunnyDancing_01", "Dancing", "Dancing", "FunnyDancing_01.gif"),
+    (23, "FunnyDancing_02", "Dancing", "Dancing", "FunnyDancing_02.gif"),
+    (24, "FunnyDancing_03", "Dancing", "Dancing", "FunnyDancing_03.gif"),
+    (25, "Agree_Gesture", "DailyActions", "Interacting", "Agree_Gesture.gif"),
+    (26, "Angry_Stomp", "DailyActions", "Interacting", "Angry_Stomp.gif"),
+    (27, "Big_Heart_Gesture", "BodyMovements", "Acting", "Big_Heart_Gesture.gif"),
+    (28, "Big_Wave_Hello", "DailyActions", "Interacting", "Big_Wave_Hello.gif"),
+    (29, "Call_Gesture", "BodyMovements", "Acting", "Call_Gesture.gif"),
+    (30, "Casual_Walk", "WalkAndRun", "Walking", "Casual_Walk.gif"),
+    (31, "Catching_Breath", "BodyMovements", "Acting", "Catching_Breath.gif"),
+    (32, "Chair_Sit_Idle_F", "DailyActions", "Idle", "Chair_Sit_Idle_F.gif"),
+    (33, "Chair_Sit_Idle_M", "DailyActions", "Idle", "Chair_Sit_Idle_M.gif"),
+    (34, "Checkout_Gesture", "DailyActions", "Interacting", "Checkout_Gesture.gif"),
+    (35, "Clapping_Run", "BodyMovements", "Acting", "Clapping_Run.gif"),
+    (36, "Confused_Scratch", "DailyActions", "Idle", "Confused_Scratch.gif"),
+    (37, "Discuss_While_Moving", "DailyActions", "Interacting", "Discuss_While_Moving.gif"),
+    (38, "Dozing_Elderly", "DailyActions", "Idle", "Dozing_Elderly.gif"),
+    (39, "Excited_Walk_F", "BodyMovements", "Acting", "Excited_Walk_F.gif"),
+    (40, "Excited_Walk_M", "BodyMovements", "Acting", "Excited_Walk_M.gif"),
+    (41, "Formal_Bow", "DailyActions", "Interacting", "Formal_Bow.gif"),
+    (42, "Gentlemans_Bow", "DailyActions", "Interacting", "Gentleman%E2%80%99s_Bow.gif"),
+    (43, "Handbag_Walk", "BodyMovements", "Acting", "Handbag_Walk.gif"),
+    (44, "Happy_jump_f", "BodyMovements", "Acting", "Happy_Jump_F.gif"),
+    (45, "Indoor_Play", "BodyMovements", "Acting", "Indoor_Play.gif"),
+    (46, "Jump_Rope", "BodyMovements", "Acting", "Jump_Rope.gif"),
+    (47, "Listening_Gesture", "DailyActions", "Interacting", "Listening_Gesture.gif"),
+    (48, "Mirror_Viewing", "DailyActions", "Idle", "Mirror_Viewing.gif"),
+    (49, "Motivational_Cheer", "DailyActions", "Interacting", "Motivational_Cheer.gif"),
+    (50, "Phone_Call_Gesture", "DailyActions", "Interacting", "Phone_Call_Gesture.gif"),
+    (51, "Shouting_Angrily", "BodyMovements", "Acting", "Shouting_Angrily.gif"),
+    (52, "Sit_to_Stand_Transition_F", "DailyActions", "Transitioning", "Sit_to_Stand_Transition_F.gif"),
+    (53, "Sit_to_Stand_Transition_M", "DailyActions", "Transitioning", "Sit_to_Stand_Transition_M.gif"),
+    (54, "Squat_Stance", "Dancing", "Dancing", "Squat_Stance.gif"),
+    (55, "Stage_Walk", "WalkAndRun", "Walking", "Stage_Walk.gif"),
+    (56, "Stand_and_Chat", "DailyActions", "Interacting", "Stand_and_Chat.gif"),
+    (57, "Stand_to_Sit_Transition_M", "DailyActions", "Transitioning", "Stand_to_Sit_Transition_M.gif"),
+    (58, "Step_to_Sit_Transition", "DailyActions", "Transitioning", "Step_to_Sit_Transition.gif"),
+    (59, "Victory_Cheer", "BodyMovements", "Acting", "Victory_Cheer.gif"),
+    (60, "Walk_to_Sit", "DailyActions", "Transitioning", "Walk_to_Sit.gif"),
+    (61, "happy_jump_m", "BodyMovements", "Acting", "Happy_Jump_M.gif"),
+    (62, "penguin_walk", "BodyMovements", "Acting", "Penguin_walk.gif"),
+    (63, "Arm_Circle_Shuffle", "Dancing", "Dancing", "Arm_Circle_Shuffle.gif"),
+    (64, "All_Night_Dance", "Dancing", "Dancing", "All_Night_Dance.gif"),
+    (65, "Bass_Beats", "Dancing", "Dancing", "Bass_Beats.gif"),
+    (66, "Boom_Dance", "Dancing", "Dancing", "Boom_Dance.gif"),
+    (67, "Bubble_Dance", "Dancing", "Dancing", "Bubble_Dance.gif"),
+    (68, "Cherish_Pop_Dance", "Dancing", "Dancing", "Cherish_Pop_Dance.gif"),
+    (69, "Crystal_Beads", "Dancing", "Dancing", "Crystal_Beads.gif"),
+    (70, "Cardio_Dance", "Dancing", "Dancing", "Cardio_Dance.gif"),
+    (71, "Denim_Pop_Dance", "Dancing", "Dancing", "Denim_Pop_Dance.gif"),
+    (72, "Dont_You_Dare", "Dancing", "Dancing", "Dont_You_Dare.gif"),
+    (73, "Fast_Lightning", "Dancing", "Dancing", "Fast_Lightning.gif"),
+    (74, "Gangnam_Groove", "Dancing", "Dancing", "Gangnam_Groove.gif"),
+    (75, "Indoor_Swing", "Dancing", "Dancing", "Indoor_Swing.gif"),
+    (76, "Love_You_Pop_Dance", "Dancing", "Dancing", "Love_You_Pop_Dance.gif"),
+    (77, "Magic_Genie", "Dancing", "Dancing", "Magic_Genie.gif"),
+    (78, "Not_Your_Mom", "Dancing", "Dancing", "Not_Your_Mom.gif"),
+    (79, "OMG_Groove", "Dancing", "Dancing", "OMG_Groove.gif"),
+    (80, "Pop_Dance_LSA2", "Dancing", "Dancing", "Pop_Dance_LSA2.gif"),
+    (81, "Pod_Baby_Groove", "Dancing", "Dancing", "Pod_Baby_Groove.gif"),
+    (82, "Shake_It_Off_Dance", "Dancing", "Dancing", "Shake_It_Off_Dance.gif"),
+    (83, "Superlove_Pop_Dance", "Dancing", "Dancing", "Superlove_Pop_Dance.gif"),
+    (84, "You_Groove", "Dancing", "Dancing", "You_Groove.gif"),
+    (85, "Axe_Stance", "Fighting", "Transitioning", "Axe_Stance.gif"),
+    (86, "Basic_Jump", "Fighting", "AttackingwithWeapon", "Basic_Jump.gif"),
+    (87, "Boxing_Practice", "Fighting", "Punching", "Boxing_Practice.gif"),
+    (88, "Chest_Pound_Taunt", "Fighting", "Transitioning", "Chest_Pound_Taunt.gif"),
+    (89, "Combat_Stance", "Fighting", "AttackingwithWeapon", "Combat_Stance.gif"),
+    (90, "Counterstrike", "Fighting", "Punching", "Counterstrike.gif"),
+    (91, "Double_Blade_Spin", "Fighting", "AttackingwithWeapon", "Double_Blade_Spin.gif"),
+    (92, "Double_Combo_Attack", "Fighting", "AttackingwithWeapon", "Double_Combo_Attack.gif"),
+    (93, "Dodge_and_Counter", "Fighting", "Punching", "Dodge_and_Counter.gif"),
+    (94, "Flying_Fist_Kick", "Fighting", "Punching", "Flying_Fist_Kick.gif"),
+    (95, "Gun_Hold_Left_Turn", "Fighting", "AttackingwithWeapon", "Gun_Hold_Left_Turn.gif"),
+    (96, "Kung_Fu_Punch", "Fighting", "Punching", "Kung_Fu_Punch.gif"),
+    (97, "Left_Slash", "Fighting", "AttackingwithWeapon", "Left_Slash.gif"),
+    (98, "Run_and_Shoot", "Fighting", "AttackingwithWeapon", "Run_and_Shoot.gif"),
+    (99, "Reaping_Swing", "Fighting", "Transitioning", "Reaping_Swing.gif"),
+    (100, "Rightward_Spin", "Fighting", "Transitioning", "Rightward_Spin.gif"),
+    (101, "Sword_Shout", "BodyMovements", "Acting", "Sword_Shout.gif"),
+    (102, "Sword_Judgment", "Fighting", "AttackingwithWeapon", "Sword_Judgment.gif"),
+    (103, "Simple_Kick", "Fighting", "AttackingwithWeapon", "Simple_Kick.gif"),
+    (104, "Side_Shot", "Fighting", "AttackingwithWeapon", "Side_Shot.gif"),
+    (105, "Triple_Combo_Attack", "Fighting", "AttackingwithWeapon", "Triple_Combo_Attack.gif"),
+    (106, "Confident_Walk", "WalkAndRun", "Walking", "Confident_Walk.gif"),
+    (107, "Confident_Strut", "WalkAndRun", "Walking", "Confident_Strut.gif"),
+    (108, "Flirty_Strut", "WalkAndRun", "Walking", "Flirty_Strut.gif"),
+    (109, "Groovy_Walk", "BodyMovements", "Acting", "Groovy_Walk.gif"),
+    (110, "Hello_Run", "WalkAndRun", "Running", "Hello_Run.gif"),
+    (111, "Injured_Walk", "WalkAndRun", "Walking", "Injured_Walk.gif"),
+    (112, "Monster_Walk", "WalkAndRun", "Walking", "Monster_Walk.gif"),
+    (113, "Mummy_Stagger", "BodyMovements", "Acting", "Mummy_Stagger.gif"),
+    (114, "Proud_Strut", "WalkAndRun", "Walking", "Proud_Strut.gif"),
+    (115, "Quick_Walk", "WalkAndRun", "Walking", "Quick_Walk.gif"),
+    (116, "Run_to_Walk_Transition", "WalkAndRun", "Walking", "Run_to_Walk_Transition.gif"),
+    (117, "Red_Carpet_Walk", "WalkAndRun", "Walking", "Red_Carpet_Walk.gif"),
+    (118, "Skip_Forward", "WalkAndRun", "Walking", "Skip_Forward.gif"),
+    (119, "Slow_Orc_Walk", "WalkAndRun", "Walking", "Slow_Orc_Walk.gif"),
+    (120, "Touch_and_Run", "WalkAndRun", "Running", "Touch_and_Run.gif"),
+    (121, "Thoughtful_Walk", "WalkAndRun", "Walking", "Thoughtful_Walk.gif"),
+    (122, "Texting_Walk", "WalkAndRun", "Walking", "Texting_Walk.gif"),
+    (123, "Unsteady_Walk", "WalkAndRun", "Walking", "Unsteady_Walk.gif"),
+    (124, "Walking_with_Phone", "WalkAndRun", "Walking", "Walking_with_Phone.gif"),
+    (125, "Charged_Spell_Cast", "Fighting", "CastingSpell", "Charged_Spell_Cast.gif"),
+    (126, "Charged_Spell_Cast_1", "Fighting", "CastingSpell", "Charged_Spell_Cast_1.gif"),
+    (127, "Charged_Ground_Slam", "Fighting", "CastingSpell", "Charged_Ground_Slam.gif"),
+    (128, "Heavy_Hammer_Swing", "Fighting", "AttackingwithWeapon", "Heavy_Hammer_Swing.gif"),
+    (129, "mage_soell_cast", "Fighting", "CastingSpell", "mage_soell_cast.gif"),
+    (130, "mage_soell_cast_1", "Fighting", "CastingSpell", "mage_soell_cast_1.gif"),
+    (131, "mage_soell_cast_2", "Fighting", "CastingSpell", "mage_soell_cast_2.gif"),
+    (132, "mage_soell_cast_3", "Fighting", "CastingSpell", "mage_soell_cast_3.gif"),
+    (133, "mage_soell_cast_4", "Fighting", "CastingSpell", "mage_soell_cast_4.gif"),
+    (134, "mage_soell_cast_5", "Fighting", "CastingSpell", "mage_soell_cast_5.gif"),
+    (135, "mage_soell_cast_6", "Fighting", "CastingSpell", "mage_soell_cast_6.gif"),
+    (136, "mage_soell_cast_7", "Fighting", "CastingSpell", "mage_soell_cast_7.gif"),
+    (137, "mage_soell_cast_8", "Fighting", "CastingSpell", "mage_soell_cast_8.gif"),
+    (138, "Block1", "Fighting", "Blocking", "Block1.gif"),
+    (139, "Block2", "Fighting", "Blocking", "Block2.gif"),
+    (140, "Block3", "Fighting", "Blocking", "Block3.gif"),
+    (141, "Block4", "Fighting", "Blocking", "Block4.gif"),
+    (142, "Block5", "Fighting", "Blocking", "Block5.gif"),
+    (143, "Block6", "Fighting", "Blocking", "Block6.gif"),
+    (144, "Block8", "Fighting", "Blocking", "Block8.gif"),
+    (145, "Block9", "Fighting", "Blocking", "Block9.gif"),
+    (146, "Block10", "Fighting", "Blocking", "Block10.gif"),
+    (147, "Sword_Parry", "Fighting", "Blocking", "Sword_Parry.gif"),
+    (148, "Sword_Parry_Backward", "Fighting", "Blocking", "Sword_Parry_Backward.gif"),
+    (149, "Two_Handed_Parry", "Fighting", "Blocking", "Two_Handed_Parry.gif"),
+    (150, "Hit_Reaction_with_Bow", "Fighting", "Blocking", "Hit_Reaction_with_Bow.gif"),
+    (151, "Sword_Parry_Backward_1", "Fighting", "Blocking", "Sword_Parry_Backward_1.gif"),
+    (152, "Sword_Parry_Backward_2", "Fighting", "Blocking", "Sword_Parry_Backward_2.gif"),
+    (153, "Sword_Parry_Backward_3", "Fighting", "Blocking", "Sword_Parry_Backward_3.gif"),
+    (154, "Sword_Parry_Backward_4", "Fighting", "Blocking", "Sword_Parry_Backward_4.gif"),
+    (155, "Sword_Parry_Backward_5", "Fighting", "Blocking", "Sword_Parry_Backward_5.gif"),
+    (156, "Stand_Dodge", "Fighting", "Transitioning", "Stand_Dodge.gif"),
+    (157, "Stand_Dodge_1", "Fighting", "Transitioning", "Stand_Dodge_1.gif"),
+    (158, "Roll_Dodge", "Fighting", "Transitioning", "Roll_Dodge.gif"),
+    (159, "Roll_Dodge_1", "Fighting", "Transitioning", "Roll_Dodge_1.gif"),
+    (160, "Roll_Dodge_2", "Fighting", "Transitioning", "Roll_Dodge_2.gif"),
+    (161, "Roll_Dodge_3", "Fighting", "Transitioning", "Roll_Dodge_3.gif"),
+    (162, "Stand_Dodge_2", "Fighting", "Transitioning", "Stand_Dodge_2.gif"),
+    (163, "Roll_Dodge_4", "Fighting", "Transitioning", "Roll_Dodge_4.gif"),
+    (164, "Stand_Dodge_3", "Fighting", "Transitioning", "Stand_Dodge_3.gif"),
+    (165, "Kneeling_Reload", "Fighting", "Transitioning", "Kneeling_Reload.gif"),
+    (166, "Running_Reload", "Fighting", "Transitioning", "Running_Reload.gif"),
+    (167, "Slow_Walk_Reload", "Fighting", "Transitioning", "Slow_Walk_Reload.gif"),
+    (168, "Prone_Reload", "Fighting", "Transitioning", "Prone_Reload.gif"),
+    (169, "Forward_Reload_Subtle", "Fighting", "Transitioning", "Forward_Reload_Subtle.gif"),
+    (170, "Standing_Reload", "Fighting", "Transitioning", "Standing_Reload.gif"),
+    (171, "Hit_Reaction_to_Waist", "Fighting", "Transitioning", "Hit_Reaction_to_Waist.gif"),
+    (172, "Electrocution_Reaction", "Fighting", "GettingHit", "Electrocution_Reaction.gif"),
+    (173, "Slap_Reaction", "Fighting", "GettingHit", "Slap_Reaction.gif"),
+    (174, "Face_Punch_Reaction", "Fighting", "GettingHit", "Face_Punch_Reaction.gif"),
+    (175, "Face_Punch_Reaction_1", "Fighting", "GettingHit", "Face_Punch_Reaction_1.gif"),
+    (176, "Face_Punch_Reaction_2", "Fighting", "GettingHit", "Face_Punch_Reaction_2.gif"),
+    (177, "Gunshot_Reaction", "Fighting", "GettingHit", "Gunshot_Reaction.gif"),
+    (178, "Hit_Reaction", "Fighting", "GettingHit", "Hit_Reaction.gif"),
+    (179, "Hit_Reaction_1", "Fighting", "GettingHit", "Hit_Reaction_1.gif"),
+    (180, "Shot_in_the_Back_and_Fall", "Fighting", "GettingHit", "Shot_in_the_Back_and_Fall.gif"),
+    (181, "Electrocuted_Fall", "Fighting", "Dying", "Electrocuted_Fall.gif"),
+    (182, "Shot_and_Blown_Back", "Fighting", "Dying", "Shot_and_Blown_Back.gif"),
+    (183, "Shot_and_Fall_Backward", "Fighting", "Dying", "Shot_and_Fall_Backward.gif"),
+    (184, "Shot_and_Fall_Forward", "Fighting", "Dying", "Shot_and_Fall_Forward.gif"),
+    (185, "Shot_and_Slow_Fall_Backward", "Fighting", "Dying", "Shot_and_Slow_Fall_Backward.gif"),
+    (186, "Strangled_and_Fall_Forward", "Fighting", "Dying", "Strangled_and_Fall_Forward.gif"),
+    (187, "Knock_Down", "Fighting", "Dying", "Knock_Down.gif"),
+    (188, "Fall_Dead_from_Abdominal_Injury", "Fighting", "Dying", "Fall_Dead_from_Abdominal_Injury.gif"),
+    (189, "dying_backwards", "Fighting", "Dying", "dying_backwards.gif"),
+    (190, "Knock_Down_1", "Fighting", "Dying", "Knock_Down_1.gif"),
+    (191, "Left_Jab_from_Guard", "Fighting", "Punching", "Left_Jab_from_Guard.gif"),
+    (192, "Right_Jab_from_Guard", "Fighting", "Punching", "Right_Jab_from_Guard.gif"),
+    (193, "Left_Hook_from_Guard", "Fighting", "Punching", "Left_Hook_from_Guard.gif"),
+    (194, "Right_Uppercut_from_Guard", "Fighting", "Punching", "Right_Uppercut_from_Guard.gif"),
+    (195, "Right_Upper_Hook_from_Guard", "Fighting", "Punching", "Right_Upper_Hook_from_Guard.gif"),
+    (196, "Left_Uppercut_from_Guard", "Fighting", "Punching", "Left_Uppercut_from_Guard.gif"),
+    (197, "Left_Short_Hook_from_Guard", "Fighting", "Punching", "Left_Short_Hook_from_Guard.gif"),
+    (198, "Punch_Combo", "Fighting", "Punching", "Punch_Combo.gif"),
+    (199, "Weapon_Combo", "Fighting", "Punching", "Weapon_Combo.gif"),
+    (200, "Punch_Combo_1", "Fighting", "Punching", "Punch_Combo_1.gif"),
+    (201, "Punch_Combo_2", "Fighting", "Punching", "Punch_Combo_2.gif"),
+    (202, "Weapon_Combo_1", "Fighting", "Punching", "Weapon_Combo_1.gif"),
+    (203, "Punch_Combo_3", "Fighting", "Punching", "Punch_Combo_3.gif"),
+    (204, "Punch_Combo_4", "Fighting", "Punching", "Punch_Combo_4.gif"),
+    (205, "Punch_Combo_5", "Fighting", "Punching", "Punch_Combo_5.gif"),
+    (206, "Spartan_Kick", "Fighting", "Punching", "Spartan_Kick.gif"),
+    (207, "Roundhouse_Kick", "Fighting", "Punching", "Roundhouse_Kick.gif"),
+    (208, "Lunge_Roundhouse_Kick", "Fighting", "Punching", "Lunge_Roundhouse_Kick.gif"),
+    (209, "Boxing_Guard_Right_Straight_Kick", "Fighting", "Punching", "Boxing_Guard_Right_Straight_Kick.gif"),
+    (210, "Boxing_Guard_Prep_Straight_Punch", "Fighting", "Punching", "Boxing_Guard_Prep_Straight_Punch.gif"),
+    (211, "Boxing_Guard_Step_Knee_Strike", "Fighting", "Punching", "Boxing_Guard_Step_Knee_Strike.gif"),
+    (212, "Elbow_Strike", "Fighting", "Punching", "Elbow_Strike.gif"),
+    (213, "Leg_Sweep", "Fighting", "Punching", "Leg_Sweep.gif"),
+    (214, "Punch_Forward_with_Both_Fists", "Fighting", "Punching", "Punch_Forward_with_Both_Fists.gif"),
+    (215, "High_Kick", "Fighting", "Punching", "High_Kick.gif"),
+    (216, "Lunge_Spin_Kick", "Fighting", "Punching", "Lunge_Spin_Kick.gif"),
+    (217, "Sweeping_Kick", "Fighting", "Punching", "Sweeping_Kick.gif"),
+    (218, "Step_in_High_Kick", "Fighting", "Punching", "Step_in_High_Kick.gif"),
+    (219, "Right_Hand_Sword_Slash", "Fighting", "Punching", "Right_Hand_Sword_Slash.gif"),
+    (220, "Shield_Push_Left", "Fighting", "Punching", "Shield_Push_Left.gif"),
+    (221, "Charged_Upward_Slash", "Fighting", "Punching", "Charged_Upward_Slash.gif"),
+    (222, "Draw_and_Shoot_from_Back", "Fighting", "AttackingwithWeapon", "Draw_and_Shoot_from_Back.gif"),
+    (223, "Draw_and_Shoot_from_Back_1", "Fighting", "AttackingwithWeapon", "Draw_and_Shoot_from_Back_1.gif"),
+    (224, "Archery_Shot", "Fighting", "AttackingwithWeapon", "Archery_Shot.gif"),
+    (225, "Archery_Shot_1", "Fighting", "AttackingwithWeapon", "Archery_Shot_1.gif"),
+    (226, "Archery_Shot_2", "Fighting", "AttackingwithWeapon", "Archery_Shot_2.gif"),
+    (227, "Archery_Shot_3", "Fighting", "AttackingwithWeapon", "Archery_Shot_3.gif"),
+    (228, "Walk_Forward_with_Bow_Aimed", "Fighting", "AttackingwithWeapon", "Walk_Forward_with_Bow_Aimed.gif"),
+    (229, "Draw_and_Shoot_from_Back_2", "Fighting", "AttackingwithWeapon", "Draw_and_Shoot_from_Back_2.gif"),
+    (230, "Walk_Backward_with_Bow_Aimed", "Fighting", "AttackingwithWeapon", "Walk_Backward_with_Bow_Aimed.gif"),
+    (231, "Archery_Aim_with_Lateral_Scan", "Fighting", "AttackingwithWeapon", "Archery_Aim_with_Lateral_Scan.gif"),
+    (232, "Cowboy_Quick_Draw_Shooting", "Fighting", "AttackingwithWeapon", "Cowboy_Quick_Draw_Shooting.gif"),
+    (233, "Walk_Backward_While_Shooting", "Fighting", "AttackingwithWeapon", "Walk_Backward_While_Shooting.gif"),
+    (234, "Walk_Forward_While_Shooting", "Fighting", "AttackingwithWeapon", "Walk_Forward_While_Shooting.gif"),
+    (235, "Forward_Roll_and_Fire", "Fighting", "AttackingwithWeapon", "Forward_Roll_and_Fire.gif"),
+    (236, "Draw_and_Shoot_Left", "Fighting", "AttackingwithWeapon", "Draw_and_Shoot_Left.gif"),
+    (237, "Charged_Axe_Chop", "Fighting", "AttackingwithWeapon", "Charged_Axe_Chop.gif"),
+    (238, "Axe_Spin_Attack", "Fighting", "AttackingwithWeapon", "Axe_Spin_Attack.gif"),
+    (239, "Crouch_Pull_and_Throw", "Fighting", "AttackingwithWeapon", "Crouch_Pull_and_Throw.gif"),
+    (240, "Thrust_Slash", "Fighting", "AttackingwithWeapon", "Thrust_Slash.gif"),
+    (241, "Weapon_Combo_2", "Fighting", "AttackingwithWeapon", "Weapon_Combo_2.gif"),
+    (242, "Charged_Slash", "Fighting", "AttackingwithWeapon", "Charged_Slash.gif"),
+    (243, "Idle_3", "DailyActions", "Idle", "Idle_3.gif"),
+    (244, "Idle_4", "DailyActions", "Idle", "Idle_4.gif"),
+    (245, "Idle_5", "DailyActions", "Idle", "Idle_5.gif"),
+    (246, "Idle_6", "DailyActions", "Idle", "Idle_6.gif"),
+    (247, "Idle_7", "DailyActions", "Idle", "Idle_7.gif"),
+    (248, "Idle_8", "DailyActions", "Idle", "Idle_8.gif"),
+    (249, "Idle_9", "DailyActions", "Idle", "Idle_9.gif"),
+    (250, "Idle_10", "DailyActions", "Idle", "Idle_10.gif"),
+    (251, "Idle_11", "DailyActions", "Idle", "Idle_11.gif"),
+    (252, "Idle_12", "DailyActions", "Idle", "Idle_12.gif"),
+    (253, "Idle_13", "DailyActions", "Idle", "Idle_13.gif"),
+    (254, "Idle_14", "DailyActions", "Idle", "Idle_14.gif"),
+    (255, "Angry_Ground_Stomp", "DailyActions", "Idle", "Angry_Ground_Stomp.gif"),
+    (256, "Angry_Ground_Stomp_1", "DailyActions", "Idle", "Angry_Ground_Stomp_1.gif"),
+    (257, "Angry_Ground_Stomp_2", "DailyActions", "Idle", "Angry_Ground_Stomp_2.gif"),
+    (258, "CrouchLookAroundBow", "DailyActions", "Idle", "CrouchLookAroundBow.gif"),
+    (259, "Step_Forward_and_Push", "DailyActions", "Pushing", "Step_Forward_and_Push.gif"),
+    (260, "Push_Forward_and_Stop", "DailyActions", "Pushing", "Push_Forward_and_Stop.gif"),
+    (261, "Push_and_Walk_Forward", "DailyActions", "Pushing", "Push_and_Walk_Forward.gif"),
+    (262, "Crouch_and_Push_Forward", "DailyActions", "Pushing", "Crouch_and_Push_Forward.gif"),
+    (263, "Sleep_on_Desk", "DailyActions", "Sleeping", "Sleep_on_Desk.gif"),
+    (264, "Cough_While_Sleeping", "DailyActions", "Sleeping", "Cough_While_Sleeping.gif"),
+    (265, "Groan_Holding_Stomach_in_Sleep", "DailyActions", "Sleeping", "Groan_Holding_Stomach_in_Sleep.gif"),
+    (266, "Lie_Down_Hands_Spread", "DailyActions", "Sleeping", "Lie_Down_Hands_Spread.gif"),
+    (267, "Sleep_Normally", "DailyActions", "Sleeping", "Sleep_Normally.gif"),
+    (268, "Sit_and_Doze_Off", "DailyActions", "Sleeping", "Sit_and_Doze_Off.gif"),
+    (269, "sleep", "DailyActions", "Sleeping", "sleep.gif"),
+    (270, "Toss_and_Turn", "DailyActions", "Sleeping", "Toss_and_Turn.gif"),
+    (271, "Wake_Up_and_Look_Up", "DailyActions", "Sleeping", "Wake_Up_and_Look_Up.gif"),
+    (272, "Lie_on_Chair_Sunbathe_and_Sleep", "DailyActions", "Sleeping", "Lie_on_Chair_Sunbathe_and_Sleep.gif"),
+    (273, "Male_Run_Forward_Pick_Up_Left", "DailyActions", "PickingUpItem", "Male_Run_Forward_Pick_Up_Left.gif"),
+    (274, "Female_Crouch_Pick_Up_Place_Side", "DailyActions", "PickingUpItem", "Female_Crouch_Pick_Up_Place_Side.gif"),
+    (275, "Female_Run_Forward_Pick_Up_Right", "DailyActions", "PickingUpItem", "Female_Run_Forward_Pick_Up_Right.gif"),
+    (276, "Male_Bend_Over_Pick_Up", "DailyActions", "PickingUpItem", "Male_Bend_Over_Pick_Up.gif"),
+    (
+        277,
+        "Female_Crouch_Pick_Fruit_Basket_Stand",
+        "DailyActions",
+        "PickingUpItem",
+        "Female_Crouch_Pick_Fruit_Basket_Stand.gif",
+    ),
+    (278, "Female_Stand_Pick_Fruit_Basket", "DailyActions", "PickingUpItem", "Female_Stand_Pick_Fruit_Basket.gif"),
+    (
+        279,
+        "Female_Crouch_Pick_Gun_Point_Forward",
+        "DailyActions",
+        "PickingUpItem",
+        "Female_Crouch_Pick_Gun_Point_Forward.gif",
+    ),
+    (280, "Female_Crouch_Pick_Throw_Forward", "DailyActions", "PickingUpItem", "Female_Crouch_Pick_Throw_Forward.gif"),
+    (281, "Female_Bend_Over_Pick_Up_Inspect", "DailyActions", "PickingUpItem", "Female_Bend_Over_Pick_Up_Inspect.gif"),
+    (282, "Female_Walk_Pick_Put_In_Pocket", "DailyActions", "PickingUpItem", "Female_Walk_Pick_Put_In_Pocket.gif"),
+    (283, "Pull_Radish", "DailyActions", "PickingUpItem", "Pull_Radish.gif"),
+    (284, "Collect_Object", "DailyActions", "PickingUpItem", "Collect_Object.gif"),
+    (285, "open_door", "DailyActions", "Interacting", "open_door.gif"),
+    (286, "open_door_1", "DailyActions", "Interacting", "open_door_1.gif"),
+    (287, "open_door_2", "DailyActions", "Interacting", "open_door_2.gif"),
+    (288, "open_door_3", "DailyActions", "Interacting", "open_door_3.gif"),
+    (289, "open_door_4", "DailyActions", "Interacting", "open_door_4.gif"),
+    (290, "Wave_One_Hand", "DailyActions", "Interacting", "Wave_One_Hand.gif"),
+    (291, "Wave_for_Help", "DailyActions", "Interacting", "Wave_for_Help.gif"),
+    (292, "Gesture_with_Hand_on_Gun", "DailyActions", "Interacting", "Gesture_with_Hand_on_Gun.gif"),
+    (293, "Wave_for_Help_1", "DailyActions", "Interacting", "Wave_for_Help_1.gif"),
+    (294, "Wave_for_Help_2", "DailyActions", "Interacting", "Wave_for_Help_2.gif"),
+    (295, "Wave_for_Help_3", "DailyActions", "Interacting", "Wave_for_Help_3.gif"),
+    (296, "Wave_for_Help_4", "DailyActions", "Interacting", "Wave_for_Help_4.gif"),
+    (297, "Personalized_Gesture", "DailyActions", "Interacting", "Personalized_Gesture.gif"),
+    (298, "Cheer_with_Both_Hands_Up", "DailyActions", "Interacting", "Cheer_with_Both_Hands_Up.gif"),
+    (299, "Stand_Clap_and_Sit_Down", "DailyActions", "Interacting", "Stand_Clap_and_Sit_Down.gif"),
+    (300, "Sit_Cheer_with_Left_Hand", "DailyActions", "Interacting", "Sit_Cheer_with_Left_Hand.gif"),
+    (301, "Cheer_with_Both_Hands_1", "DailyActions", "Interacting", "Cheer_with_Both_Hands_1.gif"),
+    (302, "Stand_Wave_and_Sit_Down", "DailyActions", "Interacting", "Stand_Wave_and_Sit_Down.gif"),
+    (303, "Cheer_with_Both_Hands", "DailyActions", "Interacting", "Cheer_with_Both_Hands.gif"),
+    (304, "Seated_Fist_Pump", "DailyActions", "Interacting", "Seated_Fist_Pump.gif"),
+    (305, "Stand_Cheer_and_Sit_Down", "DailyActions", "Interacting", "Stand_Cheer_and_Sit_Down.gif"),
+    (306, "Cheer_with_One_Hand_Up", "DailyActions", "Interacting", "Cheer_with_One_Hand_Up.gif"),
+    (307, "Sitting_Answering_Questions", "DailyActions", "Interacting", "Sitting_Answering_Questions.gif"),
+    (308, "Talk_Passionately", "DailyActions", "Interacting", "Talk_Passionately.gif"),
+    (309, "Talk_with_Left_Hand_on_Hip", "DailyActions", "Interacting", "Talk_with_Left_Hand_on_Hip.gif"),
+    (310, "Talk_with_Left_Hand_Raised", "DailyActions", "Interacting", "Talk_with_Left_Hand_Raised.gif"),
+    (311, "Stand_Talking_Angry", "DailyActions", "Interacting", "Stand_Talking_Angry.gif"),
+    (312, "Phone_Conversation", "DailyActions", "Interacting", "Phone_Conversation.gif"),
+    (313, "Talk_with_Hands_Open", "DailyActions", "Interacting", "Talk_with_Hands_Open.gif"),
+    (314, "Talk_with_Right_Hand_Open", "DailyActions", "Interacting", "Talk_with_Right_Hand_Open.gif"),
+    (315, "Hand_on_Hip_Gesture", "DailyActions", "Interacting", "Hand_on_Hip_Gesture.gif"),
+    (316, "Headache_Relief", "DailyActions", "Interacting", "Headache_Relief.gif"),
+    (317, "Shrug", "DailyActions", "Interacting", "Shrug.gif"),
+    (318, "Scheming_Hand_Rub", "DailyActions", "Interacting", "Scheming_Hand_Rub.gif"),
+    (319, "air_squat", "DailyActions", "WorkingOut", "air_squat.gif"),
+    (320, "bicep_curl", "DailyActions", "WorkingOut", "bicep_curl.gif"),
+    (321, "bicycle_crunch", "DailyActions", "WorkingOut", "bicycle_crunch.gif"),
+    (322, "circle_crunch", "DailyActions", "WorkingOut", "circle_crunch.gif"),
+    (323, "golf_drive", "DailyActions", "WorkingOut", "golf_drive.gif"),
+    (324, "idle_to_push_up", "DailyActions", "WorkingOut", "idle_to_push_up.gif"),
+    (325, "jump_push_up", "DailyActions", "WorkingOut", "jump_push_up.gif"),
+    (326, "jumping_jacks", "DailyActions", "WorkingOut", "jumping_jacks.gif"),
+    (327, "kettlebell_swing", "DailyActions", "WorkingOut", "kettlebell_swing.gif"),
+    (328, "push_up_to_idle", "DailyActions", "WorkingOut", "push_up_to_idle.gif"),
+    (329, "push_up", "DailyActions", "WorkingOut", "push_up.gif"),
+    (330, "situps", "DailyActions", "WorkingOut", "situps.gif"),
+    (331, "Sumo_High_Pull", "DailyActions", "WorkingOut", "Sumo_High_Pull.gif"),
+    (333, "Look_Around_Dumbfounded", "DailyActions", "LookingAround", "Look_Around_Dumbfounded.gif"),
+    (334, "Lower_Weapon_Look_Raise", "DailyActions", "LookingAround", "Lower_Weapon_Look_Raise.gif"),
+    (335, "Axe_Breathe_and_Look_Around", "DailyActions", "LookingAround", "Axe_Breathe_and_Look_Around.gif"),
+    (336, "Long_Breathe_and_Look_Around", "DailyActions", "LookingAround", "Long_Breathe_and_Look_Around.gif"),
+    (337, "Torch_Look_Around", "DailyActions", "LookingAround", "Torch_Look_Around.gif"),
+    (338, "Short_Breathe_and_Look_Around", "DailyActions", "LookingAround", "Short_Breathe_and_Look_Around.gif"),
+    (
+        339,
+        "Walking_Scan_with_Sudden_Look_Back",
+        "DailyActions",
+        "LookingAround",
+        "Walking_Scan_with_Sudden_Look_Back.gif",
+    ),
+    (340, "Crawl_and_Look_Back", "DailyActions", "LookingAround", "Crawl_and_Look_Back.gif"),
+    (341, "Walk_Slowly_and_Look_Around", "DailyActions", "LookingAround", "Walk_Slowly_and_Look_Around.gif"),
+    (342, "Stand_and_Drink", "DailyActions", "Drinking", "Stand_and_Drink.gif"),
+    (343, "Sit_and_Drink", "DailyActions", "Drinking", "Sit_and_Drink.gif"),
+    (344, "Stand_Up1", "DailyActions", "Transitioning", "Stand_Up1.gif"),
+    (345, "Stand_Up2", "DailyActions", "Transitioning", "Stand_Up2.gif"),
+    (346, "Stand_Up3", "DailyActions", "Transitioning", "Stand_Up3.gif"),
+    (347, "Stand_Up4", "DailyActions", "Transitioning", "Stand_Up4.gif"),
+    (348, "Stand_Up5", "DailyActions", "Transitioning", "Stand_Up5.gif"),
+    (349, "Stand_Up6", "DailyActions", "Transitioning", "Stand_Up6.gif"),
+    (350, "Stand_Up7", "DailyActions", "Transitioning", "Stand_Up7.gif"),
+    (351, "Stand_Up8", "DailyActions", "Transitioning", "Stand_Up8.gif"),
+    (352, "Stand_Up9", "DailyActions", "Transitioning", "Stand_Up9.gif"),
+    (353, "Stand_Up10", "DailyActions", "Transitioning", "Stand_Up10.gif"),
+    (354, "Sitting_Clap", "DailyActions", "Transitioning", "Sitting_Clap.gif"),
+    (355, "Sit_Finger_Wag_No", "DailyActions", "Transitioning", "Sit_Finger_Wag_No.gif"),
+    (356, "Sit_Hands_on_Head_Lean_Back", "DailyActions", "Transitioning", "Sit_Hands_on_Head_Lean_Back.gif"),
+    (357, "Sit_Thumbs_Up_Right", "DailyActions", "Transitioning", "Sit_Thumbs_Up_Right.gif"),
+    (358, "Sit_Shout_Hands_on_Mouth", "DailyActions", "Transitioning", "Sit_Shout_Hands_on_Mouth.gif"),
+    (359, "Look_Back_and_Sit", "DailyActions", "Transitioning", "Look_Back_and_Sit.gif"),
+    (360, "Sit_to_standTransition_Female_2", "DailyActions", "Transitioning", "Sit_to_standTransition_Female_2.gif"),
+    (361, "Sit_Dodge", "DailyActions", "Transitioning", "Sit_Dodge.gif"),
+    (362, "Sit_Cross_Legged", "DailyActions", "Transitioning", "Sit_Cross_Legged.gif"),
+    (363, "Sit_Cross_Legged_on_Floor", "DailyActions", "Transitioning", "Sit_Cross_Legged_on_Floor.gif"),
+    (364, "Sit_on_Chair_Arms_Crossed", "DailyActions", "Transitioning", "Sit_on_Chair_Arms_Crossed.gif"),
+    (365, "Kneel_on_One_Knee_and_Stand", "DailyActions", "Transitioning", "Kneel_on_One_Knee_and_Stand.gif"),
+    (366, "falling_down", "DailyActions", "Transitioning", "falling_down.gif"),
+    (367, "SideLying_Reach_Help", "DailyActions", "Transitioning", "SideLying_Reach_Help.gif"),
+    (368, "Angry_To_Tantrum_Sit", "DailyActions", "Transitioning", "Angry_To_Tantrum_Sit.gif"),
+    (369, "Lie_Back_Leg_Swing", "DailyActions", "Transitioning", "Lie_Back_Leg_Swing.gif"),
+    (370, "Stand_To_Side_Lying", "DailyActions", "Transitioning", "Stand_To_Side_Lying.gif"),
+    (371, "Sit_Lie_Bed", "DailyActions", "Transitioning", "Sit_Lie_Bed.gif"),
+    (372, "Prone_Reach_Help", "DailyActions", "Transitioning", "Prone_Reach_Help.gif"),
+    (375, "Handstand_Flip", "BodyMovements", "Acting", "Handstand_Flip.gif"),
+    (376, "Punch_Pose", "BodyMovements", "Acting", "Punch_Pose.gif"),
+    (377, "Relax_arms_then_strike_battle_pose", "BodyMovements", "Acting", "Relax_arms_then_strike_battle_pose.gif"),
+    (378, "Large_step_then_high_kick", "BodyMovements", "Acting", "Large_step_then_high_kick.gif"),
+    (379, "Side_jumps_in_horse_stance", "BodyMovements", "Acting", "Side_jumps_in_horse_stance.gif"),
+    (381, "Step_Right_for_Exercise", "BodyMovements", "Acting", "Step_Right_for_Exercise.gif"),
+    (382, "Jump_and_Slam_Back_Down", "BodyMovements", "Acting", "Jump_and_Slam_Back_Down.gif"),
+    (384, "Quick_Step_and_Spin_Dodge", "BodyMovements", "Acting", "Quick_Step_and_Spin_Dodge.gif"),
+    (385, "Boxing_Warmup", "BodyMovements", "Acting", "Boxing_Warmup.gif"),
+    (386, "Zombie_Scream", "BodyMovements", "Acting", "Zombie_Scream.gif"),
+    (387, "Half_Squat_with_Thumb_Up", "BodyMovements", "Acting", "Half_Squat_with_Thumb_Up.gif"),
+    (388, "Show_Both_Arm_Muscles", "BodyMovements", "Acting", "Show_Both_Arm_Muscles.gif"),
+    (389, "Grip_and_Throw_Down", "BodyMovements", "Acting", "Grip_and_Throw_Down.gif"),
+    (390, "Stand_on_Pole_and_Balance", "BodyMovements", "Acting", "Stand_on_Pole_and_Balance.gif"),
+    (391, "Head_Hold_in_Pain", "BodyMovements", "Acting", "Head_Hold_in_Pain.gif"),
+    (392, "Ground_Flip_and_Sweep_Up", "BodyMovements", "Acting", "Ground_Flip_and_Sweep_Up.gif"),
+    (393, "baseball_pitching", "BodyMovements", "Acting", "baseball_pitching.gif"),
+    (394, "Backflip_and_Hooks", "BodyMovements", "Acting", "Backflip_and_Hooks.gif"),
+    (395, "Breakdance_1990", "BodyMovements", "Acting", "Breakdance_1990.gif"),
+    (396, "Burpee_Exercise", "BodyMovements", "Acting", "Burpee_Exercise.gif"),
+    (397, "360_Power_Spin_Jump", "BodyMovements", "Acting", "360_Power_Spin_Jump.gif"),
+    (398, "Crouch_Charge_and_Throw", "BodyMovements", "Acting", "Crouch_Charge_and_Throw.gif"),
+    (399, "Step_Step_Turn_Kick", "BodyMovements", "Acting", "Step_Step_Turn_Kick.gif"),
+    (401, "Sprint_Roll_and_Flip", "BodyMovements", "Acting", "Sprint_Roll_and_Flip.gif"),
+    (402, "Run_and_Leap", "BodyMovements", "Acting", "Run_and_Leap.gif"),
+    (403, "Victory_Fist_Pump", "BodyMovements", "Acting", "Victory_Fist_Pump.gif"),
+    (404, "Crouch_and_Step_Back", "BodyMovements", "Acting", "Crouch_and_Step_Back.gif"),
+    (405, "Joyful_Dance_with_Hand_Sway", "BodyMovements", "Acting", "Joyful_Dance_with_Hand_Sway.gif"),
+    (406, "Thomas_Flair_to_Jump_Up", "BodyMovements", "Acting", "Thomas_Flair_to_Jump_Up.gif"),
+    (407, "Wall_Push_Jump_and_Flip", "BodyMovements", "Acting", "Wall_Push_Jump_and_Flip.gif"),
+    (408, "Jazz_Hands", "BodyMovements", "Acting", "Jazz_Hands.gif"),
+    (409, "Finger_Wag_No", "BodyMovements", "Acting", "Finger_Wag_No.gif"),
+    (410, "Kick_a_Soccer_Ball", "BodyMovements", "Acting", "Kick_a_Soccer_Ball.gif"),
+    (411, "Neck_Slashing_Gesture", "BodyMovements", "Acting", "Neck_Slashing_Gesture.gif"),
+    (412, "victory", "BodyMovements", "Acting", "victory.gif"),
+    (413, "Backflip_and_Rise", "BodyMovements", "Acting", "Backflip_and_Rise.gif"),
+    (414, "Double_kick_forward", "BodyMovements", "Acting", "Double_kick_forward.gif"),
+    (415, "Happy_Sway_Standing", "BodyMovements", "Acting", "Happy_Sway_Standing.gif"),
+    (416, "Hit_in_Back_While_Running", "BodyMovements", "Acting", "Hit_in_Back_While_Running.gif"),
+    (417, "Hop_with_Arms_Raised", "BodyMovements", "Acting", "Hop_with_Arms_Raised.gif"),
+    (419, "Jump_to_Catch_and_Fall", "BodyMovements", "Acting", "Jump_to_Catch_and_Fall.gif"),
+    (420, "Left_Hand_Bitten_Step_Back", "BodyMovements", "Acting", "Left_Hand_Bitten_Step_Back.gif"),
+    (421, "Over_Shoulder_Throw", "BodyMovements", "Acting", "Over_Shoulder_Throw.gif"),
+    (422, "Rising_Flying_Kick", "BodyMovements", "Acting", "Rising_Flying_Kick.gif"),
+    (425, "Vault_with_Rifle", "BodyMovements", "VaultingOverObstacle", "Vault_with_Rifle.gif"),
+    (426, "Roll_Behind_Cover", "BodyMovements", "VaultingOverObstacle", "Roll_Behind_Cover.gif"),
+    (427, "Vault_and_Land", "BodyMovements", "VaultingOverObstacle", "Vault_and_Land.gif"),
+    (428, "Unarmed_Vault", "BodyMovements", "VaultingOverObstacle", "Unarmed_Vault.gif"),
+    (429, "Parkour_Vault", "BodyMovements", "VaultingOverObstacle", "Parkour_Vault.gif"),
+    (430, "Parkour_Vault_with_Roll", "BodyMovements", "VaultingOverObstacle", "Parkour_Vault_with_Roll.gif"),
+    (431, "Parkour_Vault_1", "BodyMovements", "VaultingOverObstacle", "Parkour_Vault_1.gif"),
+    (432, "Parkour_Vault_2", "BodyMovements", "VaultingOverObstacle", "Parkour_Vault_2.gif"),
+    (433, "Parkour_Vault_3", "BodyMovements", "VaultingOverObstacle", "Parkour_Vault_3.gif"),
+    (434, "Fast_Ladder_Climb", "BodyMovements", "Climbing", "Fast_Ladder_Climb.gif"),
+    (435, "Ladder_Climb_Finish", "BodyMovements", "Climbing", "Ladder_Climb_Finish.gif"),
+    (436, "Ladder_Mount_Start", "BodyMovements", "Climbing", "Ladder_Mount_Start.gif"),
+    (437, "Slow_Ladder_Climb", "BodyMovements", "Climbing", "Slow_Ladder_Climb.gif"),
+    (438, "Ladder_Climb_Loop", "BodyMovements", "Climbing", "Ladder_Climb_Loop.gif"),
+    (439, "Climb_Left_with_Both_Limbs", "BodyMovements", "Climbing", "Climb_Left_with_Both_Limbs.gif"),
+    (440, "Climb_Right_with_Both_Limbs", "BodyMovements", "Climbing", "Climb_Right_with_Both_Limbs.gif"),
+    (441, "Climb_Stairs", "BodyMovements", "Climbing", "Climb_Stairs.gif"),
+    (442, "Fast_Stair_Climb", "BodyMovements", "Climbing", "Fast_Stair_Climb.gif"),
+    (444, "climbing_up_wall", "BodyMovements", "Climbing", "climbing_up_wall.gif"),
+    (445, "diagonal_wall_run", "BodyMovements", "Climbing", "diagonal_wall_run.gif"),
+    (446, "Hang_and_Climb_Left", "BodyMovements", "Climbing", "Hang_and_Climb_Left.gif"),
+    (447, "Hang_and_Climb_Rght", "BodyMovements", "Climbing", "Hang_and_Climb_Rght.gif"),
+    (448, "Jump_and_Grab_Wall", "BodyMovements", "Climbing", "Jump_and_Grab_Wall.gif"),
+    (449, "Climb_Up_Rope", "BodyMovements", "Climbing", "Climb_Up_Rope.gif"),
+    (450, "Wall_Flip", "BodyMovements", "PerformingStunt", "Wall_Flip.gif"),
+    (451, "One_Arm_Handstand", "BodyMovements", "PerformingStunt", "One_Arm_Handstand.gif"),
+    (452, "Backflip", "BodyMovements", "PerformingStunt", "Backflip.gif"),
+    (453, "Backflip_Sweep_Kick", "BodyMovements", "PerformingStunt", "Backflip_Sweep_Kick.gif"),
+    (455, "Sweep_Kick", "BodyMovements", "PerformingStunt", "Sweep_Kick.gif"),
+    (456, "Jumping_Head_Scissor_Takedown", "BodyMovements", "PerformingStunt", "Jumping_Head_Scissor_Takedown.gif"),
+    (457, "Jumping_Punch", "BodyMovements", "PerformingStunt", "Jumping_Punch.gif"),
+    (458, "Unicycle_Jump_Dismount", "BodyMovements", "PerformingStunt", "Unicycle_Jump_Dismount.gif"),
+    (459, "Run_Jump_and_Roll", "BodyMovements", "PerformingStunt", "Run_Jump_and_Roll.gif"),
+    (460, "Jump_with_Arms_Open", "BodyMovements", "Jumping", "Jump_with_Arms_Open.gif"),
+    (461, "Jump_with_Arms_and_Legs_Open", "BodyMovements", "Jumping", "Jump_with_Arms_and_Legs_Open.gif"),
+    (462, "Backflip_Jump", "BodyMovements", "Jumping", "Backflip_Jump.gif"),
+    (463, "Run_and_Jump", "BodyMovements", "Jumping", "Run_and_Jump.gif"),
+    (464, "Leap_and_Punch", "BodyMovements", "Jumping", "Leap_and_Punch.gif"),
+    (465, "Leap_Right_and_Catch", "BodyMovements", "Jumping", "Leap_Right_and_Catch.gif"),
+    (466, "Regular_Jump", "BodyMovements", "Jumping", "Regular_Jump.gif"),
+    (467, "Jump_Over_Obstacle_2", "BodyMovements", "Jumping", "Jump_Over_Obstacle_2.gif"),
+    (468, "Back_Jump", "BodyMovements", "Jumping", "Back_Jump.gif"),
+    (470, "Jumping_Down", "BodyMovements", "Jumping", "Jumping_Down.gif"),
+    (471, "Jump_Over_Obstacle", "BodyMovements", "Jumping", "Jump_Over_Obstacle.gif"),
+    (472, "Jump_Over_Obstacle_1", "BodyMovements", "Jumping", "Jump_Over_Obstacle_1.gif"),
+    (473, "Quad_Jump_Left", "BodyMovements", "HangingfromLedge", "Quad_Jump_Left.gif"),
+    (474, "Quad_Jump_Up", "BodyMovements", "HangingfromLedge", "Quad_Jump_Up.gif"),
+    (475, "Quad_Climb_Right", "BodyMovements", "HangingfromLedge", "Quad_Climb_Right.gif"),
+    (476, "Hang_and_Push_with_Foot", "BodyMovements", "HangingfromLedge", "Hang_and_Push_with_Foot.gif"),
+    (477, "Rope_Hang_Idle", "BodyMovements", "HangingfromLedge", "Rope_Hang_Idle.gif"),
+    (478, "Bar_Hang_Idle", "BodyMovements", "HangingfromLedge", "Bar_Hang_Idle.gif"),
+    (479, "Upside_Down_Rope_Hang", "BodyMovements", "HangingfromLedge", "Upside_Down_Rope_Hang.gif"),
+    (480, "Upside_Down_Rope_Hang_1", "BodyMovements", "HangingfromLedge", "Upside_Down_Rope_Hang_1.gif"),
+    (481, "Upside_Down_Rope_Hang_2", "BodyMovements", "HangingfromLedge", "Upside_Down_Rope_Hang_2.gif"),
+    (482, "Grab_Wall_Midair_Idle", "BodyMovements", "HangingfromLedge", "Grab_Wall_Midair_Idle.gif"),
+    (483, "Slow_Bar_Hang_Left", "BodyMovements", "HangingfromLedge", "Slow_Bar_Hang_Left.gif"),
+    (484, "Slow_Bar_Hang_Right", "BodyMovements", "HangingfromLedge", "Slow_Bar_Hang_Right.gif"),
+    (485, "Jump_and_Hang_on_Bar", "BodyMovements", "HangingfromLedge", "Jump_and_Hang_on_Bar.gif"),
+    (486, "Wall_Support_to_Step_Down", "BodyMovements", "HangingfromLedge", "Wall_Support_to_Step_Down.gif"),
+    (487, "Climb_Attempt_and_Fall_3", "BodyMovements", "FallingFreely", "Climb_Attempt_and_Fall_3.gif"),
+    (488, "Climb_Attempt_and_Fall_4", "BodyMovements", "FallingFreely", "Climb_Attempt_and_Fall_4.gif"),
+    (489, "Climb_Attempt_and_Fall_5", "BodyMovements", "FallingFreely", "Climb_Attempt_and_Fall_5.gif"),
+    (490, "Fall_Down", "BodyMovements", "HangingfromLedge", "Fall_Down.gif"),
+    (491, "Fall_from_Bar", "BodyMovements", "HangingfromLedge", "Fall_from_Bar.gif"),
+    (492, "Wall_Support_Jump_to_Ground", "BodyMovements", "HangingfromLedge", "Wall_Support_Jump_to_Ground.gif"),
+    (493, "Jump_Down_from_Wall", "BodyMovements", "HangingfromLedge", "Jump_Down_from_Wall.gif"),
+    (494, "Swing_on_Rope_to_Ground", "BodyMovements", "HangingfromLedge", "Swing_on_Rope_to_Ground.gif"),
+    (495, "Grab_Bar_and_Swing_Forward", "BodyMovements", "HangingfromLedge", "Grab_Bar_and_Swing_Forward.gif"),
+    (496, "Rope_Hang_Backflip_to_Crouch", "BodyMovements", "HangingfromLedge", "Rope_Hang_Backflip_to_Crouch.gif"),
+    (497, "climbing_down_wall", "BodyMovements", "Climbing", "climbing_down_wall.gif"),
+    (498, "Climb_Attempt_and_Fall", "BodyMovements", "FallingFreely", "Climb_Attempt_and_Fall.gif"),
+    (499, "Climb_Attempt_and_Fall_1", "BodyMovements", "FallingFreely", "Climb_Attempt_and_Fall_1.gif"),
+    (500, "Climb_Attempt_and_Fall_2", "BodyMovements", "FallingFreely", "Climb_Attempt_and_Fall_2.gif"),
+    (501, "Leap_of_Faith", "BodyMovements", "FallingFreely", "Leap_of_Faith.gif"),
+    (502, "Fall1", "BodyMovements", "FallingFreely", "Fall1.gif"),
+    (503, "Fall2", "BodyMovements", "FallingFreely", "Fall2.gif"),
+    (504, "Fall3", "BodyMovements", "FallingFreely", "Fall3.gif"),
+    (505, "Fall4", "BodyMovements", "FallingFreely", "Fall4.gif"),
+    (506, "Dive_Down_and_Land", "BodyMovements", "FallingFreely", "Dive_Down_and_Land.gif"),
+    (507, "Dive_Down_and_Land_1", "BodyMovements", "FallingFreely", "Dive_Down_and_Land_1.gif"),
+    (508, "Dive_Down_and_Land_2", "BodyMovements", "FallingFreely", "Dive_Down_and_Land_2.gif"),
+    (509, "Lean_Forward_Sprint", "WalkAndRun", "Running", "Lean_Forward_Sprint.gif"),
+    (510, "Standard_Forward_Charge", "WalkAndRun", "Running", "Standard_Forward_Charge.gif"),
+    (511, "Rifle_Charge", "WalkAndRun", "Running", "Rifle_Charge.gif"),
+    (512, "Male_Head_Down_Charge", "WalkAndRun", "Running", "Male_Head_Down_Charge.gif"),
+    (513, "Female_Head_Down_Charge", "WalkAndRun", "Running", "Female_Head_Down_Charge.gif"),
+    (514, "Female_Bow_Charge_Left_Hand", "WalkAndRun", "Running", "Female_Bow_Charge_Left_Hand.gif"),
+    (515, "Female_Throwing_Stance_Charge", "WalkAndRun", "Running", "Female_Throwing_Stance_Charge.gif"),
+    (516, "slide_light", "WalkAndRun", "Running", "slide_light.gif"),
+    (517, "slide_right", "WalkAndRun", "Running", "slide_right.gif"),
+    (518, "sliding_rool", "WalkAndRun", "Running", "sliding_rool.gif"),
+    (519, "sliding_stumble", "WalkAndRun", "Running", "sliding_stumble.gif"),
+    (520, "Crouch_Walk_with_Torch", "WalkAndRun", "CrouchWalking", "Crouch_Walk_with_Torch.gif"),
+    (521, "Crouch_Walk_Left_with_Torch", "WalkAndRun", "CrouchWalking", "Crouch_Walk_Left_with_Torch.gif"),
+    (522, "Crouch_Walk_Right_with_Torch", "WalkAndRun", "CrouchWalking", "Crouch_Walk_Right_with_Torch.gif"),
+    (523, "Cautious_Crouch_Walk_Backward", "WalkAndRun", "CrouchWalking", "Cautious_Crouch_Walk_Backward.gif"),
+    (524, "Cautious_Crouch_Walk_Forward", "WalkAndRun", "CrouchWalking", "Cautious_Crouch_Walk_Forward.gif"),
+    (525, "Cautious_Crouch_Walk_Left", "WalkAndRun", "CrouchWalking", "Cautious_Crouch_Walk_Left.gif"),
+    (526, "Cautious_Crouch_Walk_Right", "WalkAndRun", "CrouchWalking", "Cautious_Crouch_Walk_Right.gif"),
+    (527, "Crouch_Walk_Left_with_Gun", "WalkAndRun", "CrouchWalking", "Crouch_Walk_Left_with_Gun.gif"),
+    (528, "Walk_Left_with_Gun", "WalkAndRun", "CrouchWalking", "Walk_Left_with_Gun.gif"),
+    (529, "Walk_Backward_with_Gun", "WalkAndRun", "CrouchWalking", "Walk_Backward_with_Gun.gif"),
+    (530, "run_fast_3", "WalkAndRun", "Running", "run_fast_3.gif"),
+    (531, "Sprint_and_Sudden_Stop", "WalkAndRun", "Running", "Sprint_and_Sudden_Stop.gif"),
+    (532, "run_fast_4", "WalkAndRun", "Running", "run_fast_4.gif"),
+    (533, "run_fast_5", "WalkAndRun", "Running", "run_fast_5.gif"),
+    (534, "run_fast_6", "WalkAndRun", "Running", "run_fast_6.gif"),
+    (535, "run_fast_7", "WalkAndRun", "Running", "run_fast_7.gif"),
+    (536, "run_fast_8", "WalkAndRun", "Running", "run_fast_8.gif"),
+    (537, "run_fast_9", "WalkAndRun", "Running", "run_fast_9.gif"),
+    (538, "run_fast_10", "WalkAndRun", "Running", "run_fast_10.gif"),
+    (539, "run_fast_2", "WalkAndRun", "Running", "run_fast_2.gif"),
+    (540, "Injured_Walk_Backward", "WalkAndRun", "Walking", "Injured_Walk_Backward.gif"),
+    (541, "Walk_Backward_with_Gun_1", "WalkAndRun", "Walking", "Walk_Backward_with_Gun_1.gif"),
+    (542, "Walk_Backward_with_Grenade", "WalkAndRun", "Walking", "Walk_Backward_with_Grenade.gif"),
+    (543, "Step_Back", "WalkAndRun", "Walking", "Step_Back.gif"),
+    (544, "Walk_Backward", "WalkAndRun", "Walking", "Walk_Backward.gif"),
+    (545, "Walk_Backward_with_Bow", "WalkAndRun", "Walking", "Walk_Backward_with_Bow.gif"),
+    (546, "Walk_Backward_with_Sword", "WalkAndRun", "Walking", "Walk_Backward_with_Sword.gif"),
+    (547, "Walk_Backward_with_Bow_1", "WalkAndRun", "Walking", "Walk_Backward_with_Bow_1.gif"),
+    (548, "Walk_Backward_with_Sword_Shield", "WalkAndRun", "Walking", "Walk_Backward_with_Sword_Shield.gif"),
+    (549, "Crawl_Backward", "WalkAndRun", "Walking", "Crawl_Backward.gif"),
+    (550, "Carry_Heavy_Cannon_Forward", "WalkAndRun", "Walking", "Carry_Heavy_Cannon_Forward.gif"),
+    (551, "Carry_Heavy_Object_Walk", "WalkAndRun", "Walking", "Carry_Heavy_Object_Walk.gif"),
+    (552, "Carry_Water_Bucket_Walk", "WalkAndRun", "Walking", "Carry_Water_Bucket_Walk.gif"),
+    (553, "Elderly_Shaky_Walk", "WalkAndRun", "Walking", "Elderly_Shaky_Walk.gif"),
+    (554, "Funky_Walk", "WalkAndRun", "Walking", "Funky_Walk.gif"),
+    (555, "Limping_Walk_1", "WalkAndRun", "Walking", "Limping_Walk_1.gif"),
+    (556, "Limping_Walk_2", "WalkAndRun", "Walking", "Limping_Walk_2.gif"),
+    (557, "Limping_Walk_3", "WalkAndRun", "Walking", "Limping_Walk_3.gif"),
+    (558, "Limping_Walk", "WalkAndRun", "Walking", "Limping_Walk.gif"),
+    (559, "Sneaky_Walk", "WalkAndRun", "Walking", "Sneaky_Walk.gif"),
+    (560, "Spear_Walk", "WalkAndRun", "Walking", "Spear_Walk.gif"),
+    (561, "Step_Hip_Hop_Dance", "WalkAndRun", "Walking", "Step_Hip_Hop_Dance.gif"),
+    (562, "Stumble_Walk", "WalkAndRun", "Walking", "Stumble_Walk.gif"),
+    (563, "Stylish_Walk", "WalkAndRun", "Walking", "Stylish_Walk.gif"),
+    (564, "Tightrope_Walk", "WalkAndRun", "Walking", "Tightrope_Walk.gif"),
+    (565, "Walk_with_Umbrella", "WalkAndRun", "Walking", "Walk_with_Umbrella.gif"),
+    (566, "walking_2", "WalkAndRun", "Walking", "walking_2.gif"),
+    (567, "Walk_with_Walker_Support", "WalkAndRun", "Walking", "Walk_with_Walker_Support.gif"),
+    (568, "Swim_Idle", "WalkAndRun", "Swimming", "Swim_Idle.gif"),
+    (569, "Swim_Forward", "WalkAndRun", "Swimming", "Swim_Forward.gif"),
+    (570, "swimming_to_edge", "WalkAndRun", "Swimming", "swimming_to_edge.gif"),
+    (571, "Run_Turn_Left", "WalkAndRun", "TurningAround", "Run_Turn_Left.gif"),
+    (572, "Walk_Turn_Left", "WalkAndRun", "TurningAround", "Walk_Turn_Left.gif"),
+    (573, "Rifle_Turn_Left", "WalkAndRun", "TurningAround", "Rifle_Turn_Left.gif"),
+    (574, "Walk_Turn_Left_with_Weapon", "WalkAndRun", "TurningAround", "Walk_Turn_Left_with_Weapon.gif"),
+    (575, "Combat_Idle_Turn_Left", "WalkAndRun", "TurningAround", "Combat_Idle_Turn_Left.gif"),
+    (576, "Idle_Turn_Left", "WalkAndRun", "TurningAround", "Idle_Turn_Left.gif"),
+    (577, "Idle_Step_Turn_Left", "WalkAndRun", "TurningAround", "Idle_Step_Turn_Left.gif"),
+    (578, "Idle_Torch_Turn_Left", "WalkAndRun", "TurningAround", "Idle_Torch_Turn_Left.gif"),
+    (579, "Depressed_Full_Turn_Left", "WalkAndRun", "TurningAround", "Depressed_Full_Turn_Left.gif"),
+    (580, "Sword_and_Shield_Alert_Turn_Left", "WalkAndRun", "TurningAround", "Sword_and_Shield_Alert_Turn_Left.gif"),
+    (581, "Run_Sharp_Turn_Right", "WalkAndRun", "TurningAround", "Run_Sharp_Turn_Right.gif"),
+    (582, "Run_Turn_Right", "WalkAndRun", "TurningAround", "Run_Turn_Right.gif"),
+    (583, "Walk_Turn_Right", "WalkAndRun", "TurningAround", "Walk_Turn_Right.gif"),
+    (584, "Walk_Turn_Right_Female", "WalkAndRun", "TurningAround", "Walk_Turn_Right_Female.gif"),
+    (585, "Rifle_Aim_Turn_Right", "WalkAndRun", "TurningAround", "Rifle_Aim_Turn_Right.gif"),
+    (586, "Idle_Turn_Right", "WalkAndRun", "TurningAround", "Idle_Turn_Right.gif"),
+    (587, "Walk_Turn_Right_Idle_Style", "WalkAndRun", "TurningAround", "Walk_Turn_Right_Idle_Style.gif"),
+    (588, "Frustrated_Turn_Right", "WalkAndRun", "TurningAround", "Frustrated_Turn_Right.gif"),
+    (589, "Alert_Quick_Turn_Right", "WalkAndRun", "TurningAround", "Alert_Quick_Turn_Right.gif"),
+    (590, "Sword_and_Shield_Alert_Turn_Right", "WalkAndRun", "TurningAround", "Sword_and_Shield_Alert_Turn_Right.gif"),
+    (591, "Hip_Hop_Dance", "Dancing", "Dancing", "Hip_Hop_Dance.gif"),
+    (592, "Hip_Hop_Dance_1", "Dancing", "Dancing", "Hip_Hop_Dance_1.gif"),
+    (593, "Hip_Hop_Dance_2", "Dancing", "Dancing", "Hip_Hop_Dance_2.gif"),
+    (594, "Hip_Hop_Dance_3", "Dancing", "Dancing", "Hip_Hop_Dance_3.gif"),
+    (595, "jazz_danc", "Dancing", "Dancing", "jazz_danc.gif"),
+    (596, "ymca_dance", "Dancing", "Dancing", "ymca_dance.gif"),
+    (597, "Hip_Hop_Dance_4", "Dancing", "Dancing", "Hip_Hop_Dance_4.gif"),
+    (598, "kettlebell_swing_1", "DailyActions", "WorkingOut", "kettlebell_swing_1.gif"),
+    (599, "Idle_15", "DailyActions", "Idle", "Idle_15.gif"),
+    (601, "Backflip_inplace", "BodyMovements", "PerformingStunt", "Backflip.gif"),
+    (604, "Backflip_Sweep_Kick_inplace", "BodyMovements", "PerformingStunt", "Backflip_Sweep_Kick.gif"),
+    (605, "Back_Jump_inplace", "BodyMovements", "Jumping", "Back_Jump.gif"),
+    (606, "BackLeft_run_inplace", "WalkAndRun", "Running", "BackLeft_run.gif"),
+    (607, "BackRight_Run_inplace", "WalkAndRun", "Running", "BackRight_Run.gif"),
+    (608, "BeHit_FlyUp_inplace", "Fighting", "GettingHit", "BeHit_FlyUp.gif"),
+    (609, "Boxing_Practice_inplace", "Fighting", "Punching", "Boxing_Practice.gif"),
+    (610, "Carry_Heavy_Cannon_Forward_inplace", "WalkAndRun", "Walking", "Carry_Heavy_Cannon_Forward.gif"),
+    (611, "Carry_Heavy_Object_Walk_inplace", "WalkAndRun", "Walking", "Carry_Heavy_Object_Walk.gif"),
+    (612, "Carry_Water_Bucket_Walk_inplace", "WalkAndRun", "Walking", "Carry_Water_Bucket_Walk.gif"),
+    (613, "Casual_Walk_inplace", "WalkAndRun", "Walking", "Casual_Walk.gif"),
+    (615, "Cautious_Crouch_Walk_Backward_inplace", "WalkAndRun", "CrouchWalking", "Cautious_Crouch_Walk_Backward.gif"),
+    (616, "Cautious_Crouch_Walk_Forward_inplace", "WalkAndRun", "CrouchWalking", "Cautious_Crouch_Walk_Forward.gif"),
+    (617, "Cautious_Crouch_Walk_Left_inplace", "WalkAndRun", "CrouchWalking", "Cautious_Crouch_Walk_Left.gif"),
+    (618, "Cautious_Crouch_Walk_Right_inplace", "WalkAndRun", "CrouchWalking", "Cautious_Crouch_Walk_Right.gif"),
+    (619, "Climb_Left_with_Both_Limbs_inplace", "BodyMovements", "Climbing", "Climb_Left_with_Both_Limbs.gif"),
+    (620, "Climb_Right_with_Both_Limbs_inplace", "BodyMovements", "Climbing", "Climb_Right_with_Both_Limbs.gif"),
+    (621, "Confident_Strut_inplace", "WalkAndRun", "Walking", "Confident_Strut.gif"),
+    (622, "Crawl_Backward_inplace", "WalkAndRun", "Walking", "Crawl_Backward.gif"),
+    (623, "Crouch_Walk_Left_with_Gun_inplace", "WalkAndRun", "CrouchWalking", "Crouch_Walk_Left_with_Gun.gif"),
+    (624, "Crouch_Walk_Left_with_Torch_inplace", "WalkAndRun", "CrouchWalking", "Crouch_Walk_Left_with_Torch.gif"),
+    (625, "Crouch_Walk_Right_with_Torch_inplace", "WalkAndRun", "CrouchWalking", "Crouch_Walk_Right_with_Torch.gif"),
+    (626, "Elderly_Shaky_Walk_inplace", "WalkAndRun", "Walking", "Elderly_Shaky_Walk.gif"),
+    (627, "Female_Bow_Charge_Left_Hand_inplace", "WalkAndRun", "Running", "Female_Bow_Charge_Left_Hand.gif"),
+    (628, "Female_Throwing_Stance_Charge_inplace", "WalkAndRun", "Running", "Female_Throwing_Stance_Charge.gif"),
+    (629, "Flirty_Strut_inplace", "WalkAndRun", "Walking", "Flirty_Strut.gif"),
+    (630, "ForwardLeft_Run_Fight_inplace", "Fighting", "Transitioning", "ForwardLeft_Run_Fight.gif"),
+    (631, "ForwardRight_Run_Fight_inplace", "Fighting", "Transitioning", "ForwardRight_Run_Fight.gif"),
+    (632, "Funky_Walk_inplace", "WalkAndRun", "Walking", "Funky_Walk.gif"),
+    (635, "Handbag_Walk_inplace", "BodyMovements", "Acting", "Handbag_Walk.gif"),
+    (636, "Hello_Run_inplace", "WalkAndRun", "Running", "Hello_Run.gif"),
+    (637, "Injured_Walk_inplace", "WalkAndRun", "Walking", "Injured_Walk.gif"),
+    (638, "Injured_Walk_Backward_inplace", "WalkAndRun", "Walking", "Injured_Walk_Backward.gif"),
+    (639, "Jazz_Hands_inplace", "BodyMovements", "Acting", "Jazz_Hands.gif"),
+    (640, "Jump_Over_Obstacle_inplace", "BodyMovements", "Jumping", "Jump_Over_Obstacle.gif"),
+    (641, "Jump_Over_Obstacle_1_inplace", "BodyMovements", "Jumping", "Jump_Over_Obstacle_1.gif"),
+    (642, "Jump_Over_Obstacle_2_inplace", "BodyMovements", "Jumping", "Jump_Over_Obstacle_2.gif"),
+    (643, "Jump_Run_inplace", "WalkAndRun", "Running", "Jump_Run.gif"),
+    (644, "Lean_Forward_Sprint_inplace", "WalkAndRun", "Running", "Lean_Forward_Sprint.gif"),
+    (645, "Limping_Walk_inplace", "WalkAndRun", "Walking", "Limping_Walk.gif"),
+    (646, "Limping_Walk_1_inplace", "WalkAndRun", "Walking", "Limping_Walk_1.gif"),
+    (647, "Limping_Walk_2_inplace", "WalkAndRun", "Walking", "Limping_Walk_2.gif"),
+    (648, "Limping_Walk_3_inplace", "WalkAndRun", "Walking", "Limping_Walk_3.gif"),
+    (649, "Lunge_Roundhouse_Kick_inplace", "Fighting", "Punching", "Lunge_Roundhouse_Kick.gif"),
+    (650, "Mummy_Stagger_inplace", "BodyMovements", "Acting", "Mummy_Stagger.gif"),
+    (651, "Parkour_Vault_with_Roll_inplace", "BodyMovements", "VaultingOverObstacle", "Parkour_Vault_with_Roll.gif"),
+    (652, "Proud_Strut_inplace", "WalkAndRun", "Walking", "Proud_Strut.gif"),
+    (653, "Red_Carpet_Walk_inplace", "WalkAndRun", "Walking", "Red_Carpet_Walk.gif"),
+    (654, "Rifle_Charge_inplace", "WalkAndRun", "Running", "Rifle_Charge.gif"),
+    (656, "Run_and_Leap_inplace", "BodyMovements", "Acting", "Run_and_Leap.gif"),
+    (657, "run_fast_10_inplace", "WalkAndRun", "Running", "run_fast_10.gif"),
+    (658, "run_fast_2_inplace", "WalkAndRun", "Running", "run_fast_2.gif"),
+    (659, "run_fast_3_inplace", "WalkAndRun", "Running", "run_fast_3.gif"),
+    (660, "run_fast_4_inplace", "WalkAndRun", "Running", "run_fast_4.gif"),
+    (661, "run_fast_5_inplace", "WalkAndRun", "Running", "run_fast_5.gif"),
+    (662, "run_fast_6_inplace", "WalkAndRun", "Running", "run_fast_6.gif"),
+    (663, "run_fast_7_inplace", "WalkAndRun", "Running", "run_fast_7.gif"),
+    (664, "run_fast_8_inplace", "WalkAndRun", "Running", "run_fast_8.gif"),
+    (665, "run_fast_9_inplace", "WalkAndRun", "Running", "run_fast_9.gif"),
+    (666, "Running_Reload_inplace", "Fighting", "Transitioning", "Running_Reload.gif"),
+    (667, "Run_to_Walk_Transition_inplace", "WalkAndRun", "Walking", "Run_to_Walk_Transition.gif"),
+    (668, "Skip_Forward_inplace", "WalkAndRun", "Walking", "Skip_Forward.gif"),
+    (669, "Slow_Orc_Walk_inplace", "WalkAndRun", "Walking", "Slow_Orc_Walk.gif"),
+    (670, "Slow_Walk_Reload_inplace", "Fighting", "Transitioning", "Slow_Walk_Reload.gif"),
+    (671, "Sneaky_Walk_inplace", "WalkAndRun", "Walking", "Sneaky_Walk.gif"),
+    (672, "Spear_Walk_inplace", "WalkAndRun", "Walking", "Spear_Walk.gif"),
+    (673, "Standard_Forward_Charge_inplace", "WalkAndRun", "Running", "Standard_Forward_Charge.gif"),
+    (674, "Stumble_Walk_inplace", "WalkAndRun", "Walking", "Stumble_Walk.gif"),
+    (675, "Stylish_Walk_inplace", "WalkAndRun", "Walking", "Stylish_Walk.gif"),
+    (676, "Texting_Walk_inplace", "WalkAndRun", "Walking", "Texting_Walk.gif"),
+    (677, "Tightrope_Walk_inplace", "WalkAndRun", "Walking", "Tightrope_Walk.gif"),
+    (678, "Unsteady_Walk_inplace", "WalkAndRun", "Walking", "Unsteady_Walk.gif"),
+    (679, "Walk_Backward_inplace", "WalkAndRun", "Walking", "Walk_Backward.gif"),
+    (
+        680,
+        "Walk_Backward_While_Shooting_inplace",
+        "Fighting",
+        "AttackingwithWeapon",
+        "Walk_Backward_While_Shooting.gif",
+    ),
+    (681, "Walk_Backward_with_Bow_inplace", "WalkAndRun", "Walking", "Walk_Backward_with_Bow.gif"),
+    (682, "Walk_Backward_with_Bow_1_inplace", "WalkAndRun", "Walking", "Walk_Backward_with_Bow_1.gif"),
+    (
+        683,
+        "Walk_Backward_with_Bow_Aimed_inplace",
+        "Fighting",
+        "AttackingwithWeapon",
+        "Walk_Backward_with_Bow_Aimed.gif",
+    ),
+    (684, "Walk_Backward_with_Grenade_inplace", "WalkAndRun", "Walking", "Walk_Backward_with_Grenade.gif"),
+    (685, "Walk_Backward_with_Gun_inplace", "WalkAndRun", "CrouchWalking", "Walk_Backward_with_Gun.gif"),
+    (686, "Walk_Backward_with_Gun_1_inplace", "WalkAndRun", "Walking", "Walk_Backward_with_Gun_1.gif"),
+    (687, "Walk_Backward_with_Sword_inplace", "WalkAndRun", "Walking", "Walk_Backward_with_Sword.gif"),
+    (688, "Walk_Fight_Back_inplace", "WalkAndRun", "Walking", "Walk_Fight_Back.gif"),
+    (689, "Walk_Fight_Forward_inplace", "WalkAndRun", "Walking", "Walk_Fight_Forward.gif"),
+    (690, "Walk_Forward_While_Shooting_inplace", "Fighting", "AttackingwithWeapon", "Walk_Forward_While_Shooting.gif"),
+    (691, "Walk_Forward_with_Bow_Aimed_inplace", "Fighting", "AttackingwithWeapon", "Walk_Forward_with_Bow_Aimed.gif"),
+    (692, "walking_2_inplace", "WalkAndRun", "Walking", "walking_2.gif"),
+    (693, "Walking_with_Phone_inplace", "WalkAndRun", "Walking", "Walking_with_Phone.gif"),
+    (694, "Walk_Left_with_Gun_inplace", "WalkAndRun", "CrouchWalking", "Walk_Left_with_Gun.gif"),
+    (695, "Walk_with_Umbrella_inplace", "WalkAndRun", "Walking", "Walk_with_Umbrella.gif"),
+    (696, "Walk_with_Walker_Support_inplace", "WalkAndRun", "Walking", "Walk_with_Walker_Support.gif"),
+)
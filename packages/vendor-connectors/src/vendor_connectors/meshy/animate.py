@@ -13,10 +13,8 @@ Usage:
 
 from __future__ import annotations
 
-import time
-
-from vendor_connectors.meshy import base
-from vendor_connectors.meshy.models import AnimationRequest, AnimationResult, TaskStatus
+from vendor_connectors.meshy import base, completion
+from vendor_connectors.meshy.models import AnimationRequest, AnimationResult
 
 
 def create(request: AnimationRequest) -> str:
@@ -37,24 +35,8 @@ def get(task_id: str) -> AnimationResult:
 
 
 def poll(task_id: str, interval: float = 5.0, timeout: float = 600.0) -> AnimationResult:
-    """Poll until complete or failed."""
-    start = time.time()
-    while True:
-        result = get(task_id)
-        if result.status == TaskStatus.SUCCEEDED:
-            return result
-        if result.status == TaskStatus.FAILED:
-            error = getattr(result, "task_error", {})
-            msg = error.get("message", "Unknown error") if isinstance(error, dict) else str(error)
-            msg = f"Task failed: {msg}"
-            raise RuntimeError(msg)
-        if result.status == TaskStatus.EXPIRED:
-            msg = "Task expired"
-            raise RuntimeError(msg)
-        if time.time() - start > timeout:
-            msg = f"Task timed out after {timeout}s"
-            raise TimeoutError(msg)
-        time.sleep(interval)
+    """Wait until complete or failed, via webhooks when enabled, else the shared task poller."""
+    return completion.get_registry().wait(get, task_id, AnimationResult, interval=interval, timeout=timeout)
 
 
 def apply(
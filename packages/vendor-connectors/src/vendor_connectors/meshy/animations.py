@@ -1,16 +1,34 @@
-"""Meshy Animation Library - Auto-generated from API docs."""
+"""Meshy Animation Library - Auto-generated from API docs.
+
+The catalog itself lives in ``_animation_catalog`` as a packed tuple of rows
+and is only turned into ``ANIMATIONS`` the first time it is used, so
+importing the enums and helpers stays cheap. Category, subcategory and name
+lookups go through indexes built once per catalog, and search_animations
+answers free-text queries from a token inverted index with trigram fuzzy
+matching.
+"""
 
 from __future__ import annotations
 
+import functools
+import heapq
+import re
+import threading
+
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING, Any
+
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
 
-# This file is auto-generated by scripts/sync_animations.py
+
+# Enums below are auto-generated by scripts/sync_animations.py
 # Do not edit manually - run the script to update.
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AnimationMeta:
     """Metadata for a Meshy animation."""
 
@@ -64,4823 +82,346 @@ class AnimationSubcategory(str, Enum):
     WORKINGOUT = "WorkingOut"
 
 
-# Complete animation library
-ANIMATIONS: dict[int, AnimationMeta] = {
-    0: AnimationMeta(
-        0,
-        "Idle",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle.gif",
-    ),
-    1: AnimationMeta(
-        1,
-        "Walking_Woman",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walking_Woman_woman.gif",
-    ),
-    2: AnimationMeta(
-        2,
-        "Alert",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Alert.gif",
-    ),
-    3: AnimationMeta(
-        3,
-        "Arise",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Arise.gif",
-    ),
-    4: AnimationMeta(
-        4,
-        "Attack",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Attack.gif",
-    ),
-    5: AnimationMeta(
-        5,
-        "BackLeft_run",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/BackLeft_run.gif",
-    ),
-    6: AnimationMeta(
-        6,
-        "BackRight_Run",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/BackRight_Run.gif",
-    ),
-    7: AnimationMeta(
-        7,
-        "BeHit_FlyUp",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/BeHit_FlyUp.gif",
-    ),
-    8: AnimationMeta(
-        8,
-        "Dead",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Dead.gif",
-    ),
-    9: AnimationMeta(
-        9,
-        "ForwardLeft_Run_Fight",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/ForwardLeft_Run_Fight.gif",
-    ),
-    10: AnimationMeta(
-        10,
-        "ForwardRight_Run_Fight",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/ForwardRight_Run_Fight.gif",
-    ),
-    11: AnimationMeta(
-        11,
-        "Idle_02",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_02.gif",
-    ),
-    12: AnimationMeta(
-        12,
-        "Idle_03",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_03.gif",
-    ),
-    13: AnimationMeta(
-        13,
-        "Jump_Run",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Run.gif",
-    ),
-    14: AnimationMeta(
-        14,
-        "Run_02",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_02.gif",
-    ),
-    15: AnimationMeta(
-        15,
-        "Run_03",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_03.gif",
-    ),
-    16: AnimationMeta(
-        16,
-        "RunFast",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/RunFast.gif",
-    ),
-    17: AnimationMeta(
-        17,
-        "Skill_01",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Skill_01.gif",
-    ),
-    18: AnimationMeta(
-        18,
-        "Skill_02",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Skill_02.gif",
-    ),
-    19: AnimationMeta(
-        19,
-        "Skill_03",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Skill_03.gif",
-    ),
-    20: AnimationMeta(
-        20,
-        "Walk_Fight_Back",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Fight_Back.gif",
-    ),
-    21: AnimationMeta(
-        21,
-        "Walk_Fight_Forward",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Fight_Forward.gif",
-    ),
-    22: AnimationMeta(
-        22,
-        "FunnyDancing_01",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/FunnyDancing_01.gif",
-    ),
-    23: AnimationMeta(
-        23,
-        "FunnyDancing_02",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/FunnyDancing_02.gif",
-    ),
-    24: AnimationMeta(
-        24,
-        "FunnyDancing_03",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/FunnyDancing_03.gif",
-    ),
-    25: AnimationMeta(
-        25,
-        "Agree_Gesture",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Agree_Gesture.gif",
-    ),
-    26: AnimationMeta(
-        26,
-        "Angry_Stomp",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Angry_Stomp.gif",
-    ),
-    27: AnimationMeta(
-        27,
-        "Big_Heart_Gesture",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Big_Heart_Gesture.gif",
-    ),
-    28: AnimationMeta(
-        28,
-        "Big_Wave_Hello",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Big_Wave_Hello.gif",
-    ),
-    29: AnimationMeta(
-        29,
-        "Call_Gesture",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Call_Gesture.gif",
-    ),
-    30: AnimationMeta(
-        30,
-        "Casual_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Casual_Walk.gif",
-    ),
-    31: AnimationMeta(
-        31,
-        "Catching_Breath",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Catching_Breath.gif",
-    ),
-    32: AnimationMeta(
-        32,
-        "Chair_Sit_Idle_F",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Chair_Sit_Idle_F.gif",
-    ),
-    33: AnimationMeta(
-        33,
-        "Chair_Sit_Idle_M",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Chair_Sit_Idle_M.gif",
-    ),
-    34: AnimationMeta(
-        34,
-        "Checkout_Gesture",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Checkout_Gesture.gif",
-    ),
-    35: AnimationMeta(
-        35,
-        "Clapping_Run",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Clapping_Run.gif",
-    ),
-    36: AnimationMeta(
-        36,
-        "Confused_Scratch",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Confused_Scratch.gif",
-    ),
-    37: AnimationMeta(
-        37,
-        "Discuss_While_Moving",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Discuss_While_Moving.gif",
-    ),
-    38: AnimationMeta(
-        38,
-        "Dozing_Elderly",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Dozing_Elderly.gif",
-    ),
-    39: AnimationMeta(
-        39,
-        "Excited_Walk_F",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Excited_Walk_F.gif",
-    ),
-    40: AnimationMeta(
-        40,
-        "Excited_Walk_M",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Excited_Walk_M.gif",
-    ),
-    41: AnimationMeta(
-        41,
-        "Formal_Bow",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Formal_Bow.gif",
-    ),
-    42: AnimationMeta(
-        42,
-        "Gentlemans_Bow",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Gentleman%E2%80%99s_Bow.gif",
-    ),
-    43: AnimationMeta(
-        43,
-        "Handbag_Walk",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Handbag_Walk.gif",
-    ),
-    44: AnimationMeta(
-        44,
-        "Happy_jump_f",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Happy_Jump_F.gif",
-    ),
-    45: AnimationMeta(
-        45,
-        "Indoor_Play",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Indoor_Play.gif",
-    ),
-    46: AnimationMeta(
-        46,
-        "Jump_Rope",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Rope.gif",
-    ),
-    47: AnimationMeta(
-        47,
-        "Listening_Gesture",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Listening_Gesture.gif",
-    ),
-    48: AnimationMeta(
-        48,
-        "Mirror_Viewing",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Mirror_Viewing.gif",
-    ),
-    49: AnimationMeta(
-        49,
-        "Motivational_Cheer",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Motivational_Cheer.gif",
-    ),
-    50: AnimationMeta(
-        50,
-        "Phone_Call_Gesture",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Phone_Call_Gesture.gif",
-    ),
-    51: AnimationMeta(
-        51,
-        "Shouting_Angrily",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Shouting_Angrily.gif",
-    ),
-    52: AnimationMeta(
-        52,
-        "Sit_to_Stand_Transition_F",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_to_Stand_Transition_F.gif",
-    ),
-    53: AnimationMeta(
-        53,
-        "Sit_to_Stand_Transition_M",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_to_Stand_Transition_M.gif",
-    ),
-    54: AnimationMeta(
-        54,
-        "Squat_Stance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Squat_Stance.gif",
-    ),
-    55: AnimationMeta(
-        55,
-        "Stage_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stage_Walk.gif",
-    ),
-    56: AnimationMeta(
-        56,
-        "Stand_and_Chat",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_and_Chat.gif",
-    ),
-    57: AnimationMeta(
-        57,
-        "Stand_to_Sit_Transition_M",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_to_Sit_Transition_M.gif",
-    ),
-    58: AnimationMeta(
-        58,
-        "Step_to_Sit_Transition",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Step_to_Sit_Transition.gif",
-    ),
-    59: AnimationMeta(
-        59,
-        "Victory_Cheer",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Victory_Cheer.gif",
-    ),
-    60: AnimationMeta(
-        60,
-        "Walk_to_Sit",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_to_Sit.gif",
-    ),
-    61: AnimationMeta(
-        61,
-        "happy_jump_m",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Happy_Jump_M.gif",
-    ),
-    62: AnimationMeta(
-        62,
-        "penguin_walk",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Penguin_walk.gif",
-    ),
-    63: AnimationMeta(
-        63,
-        "Arm_Circle_Shuffle",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Arm_Circle_Shuffle.gif",
-    ),
-    64: AnimationMeta(
-        64,
-        "All_Night_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/All_Night_Dance.gif",
-    ),
-    65: AnimationMeta(
-        65,
-        "Bass_Beats",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Bass_Beats.gif",
-    ),
-    66: AnimationMeta(
-        66,
-        "Boom_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Boom_Dance.gif",
-    ),
-    67: AnimationMeta(
-        67,
-        "Bubble_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Bubble_Dance.gif",
-    ),
-    68: AnimationMeta(
-        68,
-        "Cherish_Pop_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cherish_Pop_Dance.gif",
-    ),
-    69: AnimationMeta(
-        69,
-        "Crystal_Beads",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crystal_Beads.gif",
-    ),
-    70: AnimationMeta(
-        70,
-        "Cardio_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cardio_Dance.gif",
-    ),
-    71: AnimationMeta(
-        71,
-        "Denim_Pop_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Denim_Pop_Dance.gif",
-    ),
-    72: AnimationMeta(
-        72,
-        "Dont_You_Dare",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Dont_You_Dare.gif",
-    ),
-    73: AnimationMeta(
-        73,
-        "Fast_Lightning",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fast_Lightning.gif",
-    ),
-    74: AnimationMeta(
-        74,
-        "Gangnam_Groove",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Gangnam_Groove.gif",
-    ),
-    75: AnimationMeta(
-        75,
-        "Indoor_Swing",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Indoor_Swing.gif",
-    ),
-    76: AnimationMeta(
-        76,
-        "Love_You_Pop_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Love_You_Pop_Dance.gif",
-    ),
-    77: AnimationMeta(
-        77,
-        "Magic_Genie",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Magic_Genie.gif",
-    ),
-    78: AnimationMeta(
-        78,
-        "Not_Your_Mom",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Not_Your_Mom.gif",
-    ),
-    79: AnimationMeta(
-        79,
-        "OMG_Groove",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/OMG_Groove.gif",
-    ),
-    80: AnimationMeta(
-        80,
-        "Pop_Dance_LSA2",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Pop_Dance_LSA2.gif",
-    ),
-    81: AnimationMeta(
-        81,
-        "Pod_Baby_Groove",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Pod_Baby_Groove.gif",
-    ),
-    82: AnimationMeta(
-        82,
-        "Shake_It_Off_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Shake_It_Off_Dance.gif",
-    ),
-    83: AnimationMeta(
-        83,
-        "Superlove_Pop_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Superlove_Pop_Dance.gif",
-    ),
-    84: AnimationMeta(
-        84,
-        "You_Groove",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/You_Groove.gif",
-    ),
-    85: AnimationMeta(
-        85,
-        "Axe_Stance",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Axe_Stance.gif",
-    ),
-    86: AnimationMeta(
-        86,
-        "Basic_Jump",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Basic_Jump.gif",
-    ),
-    87: AnimationMeta(
-        87,
-        "Boxing_Practice",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Boxing_Practice.gif",
-    ),
-    88: AnimationMeta(
-        88,
-        "Chest_Pound_Taunt",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Chest_Pound_Taunt.gif",
-    ),
-    89: AnimationMeta(
-        89,
-        "Combat_Stance",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Combat_Stance.gif",
-    ),
-    90: AnimationMeta(
-        90,
-        "Counterstrike",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Counterstrike.gif",
-    ),
-    91: AnimationMeta(
-        91,
-        "Double_Blade_Spin",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Double_Blade_Spin.gif",
-    ),
-    92: AnimationMeta(
-        92,
-        "Double_Combo_Attack",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Double_Combo_Attack.gif",
-    ),
-    93: AnimationMeta(
-        93,
-        "Dodge_and_Counter",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Dodge_and_Counter.gif",
-    ),
-    94: AnimationMeta(
-        94,
-        "Flying_Fist_Kick",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Flying_Fist_Kick.gif",
-    ),
-    95: AnimationMeta(
-        95,
-        "Gun_Hold_Left_Turn",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Gun_Hold_Left_Turn.gif",
-    ),
-    96: AnimationMeta(
-        96,
-        "Kung_Fu_Punch",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Kung_Fu_Punch.gif",
-    ),
-    97: AnimationMeta(
-        97,
-        "Left_Slash",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Left_Slash.gif",
-    ),
-    98: AnimationMeta(
-        98,
-        "Run_and_Shoot",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_and_Shoot.gif",
-    ),
-    99: AnimationMeta(
-        99,
-        "Reaping_Swing",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Reaping_Swing.gif",
-    ),
-    100: AnimationMeta(
-        100,
-        "Rightward_Spin",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Rightward_Spin.gif",
-    ),
-    101: AnimationMeta(
-        101,
-        "Sword_Shout",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_Shout.gif",
-    ),
-    102: AnimationMeta(
-        102,
-        "Sword_Judgment",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_Judgment.gif",
-    ),
-    103: AnimationMeta(
-        103,
-        "Simple_Kick",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Simple_Kick.gif",
-    ),
-    104: AnimationMeta(
-        104,
-        "Side_Shot",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Side_Shot.gif",
-    ),
-    105: AnimationMeta(
-        105,
-        "Triple_Combo_Attack",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Triple_Combo_Attack.gif",
-    ),
-    106: AnimationMeta(
-        106,
-        "Confident_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Confident_Walk.gif",
-    ),
-    107: AnimationMeta(
-        107,
-        "Confident_Strut",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Confident_Strut.gif",
-    ),
-    108: AnimationMeta(
-        108,
-        "Flirty_Strut",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Flirty_Strut.gif",
-    ),
-    109: AnimationMeta(
-        109,
-        "Groovy_Walk",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Groovy_Walk.gif",
-    ),
-    110: AnimationMeta(
-        110,
-        "Hello_Run",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hello_Run.gif",
-    ),
-    111: AnimationMeta(
-        111,
-        "Injured_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Injured_Walk.gif",
-    ),
-    112: AnimationMeta(
-        112,
-        "Monster_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Monster_Walk.gif",
-    ),
-    113: AnimationMeta(
-        113,
-        "Mummy_Stagger",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Mummy_Stagger.gif",
-    ),
-    114: AnimationMeta(
-        114,
-        "Proud_Strut",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Proud_Strut.gif",
-    ),
-    115: AnimationMeta(
-        115,
-        "Quick_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Quick_Walk.gif",
-    ),
-    116: AnimationMeta(
-        116,
-        "Run_to_Walk_Transition",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_to_Walk_Transition.gif",
-    ),
-    117: AnimationMeta(
-        117,
-        "Red_Carpet_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Red_Carpet_Walk.gif",
-    ),
-    118: AnimationMeta(
-        118,
-        "Skip_Forward",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Skip_Forward.gif",
-    ),
-    119: AnimationMeta(
-        119,
-        "Slow_Orc_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Slow_Orc_Walk.gif",
-    ),
-    120: AnimationMeta(
-        120,
-        "Touch_and_Run",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Touch_and_Run.gif",
-    ),
-    121: AnimationMeta(
-        121,
-        "Thoughtful_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Thoughtful_Walk.gif",
-    ),
-    122: AnimationMeta(
-        122,
-        "Texting_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Texting_Walk.gif",
-    ),
-    123: AnimationMeta(
-        123,
-        "Unsteady_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Unsteady_Walk.gif",
-    ),
-    124: AnimationMeta(
-        124,
-        "Walking_with_Phone",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walking_with_Phone.gif",
-    ),
-    125: AnimationMeta(
-        125,
-        "Charged_Spell_Cast",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Charged_Spell_Cast.gif",
-    ),
-    126: AnimationMeta(
-        126,
-        "Charged_Spell_Cast_1",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Charged_Spell_Cast_1.gif",
-    ),
-    127: AnimationMeta(
-        127,
-        "Charged_Ground_Slam",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Charged_Ground_Slam.gif",
-    ),
-    128: AnimationMeta(
-        128,
-        "Heavy_Hammer_Swing",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Heavy_Hammer_Swing.gif",
-    ),
-    129: AnimationMeta(
-        129,
-        "mage_soell_cast",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/mage_soell_cast.gif",
-    ),
-    130: AnimationMeta(
-        130,
-        "mage_soell_cast_1",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/mage_soell_cast_1.gif",
-    ),
-    131: AnimationMeta(
-        131,
-        "mage_soell_cast_2",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/mage_soell_cast_2.gif",
-    ),
-    132: AnimationMeta(
-        132,
-        "mage_soell_cast_3",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/mage_soell_cast_3.gif",
-    ),
-    133: AnimationMeta(
-        133,
-        "mage_soell_cast_4",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/mage_soell_cast_4.gif",
-    ),
-    134: AnimationMeta(
-        134,
-        "mage_soell_cast_5",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/mage_soell_cast_5.gif",
-    ),
-    135: AnimationMeta(
-        135,
-        "mage_soell_cast_6",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/mage_soell_cast_6.gif",
-    ),
-    136: AnimationMeta(
-        136,
-        "mage_soell_cast_7",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/mage_soell_cast_7.gif",
-    ),
-    137: AnimationMeta(
-        137,
-        "mage_soell_cast_8",
-        "Fighting",
-        "CastingSpell",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/mage_soell_cast_8.gif",
-    ),
-    138: AnimationMeta(
-        138,
-        "Block1",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Block1.gif",
-    ),
-    139: AnimationMeta(
-        139,
-        "Block2",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Block2.gif",
-    ),
-    140: AnimationMeta(
-        140,
-        "Block3",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Block3.gif",
-    ),
-    141: AnimationMeta(
-        141,
-        "Block4",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Block4.gif",
-    ),
-    142: AnimationMeta(
-        142,
-        "Block5",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Block5.gif",
-    ),
-    143: AnimationMeta(
-        143,
-        "Block6",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Block6.gif",
-    ),
-    144: AnimationMeta(
-        144,
-        "Block8",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Block8.gif",
-    ),
-    145: AnimationMeta(
-        145,
-        "Block9",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Block9.gif",
-    ),
-    146: AnimationMeta(
-        146,
-        "Block10",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Block10.gif",
-    ),
-    147: AnimationMeta(
-        147,
-        "Sword_Parry",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_Parry.gif",
-    ),
-    148: AnimationMeta(
-        148,
-        "Sword_Parry_Backward",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_Parry_Backward.gif",
-    ),
-    149: AnimationMeta(
-        149,
-        "Two_Handed_Parry",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Two_Handed_Parry.gif",
-    ),
-    150: AnimationMeta(
-        150,
-        "Hit_Reaction_with_Bow",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hit_Reaction_with_Bow.gif",
-    ),
-    151: AnimationMeta(
-        151,
-        "Sword_Parry_Backward_1",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_Parry_Backward_1.gif",
-    ),
-    152: AnimationMeta(
-        152,
-        "Sword_Parry_Backward_2",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_Parry_Backward_2.gif",
-    ),
-    153: AnimationMeta(
-        153,
-        "Sword_Parry_Backward_3",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_Parry_Backward_3.gif",
-    ),
-    154: AnimationMeta(
-        154,
-        "Sword_Parry_Backward_4",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_Parry_Backward_4.gif",
-    ),
-    155: AnimationMeta(
-        155,
-        "Sword_Parry_Backward_5",
-        "Fighting",
-        "Blocking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_Parry_Backward_5.gif",
-    ),
-    156: AnimationMeta(
-        156,
-        "Stand_Dodge",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Dodge.gif",
-    ),
-    157: AnimationMeta(
-        157,
-        "Stand_Dodge_1",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Dodge_1.gif",
-    ),
-    158: AnimationMeta(
-        158,
-        "Roll_Dodge",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Roll_Dodge.gif",
-    ),
-    159: AnimationMeta(
-        159,
-        "Roll_Dodge_1",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Roll_Dodge_1.gif",
-    ),
-    160: AnimationMeta(
-        160,
-        "Roll_Dodge_2",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Roll_Dodge_2.gif",
-    ),
-    161: AnimationMeta(
-        161,
-        "Roll_Dodge_3",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Roll_Dodge_3.gif",
-    ),
-    162: AnimationMeta(
-        162,
-        "Stand_Dodge_2",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Dodge_2.gif",
-    ),
-    163: AnimationMeta(
-        163,
-        "Roll_Dodge_4",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Roll_Dodge_4.gif",
-    ),
-    164: AnimationMeta(
-        164,
-        "Stand_Dodge_3",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Dodge_3.gif",
-    ),
-    165: AnimationMeta(
-        165,
-        "Kneeling_Reload",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Kneeling_Reload.gif",
-    ),
-    166: AnimationMeta(
-        166,
-        "Running_Reload",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Running_Reload.gif",
-    ),
-    167: AnimationMeta(
-        167,
-        "Slow_Walk_Reload",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Slow_Walk_Reload.gif",
-    ),
-    168: AnimationMeta(
-        168,
-        "Prone_Reload",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Prone_Reload.gif",
-    ),
-    169: AnimationMeta(
-        169,
-        "Forward_Reload_Subtle",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Forward_Reload_Subtle.gif",
-    ),
-    170: AnimationMeta(
-        170,
-        "Standing_Reload",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Standing_Reload.gif",
-    ),
-    171: AnimationMeta(
-        171,
-        "Hit_Reaction_to_Waist",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hit_Reaction_to_Waist.gif",
-    ),
-    172: AnimationMeta(
-        172,
-        "Electrocution_Reaction",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Electrocution_Reaction.gif",
-    ),
-    173: AnimationMeta(
-        173,
-        "Slap_Reaction",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Slap_Reaction.gif",
-    ),
-    174: AnimationMeta(
-        174,
-        "Face_Punch_Reaction",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Face_Punch_Reaction.gif",
-    ),
-    175: AnimationMeta(
-        175,
-        "Face_Punch_Reaction_1",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Face_Punch_Reaction_1.gif",
-    ),
-    176: AnimationMeta(
-        176,
-        "Face_Punch_Reaction_2",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Face_Punch_Reaction_2.gif",
-    ),
-    177: AnimationMeta(
-        177,
-        "Gunshot_Reaction",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Gunshot_Reaction.gif",
-    ),
-    178: AnimationMeta(
-        178,
-        "Hit_Reaction",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hit_Reaction.gif",
-    ),
-    179: AnimationMeta(
-        179,
-        "Hit_Reaction_1",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hit_Reaction_1.gif",
-    ),
-    180: AnimationMeta(
-        180,
-        "Shot_in_the_Back_and_Fall",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Shot_in_the_Back_and_Fall.gif",
-    ),
-    181: AnimationMeta(
-        181,
-        "Electrocuted_Fall",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Electrocuted_Fall.gif",
-    ),
-    182: AnimationMeta(
-        182,
-        "Shot_and_Blown_Back",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Shot_and_Blown_Back.gif",
-    ),
-    183: AnimationMeta(
-        183,
-        "Shot_and_Fall_Backward",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Shot_and_Fall_Backward.gif",
-    ),
-    184: AnimationMeta(
-        184,
-        "Shot_and_Fall_Forward",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Shot_and_Fall_Forward.gif",
-    ),
-    185: AnimationMeta(
-        185,
-        "Shot_and_Slow_Fall_Backward",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Shot_and_Slow_Fall_Backward.gif",
-    ),
-    186: AnimationMeta(
-        186,
-        "Strangled_and_Fall_Forward",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Strangled_and_Fall_Forward.gif",
-    ),
-    187: AnimationMeta(
-        187,
-        "Knock_Down",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Knock_Down.gif",
-    ),
-    188: AnimationMeta(
-        188,
-        "Fall_Dead_from_Abdominal_Injury",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fall_Dead_from_Abdominal_Injury.gif",
-    ),
-    189: AnimationMeta(
-        189,
-        "dying_backwards",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/dying_backwards.gif",
-    ),
-    190: AnimationMeta(
-        190,
-        "Knock_Down_1",
-        "Fighting",
-        "Dying",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Knock_Down_1.gif",
-    ),
-    191: AnimationMeta(
-        191,
-        "Left_Jab_from_Guard",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Left_Jab_from_Guard.gif",
-    ),
-    192: AnimationMeta(
-        192,
-        "Right_Jab_from_Guard",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Right_Jab_from_Guard.gif",
-    ),
-    193: AnimationMeta(
-        193,
-        "Left_Hook_from_Guard",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Left_Hook_from_Guard.gif",
-    ),
-    194: AnimationMeta(
-        194,
-        "Right_Uppercut_from_Guard",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Right_Uppercut_from_Guard.gif",
-    ),
-    195: AnimationMeta(
-        195,
-        "Right_Upper_Hook_from_Guard",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Right_Upper_Hook_from_Guard.gif",
-    ),
-    196: AnimationMeta(
-        196,
-        "Left_Uppercut_from_Guard",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Left_Uppercut_from_Guard.gif",
-    ),
-    197: AnimationMeta(
-        197,
-        "Left_Short_Hook_from_Guard",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Left_Short_Hook_from_Guard.gif",
-    ),
-    198: AnimationMeta(
-        198,
-        "Punch_Combo",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Punch_Combo.gif",
-    ),
-    199: AnimationMeta(
-        199,
-        "Weapon_Combo",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Weapon_Combo.gif",
-    ),
-    200: AnimationMeta(
-        200,
-        "Punch_Combo_1",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Punch_Combo_1.gif",
-    ),
-    201: AnimationMeta(
-        201,
-        "Punch_Combo_2",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Punch_Combo_2.gif",
-    ),
-    202: AnimationMeta(
-        202,
-        "Weapon_Combo_1",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Weapon_Combo_1.gif",
-    ),
-    203: AnimationMeta(
-        203,
-        "Punch_Combo_3",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Punch_Combo_3.gif",
-    ),
-    204: AnimationMeta(
-        204,
-        "Punch_Combo_4",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Punch_Combo_4.gif",
-    ),
-    205: AnimationMeta(
-        205,
-        "Punch_Combo_5",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Punch_Combo_5.gif",
-    ),
-    206: AnimationMeta(
-        206,
-        "Spartan_Kick",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Spartan_Kick.gif",
-    ),
-    207: AnimationMeta(
-        207,
-        "Roundhouse_Kick",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Roundhouse_Kick.gif",
-    ),
-    208: AnimationMeta(
-        208,
-        "Lunge_Roundhouse_Kick",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Lunge_Roundhouse_Kick.gif",
-    ),
-    209: AnimationMeta(
-        209,
-        "Boxing_Guard_Right_Straight_Kick",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Boxing_Guard_Right_Straight_Kick.gif",
-    ),
-    210: AnimationMeta(
-        210,
-        "Boxing_Guard_Prep_Straight_Punch",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Boxing_Guard_Prep_Straight_Punch.gif",
-    ),
-    211: AnimationMeta(
-        211,
-        "Boxing_Guard_Step_Knee_Strike",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Boxing_Guard_Step_Knee_Strike.gif",
-    ),
-    212: AnimationMeta(
-        212,
-        "Elbow_Strike",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Elbow_Strike.gif",
-    ),
-    213: AnimationMeta(
-        213,
-        "Leg_Sweep",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Leg_Sweep.gif",
-    ),
-    214: AnimationMeta(
-        214,
-        "Punch_Forward_with_Both_Fists",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Punch_Forward_with_Both_Fists.gif",
-    ),
-    215: AnimationMeta(
-        215,
-        "High_Kick",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/High_Kick.gif",
-    ),
-    216: AnimationMeta(
-        216,
-        "Lunge_Spin_Kick",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Lunge_Spin_Kick.gif",
-    ),
-    217: AnimationMeta(
-        217,
-        "Sweeping_Kick",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sweeping_Kick.gif",
-    ),
-    218: AnimationMeta(
-        218,
-        "Step_in_High_Kick",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Step_in_High_Kick.gif",
-    ),
-    219: AnimationMeta(
-        219,
-        "Right_Hand_Sword_Slash",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Right_Hand_Sword_Slash.gif",
-    ),
-    220: AnimationMeta(
-        220,
-        "Shield_Push_Left",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Shield_Push_Left.gif",
-    ),
-    221: AnimationMeta(
-        221,
-        "Charged_Upward_Slash",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Charged_Upward_Slash.gif",
-    ),
-    222: AnimationMeta(
-        222,
-        "Draw_and_Shoot_from_Back",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Draw_and_Shoot_from_Back.gif",
-    ),
-    223: AnimationMeta(
-        223,
-        "Draw_and_Shoot_from_Back_1",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Draw_and_Shoot_from_Back_1.gif",
-    ),
-    224: AnimationMeta(
-        224,
-        "Archery_Shot",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Archery_Shot.gif",
-    ),
-    225: AnimationMeta(
-        225,
-        "Archery_Shot_1",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Archery_Shot_1.gif",
-    ),
-    226: AnimationMeta(
-        226,
-        "Archery_Shot_2",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Archery_Shot_2.gif",
-    ),
-    227: AnimationMeta(
-        227,
-        "Archery_Shot_3",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Archery_Shot_3.gif",
-    ),
-    228: AnimationMeta(
-        228,
-        "Walk_Forward_with_Bow_Aimed",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Forward_with_Bow_Aimed.gif",
-    ),
-    229: AnimationMeta(
-        229,
-        "Draw_and_Shoot_from_Back_2",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Draw_and_Shoot_from_Back_2.gif",
-    ),
-    230: AnimationMeta(
-        230,
-        "Walk_Backward_with_Bow_Aimed",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Bow_Aimed.gif",
-    ),
-    231: AnimationMeta(
-        231,
-        "Archery_Aim_with_Lateral_Scan",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Archery_Aim_with_Lateral_Scan.gif",
-    ),
-    232: AnimationMeta(
-        232,
-        "Cowboy_Quick_Draw_Shooting",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cowboy_Quick_Draw_Shooting.gif",
-    ),
-    233: AnimationMeta(
-        233,
-        "Walk_Backward_While_Shooting",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_While_Shooting.gif",
-    ),
-    234: AnimationMeta(
-        234,
-        "Walk_Forward_While_Shooting",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Forward_While_Shooting.gif",
-    ),
-    235: AnimationMeta(
-        235,
-        "Forward_Roll_and_Fire",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Forward_Roll_and_Fire.gif",
-    ),
-    236: AnimationMeta(
-        236,
-        "Draw_and_Shoot_Left",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Draw_and_Shoot_Left.gif",
-    ),
-    237: AnimationMeta(
-        237,
-        "Charged_Axe_Chop",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Charged_Axe_Chop.gif",
-    ),
-    238: AnimationMeta(
-        238,
-        "Axe_Spin_Attack",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Axe_Spin_Attack.gif",
-    ),
-    239: AnimationMeta(
-        239,
-        "Crouch_Pull_and_Throw",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_Pull_and_Throw.gif",
-    ),
-    240: AnimationMeta(
-        240,
-        "Thrust_Slash",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Thrust_Slash.gif",
-    ),
-    241: AnimationMeta(
-        241,
-        "Weapon_Combo_2",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Weapon_Combo_2.gif",
-    ),
-    242: AnimationMeta(
-        242,
-        "Charged_Slash",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Charged_Slash.gif",
-    ),
-    243: AnimationMeta(
-        243,
-        "Idle_3",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_3.gif",
-    ),
-    244: AnimationMeta(
-        244,
-        "Idle_4",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_4.gif",
-    ),
-    245: AnimationMeta(
-        245,
-        "Idle_5",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_5.gif",
-    ),
-    246: AnimationMeta(
-        246,
-        "Idle_6",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_6.gif",
-    ),
-    247: AnimationMeta(
-        247,
-        "Idle_7",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_7.gif",
-    ),
-    248: AnimationMeta(
-        248,
-        "Idle_8",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_8.gif",
-    ),
-    249: AnimationMeta(
-        249,
-        "Idle_9",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_9.gif",
-    ),
-    250: AnimationMeta(
-        250,
-        "Idle_10",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_10.gif",
-    ),
-    251: AnimationMeta(
-        251,
-        "Idle_11",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_11.gif",
-    ),
-    252: AnimationMeta(
-        252,
-        "Idle_12",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_12.gif",
-    ),
-    253: AnimationMeta(
-        253,
-        "Idle_13",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_13.gif",
-    ),
-    254: AnimationMeta(
-        254,
-        "Idle_14",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_14.gif",
-    ),
-    255: AnimationMeta(
-        255,
-        "Angry_Ground_Stomp",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Angry_Ground_Stomp.gif",
-    ),
-    256: AnimationMeta(
-        256,
-        "Angry_Ground_Stomp_1",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Angry_Ground_Stomp_1.gif",
-    ),
-    257: AnimationMeta(
-        257,
-        "Angry_Ground_Stomp_2",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Angry_Ground_Stomp_2.gif",
-    ),
-    258: AnimationMeta(
-        258,
-        "CrouchLookAroundBow",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/CrouchLookAroundBow.gif",
-    ),
-    259: AnimationMeta(
-        259,
-        "Step_Forward_and_Push",
-        "DailyActions",
-        "Pushing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Step_Forward_and_Push.gif",
-    ),
-    260: AnimationMeta(
-        260,
-        "Push_Forward_and_Stop",
-        "DailyActions",
-        "Pushing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Push_Forward_and_Stop.gif",
-    ),
-    261: AnimationMeta(
-        261,
-        "Push_and_Walk_Forward",
-        "DailyActions",
-        "Pushing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Push_and_Walk_Forward.gif",
-    ),
-    262: AnimationMeta(
-        262,
-        "Crouch_and_Push_Forward",
-        "DailyActions",
-        "Pushing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_and_Push_Forward.gif",
-    ),
-    263: AnimationMeta(
-        263,
-        "Sleep_on_Desk",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sleep_on_Desk.gif",
-    ),
-    264: AnimationMeta(
-        264,
-        "Cough_While_Sleeping",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cough_While_Sleeping.gif",
-    ),
-    265: AnimationMeta(
-        265,
-        "Groan_Holding_Stomach_in_Sleep",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Groan_Holding_Stomach_in_Sleep.gif",
-    ),
-    266: AnimationMeta(
-        266,
-        "Lie_Down_Hands_Spread",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Lie_Down_Hands_Spread.gif",
-    ),
-    267: AnimationMeta(
-        267,
-        "Sleep_Normally",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sleep_Normally.gif",
-    ),
-    268: AnimationMeta(
-        268,
-        "Sit_and_Doze_Off",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_and_Doze_Off.gif",
-    ),
-    269: AnimationMeta(
-        269,
-        "sleep",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/sleep.gif",
-    ),
-    270: AnimationMeta(
-        270,
-        "Toss_and_Turn",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Toss_and_Turn.gif",
-    ),
-    271: AnimationMeta(
-        271,
-        "Wake_Up_and_Look_Up",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wake_Up_and_Look_Up.gif",
-    ),
-    272: AnimationMeta(
-        272,
-        "Lie_on_Chair_Sunbathe_and_Sleep",
-        "DailyActions",
-        "Sleeping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Lie_on_Chair_Sunbathe_and_Sleep.gif",
-    ),
-    273: AnimationMeta(
-        273,
-        "Male_Run_Forward_Pick_Up_Left",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Male_Run_Forward_Pick_Up_Left.gif",
-    ),
-    274: AnimationMeta(
-        274,
-        "Female_Crouch_Pick_Up_Place_Side",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Crouch_Pick_Up_Place_Side.gif",
-    ),
-    275: AnimationMeta(
-        275,
-        "Female_Run_Forward_Pick_Up_Right",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Run_Forward_Pick_Up_Right.gif",
-    ),
-    276: AnimationMeta(
-        276,
-        "Male_Bend_Over_Pick_Up",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Male_Bend_Over_Pick_Up.gif",
-    ),
-    277: AnimationMeta(
-        277,
-        "Female_Crouch_Pick_Fruit_Basket_Stand",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Crouch_Pick_Fruit_Basket_Stand.gif",
-    ),
-    278: AnimationMeta(
-        278,
-        "Female_Stand_Pick_Fruit_Basket",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Stand_Pick_Fruit_Basket.gif",
-    ),
-    279: AnimationMeta(
-        279,
-        "Female_Crouch_Pick_Gun_Point_Forward",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Crouch_Pick_Gun_Point_Forward.gif",
-    ),
-    280: AnimationMeta(
-        280,
-        "Female_Crouch_Pick_Throw_Forward",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Crouch_Pick_Throw_Forward.gif",
-    ),
-    281: AnimationMeta(
-        281,
-        "Female_Bend_Over_Pick_Up_Inspect",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Bend_Over_Pick_Up_Inspect.gif",
-    ),
-    282: AnimationMeta(
-        282,
-        "Female_Walk_Pick_Put_In_Pocket",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Walk_Pick_Put_In_Pocket.gif",
-    ),
-    283: AnimationMeta(
-        283,
-        "Pull_Radish",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Pull_Radish.gif",
-    ),
-    284: AnimationMeta(
-        284,
-        "Collect_Object",
-        "DailyActions",
-        "PickingUpItem",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Collect_Object.gif",
-    ),
-    285: AnimationMeta(
-        285,
-        "open_door",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/open_door.gif",
-    ),
-    286: AnimationMeta(
-        286,
-        "open_door_1",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/open_door_1.gif",
-    ),
-    287: AnimationMeta(
-        287,
-        "open_door_2",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/open_door_2.gif",
-    ),
-    288: AnimationMeta(
-        288,
-        "open_door_3",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/open_door_3.gif",
-    ),
-    289: AnimationMeta(
-        289,
-        "open_door_4",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/open_door_4.gif",
-    ),
-    290: AnimationMeta(
-        290,
-        "Wave_One_Hand",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wave_One_Hand.gif",
-    ),
-    291: AnimationMeta(
-        291,
-        "Wave_for_Help",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wave_for_Help.gif",
-    ),
-    292: AnimationMeta(
-        292,
-        "Gesture_with_Hand_on_Gun",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Gesture_with_Hand_on_Gun.gif",
-    ),
-    293: AnimationMeta(
-        293,
-        "Wave_for_Help_1",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wave_for_Help_1.gif",
-    ),
-    294: AnimationMeta(
-        294,
-        "Wave_for_Help_2",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wave_for_Help_2.gif",
-    ),
-    295: AnimationMeta(
-        295,
-        "Wave_for_Help_3",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wave_for_Help_3.gif",
-    ),
-    296: AnimationMeta(
-        296,
-        "Wave_for_Help_4",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wave_for_Help_4.gif",
-    ),
-    297: AnimationMeta(
-        297,
-        "Personalized_Gesture",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Personalized_Gesture.gif",
-    ),
-    298: AnimationMeta(
-        298,
-        "Cheer_with_Both_Hands_Up",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cheer_with_Both_Hands_Up.gif",
-    ),
-    299: AnimationMeta(
-        299,
-        "Stand_Clap_and_Sit_Down",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Clap_and_Sit_Down.gif",
-    ),
-    300: AnimationMeta(
-        300,
-        "Sit_Cheer_with_Left_Hand",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_Cheer_with_Left_Hand.gif",
-    ),
-    301: AnimationMeta(
-        301,
-        "Cheer_with_Both_Hands_1",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cheer_with_Both_Hands_1.gif",
-    ),
-    302: AnimationMeta(
-        302,
-        "Stand_Wave_and_Sit_Down",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Wave_and_Sit_Down.gif",
-    ),
-    303: AnimationMeta(
-        303,
-        "Cheer_with_Both_Hands",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cheer_with_Both_Hands.gif",
-    ),
-    304: AnimationMeta(
-        304,
-        "Seated_Fist_Pump",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Seated_Fist_Pump.gif",
-    ),
-    305: AnimationMeta(
-        305,
-        "Stand_Cheer_and_Sit_Down",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Cheer_and_Sit_Down.gif",
-    ),
-    306: AnimationMeta(
-        306,
-        "Cheer_with_One_Hand_Up",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cheer_with_One_Hand_Up.gif",
-    ),
-    307: AnimationMeta(
-        307,
-        "Sitting_Answering_Questions",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sitting_Answering_Questions.gif",
-    ),
-    308: AnimationMeta(
-        308,
-        "Talk_Passionately",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Talk_Passionately.gif",
-    ),
-    309: AnimationMeta(
-        309,
-        "Talk_with_Left_Hand_on_Hip",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Talk_with_Left_Hand_on_Hip.gif",
-    ),
-    310: AnimationMeta(
-        310,
-        "Talk_with_Left_Hand_Raised",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Talk_with_Left_Hand_Raised.gif",
-    ),
-    311: AnimationMeta(
-        311,
-        "Stand_Talking_Angry",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Talking_Angry.gif",
-    ),
-    312: AnimationMeta(
-        312,
-        "Phone_Conversation",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Phone_Conversation.gif",
-    ),
-    313: AnimationMeta(
-        313,
-        "Talk_with_Hands_Open",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Talk_with_Hands_Open.gif",
-    ),
-    314: AnimationMeta(
-        314,
-        "Talk_with_Right_Hand_Open",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Talk_with_Right_Hand_Open.gif",
-    ),
-    315: AnimationMeta(
-        315,
-        "Hand_on_Hip_Gesture",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hand_on_Hip_Gesture.gif",
-    ),
-    316: AnimationMeta(
-        316,
-        "Headache_Relief",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Headache_Relief.gif",
-    ),
-    317: AnimationMeta(
-        317,
-        "Shrug",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Shrug.gif",
-    ),
-    318: AnimationMeta(
-        318,
-        "Scheming_Hand_Rub",
-        "DailyActions",
-        "Interacting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Scheming_Hand_Rub.gif",
-    ),
-    319: AnimationMeta(
-        319,
-        "air_squat",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/air_squat.gif",
-    ),
-    320: AnimationMeta(
-        320,
-        "bicep_curl",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/bicep_curl.gif",
-    ),
-    321: AnimationMeta(
-        321,
-        "bicycle_crunch",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/bicycle_crunch.gif",
-    ),
-    322: AnimationMeta(
-        322,
-        "circle_crunch",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/circle_crunch.gif",
-    ),
-    323: AnimationMeta(
-        323,
-        "golf_drive",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/golf_drive.gif",
-    ),
-    324: AnimationMeta(
-        324,
-        "idle_to_push_up",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/idle_to_push_up.gif",
-    ),
-    325: AnimationMeta(
-        325,
-        "jump_push_up",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/jump_push_up.gif",
-    ),
-    326: AnimationMeta(
-        326,
-        "jumping_jacks",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/jumping_jacks.gif",
-    ),
-    327: AnimationMeta(
-        327,
-        "kettlebell_swing",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/kettlebell_swing.gif",
-    ),
-    328: AnimationMeta(
-        328,
-        "push_up_to_idle",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/push_up_to_idle.gif",
-    ),
-    329: AnimationMeta(
-        329,
-        "push_up",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/push_up.gif",
-    ),
-    330: AnimationMeta(
-        330,
-        "situps",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/situps.gif",
-    ),
-    331: AnimationMeta(
-        331,
-        "Sumo_High_Pull",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sumo_High_Pull.gif",
-    ),
-    333: AnimationMeta(
-        333,
-        "Look_Around_Dumbfounded",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Look_Around_Dumbfounded.gif",
-    ),
-    334: AnimationMeta(
-        334,
-        "Lower_Weapon_Look_Raise",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Lower_Weapon_Look_Raise.gif",
-    ),
-    335: AnimationMeta(
-        335,
-        "Axe_Breathe_and_Look_Around",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Axe_Breathe_and_Look_Around.gif",
-    ),
-    336: AnimationMeta(
-        336,
-        "Long_Breathe_and_Look_Around",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Long_Breathe_and_Look_Around.gif",
-    ),
-    337: AnimationMeta(
-        337,
-        "Torch_Look_Around",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Torch_Look_Around.gif",
-    ),
-    338: AnimationMeta(
-        338,
-        "Short_Breathe_and_Look_Around",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Short_Breathe_and_Look_Around.gif",
-    ),
-    339: AnimationMeta(
-        339,
-        "Walking_Scan_with_Sudden_Look_Back",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walking_Scan_with_Sudden_Look_Back.gif",
-    ),
-    340: AnimationMeta(
-        340,
-        "Crawl_and_Look_Back",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crawl_and_Look_Back.gif",
-    ),
-    341: AnimationMeta(
-        341,
-        "Walk_Slowly_and_Look_Around",
-        "DailyActions",
-        "LookingAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Slowly_and_Look_Around.gif",
-    ),
-    342: AnimationMeta(
-        342,
-        "Stand_and_Drink",
-        "DailyActions",
-        "Drinking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_and_Drink.gif",
-    ),
-    343: AnimationMeta(
-        343,
-        "Sit_and_Drink",
-        "DailyActions",
-        "Drinking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_and_Drink.gif",
-    ),
-    344: AnimationMeta(
-        344,
-        "Stand_Up1",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up1.gif",
-    ),
-    345: AnimationMeta(
-        345,
-        "Stand_Up2",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up2.gif",
-    ),
-    346: AnimationMeta(
-        346,
-        "Stand_Up3",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up3.gif",
-    ),
-    347: AnimationMeta(
-        347,
-        "Stand_Up4",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up4.gif",
-    ),
-    348: AnimationMeta(
-        348,
-        "Stand_Up5",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up5.gif",
-    ),
-    349: AnimationMeta(
-        349,
-        "Stand_Up6",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up6.gif",
-    ),
-    350: AnimationMeta(
-        350,
-        "Stand_Up7",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up7.gif",
-    ),
-    351: AnimationMeta(
-        351,
-        "Stand_Up8",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up8.gif",
-    ),
-    352: AnimationMeta(
-        352,
-        "Stand_Up9",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up9.gif",
-    ),
-    353: AnimationMeta(
-        353,
-        "Stand_Up10",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_Up10.gif",
-    ),
-    354: AnimationMeta(
-        354,
-        "Sitting_Clap",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sitting_Clap.gif",
-    ),
-    355: AnimationMeta(
-        355,
-        "Sit_Finger_Wag_No",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_Finger_Wag_No.gif",
-    ),
-    356: AnimationMeta(
-        356,
-        "Sit_Hands_on_Head_Lean_Back",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_Hands_on_Head_Lean_Back.gif",
-    ),
-    357: AnimationMeta(
-        357,
-        "Sit_Thumbs_Up_Right",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_Thumbs_Up_Right.gif",
-    ),
-    358: AnimationMeta(
-        358,
-        "Sit_Shout_Hands_on_Mouth",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_Shout_Hands_on_Mouth.gif",
-    ),
-    359: AnimationMeta(
-        359,
-        "Look_Back_and_Sit",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Look_Back_and_Sit.gif",
-    ),
-    360: AnimationMeta(
-        360,
-        "Sit_to_standTransition_Female_2",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_to_standTransition_Female_2.gif",
-    ),
-    361: AnimationMeta(
-        361,
-        "Sit_Dodge",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_Dodge.gif",
-    ),
-    362: AnimationMeta(
-        362,
-        "Sit_Cross_Legged",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_Cross_Legged.gif",
-    ),
-    363: AnimationMeta(
-        363,
-        "Sit_Cross_Legged_on_Floor",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_Cross_Legged_on_Floor.gif",
-    ),
-    364: AnimationMeta(
-        364,
-        "Sit_on_Chair_Arms_Crossed",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_on_Chair_Arms_Crossed.gif",
-    ),
-    365: AnimationMeta(
-        365,
-        "Kneel_on_One_Knee_and_Stand",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Kneel_on_One_Knee_and_Stand.gif",
-    ),
-    366: AnimationMeta(
-        366,
-        "falling_down",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/falling_down.gif",
-    ),
-    367: AnimationMeta(
-        367,
-        "SideLying_Reach_Help",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/SideLying_Reach_Help.gif",
-    ),
-    368: AnimationMeta(
-        368,
-        "Angry_To_Tantrum_Sit",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Angry_To_Tantrum_Sit.gif",
-    ),
-    369: AnimationMeta(
-        369,
-        "Lie_Back_Leg_Swing",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Lie_Back_Leg_Swing.gif",
-    ),
-    370: AnimationMeta(
-        370,
-        "Stand_To_Side_Lying",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_To_Side_Lying.gif",
-    ),
-    371: AnimationMeta(
-        371,
-        "Sit_Lie_Bed",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sit_Lie_Bed.gif",
-    ),
-    372: AnimationMeta(
-        372,
-        "Prone_Reach_Help",
-        "DailyActions",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Prone_Reach_Help.gif",
-    ),
-    375: AnimationMeta(
-        375,
-        "Handstand_Flip",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Handstand_Flip.gif",
-    ),
-    376: AnimationMeta(
-        376,
-        "Punch_Pose",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Punch_Pose.gif",
-    ),
-    377: AnimationMeta(
-        377,
-        "Relax_arms_then_strike_battle_pose",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Relax_arms_then_strike_battle_pose.gif",
-    ),
-    378: AnimationMeta(
-        378,
-        "Large_step_then_high_kick",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Large_step_then_high_kick.gif",
-    ),
-    379: AnimationMeta(
-        379,
-        "Side_jumps_in_horse_stance",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Side_jumps_in_horse_stance.gif",
-    ),
-    381: AnimationMeta(
-        381,
-        "Step_Right_for_Exercise",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Step_Right_for_Exercise.gif",
-    ),
-    382: AnimationMeta(
-        382,
-        "Jump_and_Slam_Back_Down",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_and_Slam_Back_Down.gif",
-    ),
-    384: AnimationMeta(
-        384,
-        "Quick_Step_and_Spin_Dodge",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Quick_Step_and_Spin_Dodge.gif",
-    ),
-    385: AnimationMeta(
-        385,
-        "Boxing_Warmup",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Boxing_Warmup.gif",
-    ),
-    386: AnimationMeta(
-        386,
-        "Zombie_Scream",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Zombie_Scream.gif",
-    ),
-    387: AnimationMeta(
-        387,
-        "Half_Squat_with_Thumb_Up",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Half_Squat_with_Thumb_Up.gif",
-    ),
-    388: AnimationMeta(
-        388,
-        "Show_Both_Arm_Muscles",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Show_Both_Arm_Muscles.gif",
-    ),
-    389: AnimationMeta(
-        389,
-        "Grip_and_Throw_Down",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Grip_and_Throw_Down.gif",
-    ),
-    390: AnimationMeta(
-        390,
-        "Stand_on_Pole_and_Balance",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stand_on_Pole_and_Balance.gif",
-    ),
-    391: AnimationMeta(
-        391,
-        "Head_Hold_in_Pain",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Head_Hold_in_Pain.gif",
-    ),
-    392: AnimationMeta(
-        392,
-        "Ground_Flip_and_Sweep_Up",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Ground_Flip_and_Sweep_Up.gif",
-    ),
-    393: AnimationMeta(
-        393,
-        "baseball_pitching",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/baseball_pitching.gif",
-    ),
-    394: AnimationMeta(
-        394,
-        "Backflip_and_Hooks",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Backflip_and_Hooks.gif",
-    ),
-    395: AnimationMeta(
-        395,
-        "Breakdance_1990",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Breakdance_1990.gif",
-    ),
-    396: AnimationMeta(
-        396,
-        "Burpee_Exercise",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Burpee_Exercise.gif",
-    ),
-    397: AnimationMeta(
-        397,
-        "360_Power_Spin_Jump",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/360_Power_Spin_Jump.gif",
-    ),
-    398: AnimationMeta(
-        398,
-        "Crouch_Charge_and_Throw",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_Charge_and_Throw.gif",
-    ),
-    399: AnimationMeta(
-        399,
-        "Step_Step_Turn_Kick",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Step_Step_Turn_Kick.gif",
-    ),
-    401: AnimationMeta(
-        401,
-        "Sprint_Roll_and_Flip",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sprint_Roll_and_Flip.gif",
-    ),
-    402: AnimationMeta(
-        402,
-        "Run_and_Leap",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_and_Leap.gif",
-    ),
-    403: AnimationMeta(
-        403,
-        "Victory_Fist_Pump",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Victory_Fist_Pump.gif",
-    ),
-    404: AnimationMeta(
-        404,
-        "Crouch_and_Step_Back",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_and_Step_Back.gif",
-    ),
-    405: AnimationMeta(
-        405,
-        "Joyful_Dance_with_Hand_Sway",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Joyful_Dance_with_Hand_Sway.gif",
-    ),
-    406: AnimationMeta(
-        406,
-        "Thomas_Flair_to_Jump_Up",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Thomas_Flair_to_Jump_Up.gif",
-    ),
-    407: AnimationMeta(
-        407,
-        "Wall_Push_Jump_and_Flip",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wall_Push_Jump_and_Flip.gif",
-    ),
-    408: AnimationMeta(
-        408,
-        "Jazz_Hands",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jazz_Hands.gif",
-    ),
-    409: AnimationMeta(
-        409,
-        "Finger_Wag_No",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Finger_Wag_No.gif",
-    ),
-    410: AnimationMeta(
-        410,
-        "Kick_a_Soccer_Ball",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Kick_a_Soccer_Ball.gif",
-    ),
-    411: AnimationMeta(
-        411,
-        "Neck_Slashing_Gesture",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Neck_Slashing_Gesture.gif",
-    ),
-    412: AnimationMeta(
-        412,
-        "victory",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/victory.gif",
-    ),
-    413: AnimationMeta(
-        413,
-        "Backflip_and_Rise",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Backflip_and_Rise.gif",
-    ),
-    414: AnimationMeta(
-        414,
-        "Double_kick_forward",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Double_kick_forward.gif",
-    ),
-    415: AnimationMeta(
-        415,
-        "Happy_Sway_Standing",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Happy_Sway_Standing.gif",
-    ),
-    416: AnimationMeta(
-        416,
-        "Hit_in_Back_While_Running",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hit_in_Back_While_Running.gif",
-    ),
-    417: AnimationMeta(
-        417,
-        "Hop_with_Arms_Raised",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hop_with_Arms_Raised.gif",
-    ),
-    419: AnimationMeta(
-        419,
-        "Jump_to_Catch_and_Fall",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_to_Catch_and_Fall.gif",
-    ),
-    420: AnimationMeta(
-        420,
-        "Left_Hand_Bitten_Step_Back",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Left_Hand_Bitten_Step_Back.gif",
-    ),
-    421: AnimationMeta(
-        421,
-        "Over_Shoulder_Throw",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Over_Shoulder_Throw.gif",
-    ),
-    422: AnimationMeta(
-        422,
-        "Rising_Flying_Kick",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Rising_Flying_Kick.gif",
-    ),
-    425: AnimationMeta(
-        425,
-        "Vault_with_Rifle",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Vault_with_Rifle.gif",
-    ),
-    426: AnimationMeta(
-        426,
-        "Roll_Behind_Cover",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Roll_Behind_Cover.gif",
-    ),
-    427: AnimationMeta(
-        427,
-        "Vault_and_Land",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Vault_and_Land.gif",
-    ),
-    428: AnimationMeta(
-        428,
-        "Unarmed_Vault",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Unarmed_Vault.gif",
-    ),
-    429: AnimationMeta(
-        429,
-        "Parkour_Vault",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Parkour_Vault.gif",
-    ),
-    430: AnimationMeta(
-        430,
-        "Parkour_Vault_with_Roll",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Parkour_Vault_with_Roll.gif",
-    ),
-    431: AnimationMeta(
-        431,
-        "Parkour_Vault_1",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Parkour_Vault_1.gif",
-    ),
-    432: AnimationMeta(
-        432,
-        "Parkour_Vault_2",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Parkour_Vault_2.gif",
-    ),
-    433: AnimationMeta(
-        433,
-        "Parkour_Vault_3",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Parkour_Vault_3.gif",
-    ),
-    434: AnimationMeta(
-        434,
-        "Fast_Ladder_Climb",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fast_Ladder_Climb.gif",
-    ),
-    435: AnimationMeta(
-        435,
-        "Ladder_Climb_Finish",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Ladder_Climb_Finish.gif",
-    ),
-    436: AnimationMeta(
-        436,
-        "Ladder_Mount_Start",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Ladder_Mount_Start.gif",
-    ),
-    437: AnimationMeta(
-        437,
-        "Slow_Ladder_Climb",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Slow_Ladder_Climb.gif",
-    ),
-    438: AnimationMeta(
-        438,
-        "Ladder_Climb_Loop",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Ladder_Climb_Loop.gif",
-    ),
-    439: AnimationMeta(
-        439,
-        "Climb_Left_with_Both_Limbs",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Left_with_Both_Limbs.gif",
-    ),
-    440: AnimationMeta(
-        440,
-        "Climb_Right_with_Both_Limbs",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Right_with_Both_Limbs.gif",
-    ),
-    441: AnimationMeta(
-        441,
-        "Climb_Stairs",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Stairs.gif",
-    ),
-    442: AnimationMeta(
-        442,
-        "Fast_Stair_Climb",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fast_Stair_Climb.gif",
-    ),
-    444: AnimationMeta(
-        444,
-        "climbing_up_wall",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/climbing_up_wall.gif",
-    ),
-    445: AnimationMeta(
-        445,
-        "diagonal_wall_run",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/diagonal_wall_run.gif",
-    ),
-    446: AnimationMeta(
-        446,
-        "Hang_and_Climb_Left",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hang_and_Climb_Left.gif",
-    ),
-    447: AnimationMeta(
-        447,
-        "Hang_and_Climb_Rght",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hang_and_Climb_Rght.gif",
-    ),
-    448: AnimationMeta(
-        448,
-        "Jump_and_Grab_Wall",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_and_Grab_Wall.gif",
-    ),
-    449: AnimationMeta(
-        449,
-        "Climb_Up_Rope",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Up_Rope.gif",
-    ),
-    450: AnimationMeta(
-        450,
-        "Wall_Flip",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wall_Flip.gif",
-    ),
-    451: AnimationMeta(
-        451,
-        "One_Arm_Handstand",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/One_Arm_Handstand.gif",
-    ),
-    452: AnimationMeta(
-        452,
-        "Backflip",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Backflip.gif",
-    ),
-    453: AnimationMeta(
-        453,
-        "Backflip_Sweep_Kick",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Backflip_Sweep_Kick.gif",
-    ),
-    455: AnimationMeta(
-        455,
-        "Sweep_Kick",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sweep_Kick.gif",
-    ),
-    456: AnimationMeta(
-        456,
-        "Jumping_Head_Scissor_Takedown",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jumping_Head_Scissor_Takedown.gif",
-    ),
-    457: AnimationMeta(
-        457,
-        "Jumping_Punch",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jumping_Punch.gif",
-    ),
-    458: AnimationMeta(
-        458,
-        "Unicycle_Jump_Dismount",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Unicycle_Jump_Dismount.gif",
-    ),
-    459: AnimationMeta(
-        459,
-        "Run_Jump_and_Roll",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_Jump_and_Roll.gif",
-    ),
-    460: AnimationMeta(
-        460,
-        "Jump_with_Arms_Open",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_with_Arms_Open.gif",
-    ),
-    461: AnimationMeta(
-        461,
-        "Jump_with_Arms_and_Legs_Open",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_with_Arms_and_Legs_Open.gif",
-    ),
-    462: AnimationMeta(
-        462,
-        "Backflip_Jump",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Backflip_Jump.gif",
-    ),
-    463: AnimationMeta(
-        463,
-        "Run_and_Jump",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_and_Jump.gif",
-    ),
-    464: AnimationMeta(
-        464,
-        "Leap_and_Punch",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Leap_and_Punch.gif",
-    ),
-    465: AnimationMeta(
-        465,
-        "Leap_Right_and_Catch",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Leap_Right_and_Catch.gif",
-    ),
-    466: AnimationMeta(
-        466,
-        "Regular_Jump",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Regular_Jump.gif",
-    ),
-    467: AnimationMeta(
-        467,
-        "Jump_Over_Obstacle_2",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Over_Obstacle_2.gif",
-    ),
-    468: AnimationMeta(
-        468,
-        "Back_Jump",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Back_Jump.gif",
-    ),
-    470: AnimationMeta(
-        470,
-        "Jumping_Down",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jumping_Down.gif",
-    ),
-    471: AnimationMeta(
-        471,
-        "Jump_Over_Obstacle",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Over_Obstacle.gif",
-    ),
-    472: AnimationMeta(
-        472,
-        "Jump_Over_Obstacle_1",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Over_Obstacle_1.gif",
-    ),
-    473: AnimationMeta(
-        473,
-        "Quad_Jump_Left",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Quad_Jump_Left.gif",
-    ),
-    474: AnimationMeta(
-        474,
-        "Quad_Jump_Up",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Quad_Jump_Up.gif",
-    ),
-    475: AnimationMeta(
-        475,
-        "Quad_Climb_Right",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Quad_Climb_Right.gif",
-    ),
-    476: AnimationMeta(
-        476,
-        "Hang_and_Push_with_Foot",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hang_and_Push_with_Foot.gif",
-    ),
-    477: AnimationMeta(
-        477,
-        "Rope_Hang_Idle",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Rope_Hang_Idle.gif",
-    ),
-    478: AnimationMeta(
-        478,
-        "Bar_Hang_Idle",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Bar_Hang_Idle.gif",
-    ),
-    479: AnimationMeta(
-        479,
-        "Upside_Down_Rope_Hang",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Upside_Down_Rope_Hang.gif",
-    ),
-    480: AnimationMeta(
-        480,
-        "Upside_Down_Rope_Hang_1",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Upside_Down_Rope_Hang_1.gif",
-    ),
-    481: AnimationMeta(
-        481,
-        "Upside_Down_Rope_Hang_2",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Upside_Down_Rope_Hang_2.gif",
-    ),
-    482: AnimationMeta(
-        482,
-        "Grab_Wall_Midair_Idle",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Grab_Wall_Midair_Idle.gif",
-    ),
-    483: AnimationMeta(
-        483,
-        "Slow_Bar_Hang_Left",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Slow_Bar_Hang_Left.gif",
-    ),
-    484: AnimationMeta(
-        484,
-        "Slow_Bar_Hang_Right",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Slow_Bar_Hang_Right.gif",
-    ),
-    485: AnimationMeta(
-        485,
-        "Jump_and_Hang_on_Bar",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_and_Hang_on_Bar.gif",
-    ),
-    486: AnimationMeta(
-        486,
-        "Wall_Support_to_Step_Down",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wall_Support_to_Step_Down.gif",
-    ),
-    487: AnimationMeta(
-        487,
-        "Climb_Attempt_and_Fall_3",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Attempt_and_Fall_3.gif",
-    ),
-    488: AnimationMeta(
-        488,
-        "Climb_Attempt_and_Fall_4",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Attempt_and_Fall_4.gif",
-    ),
-    489: AnimationMeta(
-        489,
-        "Climb_Attempt_and_Fall_5",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Attempt_and_Fall_5.gif",
-    ),
-    490: AnimationMeta(
-        490,
-        "Fall_Down",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fall_Down.gif",
-    ),
-    491: AnimationMeta(
-        491,
-        "Fall_from_Bar",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fall_from_Bar.gif",
-    ),
-    492: AnimationMeta(
-        492,
-        "Wall_Support_Jump_to_Ground",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Wall_Support_Jump_to_Ground.gif",
-    ),
-    493: AnimationMeta(
-        493,
-        "Jump_Down_from_Wall",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Down_from_Wall.gif",
-    ),
-    494: AnimationMeta(
-        494,
-        "Swing_on_Rope_to_Ground",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Swing_on_Rope_to_Ground.gif",
-    ),
-    495: AnimationMeta(
-        495,
-        "Grab_Bar_and_Swing_Forward",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Grab_Bar_and_Swing_Forward.gif",
-    ),
-    496: AnimationMeta(
-        496,
-        "Rope_Hang_Backflip_to_Crouch",
-        "BodyMovements",
-        "HangingfromLedge",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Rope_Hang_Backflip_to_Crouch.gif",
-    ),
-    497: AnimationMeta(
-        497,
-        "climbing_down_wall",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/climbing_down_wall.gif",
-    ),
-    498: AnimationMeta(
-        498,
-        "Climb_Attempt_and_Fall",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Attempt_and_Fall.gif",
-    ),
-    499: AnimationMeta(
-        499,
-        "Climb_Attempt_and_Fall_1",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Attempt_and_Fall_1.gif",
-    ),
-    500: AnimationMeta(
-        500,
-        "Climb_Attempt_and_Fall_2",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Attempt_and_Fall_2.gif",
-    ),
-    501: AnimationMeta(
-        501,
-        "Leap_of_Faith",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Leap_of_Faith.gif",
-    ),
-    502: AnimationMeta(
-        502,
-        "Fall1",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fall1.gif",
-    ),
-    503: AnimationMeta(
-        503,
-        "Fall2",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fall2.gif",
-    ),
-    504: AnimationMeta(
-        504,
-        "Fall3",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fall3.gif",
-    ),
-    505: AnimationMeta(
-        505,
-        "Fall4",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Fall4.gif",
-    ),
-    506: AnimationMeta(
-        506,
-        "Dive_Down_and_Land",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Dive_Down_and_Land.gif",
-    ),
-    507: AnimationMeta(
-        507,
-        "Dive_Down_and_Land_1",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Dive_Down_and_Land_1.gif",
-    ),
-    508: AnimationMeta(
-        508,
-        "Dive_Down_and_Land_2",
-        "BodyMovements",
-        "FallingFreely",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Dive_Down_and_Land_2.gif",
-    ),
-    509: AnimationMeta(
-        509,
-        "Lean_Forward_Sprint",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Lean_Forward_Sprint.gif",
-    ),
-    510: AnimationMeta(
-        510,
-        "Standard_Forward_Charge",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Standard_Forward_Charge.gif",
-    ),
-    511: AnimationMeta(
-        511,
-        "Rifle_Charge",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Rifle_Charge.gif",
-    ),
-    512: AnimationMeta(
-        512,
-        "Male_Head_Down_Charge",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Male_Head_Down_Charge.gif",
-    ),
-    513: AnimationMeta(
-        513,
-        "Female_Head_Down_Charge",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Head_Down_Charge.gif",
-    ),
-    514: AnimationMeta(
-        514,
-        "Female_Bow_Charge_Left_Hand",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Bow_Charge_Left_Hand.gif",
-    ),
-    515: AnimationMeta(
-        515,
-        "Female_Throwing_Stance_Charge",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Throwing_Stance_Charge.gif",
-    ),
-    516: AnimationMeta(
-        516,
-        "slide_light",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/slide_light.gif",
-    ),
-    517: AnimationMeta(
-        517,
-        "slide_right",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/slide_right.gif",
-    ),
-    518: AnimationMeta(
-        518,
-        "sliding_rool",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/sliding_rool.gif",
-    ),
-    519: AnimationMeta(
-        519,
-        "sliding_stumble",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/sliding_stumble.gif",
-    ),
-    520: AnimationMeta(
-        520,
-        "Crouch_Walk_with_Torch",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_Walk_with_Torch.gif",
-    ),
-    521: AnimationMeta(
-        521,
-        "Crouch_Walk_Left_with_Torch",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_Walk_Left_with_Torch.gif",
-    ),
-    522: AnimationMeta(
-        522,
-        "Crouch_Walk_Right_with_Torch",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_Walk_Right_with_Torch.gif",
-    ),
-    523: AnimationMeta(
-        523,
-        "Cautious_Crouch_Walk_Backward",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cautious_Crouch_Walk_Backward.gif",
-    ),
-    524: AnimationMeta(
-        524,
-        "Cautious_Crouch_Walk_Forward",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cautious_Crouch_Walk_Forward.gif",
-    ),
-    525: AnimationMeta(
-        525,
-        "Cautious_Crouch_Walk_Left",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cautious_Crouch_Walk_Left.gif",
-    ),
-    526: AnimationMeta(
-        526,
-        "Cautious_Crouch_Walk_Right",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cautious_Crouch_Walk_Right.gif",
-    ),
-    527: AnimationMeta(
-        527,
-        "Crouch_Walk_Left_with_Gun",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_Walk_Left_with_Gun.gif",
-    ),
-    528: AnimationMeta(
-        528,
-        "Walk_Left_with_Gun",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Left_with_Gun.gif",
-    ),
-    529: AnimationMeta(
-        529,
-        "Walk_Backward_with_Gun",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Gun.gif",
-    ),
-    530: AnimationMeta(
-        530,
-        "run_fast_3",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_3.gif",
-    ),
-    531: AnimationMeta(
-        531,
-        "Sprint_and_Sudden_Stop",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sprint_and_Sudden_Stop.gif",
-    ),
-    532: AnimationMeta(
-        532,
-        "run_fast_4",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_4.gif",
-    ),
-    533: AnimationMeta(
-        533,
-        "run_fast_5",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_5.gif",
-    ),
-    534: AnimationMeta(
-        534,
-        "run_fast_6",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_6.gif",
-    ),
-    535: AnimationMeta(
-        535,
-        "run_fast_7",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_7.gif",
-    ),
-    536: AnimationMeta(
-        536,
-        "run_fast_8",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_8.gif",
-    ),
-    537: AnimationMeta(
-        537,
-        "run_fast_9",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_9.gif",
-    ),
-    538: AnimationMeta(
-        538,
-        "run_fast_10",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_10.gif",
-    ),
-    539: AnimationMeta(
-        539,
-        "run_fast_2",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_2.gif",
-    ),
-    540: AnimationMeta(
-        540,
-        "Injured_Walk_Backward",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Injured_Walk_Backward.gif",
-    ),
-    541: AnimationMeta(
-        541,
-        "Walk_Backward_with_Gun_1",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Gun_1.gif",
-    ),
-    542: AnimationMeta(
-        542,
-        "Walk_Backward_with_Grenade",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Grenade.gif",
-    ),
-    543: AnimationMeta(
-        543,
-        "Step_Back",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Step_Back.gif",
-    ),
-    544: AnimationMeta(
-        544,
-        "Walk_Backward",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward.gif",
-    ),
-    545: AnimationMeta(
-        545,
-        "Walk_Backward_with_Bow",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Bow.gif",
-    ),
-    546: AnimationMeta(
-        546,
-        "Walk_Backward_with_Sword",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Sword.gif",
-    ),
-    547: AnimationMeta(
-        547,
-        "Walk_Backward_with_Bow_1",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Bow_1.gif",
-    ),
-    548: AnimationMeta(
-        548,
-        "Walk_Backward_with_Sword_Shield",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Sword_Shield.gif",
-    ),
-    549: AnimationMeta(
-        549,
-        "Crawl_Backward",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crawl_Backward.gif",
-    ),
-    550: AnimationMeta(
-        550,
-        "Carry_Heavy_Cannon_Forward",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Carry_Heavy_Cannon_Forward.gif",
-    ),
-    551: AnimationMeta(
-        551,
-        "Carry_Heavy_Object_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Carry_Heavy_Object_Walk.gif",
-    ),
-    552: AnimationMeta(
-        552,
-        "Carry_Water_Bucket_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Carry_Water_Bucket_Walk.gif",
-    ),
-    553: AnimationMeta(
-        553,
-        "Elderly_Shaky_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Elderly_Shaky_Walk.gif",
-    ),
-    554: AnimationMeta(
-        554,
-        "Funky_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Funky_Walk.gif",
-    ),
-    555: AnimationMeta(
-        555,
-        "Limping_Walk_1",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Limping_Walk_1.gif",
-    ),
-    556: AnimationMeta(
-        556,
-        "Limping_Walk_2",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Limping_Walk_2.gif",
-    ),
-    557: AnimationMeta(
-        557,
-        "Limping_Walk_3",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Limping_Walk_3.gif",
-    ),
-    558: AnimationMeta(
-        558,
-        "Limping_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Limping_Walk.gif",
-    ),
-    559: AnimationMeta(
-        559,
-        "Sneaky_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sneaky_Walk.gif",
-    ),
-    560: AnimationMeta(
-        560,
-        "Spear_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Spear_Walk.gif",
-    ),
-    561: AnimationMeta(
-        561,
-        "Step_Hip_Hop_Dance",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Step_Hip_Hop_Dance.gif",
-    ),
-    562: AnimationMeta(
-        562,
-        "Stumble_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stumble_Walk.gif",
-    ),
-    563: AnimationMeta(
-        563,
-        "Stylish_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stylish_Walk.gif",
-    ),
-    564: AnimationMeta(
-        564,
-        "Tightrope_Walk",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Tightrope_Walk.gif",
-    ),
-    565: AnimationMeta(
-        565,
-        "Walk_with_Umbrella",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_with_Umbrella.gif",
-    ),
-    566: AnimationMeta(
-        566,
-        "walking_2",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/walking_2.gif",
-    ),
-    567: AnimationMeta(
-        567,
-        "Walk_with_Walker_Support",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_with_Walker_Support.gif",
-    ),
-    568: AnimationMeta(
-        568,
-        "Swim_Idle",
-        "WalkAndRun",
-        "Swimming",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Swim_Idle.gif",
-    ),
-    569: AnimationMeta(
-        569,
-        "Swim_Forward",
-        "WalkAndRun",
-        "Swimming",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Swim_Forward.gif",
-    ),
-    570: AnimationMeta(
-        570,
-        "swimming_to_edge",
-        "WalkAndRun",
-        "Swimming",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/swimming_to_edge.gif",
-    ),
-    571: AnimationMeta(
-        571,
-        "Run_Turn_Left",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_Turn_Left.gif",
-    ),
-    572: AnimationMeta(
-        572,
-        "Walk_Turn_Left",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Turn_Left.gif",
-    ),
-    573: AnimationMeta(
-        573,
-        "Rifle_Turn_Left",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Rifle_Turn_Left.gif",
-    ),
-    574: AnimationMeta(
-        574,
-        "Walk_Turn_Left_with_Weapon",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Turn_Left_with_Weapon.gif",
-    ),
-    575: AnimationMeta(
-        575,
-        "Combat_Idle_Turn_Left",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Combat_Idle_Turn_Left.gif",
-    ),
-    576: AnimationMeta(
-        576,
-        "Idle_Turn_Left",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_Turn_Left.gif",
-    ),
-    577: AnimationMeta(
-        577,
-        "Idle_Step_Turn_Left",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_Step_Turn_Left.gif",
-    ),
-    578: AnimationMeta(
-        578,
-        "Idle_Torch_Turn_Left",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_Torch_Turn_Left.gif",
-    ),
-    579: AnimationMeta(
-        579,
-        "Depressed_Full_Turn_Left",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Depressed_Full_Turn_Left.gif",
-    ),
-    580: AnimationMeta(
-        580,
-        "Sword_and_Shield_Alert_Turn_Left",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_and_Shield_Alert_Turn_Left.gif",
-    ),
-    581: AnimationMeta(
-        581,
-        "Run_Sharp_Turn_Right",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_Sharp_Turn_Right.gif",
-    ),
-    582: AnimationMeta(
-        582,
-        "Run_Turn_Right",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_Turn_Right.gif",
-    ),
-    583: AnimationMeta(
-        583,
-        "Walk_Turn_Right",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Turn_Right.gif",
-    ),
-    584: AnimationMeta(
-        584,
-        "Walk_Turn_Right_Female",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Turn_Right_Female.gif",
-    ),
-    585: AnimationMeta(
-        585,
-        "Rifle_Aim_Turn_Right",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Rifle_Aim_Turn_Right.gif",
-    ),
-    586: AnimationMeta(
-        586,
-        "Idle_Turn_Right",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_Turn_Right.gif",
-    ),
-    587: AnimationMeta(
-        587,
-        "Walk_Turn_Right_Idle_Style",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Turn_Right_Idle_Style.gif",
-    ),
-    588: AnimationMeta(
-        588,
-        "Frustrated_Turn_Right",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Frustrated_Turn_Right.gif",
-    ),
-    589: AnimationMeta(
-        589,
-        "Alert_Quick_Turn_Right",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Alert_Quick_Turn_Right.gif",
-    ),
-    590: AnimationMeta(
-        590,
-        "Sword_and_Shield_Alert_Turn_Right",
-        "WalkAndRun",
-        "TurningAround",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sword_and_Shield_Alert_Turn_Right.gif",
-    ),
-    591: AnimationMeta(
-        591,
-        "Hip_Hop_Dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hip_Hop_Dance.gif",
-    ),
-    592: AnimationMeta(
-        592,
-        "Hip_Hop_Dance_1",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hip_Hop_Dance_1.gif",
-    ),
-    593: AnimationMeta(
-        593,
-        "Hip_Hop_Dance_2",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hip_Hop_Dance_2.gif",
-    ),
-    594: AnimationMeta(
-        594,
-        "Hip_Hop_Dance_3",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hip_Hop_Dance_3.gif",
-    ),
-    595: AnimationMeta(
-        595,
-        "jazz_danc",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/jazz_danc.gif",
-    ),
-    596: AnimationMeta(
-        596,
-        "ymca_dance",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/ymca_dance.gif",
-    ),
-    597: AnimationMeta(
-        597,
-        "Hip_Hop_Dance_4",
-        "Dancing",
-        "Dancing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hip_Hop_Dance_4.gif",
-    ),
-    598: AnimationMeta(
-        598,
-        "kettlebell_swing_1",
-        "DailyActions",
-        "WorkingOut",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/kettlebell_swing_1.gif",
-    ),
-    599: AnimationMeta(
-        599,
-        "Idle_15",
-        "DailyActions",
-        "Idle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Idle_15.gif",
-    ),
-    601: AnimationMeta(
-        601,
-        "Backflip_inplace",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Backflip.gif",
-    ),
-    604: AnimationMeta(
-        604,
-        "Backflip_Sweep_Kick_inplace",
-        "BodyMovements",
-        "PerformingStunt",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Backflip_Sweep_Kick.gif",
-    ),
-    605: AnimationMeta(
-        605,
-        "Back_Jump_inplace",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Back_Jump.gif",
-    ),
-    606: AnimationMeta(
-        606,
-        "BackLeft_run_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/BackLeft_run.gif",
-    ),
-    607: AnimationMeta(
-        607,
-        "BackRight_Run_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/BackRight_Run.gif",
-    ),
-    608: AnimationMeta(
-        608,
-        "BeHit_FlyUp_inplace",
-        "Fighting",
-        "GettingHit",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/BeHit_FlyUp.gif",
-    ),
-    609: AnimationMeta(
-        609,
-        "Boxing_Practice_inplace",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Boxing_Practice.gif",
-    ),
-    610: AnimationMeta(
-        610,
-        "Carry_Heavy_Cannon_Forward_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Carry_Heavy_Cannon_Forward.gif",
-    ),
-    611: AnimationMeta(
-        611,
-        "Carry_Heavy_Object_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Carry_Heavy_Object_Walk.gif",
-    ),
-    612: AnimationMeta(
-        612,
-        "Carry_Water_Bucket_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Carry_Water_Bucket_Walk.gif",
-    ),
-    613: AnimationMeta(
-        613,
-        "Casual_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Casual_Walk.gif",
-    ),
-    615: AnimationMeta(
-        615,
-        "Cautious_Crouch_Walk_Backward_inplace",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cautious_Crouch_Walk_Backward.gif",
-    ),
-    616: AnimationMeta(
-        616,
-        "Cautious_Crouch_Walk_Forward_inplace",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cautious_Crouch_Walk_Forward.gif",
-    ),
-    617: AnimationMeta(
-        617,
-        "Cautious_Crouch_Walk_Left_inplace",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cautious_Crouch_Walk_Left.gif",
-    ),
-    618: AnimationMeta(
-        618,
-        "Cautious_Crouch_Walk_Right_inplace",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Cautious_Crouch_Walk_Right.gif",
-    ),
-    619: AnimationMeta(
-        619,
-        "Climb_Left_with_Both_Limbs_inplace",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Left_with_Both_Limbs.gif",
-    ),
-    620: AnimationMeta(
-        620,
-        "Climb_Right_with_Both_Limbs_inplace",
-        "BodyMovements",
-        "Climbing",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Climb_Right_with_Both_Limbs.gif",
-    ),
-    621: AnimationMeta(
-        621,
-        "Confident_Strut_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Confident_Strut.gif",
-    ),
-    622: AnimationMeta(
-        622,
-        "Crawl_Backward_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crawl_Backward.gif",
-    ),
-    623: AnimationMeta(
-        623,
-        "Crouch_Walk_Left_with_Gun_inplace",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_Walk_Left_with_Gun.gif",
-    ),
-    624: AnimationMeta(
-        624,
-        "Crouch_Walk_Left_with_Torch_inplace",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_Walk_Left_with_Torch.gif",
-    ),
-    625: AnimationMeta(
-        625,
-        "Crouch_Walk_Right_with_Torch_inplace",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Crouch_Walk_Right_with_Torch.gif",
-    ),
-    626: AnimationMeta(
-        626,
-        "Elderly_Shaky_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Elderly_Shaky_Walk.gif",
-    ),
-    627: AnimationMeta(
-        627,
-        "Female_Bow_Charge_Left_Hand_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Bow_Charge_Left_Hand.gif",
-    ),
-    628: AnimationMeta(
-        628,
-        "Female_Throwing_Stance_Charge_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Female_Throwing_Stance_Charge.gif",
-    ),
-    629: AnimationMeta(
-        629,
-        "Flirty_Strut_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Flirty_Strut.gif",
-    ),
-    630: AnimationMeta(
-        630,
-        "ForwardLeft_Run_Fight_inplace",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/ForwardLeft_Run_Fight.gif",
-    ),
-    631: AnimationMeta(
-        631,
-        "ForwardRight_Run_Fight_inplace",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/ForwardRight_Run_Fight.gif",
-    ),
-    632: AnimationMeta(
-        632,
-        "Funky_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Funky_Walk.gif",
-    ),
-    635: AnimationMeta(
-        635,
-        "Handbag_Walk_inplace",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Handbag_Walk.gif",
-    ),
-    636: AnimationMeta(
-        636,
-        "Hello_Run_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Hello_Run.gif",
-    ),
-    637: AnimationMeta(
-        637,
-        "Injured_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Injured_Walk.gif",
-    ),
-    638: AnimationMeta(
-        638,
-        "Injured_Walk_Backward_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Injured_Walk_Backward.gif",
-    ),
-    639: AnimationMeta(
-        639,
-        "Jazz_Hands_inplace",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jazz_Hands.gif",
-    ),
-    640: AnimationMeta(
-        640,
-        "Jump_Over_Obstacle_inplace",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Over_Obstacle.gif",
-    ),
-    641: AnimationMeta(
-        641,
-        "Jump_Over_Obstacle_1_inplace",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Over_Obstacle_1.gif",
-    ),
-    642: AnimationMeta(
-        642,
-        "Jump_Over_Obstacle_2_inplace",
-        "BodyMovements",
-        "Jumping",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Over_Obstacle_2.gif",
-    ),
-    643: AnimationMeta(
-        643,
-        "Jump_Run_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Jump_Run.gif",
-    ),
-    644: AnimationMeta(
-        644,
-        "Lean_Forward_Sprint_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Lean_Forward_Sprint.gif",
-    ),
-    645: AnimationMeta(
-        645,
-        "Limping_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Limping_Walk.gif",
-    ),
-    646: AnimationMeta(
-        646,
-        "Limping_Walk_1_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Limping_Walk_1.gif",
-    ),
-    647: AnimationMeta(
-        647,
-        "Limping_Walk_2_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Limping_Walk_2.gif",
-    ),
-    648: AnimationMeta(
-        648,
-        "Limping_Walk_3_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Limping_Walk_3.gif",
-    ),
-    649: AnimationMeta(
-        649,
-        "Lunge_Roundhouse_Kick_inplace",
-        "Fighting",
-        "Punching",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Lunge_Roundhouse_Kick.gif",
-    ),
-    650: AnimationMeta(
-        650,
-        "Mummy_Stagger_inplace",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Mummy_Stagger.gif",
-    ),
-    651: AnimationMeta(
-        651,
-        "Parkour_Vault_with_Roll_inplace",
-        "BodyMovements",
-        "VaultingOverObstacle",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Parkour_Vault_with_Roll.gif",
-    ),
-    652: AnimationMeta(
-        652,
-        "Proud_Strut_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Proud_Strut.gif",
-    ),
-    653: AnimationMeta(
-        653,
-        "Red_Carpet_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Red_Carpet_Walk.gif",
-    ),
-    654: AnimationMeta(
-        654,
-        "Rifle_Charge_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Rifle_Charge.gif",
-    ),
-    656: AnimationMeta(
-        656,
-        "Run_and_Leap_inplace",
-        "BodyMovements",
-        "Acting",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_and_Leap.gif",
-    ),
-    657: AnimationMeta(
-        657,
-        "run_fast_10_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_10.gif",
-    ),
-    658: AnimationMeta(
-        658,
-        "run_fast_2_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_2.gif",
-    ),
-    659: AnimationMeta(
-        659,
-        "run_fast_3_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_3.gif",
-    ),
-    660: AnimationMeta(
-        660,
-        "run_fast_4_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_4.gif",
-    ),
-    661: AnimationMeta(
-        661,
-        "run_fast_5_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_5.gif",
-    ),
-    662: AnimationMeta(
-        662,
-        "run_fast_6_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_6.gif",
-    ),
-    663: AnimationMeta(
-        663,
-        "run_fast_7_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_7.gif",
-    ),
-    664: AnimationMeta(
-        664,
-        "run_fast_8_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_8.gif",
-    ),
-    665: AnimationMeta(
-        665,
-        "run_fast_9_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/run_fast_9.gif",
-    ),
-    666: AnimationMeta(
-        666,
-        "Running_Reload_inplace",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Running_Reload.gif",
-    ),
-    667: AnimationMeta(
-        667,
-        "Run_to_Walk_Transition_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Run_to_Walk_Transition.gif",
-    ),
-    668: AnimationMeta(
-        668,
-        "Skip_Forward_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Skip_Forward.gif",
-    ),
-    669: AnimationMeta(
-        669,
-        "Slow_Orc_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Slow_Orc_Walk.gif",
-    ),
-    670: AnimationMeta(
-        670,
-        "Slow_Walk_Reload_inplace",
-        "Fighting",
-        "Transitioning",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Slow_Walk_Reload.gif",
-    ),
-    671: AnimationMeta(
-        671,
-        "Sneaky_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Sneaky_Walk.gif",
-    ),
-    672: AnimationMeta(
-        672,
-        "Spear_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Spear_Walk.gif",
-    ),
-    673: AnimationMeta(
-        673,
-        "Standard_Forward_Charge_inplace",
-        "WalkAndRun",
-        "Running",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Standard_Forward_Charge.gif",
-    ),
-    674: AnimationMeta(
-        674,
-        "Stumble_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stumble_Walk.gif",
-    ),
-    675: AnimationMeta(
-        675,
-        "Stylish_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Stylish_Walk.gif",
-    ),
-    676: AnimationMeta(
-        676,
-        "Texting_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Texting_Walk.gif",
-    ),
-    677: AnimationMeta(
-        677,
-        "Tightrope_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Tightrope_Walk.gif",
-    ),
-    678: AnimationMeta(
-        678,
-        "Unsteady_Walk_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Unsteady_Walk.gif",
-    ),
-    679: AnimationMeta(
-        679,
-        "Walk_Backward_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward.gif",
-    ),
-    680: AnimationMeta(
-        680,
-        "Walk_Backward_While_Shooting_inplace",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_While_Shooting.gif",
-    ),
-    681: AnimationMeta(
-        681,
-        "Walk_Backward_with_Bow_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Bow.gif",
-    ),
-    682: AnimationMeta(
-        682,
-        "Walk_Backward_with_Bow_1_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Bow_1.gif",
-    ),
-    683: AnimationMeta(
-        683,
-        "Walk_Backward_with_Bow_Aimed_inplace",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Bow_Aimed.gif",
-    ),
-    684: AnimationMeta(
-        684,
-        "Walk_Backward_with_Grenade_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Grenade.gif",
-    ),
-    685: AnimationMeta(
-        685,
-        "Walk_Backward_with_Gun_inplace",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Gun.gif",
-    ),
-    686: AnimationMeta(
-        686,
-        "Walk_Backward_with_Gun_1_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Gun_1.gif",
-    ),
-    687: AnimationMeta(
-        687,
-        "Walk_Backward_with_Sword_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Backward_with_Sword.gif",
-    ),
-    688: AnimationMeta(
-        688,
-        "Walk_Fight_Back_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Fight_Back.gif",
-    ),
-    689: AnimationMeta(
-        689,
-        "Walk_Fight_Forward_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Fight_Forward.gif",
-    ),
-    690: AnimationMeta(
-        690,
-        "Walk_Forward_While_Shooting_inplace",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Forward_While_Shooting.gif",
-    ),
-    691: AnimationMeta(
-        691,
-        "Walk_Forward_with_Bow_Aimed_inplace",
-        "Fighting",
-        "AttackingwithWeapon",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Forward_with_Bow_Aimed.gif",
-    ),
-    692: AnimationMeta(
-        692,
-        "walking_2_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/walking_2.gif",
-    ),
-    693: AnimationMeta(
-        693,
-        "Walking_with_Phone_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walking_with_Phone.gif",
-    ),
-    694: AnimationMeta(
-        694,
-        "Walk_Left_with_Gun_inplace",
-        "WalkAndRun",
-        "CrouchWalking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_Left_with_Gun.gif",
-    ),
-    695: AnimationMeta(
-        695,
-        "Walk_with_Umbrella_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_with_Umbrella.gif",
-    ),
-    696: AnimationMeta(
-        696,
-        "Walk_with_Walker_Support_inplace",
-        "WalkAndRun",
-        "Walking",
-        "https://cdn.meshy.ai/webapp-assets/feature-demo/animation/preview/biped/Walk_with_Walker_Support.gif",
-    ),
-}
+if TYPE_CHECKING:
+    # Complete animation library, loaded from _animation_catalog on first access
+    ANIMATIONS: dict[int, AnimationMeta]
+
+_catalog_lock = threading.Lock()
+
+
+def _load_catalog() -> dict[int, AnimationMeta]:
+    """Build ANIMATIONS from the packed catalog rows."""
+    with _catalog_lock:
+        animations = globals().get("ANIMATIONS")
+        if animations is None:
+            from vendor_connectors.meshy._animation_catalog import CATALOG, PREVIEW_URL_PREFIX
+
+            animations = {
+                anim_id: AnimationMeta(anim_id, name, category, subcategory, PREVIEW_URL_PREFIX + preview)
+                for anim_id, name, category, subcategory, preview in CATALOG
+            }
+            globals()["ANIMATIONS"] = animations
+        return animations
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ANIMATIONS":
+        return _load_catalog()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def _animations() -> Mapping[int, AnimationMeta]:
+    """Current catalog (module attribute, so it can be replaced or patched)."""
+    animations = globals().get("ANIMATIONS")
+    return animations if animations is not None else _load_catalog()
+
+
+class _AnimationIndex:
+    """Lookup tables over one catalog mapping."""
+
+    __slots__ = ("_search", "animations", "by_category", "by_name", "by_subcategory", "position", "size")
+
+    def __init__(self, animations: Mapping[int, AnimationMeta]):
+        self.animations = animations
+        self.size = len(animations)
+        self.by_category: dict[str, list[AnimationMeta]] = {}
+        self.by_subcategory: dict[str, list[AnimationMeta]] = {}
+        self.by_name: dict[str, AnimationMeta] = {}
+        # Catalog position of each animation, for merging index lists in catalog order
+        self.position: dict[int, int] = {}
+
+        for position, anim in enumerate(animations.values()):
+            self.position[id(anim)] = position
+            self.by_category.setdefault(anim.category, []).append(anim)
+            self.by_subcategory.setdefault(anim.subcategory, []).append(anim)
+            self.by_name.setdefault(anim.name.lower(), anim)
+
+        self._search: _SearchIndex | None = None
+
+    @property
+    def search(self) -> _SearchIndex:
+        """Free-text search index, built on first search."""
+        if self._search is None:
+            self._search = _SearchIndex(list(self.animations.values()))
+        return self._search
+
+    def merge(self, groups: Iterable[list[AnimationMeta]]) -> list[AnimationMeta]:
+        """Combine index lists, keeping catalog order."""
+        groups = list(groups)
+        if len(groups) == 1:
+            return list(groups[0])
+        return list(heapq.merge(*groups, key=lambda anim: self.position[id(anim)]))
+
+
+# Search weights per field a query term matches in
+_NAME_WEIGHT = 3.0
+_SUBCATEGORY_WEIGHT = 2.0
+_CATEGORY_WEIGHT = 1.0
+
+# Match quality of a query term against an indexed term
+_PREFIX_MATCH = 0.8
+_FUZZY_MATCH = 0.6
+_MIN_TRIGRAM_SIMILARITY = 0.4
+# Query terms whose expansions are memoized per index (least recently used are dropped)
+_MAX_CACHED_EXPANSIONS = 1024
+
+_WORD_RE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])")
+_SUFFIXES = ("ing", "es", "ed", "s", "e")
+_STOPWORDS = frozenset({"a", "an", "and", "of", "the", "to", "with"})
+
+
+def _stem(word: str) -> str:
+    """Crude suffix stripping so "slashes", "slashing" and "slash" meet."""
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[: -len(suffix)]
+            # running -> runn -> run
+            if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "aeiou":
+                word = word[:-1]
+            break
+    return word
+
+
+def _terms(text: str) -> list[str]:
+    """Split names like "BackLeft_run" or "sword slash" into stemmed terms."""
+    words = (word.lower() for word in _WORD_RE.findall(text))
+    return [_stem(word) for word in words if word not in _STOPWORDS]
+
+
+def _trigrams(term: str) -> set[str]:
+    padded = f" {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class _SearchIndex:
+    """Token inverted index with prefix and trigram fuzzy matching."""
+
+    __slots__ = ("animations", "expand", "postings", "trigrams")
+
+    def __init__(self, animations: list[AnimationMeta]):
+        self.animations = animations
+        # term -> {catalog position: field weight}
+        self.postings: dict[str, dict[int, float]] = {}
+        # trigram -> indexed terms containing it
+        self.trigrams: dict[str, set[str]] = {}
+        # Bounded, since query terms come from free-form input
+        self.expand = functools.lru_cache(maxsize=_MAX_CACHED_EXPANSIONS)(self._expand)
+
+        for position, anim in enumerate(animations):
+            for text, weight in (
+                (anim.name, _NAME_WEIGHT),
+                (anim.subcategory, _SUBCATEGORY_WEIGHT),
+                (anim.category, _CATEGORY_WEIGHT),
+            ):
+                for term in _terms(text):
+                    postings = self.postings.setdefault(term, {})
+                    postings[position] = max(postings.get(position, 0.0), weight)
+
+        for term in self.postings:
+            for trigram in _trigrams(term):
+                self.trigrams.setdefault(trigram, set()).add(term)
+
+    def _expand(self, term: str) -> tuple[tuple[str, float], ...]:
+        """Indexed terms matching a query term: exact, by prefix, or by trigram similarity."""
+        matches: dict[str, float] = {}
+        if term in self.postings:
+            matches[term] = 1.0
+        if len(term) >= 3:
+            for candidate in self.postings:
+                if candidate != term and (
+                    candidate.startswith(term) or (len(candidate) >= 3 and term.startswith(candidate))
+                ):
+                    matches[candidate] = _PREFIX_MATCH
+        if not matches:
+            query_trigrams = _trigrams(term)
+            shared: dict[str, int] = {}
+            for trigram in query_trigrams:
+                for candidate in self.trigrams.get(trigram, ()):
+                    shared[candidate] = shared.get(candidate, 0) + 1
+            for candidate, count in shared.items():
+                similarity = count / (len(query_trigrams) + len(_trigrams(candidate)) - count)
+                if similarity >= _MIN_TRIGRAM_SIMILARITY:
+                    matches[candidate] = _FUZZY_MATCH * similarity
+
+        return tuple(matches.items())
+
+    def search(self, query: str, limit: int | None) -> list[tuple[AnimationMeta, float]]:
+        """Rank animations by summed per-term match scores."""
+        scores: dict[int, float] = {}
+        for term in dict.fromkeys(_terms(query)):
+            best: dict[int, float] = {}
+            for candidate, quality in self.expand(term):
+                for position, weight in self.postings[candidate].items():
+                    score = weight * quality
+                    if score > best.get(position, 0.0):
+                        best[position] = score
+            for position, score in best.items():
+                scores[position] = scores.get(position, 0.0) + score
+
+        # Highest score first, then catalog order
+        def rank(item: tuple[int, float]) -> tuple[float, int]:
+            return -item[1], item[0]
+
+        top = sorted(scores.items(), key=rank) if limit is None else heapq.nsmallest(limit, scores.items(), key=rank)
+        return [(self.animations[position], round(score, 3)) for position, score in top]
+
+
+_index: _AnimationIndex | None = None
+
+
+def _get_index() -> _AnimationIndex:
+    """Index of the current catalog, rebuilt only if the catalog was replaced or resized."""
+    global _index
+    animations = _animations()
+    index = _index
+    if index is None or index.animations is not animations or index.size != len(animations):
+        index = _index = _AnimationIndex(animations)
+    return index
 
 
 # Curated animation sets for common game use cases
 
 
-class GameAnimationSet:
+class _LazyAnimationSets(type):
+    """Populate GameAnimationSet from the catalog on first attribute access."""
+
+    def __getattr__(cls, name: str) -> list[int]:
+        if name in cls.__annotations__:
+            _populate_animation_sets()
+            return type.__getattribute__(cls, name)
+        msg = f"type object {cls.__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+
+class GameAnimationSet(metaclass=_LazyAnimationSets):
     """Pre-defined animation sets for common game scenarios."""
 
     # Basic character movement - Idle and locomotion
-    BASIC_MOVEMENT: list[int] = []
+    BASIC_MOVEMENT: list[int]
 
     # Combat animations
-    COMBAT: list[int] = []
+    COMBAT: list[int]
 
     # Social/NPC interactions
-    SOCIAL: list[int] = []
+    SOCIAL: list[int]
 
     # Dance/celebration
-    CELEBRATION: list[int] = []
+    CELEBRATION: list[int]
 
     # Exploration animations
-    EXPLORATION: list[int] = []
+    EXPLORATION: list[int]
+
+
+def _ids(anims: list[AnimationMeta], limit: int = 10) -> list[int]:
+    return [anim.id for anim in anims[:limit]]
 
 
 # Populate animation sets from available animations
 def _populate_animation_sets() -> None:
     """Populate animation sets based on available animations."""
-    all_ids = set(ANIMATIONS.keys())
+    index = _get_index()
+
+    def subcategories(*names: str) -> list[AnimationMeta]:
+        return index.merge(index.by_subcategory.get(name, []) for name in names)
 
-    # Basic movement: Idle + Walking + Running
-    GameAnimationSet.BASIC_MOVEMENT = [
-        aid for aid in all_ids if ANIMATIONS[aid].subcategory in ("Idle", "Walking", "Running")
-    ][:10]  # Limit to first 10
+    # Basic movement: Idle + Walking + Running (first 10)
+    GameAnimationSet.BASIC_MOVEMENT = _ids(subcategories("Idle", "Walking", "Running"))
 
     # Combat: Fighting category
-    GameAnimationSet.COMBAT = [aid for aid in all_ids if ANIMATIONS[aid].category == "Fighting"][:10]
+    GameAnimationSet.COMBAT = _ids(index.by_category.get("Fighting", []))
 
     # Social: Interacting subcategory
-    GameAnimationSet.SOCIAL = [aid for aid in all_ids if ANIMATIONS[aid].subcategory == "Interacting"][:10]
+    GameAnimationSet.SOCIAL = _ids(subcategories("Interacting"))
 
     # Celebration: Dancing category
-    GameAnimationSet.CELEBRATION = [aid for aid in all_ids if ANIMATIONS[aid].category == "Dancing"][:10]
+    GameAnimationSet.CELEBRATION = _ids(index.by_category.get("Dancing", []))
 
     # Exploration: LookingAround + Idle
-    GameAnimationSet.EXPLORATION = [aid for aid in all_ids if ANIMATIONS[aid].subcategory in ("LookingAround", "Idle")][
-        :10
-    ]
-
-
-# Initialize sets on module load
-_populate_animation_sets()
+    GameAnimationSet.EXPLORATION = _ids(subcategories("LookingAround", "Idle"))
 
 
-def get_animations_by_category(category: AnimationCategory) -> list[AnimationMeta]:
+def get_animations_by_category(category: AnimationCategory | str) -> list[AnimationMeta]:
     """Get all animations in a category."""
-    return [anim for anim in ANIMATIONS.values() if anim.category == category.value]
+    return list(_get_index().by_category.get(getattr(category, "value", category), []))
 
 
 def get_animations_by_subcategory(
-    subcategory: AnimationSubcategory,
+    subcategory: AnimationSubcategory | str,
 ) -> list[AnimationMeta]:
     """Get all animations in a subcategory."""
-    return [anim for anim in ANIMATIONS.values() if anim.subcategory == subcategory.value]
+    return list(_get_index().by_subcategory.get(getattr(subcategory, "value", subcategory), []))
 
 
 def get_animation(action_id: int) -> AnimationMeta:
     """Get animation by ID."""
-    if action_id not in ANIMATIONS:
+    animations = _animations()
+    if action_id not in animations:
         msg = f"Animation ID {action_id} not found"
         raise ValueError(msg)
-    return ANIMATIONS[action_id]
+    return animations[action_id]
+
+
+def get_animation_by_name(name: str) -> AnimationMeta | None:
+    """Get animation by name (case-insensitive)."""
+    return _get_index().by_name.get(name.lower())
+
+
+def filter_animations(category: str = "", subcategory: str = "") -> list[AnimationMeta]:
+    """Get animations whose category and subcategory contain the given text.
+
+    Matching is case-insensitive and only touches the index entries of the
+    matching categories, not the whole catalog.
+
+    Args:
+        category: Text the category must contain (empty matches all)
+        subcategory: Text the subcategory must contain (empty matches all)
+
+    Returns:
+        Matching animations in catalog order
+    """
+    index = _get_index()
+    category = category.lower()
+    subcategory = subcategory.lower()
+
+    if category:
+        matches = index.merge(anims for key, anims in index.by_category.items() if category in key.lower())
+    elif subcategory:
+        return index.merge(anims for key, anims in index.by_subcategory.items() if subcategory in key.lower())
+    else:
+        return list(index.animations.values())
+
+    if subcategory:
+        matches = [anim for anim in matches if subcategory in anim.subcategory.lower()]
+    return matches
+
+
+def search_animations(
+    query: str,
+    limit: int | None = 10,
+    category: str = "",
+) -> list[tuple[AnimationMeta, float]]:
+    """Search animations by free text, e.g. "sword slash attack".
+
+    Query words are matched against animation names, subcategories and
+    categories, exactly, by prefix, or approximately for misspellings.
+    Name matches weigh most, and animations matching more of the query
+    rank higher.
+
+    Args:
+        query: Free-text description of the animation
+        limit: Maximum number of results (None for all matches)
+        category: Optional text the category must contain
+
+    Returns:
+        (animation, score) pairs, best match first
+    """
+    if limit is not None and limit <= 0:
+        return []
+    search = _get_index().search
+    if not category:
+        return search.search(query, limit)
+
+    category = category.lower()
+    results = [result for result in search.search(query, None) if category in result[0].category.lower()]
+    return results if limit is None else results[:limit]
@@ -11,6 +11,7 @@ vendor-connectors. Credentials can come from:
 
 from __future__ import annotations
 
+import threading
 import time
 
 import httpx
@@ -18,6 +19,7 @@ import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from directed_inputs_class import DirectedInputsClass
+from vendor_connectors.downloads import Downloader
 
 
 class RateLimitError(Exception):
@@ -34,9 +36,11 @@ class MeshyAPIError(Exception):
 
 # Global client state
 _client: httpx.Client | None = None
+_downloader: Downloader | None = None
 _inputs: DirectedInputsClass | None = None
 _last_request_time: float = 0
 _min_request_interval: float = 0.5  # 500ms between requests
+_rate_limit_lock = threading.Lock()  # Shared by every thread issuing requests
 
 BASE_URL = "https://api.meshy.ai"
 
@@ -79,22 +83,28 @@ def get_client() -> httpx.Client:
     return _client
 
 
+def get_downloader() -> Downloader:
+    """Get or create the shared artifact downloader."""
+    global _downloader
+    if _downloader is None:
+        _downloader = Downloader()
+    return _downloader
+
+
 def close():
-    """Close the HTTP client."""
-    global _client
+    """Close the HTTP client and downloader."""
+    global _client, _downloader
     if _client:
         _client.close()
         _client = None
+    if _downloader:
+        _downloader.close()
+        _downloader = None
 
 
 def _rate_limit():
     """Simple rate limiting with thread safety."""
-    import threading
-
-    global _last_request_time, _rate_limit_lock
-
-    if "_rate_limit_lock" not in globals():
-        _rate_limit_lock = threading.Lock()
+    global _last_request_time
 
     with _rate_limit_lock:
         now = time.time()
@@ -170,26 +180,39 @@ def request(
     return response
 
 
-def download(url: str, output_path: str) -> int:
+def download(
+    url: str,
+    output_path: str,
+    expected_size: int | None = None,
+    sha256: str | None = None,
+) -> int:
     """Download file from URL.
 
+    The file is streamed to disk and resumed with a Range request if the
+    connection drops, so large GLBs never sit in memory.
+
     Args:
         url: URL to download from
         output_path: Local path to save to
+        expected_size: Optional expected size in bytes
+        sha256: Optional expected SHA-256 hex digest
 
     Returns:
         File size in bytes
     """
-    import os as _os
+    return get_downloader().download(url, output_path, expected_size=expected_size, sha256=sha256)
 
-    dirname = _os.path.dirname(output_path)
-    if dirname:
-        _os.makedirs(dirname, exist_ok=True)
 
-    response = httpx.get(url)
-    response.raise_for_status()
+def download_many(
+    items: list[tuple[str, str] | tuple[str, str, int | None, str | None]], max_workers: int | None = None
+) -> dict[str, int | Exception]:
+    """Download many files concurrently over the shared downloader.
 
-    with open(output_path, "wb") as f:
-        f.write(response.content)
+    Args:
+        items: (url, output_path) pairs, or (url, output_path, expected_size, sha256) tuples
+        max_workers: Maximum concurrent downloads
 
-    return len(response.content)
+    Returns:
+        Mapping of output path to file size, or to the exception that download failed with
+    """
+    return get_downloader().download_many(items, max_workers=max_workers)
@@ -0,0 +1,216 @@
+"""Webhook-driven task completion with a polling fallback.
+
+When Meshy is configured to send webhooks, polling for task status is wasted
+work: the callback announces completion the moment it happens.
+``CompletionRegistry`` lets waiters block on a future per task that the
+webhook receiver resolves. Each future is also handed to the shared task
+poller with a delayed first poll, so a task whose webhook never arrives is
+still picked up once the grace period ends.
+
+Until webhooks are enabled the registry simply polls, so service ``poll``
+functions can always wait through it.
+
+Usage:
+    from vendor_connectors.meshy import completion, text3d
+    from vendor_connectors.meshy.webhooks import WebhookServer
+
+    with WebhookServer() as server:  # enables webhooks on the shared registry
+        result = text3d.generate("a medieval sword")  # resolved by the webhook
+"""
+
+from __future__ import annotations
+
+import threading
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from vendor_connectors.meshy import poller as task_poller
+from vendor_connectors.meshy.models import TaskStatus
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
+    from vendor_connectors.meshy.webhooks.schemas import MeshyWebhookPayload
+
+
+# Seconds to wait for a webhook before falling back to polling
+DEFAULT_WEBHOOK_GRACE_SECONDS = 60.0
+
+# Terminal webhooks kept for tasks nobody is waiting on yet
+MAX_EARLY_WEBHOOKS = 1024
+
+TERMINAL_STATUSES = frozenset({TaskStatus.SUCCEEDED, TaskStatus.FAILED, TaskStatus.EXPIRED})
+
+
+class CompletionRegistry:
+    """Resolve task waiters from webhooks, polling only as a fallback."""
+
+    def __init__(
+        self,
+        poller: task_poller.TaskPoller | None = None,
+        grace_period: float = DEFAULT_WEBHOOK_GRACE_SECONDS,
+    ):
+        """Initialize the registry.
+
+        Args:
+            poller: Task poller for the fallback. Defaults to the shared poller.
+            grace_period: Seconds to wait for a webhook before polling.
+        """
+        self._poller = poller
+        self.grace_period = grace_period
+        self.webhooks_enabled = False
+        self._lock = threading.Lock()
+        self._pending: dict[str, tuple[Future, Callable[[str], Any], type | None]] = {}
+        self._early: OrderedDict[str, MeshyWebhookPayload] = OrderedDict()
+
+    @property
+    def poller(self) -> task_poller.TaskPoller:
+        """Task poller used for the fallback."""
+        return self._poller or task_poller.get_poller()
+
+    def enable_webhooks(self, grace_period: float | None = None) -> None:
+        """Start waiting on webhooks before polling.
+
+        Args:
+            grace_period: Optional new grace period in seconds.
+        """
+        if grace_period is not None:
+            self.grace_period = grace_period
+        self.webhooks_enabled = True
+
+    def disable_webhooks(self) -> None:
+        """Go back to polling right away."""
+        self.webhooks_enabled = False
+        with self._lock:
+            self._early.clear()
+
+    def expect(
+        self,
+        get: Callable[[str], Any],
+        task_id: str,
+        result_type: type | None = None,
+        interval: float = task_poller.DEFAULT_POLL_INTERVAL,
+        timeout: float = task_poller.DEFAULT_POLL_TIMEOUT,
+    ) -> Future:
+        """Register interest in a task's completion.
+
+        Args:
+            get: Status function of the task's service, used for the fallback.
+            task_id: Task ID.
+            result_type: Result model the webhook payload is validated into,
+                e.g. ``Text3DResult``. Without it, or if validation fails, the
+                result is fetched once with get.
+            interval: Initial poll interval once polling starts.
+            timeout: Seconds before the future fails with TimeoutError.
+
+        Returns:
+            Future resolved with the task result by the webhook or the poller.
+        """
+        delay = self.grace_period if self.webhooks_enabled else 0.0
+        future = self.poller.watch(get, task_id, interval=interval, timeout=timeout, delay=delay)
+
+        with self._lock:
+            early = self._early.pop(task_id, None)
+            if early is None:
+                self._pending[task_id] = (future, get, result_type)
+
+        if early is not None:
+            self._settle(future, early, get, result_type)
+        else:
+            future.add_done_callback(lambda _: self._discard(task_id, future))
+
+        return future
+
+    def wait(
+        self,
+        get: Callable[[str], Any],
+        task_id: str,
+        result_type: type | None = None,
+        interval: float = task_poller.DEFAULT_POLL_INTERVAL,
+        timeout: float = task_poller.DEFAULT_POLL_TIMEOUT,
+    ) -> Any:
+        """Block until a task finishes. See expect for arguments.
+
+        Raises:
+            RuntimeError: If the task fails or expires.
+            TimeoutError: If the task does not finish within timeout.
+        """
+        return self.expect(get, task_id, result_type=result_type, interval=interval, timeout=timeout).result()
+
+    def resolve(self, payload: MeshyWebhookPayload) -> bool:
+        """Resolve the waiter of a task from its webhook payload.
+
+        Non-terminal payloads are ignored. Terminal payloads for tasks nobody
+        waits on yet are kept briefly, so a webhook racing ahead of expect is
+        not lost.
+
+        Args:
+            payload: Parsed webhook payload.
+
+        Returns:
+            True if a waiter was resolved.
+        """
+        if payload.status not in TERMINAL_STATUSES:
+            return False
+
+        with self._lock:
+            pending = self._pending.pop(payload.id, None)
+            if pending is None:
+                if self.webhooks_enabled:
+                    self._early[payload.id] = payload
+                    while len(self._early) > MAX_EARLY_WEBHOOKS:
+                        self._early.popitem(last=False)
+                return False
+
+        future, get, result_type = pending
+        return self._settle(future, payload, get, result_type)
+
+    def _settle(
+        self,
+        future: Future,
+        payload: MeshyWebhookPayload,
+        get: Callable[[str], Any],
+        result_type: type | None,
+    ) -> bool:
+        if payload.status == TaskStatus.FAILED:
+            message = payload.get_error_message() or "Unknown error"
+            return task_poller.settle_future(future, exception=RuntimeError(f"Task failed: {message}"))
+        if payload.status == TaskStatus.EXPIRED:
+            return task_poller.settle_future(future, exception=RuntimeError("Task expired"))
+
+        try:
+            result = result_type.model_validate(payload.model_dump()) if result_type is not None else None
+        except ValidationError:
+            result = None
+
+        if result is None:
+            try:
+                result = get(payload.id)
+            except Exception as exc:
+                return task_poller.settle_future(future, exception=exc)
+
+        return task_poller.settle_future(future, result=result)
+
+    def _discard(self, task_id: str, future: Future) -> None:
+        with self._lock:
+            pending = self._pending.get(task_id)
+            if pending is not None and pending[0] is future:
+                del self._pending[task_id]
+
+
+_registry: CompletionRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> CompletionRegistry:
+    """Get or create the shared completion registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CompletionRegistry()
+        return _registry
@@ -9,10 +9,8 @@ Usage:
 
 from __future__ import annotations
 
-import time
-
-from vendor_connectors.meshy import base
-from vendor_connectors.meshy.models import Image3DRequest, Image3DResult, TaskStatus
+from vendor_connectors.meshy import base, completion
+from vendor_connectors.meshy.models import Image3DRequest, Image3DResult
 
 
 def create(request: Image3DRequest) -> str:
@@ -52,9 +50,12 @@ def refine(task_id: str) -> str:
 def poll(task_id: str, interval: float = 5.0, timeout: float = 600.0) -> Image3DResult:
     """Polls the status of an image-to-3D task until it completes, fails, expires, or times out.
 
+    Waits for the task's webhook when webhooks are enabled, falling back to
+    the shared task poller, whose interval adapts to the reported progress.
+
     Args:
         task_id: The ID of the image-to-3D task to poll.
-        interval: Time in seconds between polling attempts (default: 5.0).
+        interval: Initial time in seconds between polling attempts (default: 5.0).
         timeout: Maximum time in seconds to wait for task completion (default: 600.0).
 
     Returns:
@@ -64,21 +65,7 @@ def poll(task_id: str, interval: float = 5.0, timeout: float = 600.0) -> Image3D
         RuntimeError: If the task fails or expires.
         TimeoutError: If the polling times out before the task completes.
     """
-    start = time.time()
-    while True:
-        result = get(task_id)
-        if result.status == TaskStatus.SUCCEEDED:
-            return result
-        if result.status == TaskStatus.FAILED:
-            msg = f"Task failed: {result.error or 'Unknown error'}"
-            raise RuntimeError(msg)
-        if result.status == TaskStatus.EXPIRED:
-            msg = "Task expired"
-            raise RuntimeError(msg)
-        if time.time() - start > timeout:
-            msg = f"Task timed out after {timeout}s"
-            raise TimeoutError(msg)
-        time.sleep(interval)
+    return completion.get_registry().wait(get, task_id, Image3DResult, interval=interval, timeout=timeout)
 
 
 def generate(
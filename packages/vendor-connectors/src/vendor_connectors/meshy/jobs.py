@@ -9,14 +9,25 @@ from __future__ import annotations
 import hashlib
 import json
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from vendor_connectors.meshy import base, text3d
 from vendor_connectors.meshy.models import ArtStyle, AssetIntent, AssetSpec, Text3DRequest
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from vendor_connectors.meshy.models import Text3DResult
+
+
+# Number of assets downloaded concurrently while generation continues
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+
 @dataclass
 class AssetManifest:
     """Metadata for generated asset."""
@@ -60,6 +71,18 @@ class AssetGenerator:
 
     def generate_model(self, spec: AssetSpec, wait: bool = True, poll_interval: float = 5.0) -> AssetManifest:
         """Generate 3D model from spec."""
+        manifest = self._create_task(spec)
+
+        if not wait:
+            return manifest
+
+        # Poll until complete
+        result = text3d.poll(manifest.task_id, interval=poll_interval)
+
+        return self._download_assets(spec, manifest, result)
+
+    def _create_task(self, spec: AssetSpec) -> AssetManifest:
+        """Create the text3d task for a spec and return its initial manifest."""
         asset_id = self._generate_asset_id(spec)
 
         # Create task using text3d module
@@ -74,7 +97,7 @@ class AssetGenerator:
             )
         )
 
-        manifest = AssetManifest(
+        return AssetManifest(
             asset_id=asset_id,
             intent=spec.intent.value,
             description=spec.description,
@@ -84,13 +107,9 @@ class AssetGenerator:
             metadata=spec.metadata.copy() if spec.metadata else {},
         )
 
-        if not wait:
-            return manifest
-
-        # Poll until complete
-        result = text3d.poll(task_id, interval=poll_interval)
-
-        # Download assets
+    def _download_assets(self, spec: AssetSpec, manifest: AssetManifest, result: Text3DResult) -> AssetManifest:
+        """Download a finished task's files and save the manifest next to them."""
+        asset_id = manifest.asset_id
         output_dir = self.output_root / spec.output_path
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -123,18 +142,97 @@ class AssetGenerator:
 
         return manifest
 
-    def batch_generate(self, specs: list[AssetSpec], max_concurrent: int = 3) -> list[AssetManifest]:
-        """Generate multiple assets (respecting rate limits)."""
-        manifests = []
-
-        for spec in specs:
-            try:
-                manifest = self.generate_model(spec, wait=True)
-                manifests.append(manifest)
-            except Exception:  # noqa: S112 - batch continues on individual failures
-                continue
-
-        return manifests
+    def batch_generate(
+        self,
+        specs: list[AssetSpec],
+        max_concurrent: int = 3,
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        poll_interval: float = 5.0,
+    ) -> list[AssetManifest]:
+        """Generate multiple assets (respecting rate limits).
+
+        Assets that fail are skipped. See iter_generate for scheduling.
+
+        Returns:
+            Manifests of the generated assets, in spec order.
+        """
+        results = sorted(self._run_batch(specs, max_concurrent, download_workers, poll_interval))
+        return [manifest for _, manifest in results]
+
+    def iter_generate(
+        self,
+        specs: Iterable[AssetSpec],
+        max_concurrent: int = 3,
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        poll_interval: float = 5.0,
+    ) -> Iterator[AssetManifest]:
+        """Generate multiple assets, yielding manifests as assets finish.
+
+        Up to max_concurrent Meshy tasks are kept in flight. Tasks are created
+        in spec order as slots free up, and every API call goes through the
+        shared Meshy rate limiter. A finished task's files are downloaded on a
+        separate pool, so downloads overlap with ongoing generation. Assets
+        that fail are skipped.
+
+        Args:
+            specs: Asset specifications.
+            max_concurrent: Maximum number of Meshy tasks in flight.
+            download_workers: Maximum number of assets downloading at once.
+            poll_interval: Seconds between task status polls.
+
+        Yields:
+            AssetManifest for each generated asset, in completion order.
+        """
+        for _, manifest in self._run_batch(specs, max_concurrent, download_workers, poll_interval):
+            yield manifest
+
+    def _run_batch(
+        self,
+        specs: Iterable[AssetSpec],
+        max_concurrent: int,
+        download_workers: int,
+        poll_interval: float,
+    ) -> Iterator[tuple[int, AssetManifest]]:
+        """Schedule generation and downloads, yielding (spec index, manifest) as assets finish."""
+        remaining = iter(enumerate(specs))
+        generating: dict[Future, tuple[int, AssetSpec, AssetManifest]] = {}
+        downloading: dict[Future, int] = {}
+
+        poll_pool = ThreadPoolExecutor(max_workers=max(1, max_concurrent), thread_name_prefix="meshy-poll")
+        download_pool = ThreadPoolExecutor(max_workers=max(1, download_workers), thread_name_prefix="meshy-download")
+
+        try:
+            while True:
+                # Top up in-flight tasks in spec order
+                while len(generating) < max_concurrent:
+                    next_spec = next(remaining, None)
+                    if next_spec is None:
+                        break
+                    index, spec = next_spec
+                    try:
+                        manifest = self._create_task(spec)
+                    except Exception:  # noqa: S112 - batch continues on individual failures
+                        continue
+                    future = poll_pool.submit(text3d.poll, manifest.task_id, interval=poll_interval)
+                    generating[future] = (index, spec, manifest)
+
+                if not generating and not downloading:
+                    return
+
+                done, _ = wait([*generating, *downloading], return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in generating:
+                        index, spec, manifest = generating.pop(future)
+                        if future.exception() is None:
+                            download = download_pool.submit(self._download_assets, spec, manifest, future.result())
+                            downloading[download] = index
+                    else:
+                        index = downloading.pop(future)
+                        if future.exception() is None:
+                            yield index, future.result()
+        finally:
+            poll_pool.shutdown(wait=False, cancel_futures=True)
+            download_pool.shutdown(wait=False, cancel_futures=True)
 
 
 # Example specs
@@ -174,8 +174,9 @@ def _create_mcp_tools() -> list[Any]:
             "name": "list_animations",
             "description": (
                 "List available animations from the Meshy animation catalog. "
-                "Optionally filter by category. Returns animation IDs and names "
-                "that can be used with apply_animation."
+                "Optionally filter by category or search by description "
+                "(e.g. query='sword slash attack'), best matches first. Returns "
+                "animation IDs and names that can be used with apply_animation."
             ),
             "func": tools.list_animations,
             "parameters": {
@@ -185,6 +186,11 @@ def _create_mcp_tools() -> list[Any]:
                     "default": "",
                 },
                 "limit": {"type": "integer", "description": "Maximum number of animations to return", "default": 50},
+                "query": {
+                    "type": "string",
+                    "description": "Optional free-text search, e.g. 'sword slash attack'",
+                    "default": "",
+                },
             },
         },
         {
@@ -9,11 +9,17 @@ Usage:
     from vendor_connectors.meshy.persistence import TaskRepository
     repo = TaskRepository("models/")
 
+    # Append-only journal for busy projects (requires filelock)
+    repo = TaskRepository("models/", journal=True)
+
     # Vector-enabled SQLite for RAG
     from vendor_connectors.meshy.persistence import VectorStore
     store = VectorStore("assets.db")
     store.record_generation(spec_hash, prompt, embedding=get_embedding(prompt))
     similar = store.search_similar(query_embedding)
+
+    # Batched, cached embeddings
+    vectors = get_embeddings(prompts)
 """
 
 from __future__ import annotations
@@ -22,10 +28,12 @@ from vendor_connectors.meshy.persistence.repository import TaskRepository
 from vendor_connectors.meshy.persistence.schemas import ArtifactRecord, AssetManifest, ProjectManifest, TaskGraphEntry
 from vendor_connectors.meshy.persistence.utils import canonicalize_spec, compute_spec_hash
 from vendor_connectors.meshy.persistence.vector_store import (
+    EmbeddingCache,
     GenerationRecord,
     SimilarityResult,
     VectorStore,
     get_embedding,
+    get_embeddings,
 )
 
 
@@ -33,6 +41,7 @@ __all__ = [
     # JSON manifests
     "ArtifactRecord",
     "AssetManifest",
+    "EmbeddingCache",
     "GenerationRecord",
     "ProjectManifest",
     "SimilarityResult",
@@ -43,4 +52,5 @@ __all__ = [
     "canonicalize_spec",
     "compute_spec_hash",
     "get_embedding",
+    "get_embeddings",
 ]
@@ -1,14 +1,28 @@
-"""Task repository for manifest storage and retrieval."""
+"""Task repository for manifest storage and retrieval.
+
+By default every change rewrites the project's ``manifest.json``. In journal
+mode (``TaskRepository(path, journal=True)``) changes are appended as compact
+JSONL records to ``manifest.journal.jsonl`` instead and folded into the
+manifest snapshot every ``compact_every`` records, so the cost of a status
+update no longer grows with the size of the project. Writers are serialized
+with a per-project file lock; the read API is the same in both modes.
+"""
 
 from __future__ import annotations
 
 import json
 import os
 import tempfile
+import threading
 
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
 
 from vendor_connectors.meshy.persistence.schemas import (
     ArtifactRecord,
@@ -21,21 +35,152 @@ from vendor_connectors.meshy.persistence.schemas import (
 from vendor_connectors.meshy.persistence.utils import compute_spec_hash as util_compute_spec_hash
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+# Sidecar mapping task_id -> (project, spec_hash), one JSON object per line
+TASK_INDEX_FILENAME = "task_index.jsonl"
+
+MANIFEST_FILENAME = "manifest.json"
+JOURNAL_FILENAME = "manifest.journal.jsonl"
+LOCK_FILENAME = "manifest.lock"
+
+# Journal records folded into the snapshot at a time
+DEFAULT_COMPACT_EVERY = 500
+
+_DATETIME = TypeAdapter(datetime)
+
+
 def _utc_now() -> datetime:
     """Return current UTC time with timezone info."""
     return datetime.now(timezone.utc)
 
 
-class TaskRepository:
-    """File-backed repository for task manifests with atomic operations."""
+@dataclass
+class _JournalState:
+    """In-memory view of a journaled project: snapshot plus replayed records."""
 
-    def __init__(self, base_path: str = "client/public/models"):
+    manifest: ProjectManifest
+    snapshot_key: tuple[int, int, int] | None
+    offset: int = 0  # Bytes of the journal already applied
+    seq: int = 0  # Sequence number of the last applied record
+    pending: int = 0  # Records in the journal since the last compaction
+
+
+def _file_key(path: Path) -> tuple[int, int, int] | None:
+    """Identify a file version by inode, mtime and size."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _apply_record(manifest: ProjectManifest, record: dict[str, Any]) -> None:
+    """Apply one update record to a manifest (see TaskRepository._commit)."""
+    spec_hash = record["spec_hash"]
+    if record.get("asset") is not None:
+        manifest.asset_specs[spec_hash] = AssetManifest.model_validate(record["asset"])
+    asset_record = manifest.asset_specs[spec_hash]
+
+    if record.get("task") is not None:
+        task_entry = TaskGraphEntry.model_validate(record["task"])
+        for i, existing in enumerate(asset_record.task_graph):
+            if existing.task_id == task_entry.task_id:
+                asset_record.task_graph[i] = task_entry
+                break
+        else:
+            asset_record.task_graph.append(task_entry)
+
+    if record.get("history") is not None:
+        asset_record.history.append(StatusHistoryEntry.model_validate(record["history"]))
+
+    asset_record.artifacts.extend(ArtifactRecord.model_validate(artifact) for artifact in record.get("artifacts") or ())
+
+    if "at" in record:
+        manifest.last_updated = _DATETIME.validate_python(record["at"])
+
+
+class TaskRepository:
+    """File-backed repository for task manifests with atomic operations.
+
+    Task lookups go through an append-only task_id index kept next to the
+    project directories, and read-only lookups reuse parsed manifests until
+    the file on disk changes.
+
+    Args:
+        base_path: Directory holding one subdirectory per project
+        journal: Append changes to a per-project journal instead of rewriting
+            manifest.json on every update (requires filelock). All writers of
+            a base path must use the same mode.
+        compact_every: Journal records to accumulate before compacting them
+            into manifest.json
+    """
+
+    def __init__(
+        self,
+        base_path: str = "client/public/models",
+        journal: bool = False,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.journal = journal
+        self.compact_every = compact_every
+
+        self._lock = threading.RLock()
+        self._journals: dict[str, _JournalState] = {}
+        self._manifest_cache: dict[str, tuple[tuple[int, int], ProjectManifest]] = {}
+        self._task_index: dict[str, tuple[str, str]] | None = None
+        self._task_index_offset = 0
+        # Manifest versions the index was last rebuilt from
+        self._indexed_versions: dict[str, tuple[Any, ...]] | None = None
 
     def _manifest_path(self, project: str) -> Path:
         """Get path to project manifest file."""
-        return self.base_path / project / "manifest.json"
+        return self.base_path / project / MANIFEST_FILENAME
+
+    def _journal_path(self, project: str) -> Path:
+        """Get path to project journal file."""
+        return self.base_path / project / JOURNAL_FILENAME
+
+    @property
+    def task_index_path(self) -> Path:
+        """Path to the task_id index file."""
+        return self.base_path / TASK_INDEX_FILENAME
+
+    def _project_names(self) -> list[str]:
+        """List projects that have a manifest on disk."""
+        return [d.name for d in self.base_path.iterdir() if d.is_dir() and (d / MANIFEST_FILENAME).exists()]
+
+    def _read_manifest(self, project: str) -> ProjectManifest | None:
+        """Load a manifest for reading, reusing the parsed copy while the file is unchanged.
+
+        The returned manifest is shared and must not be modified.
+        """
+        if self.journal:
+            if not self._manifest_path(project).exists():
+                return None
+            with self._lock:
+                return self._journal_state(project).manifest
+
+        manifest_path = self._manifest_path(project)
+        try:
+            stat = manifest_path.stat()
+        except FileNotFoundError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._manifest_cache.get(project)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+        manifest = ProjectManifest.model_validate_json(manifest_path.read_bytes())
+        with self._lock:
+            self._manifest_cache[project] = (key, manifest)
+        return manifest
 
     def load_project_manifest(self, project: str) -> ProjectManifest:
         """Load manifest for a project, creating empty one if missing.
@@ -46,6 +191,10 @@ class TaskRepository:
         Returns:
             ProjectManifest instance
         """
+        if self.journal:
+            with self._writing(project) as manifest:
+                return manifest.model_copy(deep=True)
+
         manifest_path = self._manifest_path(project)
 
         if not manifest_path.exists():
@@ -61,15 +210,47 @@ class TaskRepository:
     def save_project_manifest(self, manifest: ProjectManifest) -> None:
         """Atomically save project manifest to disk.
 
+        In journal mode this replaces the whole project state and compacts
+        the journal.
+
         Args:
             manifest: ProjectManifest to save
         """
         manifest.last_updated = _utc_now()
+
+        if self.journal:
+            with self._project_lock(manifest.project), self._lock:
+                state = self._journal_state(manifest.project)
+                state.manifest = manifest.model_copy(deep=True)
+                self._compact(manifest.project, state)
+        else:
+            self._write_snapshot(manifest)
+            with self._lock:
+                self._manifest_cache.pop(manifest.project, None)
+
+        self._index_tasks(self._manifest_tasks(manifest))
+
+    def compact(self, project: str) -> None:
+        """Fold a project's journal into its manifest snapshot (journal mode only).
+
+        Args:
+            project: Project name
+        """
+        if not self.journal:
+            return
+        with self._project_lock(project), self._lock:
+            self._compact(project, self._journal_state(project))
+
+    def _write_snapshot(self, manifest: ProjectManifest, journal_seq: int | None = None) -> None:
+        """Atomically write manifest.json."""
         manifest_path = self._manifest_path(manifest.project)
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Serialize Pydantic model with datetime → ISO string conversion
         manifest_dict = manifest.model_dump(mode="json")
+        if journal_seq is not None:
+            # Journal records up to this sequence number are already included
+            manifest_dict["journal_seq"] = journal_seq
 
         # Atomic write: write to temp file, then rename
         with tempfile.NamedTemporaryFile(mode="w", dir=manifest_path.parent, delete=False, suffix=".tmp") as tmp_file:
@@ -89,8 +270,12 @@ class TaskRepository:
         Returns:
             AssetManifest if found, None otherwise
         """
-        manifest = self.load_project_manifest(project)
-        return manifest.asset_specs.get(spec_hash)
+        manifest = self._read_manifest(project)
+        if manifest is None:
+            self.load_project_manifest(project)
+            return None
+        asset_record = manifest.asset_specs.get(spec_hash)
+        return asset_record.model_copy(deep=True) if asset_record else None
 
     def upsert_asset_record(self, project: str, asset_manifest: AssetManifest) -> None:
         """Insert or update asset manifest.
@@ -99,10 +284,9 @@ class TaskRepository:
             project: Project name
             asset_manifest: AssetManifest to save
         """
-        manifest = self.load_project_manifest(project)
         asset_manifest.updated_at = _utc_now()
-        manifest.asset_specs[asset_manifest.asset_spec_hash] = asset_manifest
-        self.save_project_manifest(manifest)
+        with self._writing(project) as manifest:
+            self._commit(manifest, {"spec_hash": asset_manifest.asset_spec_hash, "asset": asset_manifest})
 
     def record_task_update(
         self,
@@ -131,74 +315,73 @@ class TaskRepository:
             source: Update source (orchestrator, webhook, manual)
             error: Error message if failed
         """
-        manifest = self.load_project_manifest(project)
-        asset_record = manifest.asset_specs.get(spec_hash)
-
-        if not asset_record:
-            msg = f"Asset {spec_hash} not found for project {project}"
-            raise ValueError(msg)
-
-        # Find existing task entry or create new
-        task_entry = None
-        for entry in asset_record.task_graph:
-            if entry.task_id == task_id:
-                task_entry = entry
-                break
-
-        if task_entry:
-            # Update existing entry
-            old_status = task_entry.status
-            task_entry.status = status
-            task_entry.updated_at = _utc_now()
-
-            if result_paths:
-                task_entry.result_paths.update(result_paths)
-
-            if error:
-                task_entry.error = error
-
-            # Record status transition
-            asset_record.history.append(
-                StatusHistoryEntry(
+        with self._writing(project) as manifest:
+            asset_record = manifest.asset_specs.get(spec_hash)
+
+            if not asset_record:
+                msg = f"Asset {spec_hash} not found for project {project}"
+                raise ValueError(msg)
+
+            # Find existing task entry or create new
+            task_entry = None
+            history_entry = None
+            for entry in asset_record.task_graph:
+                if entry.task_id == task_id:
+                    task_entry = entry.model_copy(deep=True)
+                    break
+
+            if task_entry:
+                # Update existing entry
+                old_status = task_entry.status
+                task_entry.status = status
+                task_entry.updated_at = _utc_now()
+
+                if result_paths:
+                    task_entry.result_paths.update(result_paths)
+
+                if error:
+                    task_entry.error = error
+
+                # Record status transition
+                history_entry = StatusHistoryEntry(
                     timestamp=_utc_now(),
                     old_status=old_status,
                     new_status=status,
                     source=source,
                     task_id=task_id,
                 )
-            )
 
-        elif service:
-            # Create new task entry
-            task_entry = TaskGraphEntry(
-                task_id=task_id,
-                service=service,
-                status=status,
-                created_at=_utc_now(),
-                updated_at=_utc_now(),
-                payload=payload or {},
-                result_paths=result_paths or {},
-                error=error,
-            )
-            asset_record.task_graph.append(task_entry)
+            elif service:
+                # Create new task entry
+                task_entry = TaskGraphEntry(
+                    task_id=task_id,
+                    service=service,
+                    status=status,
+                    created_at=_utc_now(),
+                    updated_at=_utc_now(),
+                    payload=payload or {},
+                    result_paths=result_paths or {},
+                    error=error,
+                )
 
-            # Record initial status
-            asset_record.history.append(
-                StatusHistoryEntry(
+                # Record initial status
+                history_entry = StatusHistoryEntry(
                     timestamp=_utc_now(),
                     old_status="",
                     new_status=status,
                     source=source,
                     task_id=task_id,
                 )
-            )
-
-        # Add artifacts if provided
-        if artifacts:
-            asset_record.artifacts.extend(artifacts)
 
-        # Save updated manifest
-        self.save_project_manifest(manifest)
+            self._commit(
+                manifest,
+                {
+                    "spec_hash": spec_hash,
+                    "task": task_entry,
+                    "history": history_entry,
+                    "artifacts": artifacts or [],
+                },
+            )
 
     def list_pending_assets(self, project: str) -> list[AssetManifest]:
         """List all assets with pending/in-progress tasks.
@@ -209,7 +392,7 @@ class TaskRepository:
         Returns:
             List of AssetManifest with non-terminal tasks
         """
-        manifest = self.load_project_manifest(project)
+        manifest = self._read_manifest(project) or self.load_project_manifest(project)
         pending = []
 
         terminal_statuses = {"SUCCEEDED", "FAILED", "EXPIRED", "CANCELED"}
@@ -217,7 +400,7 @@ class TaskRepository:
         for asset_record in manifest.asset_specs.values():
             has_pending = any(task.status not in terminal_statuses for task in asset_record.task_graph)
             if has_pending:
-                pending.append(asset_record)
+                pending.append(asset_record.model_copy(deep=True))
 
         return pending
 
@@ -231,22 +414,149 @@ class TaskRepository:
         Returns:
             Tuple of (project, spec_hash, AssetManifest) if found
         """
-        # Determine which project to search
+        location = self._lookup_task(task_id)
+        if location is not None and (project is None or location[0] == project):
+            found = self._find_in_project(task_id, location[0], location[1])
+            if found is None:
+                # Stale index (manifest edited outside the repository): rebuild and retry once
+                self.rebuild_task_index()
+                location = self._lookup_task(task_id)
+                if location is not None and (project is None or location[0] == project):
+                    found = self._find_in_project(task_id, *location)
+            if found is not None:
+                return found
+
         if project:
-            project_list = [project]
-        else:
-            # Search all project directories
-            project_list = [d.name for d in self.base_path.iterdir() if d.is_dir() and (d / "manifest.json").exists()]
+            return self._find_in_project(task_id, project)
+
+        if location is None and self._manifest_versions() != self._indexed_versions:
+            # Manifests without index entries (copied in, or written by an older version): rebuild once
+            self.rebuild_task_index()
+            location = self._lookup_task(task_id)
+            if location is not None:
+                return self._find_in_project(task_id, *location)
+        return None
 
-        for sp in project_list:
-            manifest = self.load_project_manifest(sp)
+    def _manifest_versions(self) -> dict[str, tuple[Any, ...]]:
+        """Identify the on-disk version of every project's manifest and journal."""
+        return {
+            project: (_file_key(self._manifest_path(project)), _file_key(self._journal_path(project)))
+            for project in self._project_names()
+        }
+
+    def rebuild_task_index(self) -> None:
+        """Rebuild the task_id index from every project manifest.
+
+        Only needed after manifests are modified outside the repository;
+        the index is otherwise kept current on every save.
+        """
+        versions = self._manifest_versions()
+        index: dict[str, tuple[str, str]] = {}
+        for project in versions:
+            manifest = self._read_manifest(project)
+            if manifest is None:
+                continue
             for spec_hash, asset_record in manifest.asset_specs.items():
                 for task in asset_record.task_graph:
-                    if task.task_id == task_id:
-                        return (sp, spec_hash, asset_record)
+                    index[task.task_id] = (project, spec_hash)
+
+        lines = "".join(self._index_line(task_id, *location) for task_id, location in index.items())
+        with self._lock:
+            with tempfile.NamedTemporaryFile(mode="w", dir=self.base_path, delete=False, suffix=".tmp") as tmp_file:
+                tmp_file.write(lines)
+                tmp_path = tmp_file.name
+            os.replace(tmp_path, self.task_index_path)
+            self._task_index = index
+            self._task_index_offset = len(lines.encode())
+            self._indexed_versions = versions
+
+    def _find_in_project(
+        self, task_id: str, project: str, spec_hash: str | None = None
+    ) -> tuple[str, str, AssetManifest] | None:
+        """Look for a task in one project's manifest, optionally in a single asset."""
+        manifest = self._read_manifest(project)
+        if manifest is None:
+            return None
+
+        if spec_hash is not None:
+            asset_record = manifest.asset_specs.get(spec_hash)
+            candidates = [(spec_hash, asset_record)] if asset_record else []
+        else:
+            candidates = manifest.asset_specs.items()
 
+        for found_hash, asset_record in candidates:
+            if any(task.task_id == task_id for task in asset_record.task_graph):
+                return (project, found_hash, asset_record.model_copy(deep=True))
         return None
 
+    @staticmethod
+    def _index_line(task_id: str, project: str, spec_hash: str) -> str:
+        return json.dumps({"task_id": task_id, "project": project, "spec_hash": spec_hash}) + "\n"
+
+    def _load_task_index(self) -> dict[str, tuple[str, str]]:
+        """Load the task index, building it from the manifests on first use."""
+        with self._lock:
+            if self._task_index is None:
+                if self.task_index_path.exists():
+                    self._task_index = {}
+                    self._task_index_offset = 0
+                    self._refresh_task_index()
+                else:
+                    self.rebuild_task_index()
+            return self._task_index
+
+    def _refresh_task_index(self) -> None:
+        """Apply entries appended to the index file since it was last read (e.g. by another process)."""
+        try:
+            with open(self.task_index_path, "rb") as f:
+                f.seek(self._task_index_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        # Ignore a trailing line another writer has not finished yet
+        complete = data[: data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            try:
+                entry = json.loads(line)
+                self._task_index[entry["task_id"]] = (entry["project"], entry["spec_hash"])
+            except (ValueError, KeyError, TypeError):
+                continue
+        self._task_index_offset += len(complete)
+
+    def _lookup_task(self, task_id: str) -> tuple[str, str] | None:
+        """Resolve a task ID to (project, spec_hash) from the index."""
+        with self._lock:
+            index = self._load_task_index()
+            location = index.get(task_id)
+            if location is None:
+                self._refresh_task_index()
+                location = index.get(task_id)
+            return location
+
+    @staticmethod
+    def _manifest_tasks(manifest: ProjectManifest) -> dict[str, tuple[str, str]]:
+        """Map every task in a manifest to its (project, spec_hash)."""
+        return {
+            task.task_id: (manifest.project, spec_hash)
+            for spec_hash, asset_record in manifest.asset_specs.items()
+            for task in asset_record.task_graph
+        }
+
+    def _index_tasks(self, tasks: dict[str, tuple[str, str]]) -> None:
+        """Append index entries for tasks that are not indexed at their location yet."""
+        with self._lock:
+            index = self._load_task_index()
+            new_entries = {task_id: location for task_id, location in tasks.items() if index.get(task_id) != location}
+            if not new_entries:
+                return
+
+            # Single write per save; the next refresh re-reads these lines harmlessly
+            lines = "".join(self._index_line(task_id, *location) for task_id, location in new_entries.items())
+            with open(self.task_index_path, "a") as f:
+                f.write(lines)
+            index.update(new_entries)
+
     def compute_spec_hash(self, spec: dict[str, Any]) -> str:
         """Compute deterministic hash for task spec.
 
@@ -280,51 +590,184 @@ class TaskRepository:
             msg = "spec_hash cannot be empty"
             raise ValueError(msg)
 
-        manifest = self.load_project_manifest(submission.project)
+        with self._writing(submission.project) as manifest:
+            new_asset = None
+            asset_record = manifest.asset_specs.get(submission.spec_hash)
+            if not asset_record:
+                new_asset = asset_record = AssetManifest(
+                    asset_spec_hash=submission.spec_hash,
+                    spec_fingerprint=submission.spec_hash,
+                    project=submission.project,
+                    asset_intent="creature",
+                )
+
+            # Idempotency: if task_id already exists with same status, short-circuit (webhook retry)
+            for existing_task in asset_record.task_graph:
+                if existing_task.task_id == submission.task_id:
+                    if existing_task.status == submission.status.value:
+                        # Duplicate submission with same status - idempotent, return silently
+                        return
+                    else:
+                        msg = (
+                            f"Task {submission.task_id} already exists with different status: "
+                            f"{existing_task.status} != {submission.status.value}"
+                        )
+                        raise ValueError(msg)
 
-        asset_record = manifest.asset_specs.get(submission.spec_hash)
-        if not asset_record:
-            asset_record = AssetManifest(
-                asset_spec_hash=submission.spec_hash,
-                spec_fingerprint=submission.spec_hash,
-                project=submission.project,
-                asset_intent="creature",
+            task_entry = TaskGraphEntry(
+                task_id=submission.task_id,
+                service=submission.service,
+                status=submission.status.value,
+                created_at=submission.created_at,
+                updated_at=submission.updated_at,
+                payload={"callback_url": submission.callback_url},
+                result_paths={},
+                error=None,
             )
-            manifest.asset_specs[submission.spec_hash] = asset_record
-
-        # Idempotency: if task_id already exists with same status, short-circuit (webhook retry)
-        for existing_task in asset_record.task_graph:
-            if existing_task.task_id == submission.task_id:
-                if existing_task.status == submission.status.value:
-                    # Duplicate submission with same status - idempotent, return silently
-                    return
-                else:
-                    msg = (
-                        f"Task {submission.task_id} already exists with different status: "
-                        f"{existing_task.status} != {submission.status.value}"
-                    )
-                    raise ValueError(msg)
-
-        task_entry = TaskGraphEntry(
-            task_id=submission.task_id,
-            service=submission.service,
-            status=submission.status.value,
-            created_at=submission.created_at,
-            updated_at=submission.updated_at,
-            payload={"callback_url": submission.callback_url},
-            result_paths={},
-            error=None,
-        )
-        asset_record.task_graph.append(task_entry)
 
-        asset_record.history.append(
-            StatusHistoryEntry(
+            history_entry = StatusHistoryEntry(
                 timestamp=_utc_now(),
                 old_status="",
                 new_status=submission.status.value,
                 source="service",
                 task_id=submission.task_id,
             )
+
+            self._commit(
+                manifest,
+                {
+                    "spec_hash": submission.spec_hash,
+                    "asset": new_asset,
+                    "task": task_entry,
+                    "history": history_entry,
+                },
+            )
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def _writing(self, project: str) -> Iterator[ProjectManifest]:
+        """Hold a project for a read-modify-write cycle.
+
+        In journal mode the project lock is held throughout and the yielded
+        manifest is the shared in-memory state, which may only be changed
+        through _commit.
+        """
+        if not self.journal:
+            yield self.load_project_manifest(project)
+            return
+
+        with self._project_lock(project), self._lock:
+            state = self._journal_state(project)
+            if state.snapshot_key is None:
+                # Create the snapshot so the project is discoverable, as load_project_manifest does
+                self._compact(project, state)
+            yield state.manifest
+
+    def _commit(self, manifest: ProjectManifest, record: dict[str, Any]) -> None:
+        """Apply an update record to a manifest obtained from _writing and persist it.
+
+        A record names the asset (spec_hash) and optionally carries a whole
+        asset to insert or replace ("asset"), a task graph entry to insert or
+        replace by task_id ("task"), a history entry to append ("history") and
+        artifacts to append ("artifacts").
+        """
+        if not self.journal:
+            _apply_record(manifest, record)
+            self.save_project_manifest(manifest)
+            return
+
+        project = manifest.project
+        state = self._journals[project]
+        state.seq += 1
+        data = to_jsonable_python({**record, "seq": state.seq, "at": _utc_now()}, exclude_none=True)
+        line = json.dumps(data, separators=(",", ":")) + "\n"
+
+        with open(self._journal_path(project), "a") as f:
+            f.write(line)
+        state.offset += len(line.encode())
+        state.pending += 1
+
+        # Apply what was written so memory matches a replay of the journal
+        _apply_record(state.manifest, data)
+
+        if state.pending >= self.compact_every:
+            self._compact(project, state)
+
+        spec_hash = record["spec_hash"]
+        self._index_tasks(
+            {task.task_id: (project, spec_hash) for task in state.manifest.asset_specs[spec_hash].task_graph}
         )
 
-        self.save_project_manifest(manifest)
+    # -------------------------------------------------------------------------
+    # Journal
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def _project_lock(self, project: str) -> Iterator[None]:
+        """Serialize writers of a project across threads and processes."""
+        from filelock import FileLock
+
+        lock_path = self.base_path / project / LOCK_FILENAME
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(str(lock_path)):
+            yield
+
+    def _journal_state(self, project: str) -> _JournalState:
+        """Bring a project's in-memory state up to date with the files on disk.
+
+        Only journal bytes added since the last call are read, unless the
+        snapshot changed or the journal was truncated (compaction by another
+        writer), in which case the state is reloaded.
+        """
+        snapshot_key = _file_key(self._manifest_path(project))
+        journal_key = _file_key(self._journal_path(project))
+        journal_size = journal_key[2] if journal_key else 0
+
+        state = self._journals.get(project)
+        if state is None or state.snapshot_key != snapshot_key or journal_size < state.offset:
+            state = self._load_snapshot(project, snapshot_key)
+            self._journals[project] = state
+
+        if journal_size > state.offset:
+            self._replay_journal(project, state)
+        return state
+
+    def _load_snapshot(self, project: str, snapshot_key: tuple[int, int, int] | None) -> _JournalState:
+        """Load manifest.json (or an empty manifest) as the base for replay."""
+        if snapshot_key is None:
+            return _JournalState(manifest=ProjectManifest(project=project), snapshot_key=None)
+
+        data = json.loads(self._manifest_path(project).read_bytes())
+        seq = data.pop("journal_seq", 0)
+        return _JournalState(manifest=ProjectManifest.model_validate(data), snapshot_key=snapshot_key, seq=seq)
+
+    def _replay_journal(self, project: str, state: _JournalState) -> None:
+        """Apply journal records written since state.offset."""
+        with open(self._journal_path(project), "rb") as f:
+            f.seek(state.offset)
+            data = f.read()
+
+        # Ignore a trailing record another writer has not finished yet
+        complete = data[: data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            record = json.loads(line)
+            state.pending += 1
+            if record["seq"] <= state.seq:
+                # Already folded into the snapshot
+                continue
+            _apply_record(state.manifest, record)
+            state.seq = record["seq"]
+        state.offset += len(complete)
+
+    def _compact(self, project: str, state: _JournalState) -> None:
+        """Write the state as the new snapshot and empty the journal. Caller holds the project lock."""
+        self._write_snapshot(state.manifest, journal_seq=state.seq)
+        # A crash here leaves records the snapshot already covers; replay skips them by seq
+        with open(self._journal_path(project), "w"):
+            pass
+        state.snapshot_key = _file_key(self._manifest_path(project))
+        state.offset = 0
+        state.pending = 0
@@ -4,8 +4,9 @@ This module provides a vector-enabled SQLite database for:
 1. Idempotency tracking - deduplicate asset generation requests
 2. RAG embeddings - semantic search over prompts, species, assets
 
-Uses sqlite-vec for vector similarity search, falling back to
-standard SQLite if vectors aren't needed.
+Uses sqlite-vec for vector similarity search when it is installed.
+Otherwise embeddings are kept as float32 blobs in a plain table and
+searched with a vectorized NumPy cosine scan over an in-memory matrix.
 
 Usage:
     from vendor_connectors.meshy.persistence.vector_store import VectorStore
@@ -20,6 +21,9 @@ Usage:
         embedding=get_embedding("cute otter character"),
     )
 
+    # Record many generations, embedding their prompts in batches
+    store.record_generations([GenerationRecord(spec_hash=h, prompt=p) for h, p in specs])
+
     # Find similar prompts (RAG)
     similar = store.search_similar("river otter", limit=5)
 
@@ -32,6 +36,8 @@ Requirements:
     The vector extra includes:
     - sqlite-vec (vector similarity extension)
     - Optional: sentence-transformers for embeddings
+
+    Without sqlite-vec, similarity search needs numpy (meshy extra).
 """
 
 from __future__ import annotations
@@ -39,7 +45,10 @@ from __future__ import annotations
 import hashlib
 import json
 import sqlite3
+import struct
+import threading
 
+from collections import OrderedDict
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -48,7 +57,7 @@ from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 # Vector extension is optional
 _HAS_VECTOR = False
@@ -59,11 +68,39 @@ try:
 except ImportError:
     pass
 
+# NumPy powers the brute-force search used without sqlite-vec
+_HAS_NUMPY = False
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    pass
+
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_CACHE_SIZE = 4096
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _pack_embedding(embedding: Any) -> bytes:
+    """Serialize an embedding as a native float32 blob."""
+    if _HAS_NUMPY:
+        return np.asarray(embedding, dtype=np.float32).tobytes()
+    return struct.pack(f"{len(embedding)}f", *embedding)
+
+
+def _unpack_embedding(blob: bytes) -> list[float]:
+    """Deserialize a float32 blob written by _pack_embedding."""
+    if _HAS_NUMPY:
+        return np.frombuffer(blob, dtype=np.float32).tolist()
+    return list(struct.unpack(f"{len(blob) // 4}f", blob))
+
+
 @dataclass
 class GenerationRecord:
     """Record of a 3D asset generation."""
@@ -115,6 +152,15 @@ class VectorStore:
         self.db_path = Path(db_path)
         self.embedding_dim = embedding_dim
         self._conn: sqlite3.Connection | None = None
+        # Row-normalized embeddings for the NumPy search, loaded on first search
+        self._matrix: Any = None
+        self._matrix_ids: Any = None
+        self._matrix_projects: Any = None
+        self._matrix_pending: list[tuple[int, str, Any]] = []
+        # PRAGMA data_version when the matrix was last checked against the database
+        self._matrix_version: int | None = None
+        # Embeddings written by the open transaction, queued for the matrix on commit
+        self._uncommitted: list[tuple[int, str, Any]] = []
         self._init_db()
 
     def _get_conn(self) -> sqlite3.Connection:
@@ -135,16 +181,25 @@ class VectorStore:
         return self._conn
 
     @contextmanager
-    def _transaction(self) -> Iterator[sqlite3.Connection]:
-        """Context manager for transactions."""
+    def _transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Context manager for transactions.
+
+        Args:
+            immediate: Take the write lock up front (BEGIN IMMEDIATE), so rows
+                read inside the transaction cannot change before it writes.
+        """
         conn = self._get_conn()
-        conn.execute("BEGIN")
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
         try:
             yield conn
             conn.execute("COMMIT")
         except Exception:
             conn.execute("ROLLBACK")
             raise
+        finally:
+            uncommitted, self._uncommitted = self._uncommitted, []
+        if self._matrix is not None:
+            self._matrix_pending.extend(uncommitted)
 
     def _init_db(self) -> None:
         """Initialize database schema."""
@@ -189,6 +244,14 @@ class VectorStore:
                     embedding FLOAT[{self.embedding_dim}]
                 )
             """)
+        else:
+            # Plain float32 blobs, searched with NumPy
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS generation_vectors (
+                    id INTEGER PRIMARY KEY,
+                    embedding BLOB NOT NULL
+                )
+            """)
 
         # Triggers to keep FTS in sync
         conn.execute("""
@@ -259,13 +322,9 @@ class VectorStore:
 
             record_id = cursor.lastrowid
 
-            # Store embedding if provided and vectors available
-            if embedding and _HAS_VECTOR and len(embedding) == self.embedding_dim:
-                embedding_blob = self._serialize_embedding(embedding)
-                conn.execute(
-                    "INSERT INTO generation_embeddings (id, embedding) VALUES (?, ?)",
-                    (record_id, embedding_blob),
-                )
+            # Store embedding if provided
+            if embedding is not None and len(embedding) == self.embedding_dim:
+                self._insert_embeddings(conn, [(record_id, project, embedding)])
 
             return GenerationRecord(
                 id=record_id,
@@ -281,6 +340,106 @@ class VectorStore:
                 updated_at=datetime.fromisoformat(now),
             )
 
+    def record_generations(
+        self,
+        records: Iterable[GenerationRecord],
+        embed: bool = True,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+    ) -> list[GenerationRecord]:
+        """Record many generations in one transaction (idempotent by spec_hash).
+
+        Prompts of new records without an embedding are embedded together
+        with get_embeddings, so the encoder runs in batches instead of once
+        per prompt.
+
+        Args:
+            records: Generations to record; id, status and timestamps are ignored
+            embed: Compute missing embeddings
+            model: Embedding model name
+
+        Returns:
+            GenerationRecords (existing or newly created) in input order
+        """
+        records = list(records)
+        if not records:
+            return []
+
+        conn = self._get_conn()
+        spec_hashes = list(dict.fromkeys(record.spec_hash for record in records))
+        existing = {
+            row["spec_hash"]: self._row_to_record(row)
+            for row in self._select_in(conn, "SELECT * FROM generations WHERE spec_hash IN ({})", spec_hashes)
+        }
+
+        new_records: dict[str, GenerationRecord] = {}
+        for record in records:
+            if record.spec_hash not in existing and record.spec_hash not in new_records:
+                new_records[record.spec_hash] = record
+
+        embeddings: dict[str, list[float] | None] = {h: r.embedding for h, r in new_records.items()}
+        if embed:
+            missing = [h for h, embedding in embeddings.items() if embedding is None]
+            vectors = get_embeddings([new_records[h].prompt for h in missing], model=model)
+            if vectors is not None:
+                embeddings.update(zip(missing, vectors, strict=True))
+
+        now = _utc_now().isoformat()
+        with self._transaction(immediate=True) as conn:
+            # Another writer may have recorded some of them while embedding
+            for row in self._select_in(conn, "SELECT * FROM generations WHERE spec_hash IN ({})", list(new_records)):
+                existing[row["spec_hash"]] = self._row_to_record(row)
+                del new_records[row["spec_hash"]]
+
+            conn.executemany(
+                """
+                INSERT INTO generations
+                (spec_hash, project, prompt, art_style, task_id, status,
+                 metadata_json, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, 'pending', ?, ?, ?)
+            """,
+                [
+                    (
+                        spec_hash,
+                        record.project,
+                        record.prompt,
+                        record.art_style,
+                        record.task_id,
+                        json.dumps(record.metadata) if record.metadata else None,
+                        now,
+                        now,
+                    )
+                    for spec_hash, record in new_records.items()
+                ],
+            )
+            ids = self._ids_by_spec_hash(conn, list(new_records))
+
+            self._insert_embeddings(
+                conn,
+                [
+                    (ids[spec_hash], record.project, embeddings[spec_hash])
+                    for spec_hash, record in new_records.items()
+                    if embeddings[spec_hash] is not None and len(embeddings[spec_hash]) == self.embedding_dim
+                ],
+            )
+
+        created = {
+            spec_hash: GenerationRecord(
+                id=ids[spec_hash],
+                spec_hash=spec_hash,
+                project=record.project,
+                prompt=record.prompt,
+                art_style=record.art_style,
+                task_id=record.task_id,
+                status="pending",
+                embedding=embeddings[spec_hash],
+                metadata=record.metadata or {},
+                created_at=datetime.fromisoformat(now),
+                updated_at=datetime.fromisoformat(now),
+            )
+            for spec_hash, record in new_records.items()
+        }
+        return [existing.get(record.spec_hash) or created[record.spec_hash] for record in records]
+
     def update_status(
         self,
         spec_hash: str,
@@ -367,7 +526,7 @@ class VectorStore:
             List of SimilarityResult ordered by similarity (highest first)
         """
         if not _HAS_VECTOR:
-            return []
+            return self._search_matrix(query_embedding, limit, project) if _HAS_NUMPY else []
 
         conn = self._get_conn()
         query_blob = self._serialize_embedding(query_embedding)
@@ -476,6 +635,146 @@ class VectorStore:
 
         return [self._row_to_record(row) for row in cursor]
 
+    # -------------------------------------------------------------------------
+    # Embedding storage and NumPy search
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _select_in(conn: sqlite3.Connection, query: str, values: list[Any]) -> list[sqlite3.Row]:
+        """Run a query with an IN ({}) clause over values, chunked below SQLite's parameter limit."""
+        rows: list[sqlite3.Row] = []
+        for start in range(0, len(values), 500):
+            chunk = values[start : start + 500]
+            rows.extend(conn.execute(query.format(", ".join("?" * len(chunk))), chunk))
+        return rows
+
+    def _ids_by_spec_hash(self, conn: sqlite3.Connection, spec_hashes: list[str]) -> dict[str, int]:
+        """Look up row IDs of just-inserted generations."""
+        rows = self._select_in(conn, "SELECT id, spec_hash FROM generations WHERE spec_hash IN ({})", spec_hashes)
+        return {row["spec_hash"]: row["id"] for row in rows}
+
+    def _insert_embeddings(self, conn: sqlite3.Connection, rows: list[tuple[int, str, Any]]) -> None:
+        """Store (id, project, embedding) rows as float32 blobs in one executemany."""
+        if not rows:
+            return
+        table = "generation_embeddings" if _HAS_VECTOR else "generation_vectors"
+        conn.executemany(
+            f"INSERT INTO {table} (id, embedding) VALUES (?, ?)",  # noqa: S608
+            [(record_id, _pack_embedding(embedding)) for record_id, _, embedding in rows],
+        )
+        self._uncommitted.extend(rows)
+
+    def _stored_vectors_state(self) -> tuple[int | None, int]:
+        """Highest ID and number of searchable embeddings in the database."""
+        row = (
+            self._get_conn()
+            .execute(
+                """
+                SELECT max(v.id), count(*)
+                FROM generation_vectors v
+                JOIN generations g ON g.id = v.id
+            """
+            )
+            .fetchone()
+        )
+        return row[0], row[1]
+
+    def _matrix_state(self) -> tuple[int | None, int]:
+        """Highest ID and number of embeddings in the in-memory matrix."""
+        if not len(self._matrix_ids):
+            return None, 0
+        return int(self._matrix_ids.max()), len(self._matrix_ids)
+
+    def _data_version(self) -> int:
+        """SQLite's counter of commits made through other connections."""
+        return self._get_conn().execute("PRAGMA data_version").fetchone()[0]
+
+    def _load_matrix(self) -> None:
+        """Build the normalized embedding matrix from the stored blobs."""
+        self._matrix_version = self._data_version()
+        rows = (
+            self._get_conn()
+            .execute(
+                """
+                SELECT v.id, g.project, v.embedding
+                FROM generation_vectors v
+                JOIN generations g ON g.id = v.id
+                ORDER BY v.id
+            """
+            )
+            .fetchall()
+        )
+        self._matrix = self._normalize(
+            np.frombuffer(b"".join(row["embedding"] for row in rows), dtype=np.float32).reshape(-1, self.embedding_dim)
+        )
+        self._matrix_ids = np.array([row["id"] for row in rows], dtype=np.int64)
+        self._matrix_projects = np.array([row["project"] for row in rows], dtype=object)
+        self._matrix_pending = []
+
+    def _flush_matrix(self) -> None:
+        """Append embeddings inserted since the matrix was loaded."""
+        pending, self._matrix_pending = self._matrix_pending, []
+        vectors = self._normalize(np.asarray([embedding for _, _, embedding in pending], dtype=np.float32))
+        self._matrix = np.vstack([self._matrix, vectors])
+        self._matrix_ids = np.concatenate([self._matrix_ids, [record_id for record_id, _, _ in pending]])
+        self._matrix_projects = np.concatenate(
+            [self._matrix_projects, np.array([project for _, project, _ in pending], dtype=object)]
+        )
+
+    @staticmethod
+    def _normalize(matrix: Any) -> Any:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _search_matrix(self, query_embedding: list[float], limit: int, project: str | None) -> list[SimilarityResult]:
+        """Cosine top-k over all stored embeddings with NumPy.
+
+        The matrix is extended with this store's own inserts. When another
+        connection has committed since the last check (PRAGMA data_version),
+        it is compared with the stored embeddings and reloaded if they differ,
+        so SQLite stays the source of truth without a table scan per search.
+        """
+        if self._matrix is None:
+            self._load_matrix()
+        else:
+            if self._matrix_pending:
+                self._flush_matrix()
+            version = self._data_version()
+            if version != self._matrix_version:
+                self._matrix_version = version
+                if self._matrix_state() != self._stored_vectors_state():
+                    self._load_matrix()
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (self.embedding_dim,) or not len(self._matrix) or limit <= 0:
+            return []
+
+        scores = self._matrix @ (query / (np.linalg.norm(query) or 1.0))
+        candidates = np.arange(len(scores))
+        if project:
+            candidates = np.flatnonzero(self._matrix_projects == project)
+            scores = scores[candidates]
+        if not len(scores):
+            return []
+
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        ids = [int(self._matrix_ids[candidates[i]]) for i in top]
+        rows = self._select_in(self._get_conn(), "SELECT * FROM generations WHERE id IN ({})", ids)
+        records = {row["id"]: self._row_to_record(row) for row in rows}
+
+        results = []
+        for i, record_id in zip(top, ids, strict=True):
+            # Rows from a rolled-back transaction may still be in the matrix
+            if record_id not in records:
+                continue
+            score = float(scores[i])
+            results.append(SimilarityResult(record=records[record_id], distance=1.0 - score, score=score))
+        return results
+
     def compute_spec_hash(self, spec: dict[str, Any]) -> str:
         """Compute deterministic hash for a generation spec.
 
@@ -512,9 +811,7 @@ class VectorStore:
 
     def _serialize_embedding(self, embedding: list[float]) -> bytes:
         """Serialize embedding to bytes for SQLite vec."""
-        import struct
-
-        return struct.pack(f"{len(embedding)}f", *embedding)
+        return _pack_embedding(embedding)
 
     def close(self) -> None:
         """Close database connection."""
@@ -529,10 +826,179 @@ class VectorStore:
         self.close()
 
 
+# Process-wide encoders by model name, loaded on first use
+_encoders: dict[str, Any] = {}
+_encoders_lock = threading.Lock()
+
+
+def get_encoder(model: str = DEFAULT_EMBEDDING_MODEL) -> Any | None:
+    """Get the shared SentenceTransformer for a model, loading it once per process.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Encoder, or None if sentence-transformers is not available
+    """
+    encoder = _encoders.get(model)
+    if encoder is not None:
+        return encoder
+
+    with _encoders_lock:
+        if model not in _encoders:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                return None
+            _encoders[model] = SentenceTransformer(model, device="cpu")
+        return _encoders[model]
+
+
+class EmbeddingCache:
+    """LRU cache of embeddings keyed by a hash of model and text.
+
+    With a path, embeddings are also kept in a small SQLite file so repeated
+    prompts skip the encoder across processes.
+
+    Args:
+        path: Optional SQLite file for the on-disk cache
+        max_size: Maximum embeddings kept in memory
+    """
+
+    def __init__(self, path: str | Path | None = None, max_size: int = EMBEDDING_CACHE_SIZE):
+        self.path = Path(path) if path is not None else None
+        self.max_size = max_size
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+        if self.path is not None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+            self._conn.commit()
+
+    @staticmethod
+    def key(text: str, model: str = DEFAULT_EMBEDDING_MODEL) -> str:
+        """Cache key for a text embedded with a model."""
+        return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up embeddings, falling back to the on-disk cache.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Embeddings found, by key
+        """
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for key in keys:
+                embedding = self._entries.get(key)
+                if embedding is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = embedding
+
+            missing = [key for key in keys if key not in found]
+            if self._conn is not None and missing:
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start : start + 500]
+                    placeholders = ", ".join("?" * len(chunk))
+                    cursor = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",  # noqa: S608
+                        chunk,
+                    )
+                    for key, blob in cursor:
+                        embedding = _unpack_embedding(blob)
+                        found[key] = embedding
+                        self._remember(key, embedding)
+        return found
+
+    def put_many(self, embeddings: dict[str, list[float]]) -> None:
+        """Store embeddings in memory and, if configured, on disk.
+
+        Args:
+            embeddings: Embeddings by key
+        """
+        with self._lock:
+            for key, embedding in embeddings.items():
+                self._remember(key, embedding)
+            if self._conn is not None and embeddings:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, _pack_embedding(embedding)) for key, embedding in embeddings.items()],
+                )
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop the in-memory entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Close the on-disk cache."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, embedding: list[float]) -> None:
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+_default_cache = EmbeddingCache()
+
+
+def get_embeddings(
+    texts: list[str],
+    model: str = DEFAULT_EMBEDDING_MODEL,
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    cache: EmbeddingCache | None = None,
+) -> list[list[float]] | None:
+    """Get embeddings for many texts using sentence-transformers.
+
+    Texts already in the cache are not re-encoded; the rest are encoded
+    together in batches of batch_size.
+
+    Args:
+        texts: Texts to embed
+        model: Model name (default: all-MiniLM-L6-v2)
+        batch_size: Texts per forward pass
+        cache: Embedding cache (default: the process-wide cache)
+
+    Returns:
+        Embedding vectors in input order, or None if sentence-transformers not available
+    """
+    cache = cache if cache is not None else _default_cache
+    keys = [EmbeddingCache.key(text, model) for text in texts]
+    found = cache.get_many(list(dict.fromkeys(keys)))
+
+    pending = {key: text for key, text in zip(keys, texts, strict=True) if key not in found}
+    if pending:
+        encoder = get_encoder(model)
+        if encoder is None:
+            return None
+        vectors = encoder.encode(list(pending.values()), batch_size=batch_size, convert_to_numpy=True)
+        encoded = {key: vector.tolist() for key, vector in zip(pending, vectors, strict=True)}
+        cache.put_many(encoded)
+        found.update(encoded)
+
+    return [found[key] for key in keys]
+
+
 # Convenience function for getting embeddings
-def get_embedding(text: str, model: str = "all-MiniLM-L6-v2") -> list[float] | None:
+def get_embedding(text: str, model: str = DEFAULT_EMBEDDING_MODEL) -> list[float] | None:
     """Get embedding for text using sentence-transformers.
 
+    The encoder is loaded once per process and results are cached; see
+    get_embeddings for embedding many texts at once.
+
     Args:
         text: Text to embed
         model: Model name (default: all-MiniLM-L6-v2)
@@ -540,11 +1006,5 @@ def get_embedding(text: str, model: str = "all-MiniLM-L6-v2") -> list[float] | N
     Returns:
         Embedding vector or None if sentence-transformers not available
     """
-    try:
-        from sentence_transformers import SentenceTransformer
-
-        encoder = SentenceTransformer(model)
-        embedding = encoder.encode(text)
-        return embedding.tolist()
-    except ImportError:
-        return None
+    embeddings = get_embeddings([text], model=model)
+    return embeddings[0] if embeddings is not None else None
@@ -0,0 +1,302 @@
+"""Shared task poller for Meshy generation tasks.
+
+Every Meshy service (text3d, image3d, rigging, animate, retexture) reports
+task progress through its ``get`` endpoint. Rather than blocking a thread per
+task in its own sleep loop, ``TaskPoller`` tracks any number of tasks across
+services on a single background thread and resolves a future for each one
+when it finishes.
+
+Poll intervals adapt to each task: while a task reports steady progress the
+next poll is scheduled around half of its estimated remaining time, and tasks
+that stop moving back off exponentially. Short tasks finish promptly and long
+ones cost few status requests.
+
+Usage:
+    from vendor_connectors.meshy import poller, text3d
+
+    future = poller.get_poller().watch(text3d.get, task_id)
+    result = future.result()
+
+    # asyncio
+    result = await poller.get_poller().wait_async(text3d.get, task_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from vendor_connectors.meshy.models import TaskStatus
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+DEFAULT_POLL_INTERVAL = 5.0
+MIN_POLL_INTERVAL = 1.0
+MAX_POLL_INTERVAL = 30.0
+DEFAULT_POLL_TIMEOUT = 600.0
+
+# Growth factor for the interval of tasks whose progress stalls
+POLL_BACKOFF_FACTOR = 1.5
+
+
+def task_failure_message(result: Any) -> str:
+    """Extract the failure message from a failed task result."""
+    error = getattr(result, "task_error", None) or getattr(result, "error", None)
+    if isinstance(error, dict):
+        return error.get("message", "Unknown error")
+    return str(error) if error else "Unknown error"
+
+
+def settle_future(future: Future, result: Any = None, exception: BaseException | None = None) -> bool:
+    """Resolve a future unless it is already done.
+
+    Returns:
+        True if this call resolved the future.
+    """
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        return False
+    return True
+
+
+@dataclass
+class _WatchedTask:
+    """Polling state for one task."""
+
+    get: Callable[[str], Any]
+    task_id: str
+    future: Future
+    interval: float
+    min_interval: float
+    timeout: float
+    deadline: float
+    progress: int = -1
+    progress_at: float = field(default_factory=monotonic)
+
+
+class TaskPoller:
+    """Poll many Meshy tasks from one background thread."""
+
+    def __init__(
+        self,
+        min_interval: float = MIN_POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ):
+        """Initialize the poller.
+
+        Args:
+            min_interval: Shortest delay between polls of the same task.
+            max_interval: Longest delay between polls of the same task.
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._condition = threading.Condition()
+        self._schedule: list[tuple[float, int, _WatchedTask]] = []
+        self._watched: dict[tuple[Any, str], _WatchedTask] = {}
+        self._sequence = itertools.count()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def watch(
+        self,
+        get: Callable[[str], Any],
+        task_id: str,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_POLL_TIMEOUT,
+        delay: float = 0.0,
+    ) -> Future:
+        """Start tracking a task.
+
+        Watching a task that is already tracked returns the existing future.
+        The future may also be resolved by someone else (e.g. a webhook), in
+        which case the task is dropped without being polled again.
+
+        Args:
+            get: Status function of the task's service, e.g. ``text3d.get``.
+            task_id: Task ID.
+            interval: Initial poll interval.
+            timeout: Seconds before the future fails with TimeoutError.
+            delay: Seconds before the first poll. Defaults to polling right away.
+
+        Returns:
+            Future resolved with the task result once it succeeds. It fails
+            with RuntimeError if the task fails or expires.
+        """
+        with self._condition:
+            if self._closed:
+                msg = "TaskPoller is closed"
+                raise RuntimeError(msg)
+
+            key = (get, task_id)
+            watched = self._watched.get(key)
+            if watched is not None:
+                return watched.future
+
+            now = monotonic()
+            watched = _WatchedTask(
+                get=get,
+                task_id=task_id,
+                future=Future(),
+                interval=min(interval, self.max_interval),
+                min_interval=min(interval, self.min_interval),
+                timeout=timeout,
+                deadline=now + timeout,
+            )
+            self._watched[key] = watched
+            self._push(now + delay, watched)
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="meshy-task-poller", daemon=True)
+                self._thread.start()
+
+            return watched.future
+
+    def wait(
+        self,
+        get: Callable[[str], Any],
+        task_id: str,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_POLL_TIMEOUT,
+    ) -> Any:
+        """Block until a task finishes. See watch for arguments."""
+        return self.watch(get, task_id, interval=interval, timeout=timeout).result()
+
+    async def wait_async(
+        self,
+        get: Callable[[str], Any],
+        task_id: str,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_POLL_TIMEOUT,
+    ) -> Any:
+        """Await a task without blocking the event loop. See watch for arguments."""
+        return await asyncio.wrap_future(self.watch(get, task_id, interval=interval, timeout=timeout))
+
+    def close(self) -> None:
+        """Stop polling and cancel every pending future."""
+        with self._condition:
+            self._closed = True
+            pending = list(self._watched.values())
+            self._watched.clear()
+            self._schedule.clear()
+            self._condition.notify_all()
+            thread = self._thread
+
+        for watched in pending:
+            watched.future.cancel()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _push(self, due_at: float, watched: _WatchedTask) -> None:
+        heapq.heappush(self._schedule, (due_at, next(self._sequence), watched))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and not self._schedule:
+                    self._condition.wait()
+                if self._closed:
+                    return
+
+                due_at, _, watched = self._schedule[0]
+                delay = due_at - monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._schedule)
+
+            try:
+                self._poll(watched)
+            except Exception as exc:
+                # Fail only this task (e.g. an unexpected status result); the
+                # thread keeps polling every other task
+                self._finish(watched, exception=exc)
+
+    def _poll(self, watched: _WatchedTask) -> None:
+        """Poll one task, then resolve its future or schedule its next poll."""
+        if watched.future.done():
+            self._forget(watched)
+            return
+
+        result = watched.get(watched.task_id)
+
+        if result.status == TaskStatus.SUCCEEDED:
+            self._finish(watched, result=result)
+            return
+        if result.status == TaskStatus.FAILED:
+            self._finish(watched, exception=RuntimeError(f"Task failed: {task_failure_message(result)}"))
+            return
+        if result.status == TaskStatus.EXPIRED:
+            self._finish(watched, exception=RuntimeError("Task expired"))
+            return
+
+        now = monotonic()
+        if now >= watched.deadline:
+            self._finish(watched, exception=TimeoutError(f"Task timed out after {watched.timeout}s"))
+            return
+
+        watched.interval = self._next_interval(watched, result.progress or 0, now)
+        with self._condition:
+            if not self._closed:
+                self._push(min(now + watched.interval, watched.deadline), watched)
+
+    def _next_interval(self, watched: _WatchedTask, progress: int, now: float) -> float:
+        """Pick the next poll interval from the task's observed progress rate."""
+        if watched.progress < 0 or progress <= watched.progress:
+            # First observation or stalled: back off
+            interval = watched.interval if watched.progress < 0 else watched.interval * POLL_BACKOFF_FACTOR
+        else:
+            rate = (progress - watched.progress) / max(now - watched.progress_at, 1e-6)
+            interval = (100 - progress) / rate / 2
+
+        if progress != watched.progress:
+            watched.progress = progress
+            watched.progress_at = now
+
+        return min(max(interval, watched.min_interval), self.max_interval)
+
+    def _finish(self, watched: _WatchedTask, result: Any = None, exception: BaseException | None = None) -> None:
+        self._forget(watched)
+        settle_future(watched.future, result=result, exception=exception)
+
+    def _forget(self, watched: _WatchedTask) -> None:
+        with self._condition:
+            key = (watched.get, watched.task_id)
+            if self._watched.get(key) is watched:
+                del self._watched[key]
+
+
+_poller: TaskPoller | None = None
+_poller_lock = threading.Lock()
+
+
+def get_poller() -> TaskPoller:
+    """Get or create the shared task poller."""
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            _poller = TaskPoller()
+        return _poller
+
+
+def close() -> None:
+    """Close the shared task poller."""
+    global _poller
+    with _poller_lock:
+        poller, _poller = _poller, None
+    if poller is not None:
+        poller.close()
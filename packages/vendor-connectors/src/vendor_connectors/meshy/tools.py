@@ -71,6 +71,7 @@ class ListAnimationsSchema(BaseModel):
 
     category: str = Field("", description="Optional category filter (Fighting, WalkAndRun, etc.)")
     limit: int = Field(50, description="Maximum number of results")
+    query: str = Field("", description="Optional free-text search, e.g. 'sword slash attack'")
 
 
 class CheckTaskStatusSchema(BaseModel):
@@ -296,33 +297,39 @@ def retexture_model(
     }
 
 
-def list_animations(category: str = "", limit: int = 50) -> dict[str, Any]:
+def list_animations(category: str = "", limit: int = 50, query: str = "") -> dict[str, Any]:
     """List available animations from the Meshy catalog.
 
     Args:
         category: Optional category filter (Fighting, WalkAndRun, etc.)
         limit: Maximum number of results
+        query: Optional free-text search; results are ranked by relevance
+            and include a score
 
     Returns:
         Dict with count, total, and list of animations
     """
-    from vendor_connectors.meshy.animations import ANIMATIONS
+    from vendor_connectors.meshy.animations import filter_animations, search_animations
 
-    animations = list(ANIMATIONS.values())
-
-    if category:
-        animations = [a for a in animations if category.lower() in a.category.lower()]
+    if query:
+        matches = search_animations(query, limit=None, category=category)
+        animations = [anim for anim, _ in matches]
+        scores = [score for _, score in matches]
+    else:
+        animations = filter_animations(category=category)
+        scores = []
 
     results = []
-    for anim in animations[:limit]:
-        results.append(
-            {
-                "id": anim.id,
-                "name": anim.name,
-                "category": anim.category,
-                "subcategory": anim.subcategory,
-            }
-        )
+    for i, anim in enumerate(animations[:limit]):
+        result = {
+            "id": anim.id,
+            "name": anim.name,
+            "category": anim.category,
+            "subcategory": anim.subcategory,
+        }
+        if scores:
+            result["score"] = scores[i]
+        results.append(result)
 
     return {
         "count": len(results),
@@ -383,12 +390,9 @@ def get_animation(animation_id: int) -> dict[str, Any]:
     Returns:
         Dict with animation details
     """
-    from vendor_connectors.meshy.animations import ANIMATIONS
-
-    if animation_id not in ANIMATIONS:
-        raise ValueError(f"Animation ID {animation_id} not found")
+    from vendor_connectors.meshy.animations import get_animation as get_animation_meta
 
-    anim = ANIMATIONS[animation_id]
+    anim = get_animation_meta(animation_id)
 
     return {
         "id": anim.id,
@@ -458,8 +462,9 @@ TOOL_DEFINITIONS = [
         "name": "list_animations",
         "description": (
             "List available animations from the Meshy animation catalog. "
-            "Optionally filter by category. Returns animation IDs and names "
-            "that can be used with apply_animation."
+            "Optionally filter by category or search by description "
+            "(e.g. query='sword slash attack'), best matches first. Returns "
+            "animation IDs and names that can be used with apply_animation."
         ),
         "schema": ListAnimationsSchema,
     },
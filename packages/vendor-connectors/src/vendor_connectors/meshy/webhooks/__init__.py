@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from vendor_connectors.meshy.webhooks.handler import WebhookHandler
 from vendor_connectors.meshy.webhooks.schemas import MeshyWebhookPayload
+from vendor_connectors.meshy.webhooks.server import WebhookServer, send_webhook
 
 
-__all__ = ["MeshyWebhookPayload", "WebhookHandler"]
+__all__ = ["MeshyWebhookPayload", "WebhookHandler", "WebhookServer", "send_webhook"]
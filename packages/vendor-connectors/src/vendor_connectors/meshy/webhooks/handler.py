@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import hashlib
-
 from datetime import datetime, timezone
 from typing import Any
 
-from vendor_connectors.meshy import base
+from vendor_connectors.downloads import file_sha256
+from vendor_connectors.meshy import base, completion
 from vendor_connectors.meshy.webhooks.schemas import MeshyWebhookPayload
 
 from ..persistence.repository import TaskRepository
@@ -22,23 +21,27 @@ def _utc_now() -> datetime:
 class WebhookHandler:
     """Handle webhook callbacks from Meshy API.
 
-    This class processes webhook payloads, updates task state in the repository,
-    and downloads artifacts on successful completion.
+    This class processes webhook payloads, resolves anyone waiting on the task,
+    updates task state in the repository, and downloads artifacts on
+    successful completion.
     """
 
     def __init__(
         self,
         repository: TaskRepository,
         download_artifacts: bool = True,
+        registry: completion.CompletionRegistry | None = None,
     ):
         """Initialize webhook handler.
 
         Args:
             repository: TaskRepository for updating state
             download_artifacts: Whether to download GLB files on SUCCEEDED
+            registry: Completion registry to resolve (default: shared registry)
         """
         self.repository = repository
         self.download_artifacts = download_artifacts
+        self.registry = registry if registry is not None else completion.get_registry()
 
     def handle_webhook(
         self, payload: MeshyWebhookPayload, project: str | None = None, spec_hash: str | None = None
@@ -53,6 +56,8 @@ class WebhookHandler:
         Returns:
             Dict with status and details
         """
+        self.registry.resolve(payload)
+
         task_lookup = self.repository.find_task_by_id(task_id=payload.id, project=project)
 
         if not task_lookup:
@@ -126,8 +131,7 @@ class WebhookHandler:
 
             file_size = base.download(glb_url, str(output_path))
 
-            with open(output_path, "rb") as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
+            file_hash = file_sha256(str(output_path))
 
             return ArtifactRecord(
                 relative_path=filename,
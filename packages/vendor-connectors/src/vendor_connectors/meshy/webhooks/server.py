@@ -0,0 +1,163 @@
+"""Local HTTP receiver for Meshy webhooks.
+
+``WebhookServer`` accepts webhook POSTs on a local port, resolves waiters in
+the completion registry and, when given a ``WebhookHandler``, records the
+update in the task repository. ``send_webhook`` posts a payload the way Meshy
+would, so the full webhook path can be exercised locally without the API.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from pydantic import ValidationError
+
+from vendor_connectors.meshy import completion
+from vendor_connectors.meshy.webhooks.schemas import MeshyWebhookPayload
+
+
+if TYPE_CHECKING:
+    from vendor_connectors.meshy.webhooks.handler import WebhookHandler
+
+
+DEFAULT_WEBHOOK_PATH = "/webhooks/meshy"
+
+
+class WebhookServer:
+    """Receive Meshy webhooks on a background thread.
+
+    Starting the server enables webhooks on its registry, so waiters stop
+    polling until their grace period runs out; stopping it disables them.
+    """
+
+    def __init__(
+        self,
+        handler: WebhookHandler | None = None,
+        registry: completion.CompletionRegistry | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = DEFAULT_WEBHOOK_PATH,
+        grace_period: float | None = None,
+    ):
+        """Initialize the server.
+
+        Args:
+            handler: Optional WebhookHandler that records updates in a repository.
+            registry: Completion registry to resolve. Defaults to the handler's
+                registry, then the shared registry.
+            host: Interface to listen on.
+            port: Port to listen on (0 picks a free port).
+            path: URL path webhooks are posted to.
+            grace_period: Seconds waiters wait for a webhook before polling.
+        """
+        self.handler = handler
+        self.registry = registry or (handler.registry if handler is not None else completion.get_registry())
+        self.path = path
+        self.grace_period = grace_period
+        self._httpd = ThreadingHTTPServer((host, port), self._request_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """URL Meshy should post webhooks to."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def start(self) -> WebhookServer:
+        """Start serving and enable webhooks on the registry."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="meshy-webhooks", daemon=True)
+            self._thread.start()
+            self.registry.enable_webhooks(self.grace_period)
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and fall back to polling."""
+        if self._thread is not None:
+            self.registry.disable_webhooks()
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        """Context manager exit."""
+        self.stop()
+
+    def dispatch(self, payload: MeshyWebhookPayload) -> dict[str, Any]:
+        """Apply a received webhook payload.
+
+        Args:
+            payload: Parsed webhook payload.
+
+        Returns:
+            Handler result, or whether a waiter was resolved.
+        """
+        if self.handler is not None:
+            return self.handler.handle_webhook(payload)
+        return {"status": "success", "task_id": payload.id, "resolved": self.registry.resolve(payload)}
+
+    def _request_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                if self.path.split("?", 1)[0] != server.path:
+                    self._reply(HTTPStatus.NOT_FOUND, {"status": "error", "message": "Not found"})
+                    return
+
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                signature = self.headers.get("X-Meshy-Signature", "")
+                if server.handler is not None and not server.handler.verify_signature(body, signature):
+                    self._reply(HTTPStatus.UNAUTHORIZED, {"status": "error", "message": "Invalid signature"})
+                    return
+
+                try:
+                    payload = MeshyWebhookPayload.model_validate_json(body)
+                except ValidationError as e:
+                    self._reply(HTTPStatus.BAD_REQUEST, {"status": "error", "message": str(e)})
+                    return
+
+                self._reply(HTTPStatus.OK, server.dispatch(payload))
+
+            def _reply(self, status: HTTPStatus, data: dict[str, Any]) -> None:
+                body = json.dumps(data, default=str).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - BaseHTTPRequestHandler signature
+                return
+
+        return _Handler
+
+
+def send_webhook(url: str, payload: MeshyWebhookPayload | dict[str, Any], timeout: float = 10.0) -> httpx.Response:
+    """Post a webhook payload the way Meshy does.
+
+    Args:
+        url: Webhook receiver URL.
+        payload: Payload to send.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        The receiver's response.
+    """
+    if isinstance(payload, MeshyWebhookPayload):
+        payload = payload.model_dump(exclude_none=True)
+    return httpx.post(url, json=payload, timeout=timeout)
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
+import threading
 
-from collections.abc import Iterator, Mapping, Sequence
-from time import sleep
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from time import monotonic, sleep
 from typing import Any
 
 
@@ -32,6 +36,23 @@ from vendor_connectors.base import VendorConnectorBase
 
 # Settings
 MAX_RETRY_TIMEOUT_SECONDS = 30
+BOT_CHANNELS_CACHE_SECONDS = 60
+
+# Slack Web API rate limit tiers for the methods this connector calls.
+# See https://api.slack.com/apis/rate-limits
+SLACK_METHOD_TIERS: dict[str, int] = {
+    "chat_delete": 3,
+    "chat_postEphemeral": 4,
+    "chat_scheduleMessage": 3,
+    "chat_update": 3,
+    "conversations_history": 3,
+    "conversations_list": 2,
+    "conversations_members": 4,
+    "usergroups_list": 2,
+    "users_conversations": 3,
+    "users_list": 2,
+}
+SLACK_TIER_REQUESTS_PER_MINUTE: dict[int, int] = {1: 1, 2: 20, 3: 50, 4: 100}
 
 
 class SlackAPIError(RuntimeError):
@@ -179,6 +200,14 @@ class SlackConnector(VendorConnectorBase):
         self.web_client = WebClient(self.token)
         self.bot_web_client = WebClient(self.bot_token)
 
+        # Per-method call schedule used to stay within Slack's rate limit tiers
+        self._throttle_lock = threading.Lock()
+        self._next_call_at: dict[str, float] = {}
+
+        # Bot channel memberships, reused by send_message until they expire
+        self._bot_channels: dict[str, dict] | None = None
+        self._bot_channels_expire_at = 0.0
+
     @staticmethod
     def _normalize_identifier_filter(
         identifiers: str | Sequence[str] | None,
@@ -241,6 +270,9 @@ class SlackConnector(VendorConnectorBase):
             blocks.extend(get_rich_text_blocks(lines=lines, bold=bold, italic=italic, strike=strike))
 
         channels = self.get_bot_channels()
+        if channel_name not in channels:
+            # The bot may have joined since the memberships were cached
+            channels = self.get_bot_channels(refresh=True)
         if channel_name not in channels:
             raise RuntimeError(f"Bot not in channel {channel_name}. Add the bot first.")
 
@@ -261,21 +293,149 @@ class SlackConnector(VendorConnectorBase):
                 raise SlackAPIError(exc.response) from exc
             return exc.response
 
-    def get_bot_channels(self) -> dict[str, dict]:
+    def send_messages(
+        self,
+        messages: Iterable[SlackMessage],
+        max_concurrency: int = 50,
+    ) -> list[SlackDeliveryResult]:
+        """Deliver many messages concurrently using the bot token.
+
+        Blocking wrapper around `asend_messages` for callers without an event loop.
+
+        Args:
+            messages: Messages to deliver. Channels may be given by name or ID.
+            max_concurrency: Maximum number of concurrent Slack API requests.
+
+        Returns:
+            list[SlackDeliveryResult]: Results in the order the messages were given.
+        """
+        return asyncio.run(self.asend_messages(messages, max_concurrency=max_concurrency))
+
+    async def asend_messages(
+        self,
+        messages: Iterable[SlackMessage],
+        max_concurrency: int = 50,
+    ) -> list[SlackDeliveryResult]:
+        """Deliver many messages concurrently using the bot token.
+
+        Messages to the same channel are delivered in order. Channels the bot is
+        not a member of are reported as failed deliveries instead of raising.
+
+        Args:
+            messages: Messages to deliver. Channels may be given by name or ID.
+            max_concurrency: Maximum number of concurrent Slack API requests.
+
+        Returns:
+            list[SlackDeliveryResult]: Results in the order the messages were given.
+        """
+        messages = list(messages)
+        if not messages:
+            return []
+
+        channels = await asyncio.to_thread(self.get_bot_channels)
+        channel_ids = {name: channel.get("id") for name, channel in channels.items()}
+        member_ids = set(channel_ids.values())
+
+        dispatcher = AsyncSlackDispatcher(
+            self.get_async_bot_client(), max_concurrency=max_concurrency, logger=self.logger
+        )
+
+        pending: list[asyncio.Future[SlackDeliveryResult] | SlackDeliveryResult] = []
+        for message in messages:
+            channel_id = channel_ids.get(message.channel) or (
+                message.channel if message.channel in member_ids else None
+            )
+            if is_nothing(channel_id):
+                pending.append(SlackDeliveryResult(channel=message.channel, ok=False, error="not_in_channel"))
+                continue
+            pending.append(dispatcher.submit(replace(message, channel=channel_id)))
+
+        results = []
+        for message, outcome in zip(messages, pending, strict=True):
+            result = outcome if isinstance(outcome, SlackDeliveryResult) else await outcome
+            results.append(replace(result, channel=message.channel))
+
+        failed = sum(1 for result in results if not result.ok)
+        if failed:
+            self.logger.warning(f"Failed to deliver {failed} of {len(results)} Slack messages")
+        return results
+
+    def broadcast_message(
+        self,
+        channel_names: Iterable[str],
+        text: str,
+        blocks: list | None = None,
+        lines: list[str] | None = None,
+        bold: bool = False,
+        italic: bool = False,
+        strike: bool = False,
+        max_concurrency: int = 50,
+    ) -> dict[str, SlackDeliveryResult]:
+        """Send the same message to many channels concurrently.
+
+        Args:
+            channel_names: Channel names (without #) or IDs to post to.
+            text: Plain text fallback for the message body.
+            blocks: Optional structured block payload to include.
+            lines: Convenience helper to render rich-text lines.
+            bold: Whether to bold the rendered lines.
+            italic: Whether to italicize the rendered lines.
+            strike: Whether to strike-through the rendered lines.
+            max_concurrency: Maximum number of concurrent Slack API requests.
+
+        Returns:
+            dict[str, SlackDeliveryResult]: Delivery result per channel.
+        """
+        blocks = list(blocks or [])
+        if lines:
+            blocks.extend(get_rich_text_blocks(lines=lines, bold=bold, italic=italic, strike=strike))
+
+        channel_names = list(dict.fromkeys(channel_names))
+        results = self.send_messages(
+            [SlackMessage(channel=name, text=text, blocks=blocks or None) for name in channel_names],
+            max_concurrency=max_concurrency,
+        )
+        return dict(zip(channel_names, results, strict=True))
+
+    def get_async_bot_client(self) -> Any:
+        """Create an asynchronous Slack client for the bot token.
+
+        Returns:
+            AsyncWebClient: Client for asynchronous Slack API calls.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+        """
+        try:
+            from slack_sdk.web.async_client import AsyncWebClient
+        except ImportError as e:
+            msg = "aiohttp is required for asynchronous Slack delivery.\nInstall with: pip install aiohttp"
+            raise ImportError(msg) from e
+
+        return AsyncWebClient(self.bot_token)
+
+    def get_bot_channels(self, refresh: bool = False) -> dict[str, dict]:
         """Return channels the bot account is a member of.
 
+        Memberships are cached for BOT_CHANNELS_CACHE_SECONDS, so repeated
+        sends do not page through users_conversations every time.
+
+        Args:
+            refresh: Fetch the memberships from Slack even if cached.
+
         Returns:
             dict[str, dict]: Mapping of channel name to channel metadata.
 
         Raises:
             SlackAPIError: If Slack returns an error.
         """
-        try:
-            return {channel["name"]: channel for channel in self.bot_web_client.users_conversations()["channels"]}
-        except SlackApiError as exc:
-            raise SlackAPIError(exc.response) from exc
+        if refresh or self._bot_channels is None or monotonic() >= self._bot_channels_expire_at:
+            channels = self._iter_api("users_conversations", "channels", web_client=self.bot_web_client)
+            self._bot_channels = {channel["name"]: channel for channel in channels}
+            self._bot_channels_expire_at = monotonic() + BOT_CHANNELS_CACHE_SECONDS
+        return dict(self._bot_channels)
 
-    def list_users(
+    def iter_users(
         self,
         include_locale: bool | None = None,
         limit: int | None = None,
@@ -283,9 +443,10 @@ class SlackConnector(VendorConnectorBase):
         include_deleted: bool | None = None,
         include_bots: bool | None = None,
         include_app_users: bool | None = None,
+        prefetch: bool = False,
         **kwargs,
-    ) -> dict[str, dict[str, Any]]:
-        """List Slack users with optional filtering flags.
+    ) -> Iterator[dict[str, Any]]:
+        """Stream Slack users page by page with optional filtering flags.
 
         Args:
             include_locale: When True, include the locale for each user.
@@ -294,10 +455,11 @@ class SlackConnector(VendorConnectorBase):
             include_deleted: Include deactivated accounts when True.
             include_bots: Include bot accounts when True.
             include_app_users: Include app users when True.
+            prefetch: Fetch the next page in the background. Defaults to False.
             **kwargs: Additional keyword arguments forwarded to `users_list`.
 
-        Returns:
-            dict[str, dict[str, Any]]: Filtered mapping of user IDs to user profiles.
+        Yields:
+            dict[str, Any]: User profiles that pass the filters.
         """
         if include_locale is None:
             include_locale = self.get_input("include_locale", required=False, is_bool=True)
@@ -313,15 +475,21 @@ class SlackConnector(VendorConnectorBase):
             include_app_users = self.get_input("include_app_users", required=False, default=False, is_bool=True)
 
         self.logger.info("Retrieving users from Slack")
-        response = self._call_api(
-            "users_list", group_by="members", include_locale=include_locale, limit=limit, team_id=team_id, **kwargs
+        users = self._iter_api(
+            "users_list",
+            "members",
+            prefetch=prefetch,
+            include_locale=include_locale,
+            limit=limit,
+            team_id=team_id,
+            **kwargs,
         )
 
         if include_deleted and include_bots and include_app_users:
-            return response
+            yield from users
+            return
 
-        filtered = {}
-        for user_id, user_data in response.items():
+        for user_data in users:
             deleted = user_data.get("deleted", False)
             is_bot = user_data.get("is_bot", False) or user_data.get("is_workflow_bot", False)
             is_app_user = user_data.get("is_app_user", False)
@@ -332,11 +500,48 @@ class SlackConnector(VendorConnectorBase):
                 or (is_app_user and not include_app_users)
             ):
                 continue
-            filtered[user_id] = user_data
+            yield user_data
 
-        return filtered
+    def list_users(
+        self,
+        include_locale: bool | None = None,
+        limit: int | None = None,
+        team_id: str | None = None,
+        include_deleted: bool | None = None,
+        include_bots: bool | None = None,
+        include_app_users: bool | None = None,
+        prefetch: bool = False,
+        **kwargs,
+    ) -> dict[str, dict[str, Any]]:
+        """List Slack users with optional filtering flags.
 
-    def list_usergroups(
+        Args:
+            include_locale: When True, include the locale for each user.
+            limit: Maximum number of users per API call.
+            team_id: Optional team/workspace ID.
+            include_deleted: Include deactivated accounts when True.
+            include_bots: Include bot accounts when True.
+            include_app_users: Include app users when True.
+            prefetch: Fetch the next page in the background. Defaults to False.
+            **kwargs: Additional keyword arguments forwarded to `users_list`.
+
+        Returns:
+            dict[str, dict[str, Any]]: Filtered mapping of user IDs to user profiles.
+        """
+        return self._group_by_id(
+            self.iter_users(
+                include_locale=include_locale,
+                limit=limit,
+                team_id=team_id,
+                include_deleted=include_deleted,
+                include_bots=include_bots,
+                include_app_users=include_app_users,
+                prefetch=prefetch,
+                **kwargs,
+            )
+        )
+
+    def iter_usergroups(
         self,
         include_disabled: bool | None = None,
         include_count: bool | None = None,
@@ -344,8 +549,8 @@ class SlackConnector(VendorConnectorBase):
         team_id: str | None = None,
         usergroup_ids: str | Sequence[str] | None = None,
         **kwargs,
-    ) -> dict[str, dict[str, Any]]:
-        """List Slack user groups with optional filtering.
+    ) -> Iterator[dict[str, Any]]:
+        """Stream Slack user groups with optional filtering.
 
         Args:
             include_disabled: Include disabled user groups when True.
@@ -355,8 +560,8 @@ class SlackConnector(VendorConnectorBase):
             usergroup_ids: Comma-separated string or iterable of user group IDs to return.
             **kwargs: Extra keyword arguments forwarded to `usergroups_list`.
 
-        Returns:
-            dict[str, dict[str, Any]]: Mapping of user group IDs to metadata.
+        Yields:
+            dict[str, Any]: User group metadata that passes the filters.
         """
         if include_disabled is None:
             include_disabled = self.get_input("include_disabled", required=False, default=False, is_bool=True)
@@ -372,9 +577,9 @@ class SlackConnector(VendorConnectorBase):
         )
         normalized_ids = self._normalize_identifier_filter(identifier_filter)
 
-        response = self._call_api(
+        usergroups = self._iter_api(
             "usergroups_list",
-            group_by="usergroups",
+            "usergroups",
             include_disabled=include_disabled,
             include_count=include_count,
             include_users=include_users,
@@ -383,11 +588,45 @@ class SlackConnector(VendorConnectorBase):
         )
 
         if not normalized_ids:
-            return response
+            yield from usergroups
+            return
 
-        return {gid: gdata for gid, gdata in response.items() if gid in normalized_ids}
+        yield from (group for group in usergroups if group.get("id") in normalized_ids)
 
-    def list_conversations(
+    def list_usergroups(
+        self,
+        include_disabled: bool | None = None,
+        include_count: bool | None = None,
+        include_users: bool | None = None,
+        team_id: str | None = None,
+        usergroup_ids: str | Sequence[str] | None = None,
+        **kwargs,
+    ) -> dict[str, dict[str, Any]]:
+        """List Slack user groups with optional filtering.
+
+        Args:
+            include_disabled: Include disabled user groups when True.
+            include_count: Include member counts when True.
+            include_users: Include member lists when True.
+            team_id: Optional workspace/team identifier.
+            usergroup_ids: Comma-separated string or iterable of user group IDs to return.
+            **kwargs: Extra keyword arguments forwarded to `usergroups_list`.
+
+        Returns:
+            dict[str, dict[str, Any]]: Mapping of user group IDs to metadata.
+        """
+        return self._group_by_id(
+            self.iter_usergroups(
+                include_disabled=include_disabled,
+                include_count=include_count,
+                include_users=include_users,
+                team_id=team_id,
+                usergroup_ids=usergroup_ids,
+                **kwargs,
+            )
+        )
+
+    def iter_conversations(
         self,
         exclude_archived: bool | None = None,
         limit: int | None = None,
@@ -395,21 +634,23 @@ class SlackConnector(VendorConnectorBase):
         types: str | Sequence[str] | None = None,
         get_members: bool | None = None,
         channels_only: bool | None = None,
+        prefetch: bool = False,
         **kwargs,
-    ) -> dict[str, dict[str, Any]]:
-        """List Slack conversations with optional filtering.
+    ) -> Iterator[dict[str, Any]]:
+        """Stream Slack conversations page by page with optional filtering.
 
         Args:
             exclude_archived: Exclude archived conversations when True.
-            limit: Maximum number of conversations to request.
+            limit: Maximum number of conversations per API call.
             team_id: Optional workspace/team identifier.
             types: Slack channel type(s) (public_channel, private_channel, im, mpim).
             get_members: Include member lists when True.
             channels_only: Return only channel-type conversations when True.
+            prefetch: Fetch the next page in the background. Defaults to False.
             **kwargs: Extra keyword arguments forwarded to `conversations_list`.
 
-        Returns:
-            dict[str, dict[str, Any]]: Mapping of conversation IDs to metadata.
+        Yields:
+            dict[str, Any]: Conversation metadata that passes the filters.
         """
         if exclude_archived is None:
             exclude_archived = self.get_input("exclude_archived", required=False, is_bool=True)
@@ -431,9 +672,10 @@ class SlackConnector(VendorConnectorBase):
             )
 
         self.logger.info("Getting Slack conversations")
-        response = self._call_api(
+        conversations = self._iter_api(
             "conversations_list",
-            group_by="channels",
+            "channels",
+            prefetch=prefetch,
             exclude_archived=exclude_archived,
             limit=limit,
             team_id=team_id,
@@ -442,9 +684,49 @@ class SlackConnector(VendorConnectorBase):
         )
 
         if not channels_only:
-            return response
+            yield from conversations
+            return
+
+        yield from (conversation for conversation in conversations if conversation.get("is_channel"))
 
-        return {cid: cdata for cid, cdata in response.items() if cdata.get("is_channel")}
+    def list_conversations(
+        self,
+        exclude_archived: bool | None = None,
+        limit: int | None = None,
+        team_id: str | None = None,
+        types: str | Sequence[str] | None = None,
+        get_members: bool | None = None,
+        channels_only: bool | None = None,
+        prefetch: bool = False,
+        **kwargs,
+    ) -> dict[str, dict[str, Any]]:
+        """List Slack conversations with optional filtering.
+
+        Args:
+            exclude_archived: Exclude archived conversations when True.
+            limit: Maximum number of conversations per API call.
+            team_id: Optional workspace/team identifier.
+            types: Slack channel type(s) (public_channel, private_channel, im, mpim).
+            get_members: Include member lists when True.
+            channels_only: Return only channel-type conversations when True.
+            prefetch: Fetch the next page in the background. Defaults to False.
+            **kwargs: Extra keyword arguments forwarded to `conversations_list`.
+
+        Returns:
+            dict[str, dict[str, Any]]: Mapping of conversation IDs to metadata.
+        """
+        return self._group_by_id(
+            self.iter_conversations(
+                exclude_archived=exclude_archived,
+                limit=limit,
+                team_id=team_id,
+                types=types,
+                get_members=get_members,
+                channels_only=channels_only,
+                prefetch=prefetch,
+                **kwargs,
+            )
+        )
 
     def _call_api(
         self,
@@ -455,6 +737,9 @@ class SlackConnector(VendorConnectorBase):
     ) -> Any:
         """Call a Slack WebClient method with retry and grouping support.
 
+        When `group_by` is provided, every page of the listing is fetched by
+        following `response_metadata.next_cursor`.
+
         Args:
             method: Slack WebClient method name to invoke.
             group_by: Optional response field containing a list to re-index by ID.
@@ -469,7 +754,87 @@ class SlackConnector(VendorConnectorBase):
             SlackAPIError: When Slack returns an error other than rate limiting.
             TimeoutError: If rate-limited retries exceed `MAX_RETRY_TIMEOUT_SECONDS`.
         """
-        call = getattr(self.web_client, method, None)
+        if is_nothing(group_by):
+            return self._call_method(method, **kwargs)
+
+        return self._group_by_id(self._iter_api(method, group_by, **kwargs), id_field_name)
+
+    def _iter_api(
+        self,
+        method: str,
+        items_key: str,
+        prefetch: bool = False,
+        web_client: WebClient | None = None,
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yield items from a cursor-paginated Slack WebClient method.
+
+        Pages are requested as the caller consumes items, so abandoning the
+        generator stops pagination. With `prefetch` the next page is requested
+        in the background while the caller works through the current one.
+
+        Args:
+            method: Slack WebClient method name to invoke.
+            items_key: Response field holding the items of each page.
+            prefetch: Fetch the next page in the background. Defaults to False.
+            web_client: Client to call instead of `web_client`, e.g. the bot client.
+            **kwargs: Keyword arguments forwarded to every call. A `cursor`
+                argument sets the starting page.
+
+        Yields:
+            dict[str, Any]: Items in API order.
+        """
+
+        def fetch(cursor: str | None) -> Any:
+            if cursor:
+                return self._call_method(method, web_client=web_client, **{**kwargs, "cursor": cursor})
+            return self._call_method(method, web_client=web_client, **kwargs)
+
+        def next_cursor(response: Any) -> str | None:
+            return (response.get("response_metadata") or {}).get("next_cursor") or None
+
+        if not prefetch:
+            response = fetch(kwargs.pop("cursor", None))
+            while True:
+                yield from response.get(items_key) or []
+
+                cursor = next_cursor(response)
+                if not cursor:
+                    return
+                response = fetch(cursor)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            response = fetch(kwargs.pop("cursor", None))
+            while True:
+                cursor = next_cursor(response)
+                pending = executor.submit(fetch, cursor) if cursor else None
+
+                yield from response.get(items_key) or []
+
+                if pending is None:
+                    return
+                response = pending.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _call_method(self, method: str, web_client: WebClient | None = None, **kwargs) -> Any:
+        """Make a single Slack WebClient call, pacing it to the method's tier and retrying rate limits.
+
+        Args:
+            method: Slack WebClient method name to invoke.
+            web_client: Client to call instead of `web_client`, e.g. the bot client.
+            **kwargs: Keyword arguments forwarded to the Slack API method.
+
+        Returns:
+            Any: Raw Slack response.
+
+        Raises:
+            AttributeError: If the requested method is not implemented by WebClient.
+            SlackAPIError: When Slack returns an error other than rate limiting.
+            TimeoutError: If rate-limited retries exceed `MAX_RETRY_TIMEOUT_SECONDS`.
+        """
+        call = getattr(web_client or self.web_client, method, None)
         if call is None:
             raise AttributeError(f"{method} is not supported by the Slack WebClient")
 
@@ -478,6 +843,7 @@ class SlackConnector(VendorConnectorBase):
         total_delay = 0
 
         while not response:
+            self._throttle(method)
             self.logger.debug(f"[Attempt {attempt}] Calling Slack WebClient {method}...")
             try:
                 response = call(**kwargs)
@@ -493,11 +859,46 @@ class SlackConnector(VendorConnectorBase):
                 else:
                     raise SlackAPIError(exc.response) from exc
 
-        if is_nothing(response) or is_nothing(group_by):
-            return response
+        return response
 
+    def _throttle(self, method: str) -> None:
+        """Wait until the next call to a method fits within its Slack rate limit tier.
+
+        Calls to the same method are spaced out evenly. Methods without a known
+        tier are not paced.
+
+        Args:
+            method: Slack WebClient method name about to be invoked.
+        """
+        tier = SLACK_METHOD_TIERS.get(method)
+        if tier is None:
+            return
+
+        interval = 60.0 / SLACK_TIER_REQUESTS_PER_MINUTE[tier]
+        with self._throttle_lock:
+            now = monotonic()
+            scheduled = max(now, self._next_call_at.get(method, 0.0))
+            self._next_call_at[method] = scheduled + interval
+
+        if scheduled > now:
+            sleep(scheduled - now)
+
+    @staticmethod
+    def _group_by_id(items: Iterable[dict[str, Any]], id_field_name: str = "id") -> dict[str, dict[str, Any]]:
+        """Index items by an ID field.
+
+        Args:
+            items: Items to index.
+            id_field_name: Field used as the dictionary key.
+
+        Returns:
+            dict[str, dict[str, Any]]: Mapping of IDs to items.
+
+        Raises:
+            RuntimeError: If an item has no value for `id_field_name`.
+        """
         grouped = {}
-        for datum in response.get(group_by, {}):
+        for datum in items:
             datum_id = datum.get(id_field_name)
             if is_nothing(datum_id):
                 raise RuntimeError(f"No ID for field {id_field_name} in returned datum: {datum}")
@@ -506,6 +907,7 @@ class SlackConnector(VendorConnectorBase):
         return grouped
 
 
+from vendor_connectors.slack.delivery import AsyncSlackDispatcher, SlackDeliveryResult, SlackMessage
 from vendor_connectors.slack.tools import (
     get_crewai_tools,
     get_langchain_tools,
@@ -515,10 +917,14 @@ from vendor_connectors.slack.tools import (
 
 
 __all__ = [
+    # Delivery
+    "AsyncSlackDispatcher",
     # Exceptions
     "SlackAPIError",
     # Core connector
     "SlackConnector",
+    "SlackDeliveryResult",
+    "SlackMessage",
     "get_crewai_tools",
     # Helper functions
     "get_divider",
@@ -0,0 +1,202 @@
+"""Asynchronous bulk message delivery for Slack.
+
+Posting a message with the synchronous WebClient blocks until Slack answers, and
+rate-limited calls block for the whole ``Retry-After`` delay. ``AsyncSlackDispatcher``
+queues messages per channel on top of ``slack_sdk``'s ``AsyncWebClient`` instead:
+every channel is drained in order by its own worker, while different channels are
+delivered concurrently. Calls are paced to Slack's per-channel and per-method
+limits, so large fan-outs are bounded by Slack rather than by the client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from slack_sdk.errors import SlackApiError
+
+from vendor_connectors.slack import MAX_RETRY_TIMEOUT_SECONDS, SLACK_METHOD_TIERS, SLACK_TIER_REQUESTS_PER_MINUTE
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+# Minimum seconds between calls of a method to the same channel.
+# chat.postMessage allows roughly one message per second per channel.
+SLACK_CHANNEL_METHOD_INTERVALS: dict[str, float] = {
+    "chat_postMessage": 1.0,
+}
+
+
+@dataclass
+class SlackMessage:
+    """A message queued for delivery."""
+
+    channel: str
+    text: str
+    blocks: list[dict[str, Any]] | None = None
+    thread_ts: str | None = None
+    method: str = "chat_postMessage"
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SlackDeliveryResult:
+    """Outcome of delivering one message."""
+
+    channel: str
+    ok: bool
+    ts: str | None = None
+    error: str | None = None
+    attempts: int = 0
+
+
+class AsyncSlackDispatcher:
+    """Deliver Slack messages concurrently while keeping per-channel order.
+
+    Messages submitted for the same channel are sent one after another in
+    submission order. Channels are drained concurrently, up to
+    ``max_concurrency`` requests in flight at once.
+    """
+
+    def __init__(self, client: Any, max_concurrency: int = 50, logger: Any = None):
+        """Initialize the dispatcher.
+
+        Args:
+            client: Slack ``AsyncWebClient`` (or compatible) used for delivery.
+            max_concurrency: Maximum number of concurrent Slack API requests.
+            logger: Optional logger for retry warnings.
+        """
+        self.client = client
+        self.logger = logger
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._next_call_at: dict[Any, float] = {}
+
+    def submit(self, message: SlackMessage) -> asyncio.Future[SlackDeliveryResult]:
+        """Queue a message for delivery.
+
+        Must be called from within a running event loop.
+
+        Args:
+            message: Message to deliver.
+
+        Returns:
+            asyncio.Future[SlackDeliveryResult]: Future resolved once the message is delivered or fails.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        queue = self._queues.get(message.channel)
+        if queue is None:
+            queue = self._queues[message.channel] = asyncio.Queue()
+            self._workers[message.channel] = asyncio.create_task(self._drain_channel(message.channel, queue))
+
+        queue.put_nowait((message, future))
+        return future
+
+    async def send_all(self, messages: Iterable[SlackMessage]) -> list[SlackDeliveryResult]:
+        """Deliver messages and wait for all of them.
+
+        Args:
+            messages: Messages to deliver.
+
+        Returns:
+            list[SlackDeliveryResult]: Results in the order the messages were given.
+        """
+        futures = [self.submit(message) for message in messages]
+        return list(await asyncio.gather(*futures))
+
+    async def _drain_channel(self, channel: str, queue: asyncio.Queue) -> None:
+        """Deliver a channel's queued messages in order, then retire the worker."""
+        while not queue.empty():
+            message, future = queue.get_nowait()
+            try:
+                result = await self._deliver(message)
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+                continue
+            if not future.done():
+                future.set_result(result)
+
+        del self._queues[channel]
+        del self._workers[channel]
+
+    async def _deliver(self, message: SlackMessage) -> SlackDeliveryResult:
+        """Send one message, retrying rate-limited attempts.
+
+        API and transport errors (e.g. a reset connection) become failed
+        results rather than exceptions, so one failure never discards the
+        outcome of other messages.
+
+        Args:
+            message: Message to deliver.
+
+        Returns:
+            SlackDeliveryResult: Delivery outcome.
+        """
+        call = getattr(self.client, message.method)
+
+        opts: dict[str, Any] = {"channel": message.channel, "text": message.text, **message.options}
+        if message.blocks:
+            opts["blocks"] = message.blocks
+        if message.thread_ts:
+            opts["thread_ts"] = message.thread_ts
+
+        attempts = 0
+        total_delay = 0
+        while True:
+            attempts += 1
+            await self._pace(message.method, message.channel)
+            try:
+                async with self._semaphore:
+                    response = await call(**opts)
+            except SlackApiError as exc:
+                error = exc.response.get("error")
+                if error == "ratelimited":
+                    delay = int(exc.response.headers.get("Retry-After", 1))
+                    total_delay += delay
+                    if total_delay <= MAX_RETRY_TIMEOUT_SECONDS:
+                        if self.logger is not None:
+                            self.logger.warning(
+                                f"Rate limited posting to {message.channel}. Retrying in {delay} seconds"
+                            )
+                        await asyncio.sleep(delay)
+                        continue
+                return SlackDeliveryResult(channel=message.channel, ok=False, error=error, attempts=attempts)
+            except Exception as exc:
+                if self.logger is not None:
+                    self.logger.warning(f"Failed posting to {message.channel}: {exc!r}")
+                return SlackDeliveryResult(
+                    channel=message.channel, ok=False, error=str(exc) or type(exc).__name__, attempts=attempts
+                )
+
+            return SlackDeliveryResult(channel=message.channel, ok=True, ts=response.get("ts"), attempts=attempts)
+
+    async def _pace(self, method: str, channel: str) -> None:
+        """Wait until a call fits within the method's workspace and per-channel limits."""
+        now = monotonic()
+        reservations: list[tuple[Any, float]] = []
+
+        tier = SLACK_METHOD_TIERS.get(method)
+        if tier is not None:
+            reservations.append((method, 60.0 / SLACK_TIER_REQUESTS_PER_MINUTE[tier]))
+
+        channel_interval = SLACK_CHANNEL_METHOD_INTERVALS.get(method)
+        if channel_interval is not None:
+            reservations.append(((method, channel), channel_interval))
+
+        if not reservations:
+            return
+
+        scheduled = max([now] + [self._next_call_at.get(key, 0.0) for key, _ in reservations])
+        for key, interval in reservations:
+            self._next_call_at[key] = scheduled + interval
+
+        if scheduled > now:
+            await asyncio.sleep(scheduled - now)
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
-from collections import deque
+import hashlib
+import heapq
+import json
+import threading
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
+from time import monotonic
 from typing import Any
 
 import hvac
+import requests
 
 from hvac.exceptions import VaultError
+from requests.adapters import HTTPAdapter
 
 from extended_data_types import is_nothing
 from lifecyclelogging import Logging
@@ -22,6 +33,72 @@ VAULT_ROLE_ID_ENV_VAR = "VAULT_ROLE_ID"
 VAULT_SECRET_ID_ENV_VAR = "VAULT_SECRET_ID"
 VAULT_APPROLE_PATH_ENV_VAR = "VAULT_APPROLE_PATH"
 
+# Default number of concurrent Vault requests when walking KV trees
+DEFAULT_VAULT_WORKERS = 16
+
+# Renew Vault tokens this many seconds before they expire
+TOKEN_RENEWAL_MARGIN_SECONDS = 300
+# Bounds on how long the renewal thread sleeps between checks
+MIN_RENEWAL_INTERVAL_SECONDS = 30
+MAX_RENEWAL_INTERVAL_SECONDS = 3600
+
+# Refresh cached AWS credentials in the background this many seconds before their lease ends
+CREDENTIAL_REFRESH_MARGIN_SECONDS = 300
+# Stop handing out cached AWS credentials this many seconds before their lease ends
+CREDENTIAL_EXPIRY_MARGIN_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class _LeasedCredentials:
+    """AWS credentials leased from Vault with their cache deadlines (monotonic seconds)."""
+
+    credentials: dict[str, Any]
+    refresh_at: float
+    expires_at: float
+
+
+class LazySecretMapping(Mapping):
+    """Read-only mapping of secret paths whose values are read on first access.
+
+    Iterating, counting and membership tests only use the paths discovered
+    while listing; a secret's data is read from Vault the first time it is
+    looked up and cached afterwards. Unreadable secrets map to None.
+    """
+
+    def __init__(self, paths: Iterable[str], reader: Callable[[str], dict | None]):
+        """Initialize the mapping.
+
+        Args:
+            paths: Secret paths in the mapping.
+            reader: Callable reading a secret's data by path.
+        """
+        self._paths = list(dict.fromkeys(paths))
+        self._path_set = set(self._paths)
+        self._reader = reader
+        self._values: dict[str, dict | None] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, path: str) -> dict | None:
+        if path not in self._path_set:
+            raise KeyError(path)
+        if path not in self._values:
+            value = self._reader(path)
+            with self._lock:
+                self._values.setdefault(path, value)
+        return self._values[path]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._path_set
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._paths)} paths, {len(self._values)} loaded)"
+
 
 class VaultConnector(VendorConnectorBase):
     """Vault connector with token and AppRole authentication."""
@@ -41,6 +118,22 @@ class VaultConnector(VendorConnectorBase):
         self.vault_token = vault_token
         self._vault_client: hvac.Client | None = None
         self._vault_token_expiration: datetime | None = None
+        self._http_session: requests.Session | None = None
+
+        # Fingerprints of key/value pairs seen in secrets, keyed by (mount point, path)
+        self._secret_index: dict[tuple[str, str], frozenset[str]] = {}
+
+        # Token lifecycle: (re-)authentication is serialized and renewal can run in the background
+        self._client_lock = threading.RLock()
+        self._renewal_thread: threading.Thread | None = None
+        self._renewal_stop = threading.Event()
+
+        # Leased AWS credentials keyed by (mount point, role, ttl, credential type)
+        self._aws_credentials: dict[tuple, _LeasedCredentials] = {}
+        self._aws_credential_locks: dict[tuple, threading.Lock] = {}
+        self._aws_credential_refreshing: set[tuple] = set()
+        self._aws_credential_lock = threading.Lock()
+        self._background_executor: ThreadPoolExecutor | None = None
 
         self.logger.info("Initializing Vault connector")
 
@@ -50,13 +143,21 @@ class VaultConnector(VendorConnectorBase):
         if self._vault_client and self._is_token_valid():
             return self._vault_client
 
+        with self._client_lock:
+            # Another thread may have authenticated while we waited
+            if self._vault_client and self._is_token_valid():
+                return self._vault_client
+            return self._connect()
+
+    def _connect(self) -> hvac.Client:
+        """Create and authenticate a Vault client with a token or AppRole credentials."""
         self.logger.info("Initializing new Vault client connection")
 
         vault_url = self.vault_url or self.get_input(VAULT_URL_ENV_VAR, required=True)
         vault_namespace = self.vault_namespace or self.get_input(VAULT_NAMESPACE_ENV_VAR, required=False)
         vault_token = self.vault_token or self.get_input("VAULT_TOKEN", required=False)
 
-        vault_opts: dict = {"url": vault_url}
+        vault_opts: dict = {"url": vault_url, "session": self.http_session}
         if vault_namespace:
             vault_opts["namespace"] = vault_namespace
         if vault_token:
@@ -82,7 +183,7 @@ class VaultConnector(VendorConnectorBase):
             secret_id = self.get_input(VAULT_SECRET_ID_ENV_VAR, required=False)
 
             if role_id and secret_id:
-                vault_opts = {"url": vault_url}
+                vault_opts = {"url": vault_url, "session": self.http_session}
                 if vault_namespace:
                     vault_opts["namespace"] = vault_namespace
 
@@ -106,6 +207,116 @@ class VaultConnector(VendorConnectorBase):
         msg = "Vault authentication failed: no valid token or AppRole credentials provided"
         raise RuntimeError(msg)
 
+    @property
+    def http_session(self) -> requests.Session:
+        """Get or create the pooled HTTP session shared by Vault clients."""
+        if self._http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=DEFAULT_VAULT_WORKERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._http_session = session
+        return self._http_session
+
+    def close(self) -> None:
+        """Stop background work, close HTTP sessions and release resources."""
+        self.stop_token_renewal()
+        if self._background_executor is not None:
+            self._background_executor.shutdown(wait=False, cancel_futures=True)
+            self._background_executor = None
+        super().close()
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
+    # ---------------------------------------------------------------------
+    # Token lifecycle
+    # ---------------------------------------------------------------------
+
+    def start_token_renewal(self, renew_margin_seconds: float = TOKEN_RENEWAL_MARGIN_SECONDS) -> None:
+        """Renew the Vault token in a background thread before it expires.
+
+        Keeps `vault_client` from ever blocking on re-authentication. If the
+        token cannot be renewed any further, the thread re-authenticates.
+
+        Args:
+            renew_margin_seconds: Renew this many seconds before the token expires.
+        """
+        if self._renewal_thread is not None and self._renewal_thread.is_alive():
+            return
+
+        # Authenticate up front so the thread knows when the token expires
+        _ = self.vault_client
+
+        self._renewal_stop = threading.Event()
+        self._renewal_thread = threading.Thread(
+            target=self._token_renewal_loop,
+            args=(self._renewal_stop, renew_margin_seconds),
+            name="vault-token-renewal",
+            daemon=True,
+        )
+        self._renewal_thread.start()
+        self.logger.info("Started Vault token renewal")
+
+    def stop_token_renewal(self) -> None:
+        """Stop the background token renewal thread, if running."""
+        thread = self._renewal_thread
+        if thread is None:
+            return
+
+        self._renewal_stop.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._renewal_thread = None
+
+    def renew_token(self, renew_margin_seconds: float = TOKEN_RENEWAL_MARGIN_SECONDS) -> None:
+        """Renew the current Vault token, re-authenticating if it cannot be extended.
+
+        Args:
+            renew_margin_seconds: Re-authenticate when a renewed token would
+                still expire within this many seconds (e.g. at its max TTL).
+        """
+        with self._client_lock:
+            client = self._vault_client
+            if client is not None:
+                try:
+                    client.auth.token.renew_self()
+                    self._set_token_expiration()
+                    if self._seconds_until_expiration() > renew_margin_seconds:
+                        self.logger.debug("Renewed Vault token")
+                        return
+                    self.logger.info("Vault token reached its maximum TTL, re-authenticating")
+                except VaultError as e:
+                    self.logger.warning(f"Failed to renew Vault token, re-authenticating: {e}")
+
+            self._vault_token_expiration = None
+            self._connect()
+
+    def _token_renewal_loop(self, stop: threading.Event, renew_margin_seconds: float) -> None:
+        """Sleep until the token is due for renewal, renew it, and repeat until stopped."""
+        while True:
+            delay = self._seconds_until_expiration() - renew_margin_seconds
+            delay = min(max(delay, MIN_RENEWAL_INTERVAL_SECONDS), MAX_RENEWAL_INTERVAL_SECONDS)
+            if stop.wait(delay):
+                return
+            if self._seconds_until_expiration() > renew_margin_seconds:
+                continue
+
+            try:
+                self.renew_token(renew_margin_seconds)
+            except Exception as e:
+                # Keep renewing through transient outages (e.g. Vault unreachable);
+                # MIN_RENEWAL_INTERVAL_SECONDS paces the retries
+                self.logger.exception(f"Background Vault token renewal failed: {e}")
+
+    def _seconds_until_expiration(self) -> float:
+        """Get the seconds left before the current token expires (0 if unknown)."""
+        if not self._vault_token_expiration:
+            return 0.0
+        if self._vault_token_expiration == datetime.max.replace(tzinfo=timezone.utc):
+            return float("inf")
+        return (self._vault_token_expiration - datetime.now(timezone.utc)).total_seconds()
+
     def _set_token_expiration(self):
         """Set the token expiration time."""
         if self._vault_client is None:
@@ -121,6 +332,9 @@ class VaultConnector(VendorConnectorBase):
                 # fromisoformat with '+00:00' produces a timezone-aware datetime (Python 3.7+ only)
                 # No need to manually set tzinfo if running on Python 3.7 or newer.
                 # If supporting Python <3.7, manual tzinfo assignment is required.
+            elif token_data.get("data", {}).get("ttl") == 0:
+                # Tokens without a TTL (e.g. root tokens) never expire
+                self._vault_token_expiration = datetime.max.replace(tzinfo=timezone.utc)
         except VaultError as e:
             self.logger.exception(f"Failed to lookup Vault token expiration: {e}")
 
@@ -154,16 +368,59 @@ class VaultConnector(VendorConnectorBase):
         root_path: str = "/",
         mount_point: str = "secret",
         max_depth: int | None = None,
-    ) -> dict[str, dict]:
+        paths_only: bool = False,
+        max_workers: int = DEFAULT_VAULT_WORKERS,
+    ) -> Mapping[str, dict | None]:
         """List secrets recursively from Vault KV v2 engine.
 
+        Directories are listed and secrets are read concurrently on a bounded
+        worker pool.
+
         Args:
             root_path: Starting path for listing (default: "/").
             mount_point: KV engine mount point (default: "secret").
             max_depth: Maximum directory depth to traverse (None = unlimited).
+            paths_only: Only list paths and return a mapping that reads each
+                secret on first access (default: False).
+            max_workers: Maximum number of concurrent Vault requests.
+
+        Returns:
+            Dict mapping secret paths to their data, or a LazySecretMapping
+            when paths_only is set.
+
+        Raises:
+            ValueError: If root_path contains path traversal sequences.
+        """
+        initial_paths = self._list_secret_root(root_path, mount_point)
+        if initial_paths is None:
+            return LazySecretMapping([], self.read_secret) if paths_only else {}
+
+        walk = self._walk_secrets(
+            initial_paths,
+            mount_point=mount_point,
+            max_depth=max_depth,
+            read_values=not paths_only,
+            max_workers=max_workers,
+        )
+
+        if paths_only:
+            secrets = LazySecretMapping((path for path, _ in walk), partial(self.read_secret, mount_point=mount_point))
+            self.logger.info(f"Listed {len(secrets)} Vault secret paths")
+            return secrets
+
+        secrets = dict(walk)
+        self.logger.info(f"Listed {len(secrets)} Vault secrets")
+        return secrets
+
+    def _list_secret_root(self, root_path: str, mount_point: str) -> list[str] | None:
+        """Validate a KV root path and list its immediate entries.
+
+        Args:
+            root_path: Starting path for listing.
+            mount_point: KV engine mount point.
 
         Returns:
-            Dict mapping secret paths to their data.
+            Paths of the entries under root_path, or None if it cannot be listed.
 
         Raises:
             ValueError: If root_path contains path traversal sequences.
@@ -176,59 +433,124 @@ class VaultConnector(VendorConnectorBase):
         display_root = root_path if root_path not in (None, "", "/") else "/"
         self.logger.info(f"Listing Vault secrets from {mount_point}{display_root}")
 
-        secrets: dict[str, dict] = {}
-        client = self.vault_client
-
         normalized_root = (root_path or "").strip("/")
         list_path = normalized_root.rstrip("/") if normalized_root else ""
         path_prefix = f"{list_path}/" if list_path else ""
 
-        # Initial listing from root_path
         try:
-            root_result = client.secrets.kv.v2.list_secrets(
+            root_result = self.vault_client.secrets.kv.v2.list_secrets(
                 path=list_path,
                 mount_point=mount_point,
             )
-            initial_paths = [
-                (f"{path_prefix}{key}" if path_prefix else key, 0)
-                for key in root_result.get("data", {}).get("keys", [])
-            ]
         except VaultError as e:
             self.logger.warning(f"Invalid root path {display_root}: {e}")
-            return secrets
+            return None
 
-        stack: deque[tuple[str, int]] = deque(initial_paths)
+        return [f"{path_prefix}{key}" for key in root_result.get("data", {}).get("keys", [])]
 
-        while stack:
-            current_path, depth = stack.popleft()
+    def _walk_secrets(
+        self,
+        initial_paths: Iterable[str],
+        mount_point: str,
+        max_depth: int | None = None,
+        read_values: bool = True,
+        max_workers: int = DEFAULT_VAULT_WORKERS,
+        *,
+        ordered: bool = False,
+    ) -> Iterator[tuple[str, dict | None]]:
+        """Concurrently walk a KV tree, yielding secrets as they are found.
+
+        Directory listings and secret reads share one bounded worker pool fed
+        from the frontier of the walk, with at most two requests in flight per
+        worker. Closing the generator cancels any requests that have not
+        started yet.
+
+        Every entry is ranked by its position in a sequential breadth-first
+        walk, and the frontier is worked through in that order. With
+        ``ordered`` a secret is only yielded once no entry ranked before it is
+        still outstanding; since descendants always rank after their
+        directory, this reproduces the sequential walk order exactly.
 
-            if not current_path.endswith("/"):
-                # It's a secret, fetch it
-                try:
-                    secret_data = client.secrets.kv.v2.read_secret_version(
-                        path=current_path,
-                        mount_point=mount_point,
-                    )["data"]["data"]
-                    secrets[current_path] = secret_data
-                    self.logger.debug(f"Retrieved secret: {current_path}")
-                except VaultError as e:
-                    self.logger.warning(f"Failed to read secret {current_path}: {e}")
-            # It's a directory, list its contents if within max_depth
-            elif max_depth is None or depth < max_depth:
-                try:
-                    listing = client.secrets.kv.v2.list_secrets(
-                        path=current_path,
-                        mount_point=mount_point,
-                    )
-                    keys = listing.get("data", {}).get("keys", [])
-                    for key in keys:
-                        new_path = f"{current_path}{key}"  # current_path already ends with /
-                        stack.append((new_path, depth + 1))
-                except VaultError as e:
-                    self.logger.warning(f"Failed to list path {current_path}: {e}")
+        Args:
+            initial_paths: Entries to start from (directories end with "/").
+            mount_point: KV engine mount point.
+            max_depth: Maximum directory depth to traverse (None = unlimited).
+            read_values: Read each secret's data. When False, data is None.
+            max_workers: Maximum number of concurrent Vault requests.
+            ordered: Yield in walk order instead of completion order.
 
-        self.logger.info(f"Listed {len(secrets)} Vault secrets")
-        return secrets
+        Yields:
+            Tuples of (secret path, secret data).
+        """
+        kv = self.vault_client.secrets.kv.v2
+
+        def list_directory(path: str) -> list[str]:
+            return kv.list_secrets(path=path, mount_point=mount_point).get("data", {}).get("keys", [])
+
+        def read_secret_data(path: str) -> dict:
+            return kv.read_secret_version(path=path, mount_point=mount_point)["data"]["data"]
+
+        # Entries are (rank, path); a rank is (depth, parent rank, index), so
+        # ranks compare like positions in a sequential breadth-first walk.
+        # Paths waiting to be listed or read, and secrets waiting to be yielded
+        frontier: list[tuple[tuple, str]] = [((0, (), i), path) for i, path in enumerate(initial_paths)]
+        ready: list[tuple[tuple, str, dict | None]] = []
+        pending: dict[Future, tuple[tuple, str]] = {}
+        # Keep only a few requests queued per worker so early exits waste little work
+        window = max(1, max_workers) * 2
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+
+        def fill() -> None:
+            while frontier and len(pending) < window:
+                rank, path = heapq.heappop(frontier)
+                if not path.endswith("/"):
+                    if read_values:
+                        pending[executor.submit(read_secret_data, path)] = (rank, path)
+                    else:
+                        heapq.heappush(ready, (rank, path, None))
+                # It's a directory, list its contents if within max_depth
+                elif max_depth is None or rank[0] < max_depth:
+                    pending[executor.submit(list_directory, path)] = (rank, path)
+
+        def releasable() -> bool:
+            if not ready:
+                return False
+            if not ordered:
+                return True
+            outstanding = [rank for rank, _ in pending.values()]
+            if frontier:
+                outstanding.append(frontier[0][0])
+            return not outstanding or ready[0][0] < min(outstanding)
+
+        try:
+            while True:
+                fill()
+                if releasable():
+                    _, path, data = heapq.heappop(ready)
+                    yield path, data
+                    continue
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rank, path = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except VaultError as e:
+                        action = "list path" if path.endswith("/") else "read secret"
+                        self.logger.warning(f"Failed to {action} {path}: {e}")
+                        continue
+
+                    if path.endswith("/"):
+                        for i, key in enumerate(result):
+                            # path already ends with /
+                            heapq.heappush(frontier, ((rank[0] + 1, rank, i), f"{path}{key}"))
+                    else:
+                        self.logger.debug(f"Retrieved secret: {path}")
+                        heapq.heappush(ready, (rank, path, result))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def read_secret(
         self,
@@ -260,6 +582,8 @@ class VaultConnector(VendorConnectorBase):
         secret_name: str | None = None,
         matchers: dict[str, str] | None = None,
         mount_point: str = "secret",
+        use_index: bool = False,
+        max_workers: int = DEFAULT_VAULT_WORKERS,
     ) -> dict | None:
         """Get Vault secret by path, name, or by searching with matchers.
 
@@ -268,20 +592,25 @@ class VaultConnector(VendorConnectorBase):
         2. Path with matchers: Searches secrets under path and returns first match
         3. Path without matchers: Returns first non-empty secret found
 
+        Searches read secrets concurrently but test them in walk order and stop
+        at the first match, so the same secret is returned as by a sequential
+        walk and each secret is read at most once. Every secret
+        read during a search is fingerprinted; with use_index, secrets whose
+        fingerprints already match are checked before walking the tree.
+
         Args:
             path: Root path to search or base path for secret_name (default: "/").
             secret_name: Specific secret name to append to path.
             matchers: Dict of key/value pairs to match against secret data.
             mount_point: KV engine mount point (default: "secret").
+            use_index: Check previously indexed matching secrets first (default: False).
+            max_workers: Maximum number of concurrent Vault requests while searching.
 
         Returns:
             Secret data dict, or None if not found.
         """
         self.logger.debug(f"Getting Vault secret: path={path}, secret_name={secret_name}")
 
-        client = self.vault_client
-        secret_data = None
-
         # Handle specific secret_name case - direct fetch
         if not is_nothing(secret_name):
             # Build the full path: path/secret_name or just secret_name if path is "/"
@@ -289,9 +618,9 @@ class VaultConnector(VendorConnectorBase):
             self.logger.debug(f"Resolved secret path: {secret_path}")
 
             try:
-                secret_data = client.secrets.kv.v2.read_secret_version(path=secret_path, mount_point=mount_point)[
-                    "data"
-                ]["data"]
+                secret_data = self.vault_client.secrets.kv.v2.read_secret_version(
+                    path=secret_path, mount_point=mount_point
+                )["data"]["data"]
                 self.logger.debug(f"Retrieved secret data for {secret_path}")
             except VaultError as e:
                 self.logger.warning(
@@ -299,53 +628,102 @@ class VaultConnector(VendorConnectorBase):
                     + (f"/{secret_name}" if not is_nothing(secret_name) else "")
                     + f": {e}"
                 )
+                return None
             return secret_data
 
         # No secret_name provided - search under path
         self.logger.info(f"Finding secrets under {path}")
 
-        matching_secret_paths = self.list_secrets(root_path=path, mount_point=mount_point)
-        self.logger.debug(f"Found {len(matching_secret_paths)} potential secrets")
+        if use_index and not is_nothing(matchers):
+            secret_data = self._search_secret_index(path, matchers, mount_point)
+            if secret_data is not None:
+                return secret_data
 
-        if is_nothing(matching_secret_paths):
+        initial_paths = self._list_secret_root(path, mount_point)
+        if is_nothing(initial_paths):
             self.logger.warning(f"No secrets found matching {path}")
             return None
 
-        # Convert to deque for efficient popleft iteration
-        path_queue: deque[str] = deque(matching_secret_paths.keys())
+        walk = self._walk_secrets(initial_paths, mount_point=mount_point, max_workers=max_workers, ordered=True)
+        try:
+            for secret_path, secret_data in walk:
+                self._index_secret(mount_point, secret_path, secret_data)
 
-        while path_queue and secret_data is None:
-            secret_path = path_queue.popleft()
-            self.logger.debug(f"Checking secret path: {secret_path}")
+                # If no matchers, take the first non-empty secret
+                if is_nothing(matchers):
+                    self.logger.warning("No matchers provided, taking the first non-empty secret found")
+                    return secret_data
 
-            try:
-                matching_secret_data = client.secrets.kv.v2.read_secret_version(
-                    path=secret_path, mount_point=mount_point
-                )["data"]["data"]
-                self.logger.debug(f"Secret data for {secret_path}: {list(matching_secret_data.keys())}")
-            except VaultError:
-                self.logger.warning(f"{secret_path} is empty or invalid, skipping it")
-                continue
+                if self._match_secret(secret_path, secret_data, matchers):
+                    return secret_data
+        finally:
+            walk.close()
 
-            # If no matchers, take the first non-empty secret
-            if is_nothing(matchers):
-                self.logger.warning("No matchers provided, taking the first non-empty secret found")
-                secret_data = matching_secret_data
-                continue
+        return None
 
-            # Check matchers against the secret data
-            found_match = False
-            for k, v in matchers.items():
-                datum = matching_secret_data.get(k)
-                if datum == v:
-                    self.logger.info(f"Matching {secret_path} on matcher {k}: {datum} equals {v}")
-                    found_match = True
-                    break
+    def _match_secret(self, secret_path: str, secret_data: Mapping[str, Any], matchers: Mapping[str, Any]) -> bool:
+        """Check whether any matcher key/value pair is present in a secret.
 
-            if found_match:
-                secret_data = matching_secret_data
+        Args:
+            secret_path: Path of the secret, used for logging.
+            secret_data: Secret data to test.
+            matchers: Key/value pairs to look for.
+
+        Returns:
+            True if at least one matcher matches.
+        """
+        for k, v in matchers.items():
+            datum = secret_data.get(k)
+            if datum == v:
+                self.logger.info(f"Matching {secret_path} on matcher {k}: {datum} equals {v}")
+                return True
+        return False
+
+    @staticmethod
+    def _fingerprint(key: str, value: Any) -> str:
+        """Hash a key/value pair so the index never holds secret values."""
+        payload = json.dumps([key, value], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _index_secret(self, mount_point: str, secret_path: str, secret_data: Mapping[str, Any] | None) -> None:
+        """Record the fingerprints of a secret read from Vault."""
+        if secret_data is None:
+            self._secret_index.pop((mount_point, secret_path), None)
+            return
+        self._secret_index[(mount_point, secret_path)] = frozenset(
+            self._fingerprint(k, v) for k, v in secret_data.items()
+        )
+
+    def _search_secret_index(self, path: str, matchers: Mapping[str, Any], mount_point: str) -> dict | None:
+        """Check indexed secrets under path that matched the matchers when last read.
 
-        return secret_data
+        Candidates are re-read before being returned, so stale index entries are
+        corrected rather than trusted.
+
+        Args:
+            path: Root path of the search.
+            matchers: Key/value pairs to look for.
+            mount_point: KV engine mount point.
+
+        Returns:
+            Matching secret data, or None if no indexed secret still matches.
+        """
+        wanted = {self._fingerprint(k, v) for k, v in matchers.items()}
+        normalized_root = (path or "").strip("/")
+        prefix = f"{normalized_root}/" if normalized_root else ""
+
+        candidates = [
+            secret_path
+            for (indexed_mount, secret_path), fingerprints in self._secret_index.items()
+            if indexed_mount == mount_point and secret_path.startswith(prefix) and fingerprints & wanted
+        ]
+        for secret_path in candidates:
+            secret_data = self.read_secret(secret_path, mount_point=mount_point)
+            self._index_secret(mount_point, secret_path, secret_data)
+            if secret_data is not None and self._match_secret(secret_path, secret_data, matchers):
+                return secret_data
+
+        return None
 
     def write_secret(
         self,
@@ -450,14 +828,21 @@ class VaultConnector(VendorConnectorBase):
         mount_point: str = "aws",
         ttl: str | None = None,
         credential_type: str | None = None,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """Generate AWS credentials via Vault's AWS secrets engine.
 
+        Leased credentials are cached per role until shortly before their lease
+        ends. Near the end of a lease the cached credentials are still returned
+        while a replacement is leased in the background, so callers only wait
+        on Vault for the first lease of a role.
+
         Args:
             role_name: AWS role configured in Vault.
             mount_point: AWS secrets engine mount point (default: "aws").
             ttl: Optional TTL override (e.g., "1h").
             credential_type: Optional credential type override (e.g., "sts").
+            use_cache: Reuse leased credentials for the same role and options (default: True).
 
         Returns:
             Dict of generated credential data (e.g., AccessKeyId, SecretAccessKey, SessionToken).
@@ -472,6 +857,41 @@ class VaultConnector(VendorConnectorBase):
 
         self._validate_mount_point(mount_point)
 
+        if not use_cache:
+            return self._lease_aws_credentials(role_name, mount_point, ttl, credential_type)[0]
+
+        key = (mount_point, role_name, ttl, credential_type)
+        leased = self._aws_credentials.get(key)
+        if leased is not None and monotonic() < leased.expires_at:
+            if monotonic() >= leased.refresh_at:
+                self._refresh_aws_credentials_in_background(key)
+            return dict(leased.credentials)
+
+        with self._aws_credential_lock:
+            key_lock = self._aws_credential_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have leased credentials while we waited
+            leased = self._aws_credentials.get(key)
+            if leased is not None and monotonic() < leased.expires_at:
+                return dict(leased.credentials)
+            return dict(self._lease_and_cache_aws_credentials(key))
+
+    def _lease_aws_credentials(
+        self,
+        role_name: str,
+        mount_point: str,
+        ttl: str | None,
+        credential_type: str | None,
+    ) -> tuple[dict[str, Any], int]:
+        """Lease new AWS credentials from Vault.
+
+        Returns:
+            Tuple of (credential data, lease duration in seconds).
+
+        Raises:
+            RuntimeError: If Vault fails to return credentials.
+        """
         aws_secrets = self.vault_client.secrets.aws
         generate_kwargs: dict[str, Any] = {}
         if ttl:
@@ -490,8 +910,46 @@ class VaultConnector(VendorConnectorBase):
             raise RuntimeError(f"Vault returned empty credentials for role {role_name}")
 
         self.logger.info(f"Generated AWS credentials for role {role_name}")
+        return credentials, int(response.get("lease_duration") or 0)
+
+    def _lease_and_cache_aws_credentials(self, key: tuple) -> dict[str, Any]:
+        """Lease AWS credentials for a cache key and cache them for their lease."""
+        mount_point, role_name, ttl, credential_type = key
+        credentials, lease_duration = self._lease_aws_credentials(role_name, mount_point, ttl, credential_type)
+
+        if lease_duration > 0:
+            leased_at = monotonic()
+            expires_at = leased_at + max(lease_duration - CREDENTIAL_EXPIRY_MARGIN_SECONDS, 0)
+            refresh_at = leased_at + max(lease_duration - CREDENTIAL_REFRESH_MARGIN_SECONDS, lease_duration / 2)
+            self._aws_credentials[key] = _LeasedCredentials(
+                credentials=credentials,
+                refresh_at=min(refresh_at, expires_at),
+                expires_at=expires_at,
+            )
         return credentials
 
+    def _refresh_aws_credentials_in_background(self, key: tuple) -> None:
+        """Lease replacement credentials for a cache key without blocking the caller."""
+        with self._aws_credential_lock:
+            if key in self._aws_credential_refreshing:
+                return
+            self._aws_credential_refreshing.add(key)
+            if self._background_executor is None:
+                self._background_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vault-refresh")
+            key_lock = self._aws_credential_locks.setdefault(key, threading.Lock())
+
+        def refresh() -> None:
+            try:
+                with key_lock:
+                    self._lease_and_cache_aws_credentials(key)
+            except RuntimeError as e:
+                self.logger.warning(f"Background refresh of AWS credentials for role {key[1]} failed: {e}")
+            finally:
+                with self._aws_credential_lock:
+                    self._aws_credential_refreshing.discard(key)
+
+        self._background_executor.submit(refresh)
+
 
 from vendor_connectors.vault.tools import (
     get_crewai_tools,
@@ -502,6 +960,7 @@ from vendor_connectors.vault.tools import (
 
 
 __all__ = [
+    "LazySecretMapping",
     # Core connector
     "VaultConnector",
     "get_crewai_tools",
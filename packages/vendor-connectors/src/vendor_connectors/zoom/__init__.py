@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import base64
+import threading
 
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
 from typing import Any
 
 import requests
 
+from requests.adapters import HTTPAdapter
+
 from lifecyclelogging import Logging
 from vendor_connectors.base import VendorConnectorBase
 
@@ -15,6 +21,19 @@ from vendor_connectors.base import VendorConnectorBase
 # Default timeout for HTTP requests in seconds
 DEFAULT_REQUEST_TIMEOUT = 30
 
+# Refresh access tokens this many seconds before Zoom says they expire
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+# Token lifetime assumed when Zoom does not report expires_in
+DEFAULT_TOKEN_LIFETIME_SECONDS = 3600
+
+# Requests per second allowed for each Zoom API rate limit category (Pro plan).
+# See https://developers.zoom.us/docs/api/rest/rate-limits/
+ZOOM_RATE_LIMITS: dict[str, float] = {"light": 30.0, "medium": 20.0, "heavy": 10.0}
+
+# Default number of concurrent requests for bulk user operations
+DEFAULT_BULK_WORKERS = 8
+
 
 class ZoomConnector(VendorConnectorBase):
     """Zoom connector for user management."""
@@ -34,23 +53,93 @@ class ZoomConnector(VendorConnectorBase):
         self.client_secret = client_secret or self.get_input("ZOOM_CLIENT_SECRET", required=True)
         self.account_id = account_id or self.get_input("ZOOM_ACCOUNT_ID", required=True)
 
-    def get_access_token(self) -> str | None:
-        """Get an OAuth access token from Zoom."""
-        url = "https://zoom.us/oauth/token"
-        auth_string = f"{self.client_id}:{self.client_secret}"
-        headers = {
-            "Authorization": f"Basic {base64.b64encode(auth_string.encode()).decode()}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        data = {"grant_type": "account_credentials", "account_id": self.account_id}
+        # Cached OAuth token, refreshed shortly before it expires
+        self._access_token: str | None = None
+        self._token_expires_at = 0.0
+        self._token_lock = threading.Lock()
+
+        # Lazy-initialized persistent HTTP session
+        self._session: requests.Session | None = None
+
+        # Per-category call schedule used to stay within Zoom's rate limits
+        self.rate_limits = dict(ZOOM_RATE_LIMITS)
+        self._throttle_lock = threading.Lock()
+        self._next_call_at: dict[str, float] = {}
+
+    @property
+    def session(self) -> requests.Session:
+        """Get or create the pooled HTTP session used for Zoom calls."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=DEFAULT_BULK_WORKERS * 2)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close HTTP sessions and release resources."""
+        super().close()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def get_access_token(self, force_refresh: bool = False) -> str | None:
+        """Get an OAuth access token from Zoom.
+
+        Tokens are cached until shortly before they expire. Refreshes are
+        serialized, so concurrent callers share a single token request.
 
-        try:
-            response = requests.post(url, headers=headers, data=data, timeout=DEFAULT_REQUEST_TIMEOUT)
-            response.raise_for_status()
-            return response.json().get("access_token")
-        except requests.exceptions.RequestException as exc:
-            msg = "Failed to get Zoom access token"
-            raise RuntimeError(msg) from exc
+        Args:
+            force_refresh: Request a new token even if the cached one is still valid.
+
+        Returns:
+            The access token.
+        """
+        if not force_refresh and self._has_valid_token():
+            return self._access_token
+
+        with self._token_lock:
+            # Another thread may have refreshed the token while we waited
+            if not force_refresh and self._has_valid_token():
+                return self._access_token
+
+            url = "https://zoom.us/oauth/token"
+            auth_string = f"{self.client_id}:{self.client_secret}"
+            headers = {
+                "Authorization": f"Basic {base64.b64encode(auth_string.encode()).decode()}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            }
+            data = {"grant_type": "account_credentials", "account_id": self.account_id}
+
+            try:
+                response = self.session.post(url, headers=headers, data=data, timeout=DEFAULT_REQUEST_TIMEOUT)
+                response.raise_for_status()
+                payload = response.json()
+            except requests.exceptions.RequestException as exc:
+                msg = "Failed to get Zoom access token"
+                raise RuntimeError(msg) from exc
+
+            expires_in = payload.get("expires_in") or DEFAULT_TOKEN_LIFETIME_SECONDS
+            self._access_token = payload.get("access_token")
+            self._token_expires_at = monotonic() + max(int(expires_in) - TOKEN_EXPIRY_MARGIN_SECONDS, 0)
+            return self._access_token
+
+    def invalidate_access_token(self, token: str | None = None) -> None:
+        """Drop the cached access token so the next call fetches a new one.
+
+        Args:
+            token: Only invalidate if this is still the cached token. Lets callers
+                that saw a rejected token avoid discarding a token another thread
+                has already refreshed.
+        """
+        with self._token_lock:
+            if token is None or token == self._access_token:
+                self._access_token = None
+                self._token_expires_at = 0.0
+
+    def _has_valid_token(self) -> bool:
+        """Check whether the cached access token can still be used."""
+        return bool(self._access_token) and monotonic() < self._token_expires_at
 
     def get_headers(self) -> dict[str, str]:
         """Get headers with authorization for Zoom API calls."""
@@ -60,10 +149,85 @@ class ZoomConnector(VendorConnectorBase):
             raise RuntimeError(msg)
         return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
+    def _send(self, method: str, url: str, category: str = "light", **kwargs) -> requests.Response:
+        """Send an authorized request to the Zoom API on the shared session.
+
+        Requests are paced to the endpoint's rate limit category. A 401 response
+        invalidates the cached token and the request is retried once with a
+        fresh one; 429 responses are retried after the advertised delay.
+
+        Args:
+            method: HTTP method name (get, post, patch, delete).
+            url: Request URL.
+            category: Zoom rate limit category of the endpoint (light, medium, heavy).
+            **kwargs: Extra arguments forwarded to the session call.
+
+        Returns:
+            The HTTP response. Status errors are raised by the caller.
+        """
+        call = getattr(self.session, method)
+        token_refreshed = False
+        rate_limit_retries = 0
+
+        while True:
+            self._throttle(category)
+            headers = self.get_headers()
+            response = call(url, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT, **kwargs)
+
+            if response.status_code == 401 and not token_refreshed:
+                self.invalidate_access_token(headers["Authorization"].removeprefix("Bearer "))
+                token_refreshed = True
+                continue
+
+            if response.status_code == 429 and rate_limit_retries < self.MAX_RETRIES:
+                delay = self._get_retry_delay(response)
+                if delay is not None:
+                    rate_limit_retries += 1
+                    self.logger.warning(f"Zoom rate limit hit for {category} requests. Retrying in {delay} seconds")
+                    sleep(delay)
+                    continue
+
+            return response
+
+    def _throttle(self, category: str) -> None:
+        """Wait until the next request fits within its Zoom rate limit category.
+
+        Args:
+            category: Zoom rate limit category (light, medium, heavy).
+        """
+        rate = self.rate_limits.get(category)
+        if not rate:
+            return
+
+        with self._throttle_lock:
+            now = monotonic()
+            scheduled = max(now, self._next_call_at.get(category, 0.0))
+            self._next_call_at[category] = scheduled + 1.0 / rate
+
+        if scheduled > now:
+            sleep(scheduled - now)
+
+    @staticmethod
+    def _get_retry_delay(response: requests.Response) -> float | None:
+        """Get the delay before retrying a rate-limited request.
+
+        Zoom sends a number of seconds for per-second limits and a timestamp
+        once a daily limit is exhausted; the latter is not worth waiting for.
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return 1.0
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            return None
+
     def get_zoom_users(self) -> dict[str, dict[str, Any]]:
         """Get all Zoom users."""
         url = "https://api.zoom.us/v2/users"
-        headers = self.get_headers()
         users: dict[str, dict[str, Any]] = {}
         page_size = 300
         next_page_token = None
@@ -74,7 +238,7 @@ class ZoomConnector(VendorConnectorBase):
                 params["next_page_token"] = next_page_token
 
             try:
-                response = requests.get(url, headers=headers, params=params, timeout=DEFAULT_REQUEST_TIMEOUT)
+                response = self._send("get", url, category="medium", params=params)
                 response.raise_for_status()
                 data = response.json()
                 for user in data.get("users", []):
@@ -88,29 +252,46 @@ class ZoomConnector(VendorConnectorBase):
 
         return users
 
-    def remove_zoom_user(self, email: str) -> None:
+    def remove_zoom_user(self, email: str) -> bool:
         """Remove a Zoom user."""
         url = f"https://api.zoom.us/v2/users/{email}"
-        headers = self.get_headers()
         try:
-            response = requests.delete(url, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT)
+            response = self._send("delete", url)
             response.raise_for_status()
             self.logger.warning(f"Removed Zoom user {email}")
+            return True
         except requests.exceptions.RequestException as exc:
             error_msg = f"Failed to remove Zoom user {email}: {exc}"
             self.errors.append(error_msg)
             self.logger.exception(error_msg)
+            return False
+
+    def remove_zoom_users(self, emails: Iterable[str], max_workers: int = DEFAULT_BULK_WORKERS) -> dict[str, bool]:
+        """Remove many Zoom users concurrently.
+
+        Failures are recorded in `errors` like `remove_zoom_user` does.
+
+        Args:
+            emails: Email addresses of the users to remove.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            Mapping of email to whether the user was removed.
+        """
+        emails = list(dict.fromkeys(emails))
+        return dict(
+            zip(emails, self._run_bulk(self.remove_zoom_user, [(email,) for email in emails], max_workers), strict=True)
+        )
 
     def create_zoom_user(self, email: str, first_name: str, last_name: str) -> bool:
         """Create a Zoom user with a paid license."""
         url = "https://api.zoom.us/v2/users"
-        headers = self.get_headers()
         user_info = {
             "action": "create",
             "user_info": {"email": email, "type": 2, "first_name": first_name, "last_name": last_name},
         }
         try:
-            response = requests.post(url, headers=headers, json=user_info, timeout=DEFAULT_REQUEST_TIMEOUT)
+            response = self._send("post", url, json=user_info)
             response.raise_for_status()
             self.logger.info(f"Created Zoom user {email}")
             return True
@@ -120,6 +301,48 @@ class ZoomConnector(VendorConnectorBase):
             self.logger.exception(error_msg)
             return False
 
+    def create_zoom_users(
+        self,
+        users: Iterable[Mapping[str, str]],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> dict[str, bool]:
+        """Create many Zoom users with paid licenses concurrently.
+
+        Failures are recorded in `errors` like `create_zoom_user` does.
+
+        Args:
+            users: User mappings with email, first_name and last_name keys.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            Mapping of email to whether the user was created.
+        """
+        unique_users = {user["email"]: user for user in users}
+        arguments = [
+            (email, user.get("first_name", ""), user.get("last_name", "")) for email, user in unique_users.items()
+        ]
+        return dict(zip(unique_users, self._run_bulk(self.create_zoom_user, arguments, max_workers), strict=True))
+
+    def _run_bulk(self, operation: Any, arguments: list[tuple], max_workers: int) -> list[Any]:
+        """Run an operation for each argument tuple on a bounded thread pool.
+
+        Args:
+            operation: Callable invoked once per argument tuple.
+            arguments: Positional arguments for each call.
+            max_workers: Maximum number of concurrent calls.
+
+        Returns:
+            Results in the order of the arguments.
+        """
+        if not arguments:
+            return []
+
+        # Fetch the token up front so workers don't queue behind the first refresh
+        self.get_access_token()
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(arguments)))) as executor:
+            return list(executor.map(lambda args: operation(*args), arguments))
+
     def list_users(self) -> dict[str, dict[str, Any]]:
         """List all Zoom users.
 
@@ -140,10 +363,9 @@ class ZoomConnector(VendorConnectorBase):
             User data dictionary
         """
         url = f"https://api.zoom.us/v2/users/{user_id}"
-        headers = self.get_headers()
 
         try:
-            response = requests.get(url, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT)
+            response = self._send("get", url)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as exc:
@@ -160,11 +382,10 @@ class ZoomConnector(VendorConnectorBase):
             List of meeting data dictionaries
         """
         url = f"https://api.zoom.us/v2/users/{user_id}/meetings"
-        headers = self.get_headers()
         params = {"type": meeting_type}
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=DEFAULT_REQUEST_TIMEOUT)
+            response = self._send("get", url, category="medium", params=params)
             response.raise_for_status()
             data = response.json()
             return data.get("meetings", [])
@@ -181,10 +402,9 @@ class ZoomConnector(VendorConnectorBase):
             Meeting data dictionary
         """
         url = f"https://api.zoom.us/v2/meetings/{meeting_id}"
-        headers = self.get_headers()
 
         try:
-            response = requests.get(url, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT)
+            response = self._send("get", url)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as exc:
@@ -0,0 +1,196 @@
+"""Tests for the Meshy animation catalog."""
+
+from __future__ import annotations
+
+import dataclasses
+import subprocess
+import sys
+
+from unittest.mock import patch
+
+import pytest
+
+from vendor_connectors.meshy import animations
+from vendor_connectors.meshy.animations import (
+    ANIMATIONS,
+    AnimationCategory,
+    AnimationMeta,
+    AnimationSubcategory,
+    GameAnimationSet,
+    filter_animations,
+    get_animation,
+    get_animation_by_name,
+    get_animations_by_category,
+    get_animations_by_subcategory,
+    search_animations,
+)
+
+
+def _meta(anim_id, name, category, subcategory):
+    return AnimationMeta(anim_id, name, category, subcategory, f"https://example.com/{anim_id}.gif")
+
+
+class TestCatalog:
+    """Tests for loading the catalog."""
+
+    def test_catalog_loads_lazily(self):
+        """Importing the module does not build the catalog."""
+        code = (
+            "import sys\n"
+            "from vendor_connectors.meshy import animations\n"
+            "assert 'vendor_connectors.meshy._animation_catalog' not in sys.modules\n"
+            "assert 'ANIMATIONS' not in vars(animations)\n"
+            "assert animations.ANIMATIONS[0].name == 'Idle'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_entries(self):
+        """Catalog rows become AnimationMeta with full preview URLs."""
+        anim = ANIMATIONS[4]
+
+        assert anim.category == "Fighting"
+        assert anim.preview_url.startswith("https://cdn.meshy.ai/")
+        assert all(anim_id == meta.id for anim_id, meta in ANIMATIONS.items())
+
+    def test_meta_is_frozen(self):
+        """AnimationMeta is immutable and has no instance dict."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ANIMATIONS[0].name = "Renamed"
+        assert not hasattr(ANIMATIONS[0], "__dict__")
+
+
+class TestLookups:
+    """Tests for the indexed lookups."""
+
+    def test_by_category_matches_scan(self):
+        """Category lookups return the same animations as a full scan."""
+        for category in AnimationCategory:
+            expected = [anim for anim in ANIMATIONS.values() if anim.category == category.value]
+            assert get_animations_by_category(category) == expected
+            assert get_animations_by_category(category.value) == expected
+
+    def test_by_subcategory_matches_scan(self):
+        """Subcategory lookups return the same animations as a full scan."""
+        expected = [anim for anim in ANIMATIONS.values() if anim.subcategory == "Dancing"]
+
+        assert get_animations_by_subcategory(AnimationSubcategory.DANCING) == expected
+
+    def test_results_are_copies(self):
+        """Callers cannot modify the index through returned lists."""
+        get_animations_by_category(AnimationCategory.DANCING).clear()
+
+        assert get_animations_by_category(AnimationCategory.DANCING)
+
+    def test_by_id_and_name(self):
+        """Animations are found by ID and case-insensitive name."""
+        assert get_animation(0).name == "Idle"
+        assert get_animation_by_name("IDLE") is ANIMATIONS[0]
+        assert get_animation_by_name("No Such Move") is None
+        with pytest.raises(ValueError, match="Animation ID -1 not found"):
+            get_animation(-1)
+
+    def test_filter_matches_scan(self):
+        """Substring filters keep catalog order."""
+        expected = [
+            anim for anim in ANIMATIONS.values() if "ing" in anim.category.lower() and "g" in anim.subcategory.lower()
+        ]
+
+        assert filter_animations(category="ING", subcategory="g") == expected
+        assert filter_animations() == list(ANIMATIONS.values())
+        assert filter_animations(category="nothing") == []
+
+    def test_patched_catalog(self):
+        """Replacing ANIMATIONS rebuilds the indexes."""
+        catalog = {
+            7: _meta(7, "Jab", "Fighting", "Punching"),
+            3: _meta(3, "Waltz", "Dancing", "Dancing"),
+            5: _meta(5, "Hook", "Fighting", "Punching"),
+        }
+
+        with patch.object(animations, "ANIMATIONS", catalog):
+            assert [anim.id for anim in get_animations_by_category("Fighting")] == [7, 5]
+            assert get_animation_by_name("waltz").id == 3
+            assert [anim.id for anim in filter_animations(subcategory="punch")] == [7, 5]
+
+        assert get_animation_by_name("waltz") is None
+
+
+class TestSearch:
+    """Tests for free-text animation search."""
+
+    def test_ranks_by_matched_terms(self):
+        """Animations matching more query words rank first."""
+        results = search_animations("sword slash attack", limit=5)
+
+        assert results[0][0].name == "Right_Hand_Sword_Slash"
+        assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+        assert all("sword" in anim.name.lower() or "slash" in anim.name.lower() for anim, _ in results)
+
+    def test_stems_and_prefixes(self):
+        """Word forms and prefixes match the same animations."""
+        dancing = {anim.id for anim, _ in search_animations("dancing", limit=None)}
+
+        assert dancing == {anim.id for anim, _ in search_animations("dance", limit=None)}
+        assert ANIMATIONS[22].id in dancing
+        assert search_animations("drink", limit=None) == search_animations("drinks", limit=None)
+
+    def test_fuzzy_matches_misspellings(self):
+        """Misspelled words fall back to trigram matches."""
+        anim, score = search_animations("atack", limit=1)[0]
+
+        assert "attack" in f"{anim.name} {anim.subcategory}".lower()
+        assert 0 < score < 3
+
+    def test_category_filter_and_limit(self):
+        """Results can be narrowed to a category and capped."""
+        results = search_animations("run", limit=3, category="walkand")
+
+        assert len(results) == 3
+        assert all(anim.category == "WalkAndRun" for anim, _ in results)
+        assert search_animations("run", limit=0) == []
+
+    def test_no_match(self):
+        """Unrelated queries return nothing."""
+        assert search_animations("zzqx") == []
+        assert search_animations("") == []
+
+    def test_expansion_cache_is_bounded(self):
+        """Memoized query terms are capped, so arbitrary input cannot grow the cache."""
+        search_animations("slash")
+        expand = animations._get_index().search.expand
+
+        for i in range(animations._MAX_CACHED_EXPANSIONS + 50):
+            # Distinct letters-only words the stemmer leaves alone (the tokenizer drops digits)
+            search_animations("zq" + "".join("bcfhjkmpqx"[int(digit)] for digit in str(i)))
+
+        assert expand.cache_info().currsize == animations._MAX_CACHED_EXPANSIONS
+        assert search_animations("slash")
+
+    def test_patched_catalog(self):
+        """Search follows a replaced catalog."""
+        catalog = {
+            1: _meta(1, "Shield_Bash", "Fighting", "Blocking"),
+            2: _meta(2, "Sword_Slash", "Fighting", "AttackingwithWeapon"),
+        }
+
+        with patch.object(animations, "ANIMATIONS", catalog):
+            assert [(anim.id, score) for anim, score in search_animations("slash attack")] == [(2, 4.6)]
+
+
+class TestGameAnimationSet:
+    """Tests for the curated animation sets."""
+
+    def test_sets(self):
+        """Sets hold the first ten IDs of their categories, in catalog order."""
+        assert GameAnimationSet.BASIC_MOVEMENT == [0, 1, 5, 6, 11, 12, 13, 14, 15, 16]
+        assert GameAnimationSet.COMBAT == [4, 7, 8, 9, 10, 85, 86, 87, 88, 89]
+        assert GameAnimationSet.COMBAT == [anim.id for anim in get_animations_by_category("Fighting")][:10]
+        for name in ("SOCIAL", "CELEBRATION", "EXPLORATION"):
+            ids = getattr(GameAnimationSet, name)
+            assert 0 < len(ids) <= 10
+            assert all(anim_id in ANIMATIONS for anim_id in ids)
+
+    def test_unknown_attribute(self):
+        """Unknown set names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            GameAnimationSet.NOT_A_SET
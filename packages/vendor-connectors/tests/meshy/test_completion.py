@@ -0,0 +1,161 @@
+"""Tests for webhook-driven task completion."""
+
+from __future__ import annotations
+
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from vendor_connectors.meshy import completion, text3d
+from vendor_connectors.meshy.completion import CompletionRegistry
+from vendor_connectors.meshy.models import TaskStatus, Text3DResult
+from vendor_connectors.meshy.poller import TaskPoller
+from vendor_connectors.meshy.webhooks import MeshyWebhookPayload, WebhookHandler, WebhookServer, send_webhook
+
+
+class _CountingGet:
+    """Status function that reports a task as running, then succeeded."""
+
+    def __init__(self, polls_until_done=1):
+        self.calls = 0
+        self._polls_until_done = polls_until_done
+
+    def __call__(self, task_id):
+        self.calls += 1
+        status = TaskStatus.SUCCEEDED if self.calls >= self._polls_until_done else TaskStatus.IN_PROGRESS
+        return Text3DResult(id=task_id, status=status, progress=50, created_at=1700000000)
+
+
+@pytest.fixture
+def task_poller():
+    """Poller with short intervals for fast tests."""
+    instance = TaskPoller(min_interval=0.001, max_interval=0.02)
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def registry(task_poller):
+    """Registry with webhooks enabled and a long grace period."""
+    instance = CompletionRegistry(poller=task_poller, grace_period=30)
+    instance.enable_webhooks()
+    return instance
+
+
+class TestCompletionRegistry:
+    """Tests for CompletionRegistry."""
+
+    def test_polls_when_webhooks_disabled(self, task_poller):
+        """Without webhooks, waiting polls right away."""
+        get = _CountingGet()
+        instance = CompletionRegistry(poller=task_poller)
+
+        result = instance.wait(get, "task-1", Text3DResult, interval=0.001)
+
+        assert result.status == TaskStatus.SUCCEEDED
+        assert get.calls == 1
+
+    def test_webhook_resolves_without_polling(self, registry, webhook_payload_succeeded):
+        """A terminal webhook resolves the waiter and no status request is made."""
+        get = _CountingGet()
+        future = registry.expect(get, "task-12345-abcde", Text3DResult)
+
+        assert registry.resolve(MeshyWebhookPayload(**webhook_payload_succeeded))
+
+        result = future.result(timeout=5)
+        assert isinstance(result, Text3DResult)
+        assert result.model_urls.glb == "https://assets.meshy.ai/models/task-12345.glb"
+        assert get.calls == 0
+
+    def test_failed_webhook(self, registry, webhook_payload_failed):
+        """Failed webhooks fail the waiter with the reported message."""
+        future = registry.expect(_CountingGet(), "task-failed-xyz", Text3DResult)
+        registry.resolve(MeshyWebhookPayload(**webhook_payload_failed))
+
+        with pytest.raises(RuntimeError, match="invalid prompt"):
+            future.result(timeout=5)
+
+    def test_progress_webhook_ignored(self, registry, webhook_payload_succeeded):
+        """Non-terminal webhooks leave the waiter pending."""
+        future = registry.expect(_CountingGet(), "task-12345-abcde", Text3DResult)
+
+        assert not registry.resolve(
+            MeshyWebhookPayload(**{**webhook_payload_succeeded, "status": "IN_PROGRESS", "progress": 40})
+        )
+        assert not future.done()
+
+    def test_early_webhook_is_kept(self, registry, webhook_payload_succeeded):
+        """A webhook arriving before the waiter registers still resolves it."""
+        registry.resolve(MeshyWebhookPayload(**webhook_payload_succeeded))
+        get = _CountingGet()
+
+        result = registry.wait(get, "task-12345-abcde", Text3DResult)
+
+        assert result.id == "task-12345-abcde"
+        assert get.calls == 0
+
+    def test_falls_back_to_polling_after_grace_period(self, task_poller):
+        """Waiters poll once the grace period passes without a webhook."""
+        instance = CompletionRegistry(poller=task_poller)
+        instance.enable_webhooks(grace_period=0.02)
+        get = _CountingGet(polls_until_done=2)
+
+        result = instance.wait(get, "task-1", Text3DResult, interval=0.001, timeout=5)
+
+        assert result.status == TaskStatus.SUCCEEDED
+        assert get.calls == 2
+
+    def test_handler_resolves_registry(self, registry, webhook_payload_succeeded):
+        """WebhookHandler resolves waiters even for tasks unknown to the repository."""
+        repository = MagicMock()
+        repository.find_task_by_id.return_value = None
+        future = registry.expect(_CountingGet(), "task-12345-abcde", Text3DResult)
+
+        WebhookHandler(repository, registry=registry).handle_webhook(MeshyWebhookPayload(**webhook_payload_succeeded))
+
+        assert future.result(timeout=5).status == TaskStatus.SUCCEEDED
+
+
+class TestWebhookServer:
+    """Tests for the local webhook receiver."""
+
+    def test_end_to_end_poll_resolved_by_webhook(self, webhook_payload_succeeded):
+        """text3d.poll returns as soon as the local server receives the webhook."""
+        get = _CountingGet(polls_until_done=10**6)
+
+        with (
+            patch.object(text3d, "get", get),
+            WebhookServer(grace_period=30) as server,
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            assert completion.get_registry().webhooks_enabled
+            waiter = executor.submit(text3d.poll, "task-12345-abcde")
+
+            response = send_webhook(server.url, webhook_payload_succeeded)
+            result = waiter.result(timeout=5)
+
+        assert response.status_code == 200
+        assert result.id == "task-12345-abcde"
+        assert get.calls == 0
+        assert not completion.get_registry().webhooks_enabled
+
+    def test_rejects_invalid_payload(self, registry):
+        """Malformed payloads are rejected with 400."""
+        with WebhookServer(registry=registry) as server:
+            response = send_webhook(server.url, {"status": "SUCCEEDED"})
+
+        assert response.status_code == 400
+
+    def test_unknown_path(self, registry, webhook_payload_succeeded):
+        """Posts to other paths are not dispatched."""
+        resolved = threading.Event()
+        registry.resolve = lambda payload: resolved.set()
+
+        with WebhookServer(registry=registry) as server:
+            response = send_webhook(server.url.replace("/webhooks/meshy", "/other"), webhook_payload_succeeded)
+
+        assert response.status_code == 404
+        assert not resolved.is_set()
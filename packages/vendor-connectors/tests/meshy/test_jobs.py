@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 
 from unittest.mock import patch
 
@@ -286,6 +288,93 @@ class TestAssetGenerator:
             assert manifests[0].asset_id == "success-001"
 
 
+class TestBatchScheduling:
+    """Tests for concurrent batch generation."""
+
+    @staticmethod
+    def _specs(count):
+        return [
+            AssetSpec(
+                intent=AssetIntent.PROP_DECORATION,
+                description=f"Item {i}",
+                output_path="models/props",
+                asset_id=f"item-{i:03d}",
+            )
+            for i in range(count)
+        ]
+
+    def test_batch_generate_honors_max_concurrent(self, temp_dir):
+        """No more than max_concurrent tasks are polled at once."""
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def poll(task_id, interval):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return Text3DResult(id=task_id, status=TaskStatus.SUCCEEDED, progress=100, created_at=1700000000)
+
+        with (
+            patch("vendor_connectors.meshy.jobs.text3d") as mock_text3d,
+            patch("vendor_connectors.meshy.jobs.base"),
+        ):
+            mock_text3d.create.side_effect = [f"task-{i}" for i in range(8)]
+            mock_text3d.poll.side_effect = poll
+
+            manifests = AssetGenerator(output_root=str(temp_dir)).batch_generate(self._specs(8), max_concurrent=3)
+
+        assert [m.asset_id for m in manifests] == [f"item-{i:03d}" for i in range(8)]
+        assert 1 < peak[0] <= 3
+
+    def test_iter_generate_yields_in_completion_order(self, temp_dir):
+        """Manifests stream back as soon as each asset finishes."""
+        release_slow = threading.Event()
+
+        def poll(task_id, interval):
+            if task_id == "task-0":
+                release_slow.wait(5)
+            return Text3DResult(id=task_id, status=TaskStatus.SUCCEEDED, progress=100, created_at=1700000000)
+
+        with (
+            patch("vendor_connectors.meshy.jobs.text3d") as mock_text3d,
+            patch("vendor_connectors.meshy.jobs.base"),
+        ):
+            mock_text3d.create.side_effect = ["task-0", "task-1"]
+            mock_text3d.poll.side_effect = poll
+
+            results = AssetGenerator(output_root=str(temp_dir)).iter_generate(self._specs(2), max_concurrent=2)
+            first = next(results)
+            release_slow.set()
+            second = next(results)
+
+        assert first.asset_id == "item-001"
+        assert second.asset_id == "item-000"
+
+    def test_batch_generate_skips_failed_polls(self, temp_dir):
+        """Assets whose task fails are left out of the results."""
+
+        def poll(task_id, interval):
+            if task_id == "task-0":
+                msg = "Task failed: bad prompt"
+                raise RuntimeError(msg)
+            return Text3DResult(id=task_id, status=TaskStatus.SUCCEEDED, progress=100, created_at=1700000000)
+
+        with (
+            patch("vendor_connectors.meshy.jobs.text3d") as mock_text3d,
+            patch("vendor_connectors.meshy.jobs.base"),
+        ):
+            mock_text3d.create.side_effect = ["task-0", "task-1"]
+            mock_text3d.poll.side_effect = poll
+
+            manifests = AssetGenerator(output_root=str(temp_dir)).batch_generate(self._specs(2))
+
+        assert [m.asset_id for m in manifests] == ["item-001"]
+
+
 class TestExampleSpecs:
     """Tests for example asset specs."""
 
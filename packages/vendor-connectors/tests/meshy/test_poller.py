@@ -0,0 +1,196 @@
+"""Tests for the shared Meshy task poller."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from unittest.mock import patch
+
+import pytest
+
+from vendor_connectors.meshy import poller, text3d
+from vendor_connectors.meshy.models import RiggingResult, TaskStatus, Text3DResult
+from vendor_connectors.meshy.poller import TaskPoller
+
+
+def _result(task_id, status, progress=0, **kwargs):
+    return Text3DResult(id=task_id, status=status, progress=progress, created_at=1700000000, **kwargs)
+
+
+class _FakeService:
+    """Status function replaying a sequence of results per task."""
+
+    def __init__(self, sequences):
+        self._sequences = {task_id: list(results) for task_id, results in sequences.items()}
+        self.calls: list[str] = []
+        self.threads: set[str] = set()
+
+    def get(self, task_id):
+        self.calls.append(task_id)
+        self.threads.add(threading.current_thread().name)
+        results = self._sequences[task_id]
+        return results.pop(0) if len(results) > 1 else results[0]
+
+
+@pytest.fixture
+def task_poller():
+    """Poller with short intervals for fast tests."""
+    instance = TaskPoller(min_interval=0.001, max_interval=0.02)
+    yield instance
+    instance.close()
+
+
+class TestTaskPoller:
+    """Tests for TaskPoller."""
+
+    def test_many_tasks_share_one_thread(self, task_poller):
+        """Tasks across services resolve from a single polling thread."""
+        service = _FakeService(
+            {
+                f"task-{i}": [
+                    _result(f"task-{i}", TaskStatus.IN_PROGRESS, 50),
+                    _result(f"task-{i}", TaskStatus.SUCCEEDED),
+                ]
+                for i in range(20)
+            }
+        )
+
+        futures = [task_poller.watch(service.get, f"task-{i}", interval=0.001) for i in range(20)]
+        results = [future.result(timeout=5) for future in futures]
+
+        assert [r.id for r in results] == [f"task-{i}" for i in range(20)]
+        assert service.threads == {"meshy-task-poller"}
+        assert len(service.calls) == 40
+
+    def test_watch_same_task_returns_same_future(self, task_poller):
+        """Watching a tracked task does not poll it twice."""
+        release = threading.Event()
+
+        def get(task_id):
+            release.wait(5)
+            return _result(task_id, TaskStatus.SUCCEEDED)
+
+        first = task_poller.watch(get, "task-1")
+        second = task_poller.watch(get, "task-1")
+        release.set()
+
+        assert first is second
+        assert first.result(timeout=5).id == "task-1"
+
+    def test_failed_task(self, task_poller):
+        """Failed tasks fail the future with the reported message."""
+        failed = RiggingResult(
+            id="task-1", status=TaskStatus.FAILED, created_at=1700000000, task_error={"message": "bad prompt"}
+        )
+        service = _FakeService({"task-1": [failed]})
+
+        with pytest.raises(RuntimeError, match="Task failed: bad prompt"):
+            task_poller.watch(service.get, "task-1").result(timeout=5)
+
+    def test_expired_task(self, task_poller):
+        """Expired tasks fail the future."""
+        service = _FakeService({"task-1": [_result("task-1", TaskStatus.EXPIRED)]})
+
+        with pytest.raises(RuntimeError, match="Task expired"):
+            task_poller.watch(service.get, "task-1").result(timeout=5)
+
+    def test_timeout(self, task_poller):
+        """Tasks that never finish time out."""
+        service = _FakeService({"task-1": [_result("task-1", TaskStatus.IN_PROGRESS)]})
+
+        with pytest.raises(TimeoutError):
+            task_poller.watch(service.get, "task-1", interval=0.001, timeout=0.05).result(timeout=5)
+
+    def test_unexpected_result_fails_only_its_task(self, task_poller):
+        """A task whose status cannot be read fails without stopping the poller."""
+        service = _FakeService(
+            {
+                "bad": [object()],
+                "good": [_result("good", TaskStatus.IN_PROGRESS, 50), _result("good", TaskStatus.SUCCEEDED)],
+            }
+        )
+
+        bad = task_poller.watch(service.get, "bad")
+        good = task_poller.watch(service.get, "good", interval=0.001)
+
+        with pytest.raises(AttributeError):
+            bad.result(timeout=5)
+        assert good.result(timeout=5).id == "good"
+
+    def test_restarts_dead_thread(self, task_poller):
+        """Watching restarts the polling thread if it has died."""
+        service = _FakeService({"task-1": [_result("task-1", TaskStatus.SUCCEEDED)]})
+        dead = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+        task_poller._thread = dead
+
+        assert task_poller.watch(service.get, "task-1").result(timeout=5).id == "task-1"
+        assert task_poller._thread is not dead
+
+    def test_close_cancels_pending(self):
+        """Closing the poller cancels futures that have not resolved."""
+        instance = TaskPoller(min_interval=10, max_interval=10)
+        service = _FakeService({"task-1": [_result("task-1", TaskStatus.PENDING)]})
+
+        future = instance.watch(service.get, "task-1", interval=10)
+        instance.close()
+
+        assert future.cancelled()
+        with pytest.raises(RuntimeError, match="closed"):
+            instance.watch(service.get, "task-2")
+
+    async def test_wait_async(self, task_poller):
+        """Async waiters are woken by the poller thread."""
+        service = _FakeService({"task-1": [_result("task-1", TaskStatus.SUCCEEDED)]})
+
+        result = await asyncio.wait_for(task_poller.wait_async(service.get, "task-1"), timeout=5)
+
+        assert result.id == "task-1"
+
+
+class TestAdaptiveInterval:
+    """Tests for progress-driven poll intervals."""
+
+    def test_steady_progress_schedules_near_completion(self):
+        """Steady progress schedules the next poll at half the remaining time."""
+        instance = TaskPoller(min_interval=0.1, max_interval=100)
+        watched = poller._WatchedTask(
+            get=None, task_id="t", future=None, interval=5, min_interval=0.1, timeout=600, deadline=600
+        )
+        watched.progress, watched.progress_at = 20, 0.0
+
+        # 20% -> 60% in 10s: 4%/s, 40% left, so ~10s to go
+        assert instance._next_interval(watched, 60, 10.0) == pytest.approx(5.0)
+
+    def test_stalled_progress_backs_off(self):
+        """No progress grows the interval up to the maximum."""
+        instance = TaskPoller(min_interval=0.1, max_interval=10)
+        watched = poller._WatchedTask(
+            get=None, task_id="t", future=None, interval=4, min_interval=0.1, timeout=600, deadline=600
+        )
+        watched.progress = 30
+
+        assert instance._next_interval(watched, 30, 1.0) == pytest.approx(6.0)
+        watched.interval = 8
+        assert instance._next_interval(watched, 30, 2.0) == 10
+
+
+class TestModulePoll:
+    """Tests for service poll functions using the shared poller."""
+
+    def test_text3d_poll_uses_shared_poller(self):
+        """text3d.poll resolves through the shared poller."""
+        service = _FakeService(
+            {"task-1": [_result("task-1", TaskStatus.IN_PROGRESS, 90), _result("task-1", TaskStatus.SUCCEEDED)]}
+        )
+
+        with patch.object(text3d, "get", service.get):
+            try:
+                result = text3d.poll("task-1", interval=0.01)
+            finally:
+                poller.close()
+
+        assert result.status == TaskStatus.SUCCEEDED
+        assert service.threads == {"meshy-task-poller"}
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import pytest
@@ -326,6 +327,212 @@ class TestTaskLookup:
         assert result is None
 
 
+class TestTaskIndex:
+    """Tests for the task_id index and manifest cache."""
+
+    @staticmethod
+    def _submit(repository, task_id, project="project1", spec_hash="hash-abc"):
+        repository.record_task_submission(
+            TaskSubmission(
+                task_id=task_id,
+                spec_hash=spec_hash,
+                project=project,
+                service="text3d",
+                status=TaskStatus.PENDING,
+                callback_url="https://example.com/webhook",
+            )
+        )
+
+    def test_submission_is_indexed(self, task_repository):
+        """Submissions append index entries."""
+        self._submit(task_repository, "task-1")
+
+        lines = task_repository.task_index_path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"task_id": "task-1", "project": "project1", "spec_hash": "hash-abc"}
+        ]
+
+    def test_lookup_reads_only_indexed_project(self, task_repository):
+        """Lookups load the one manifest the index points at."""
+        for project in ("project1", "project2", "project3"):
+            self._submit(task_repository, f"task-{project}", project=project, spec_hash=f"hash-{project}")
+
+        loaded = []
+        read_manifest = task_repository._read_manifest
+        task_repository._read_manifest = lambda project: loaded.append(project) or read_manifest(project)
+
+        result = task_repository.find_task_by_id("task-project2")
+
+        assert result[:2] == ("project2", "hash-project2")
+        assert loaded == ["project2"]
+
+    def test_existing_manifests_are_indexed(self, temp_dir):
+        """Manifests written before the index existed are indexed on first lookup."""
+        self._submit(TaskRepository(base_path=str(temp_dir)), "task-1")
+        (temp_dir / "task_index.jsonl").unlink()
+
+        result = TaskRepository(base_path=str(temp_dir)).find_task_by_id("task-1")
+
+        assert result[:2] == ("project1", "hash-abc")
+        assert (temp_dir / "task_index.jsonl").exists()
+
+    def test_sees_entries_from_other_writers(self, temp_dir):
+        """Entries appended by another repository instance are picked up."""
+        reader = TaskRepository(base_path=str(temp_dir))
+        assert reader.find_task_by_id("task-1") is None
+
+        self._submit(TaskRepository(base_path=str(temp_dir)), "task-1")
+
+        assert reader.find_task_by_id("task-1")[0] == "project1"
+
+    def test_stale_entry_is_rebuilt(self, task_repository, temp_dir):
+        """An entry pointing at the wrong asset triggers a rebuild."""
+        self._submit(task_repository, "task-1")
+        with open(task_repository.task_index_path, "a") as f:
+            f.write(json.dumps({"task_id": "task-1", "project": "project1", "spec_hash": "gone"}) + "\n")
+
+        fresh = TaskRepository(base_path=str(temp_dir))
+        assert fresh.find_task_by_id("task-1")[:2] == ("project1", "hash-abc")
+
+    def test_unindexed_manifest_is_found(self, task_repository, temp_dir, tmp_path):
+        """A manifest without index entries is found by rebuilding the index on a miss."""
+        self._submit(task_repository, "task-1")
+        assert task_repository.find_task_by_id("task-2") is None
+
+        # Written elsewhere (e.g. by an older version) and copied in without its index entries
+        self._submit(TaskRepository(base_path=str(tmp_path / "other")), "task-2", project="project2")
+        (temp_dir / "project2").mkdir()
+        (temp_dir / "project2" / "manifest.json").write_bytes(
+            (tmp_path / "other" / "project2" / "manifest.json").read_bytes()
+        )
+
+        assert task_repository.find_task_by_id("task-2")[:2] == ("project2", "hash-abc")
+        assert TaskRepository(base_path=str(temp_dir)).find_task_by_id("task-2")[:2] == ("project2", "hash-abc")
+
+    def test_miss_rebuilds_only_after_manifest_changes(self, task_repository):
+        """Repeated misses do not rebuild the index while the manifests are unchanged."""
+        self._submit(task_repository, "task-1")
+        rebuilds = []
+        rebuild = task_repository.rebuild_task_index
+        task_repository.rebuild_task_index = lambda: rebuilds.append(1) or rebuild()
+
+        for _ in range(3):
+            assert task_repository.find_task_by_id("unknown") is None
+        assert len(rebuilds) == 1
+
+        self._submit(task_repository, "task-2")
+        assert task_repository.find_task_by_id("unknown") is None
+        assert len(rebuilds) == 2
+
+    def test_manifest_cache_tracks_file_changes(self, task_repository):
+        """Parsed manifests are reused until the file changes."""
+        self._submit(task_repository, "task-1")
+
+        first = task_repository._read_manifest("project1")
+        assert task_repository._read_manifest("project1") is first
+
+        task_repository.record_task_update("project1", "hash-abc", "task-1", "SUCCEEDED")
+
+        updated = task_repository._read_manifest("project1")
+        assert updated is not first
+        assert updated.asset_specs["hash-abc"].task_graph[0].status == "SUCCEEDED"
+
+    def test_lookup_results_are_copies(self, task_repository):
+        """Mutating a lookup result does not affect later lookups."""
+        self._submit(task_repository, "task-1")
+
+        _, _, asset = task_repository.find_task_by_id("task-1")
+        asset.task_graph.clear()
+
+        assert len(task_repository.find_task_by_id("task-1")[2].task_graph) == 1
+
+
+class TestJournalMode:
+    """Tests for journaled manifest storage."""
+
+    @pytest.fixture
+    def journal_repo(self, temp_dir):
+        """Journal-mode repository with one submitted task."""
+        repository = TaskRepository(base_path=str(temp_dir), journal=True, compact_every=100)
+        TestTaskIndex._submit(repository, "task-1")
+        return repository
+
+    def test_updates_append_to_journal(self, journal_repo, temp_dir):
+        """Updates are appended without rewriting the snapshot."""
+        snapshot = (temp_dir / "project1" / "manifest.json").read_bytes()
+
+        journal_repo.record_task_update("project1", "hash-abc", "task-1", "IN_PROGRESS")
+        journal_repo.record_task_update("project1", "hash-abc", "task-1", "SUCCEEDED", source="webhook")
+
+        assert (temp_dir / "project1" / "manifest.json").read_bytes() == snapshot
+        records = (temp_dir / "project1" / "manifest.journal.jsonl").read_text().splitlines()
+        assert len(records) == 3
+        assert json.loads(records[-1])["task"]["status"] == "SUCCEEDED"
+
+        asset = journal_repo.get_asset_record("project1", "hash-abc")
+        assert asset.task_graph[0].status == "SUCCEEDED"
+        assert [entry.new_status for entry in asset.history] == ["PENDING", "IN_PROGRESS", "SUCCEEDED"]
+
+    def test_other_instances_replay_journal(self, journal_repo, temp_dir):
+        """A fresh repository sees the snapshot plus the journal."""
+        artifact = ArtifactRecord(
+            relative_path="hash-abc_text3d.glb",
+            sha256_hash="abc",
+            file_size_bytes=10,
+            downloaded_at=datetime.now(timezone.utc),
+        )
+        journal_repo.record_task_update("project1", "hash-abc", "task-1", "SUCCEEDED", artifacts=[artifact])
+
+        reader = TaskRepository(base_path=str(temp_dir), journal=True)
+        manifest = reader.load_project_manifest("project1")
+
+        assert manifest.asset_specs["hash-abc"].task_graph[0].status == "SUCCEEDED"
+        assert manifest.asset_specs["hash-abc"].artifacts[0].relative_path == "hash-abc_text3d.glb"
+        assert reader.find_task_by_id("task-1")[:2] == ("project1", "hash-abc")
+
+    def test_compaction(self, temp_dir):
+        """The journal is folded into the snapshot every compact_every records."""
+        repository = TaskRepository(base_path=str(temp_dir), journal=True, compact_every=3)
+        TestTaskIndex._submit(repository, "task-1")
+        repository.record_task_update("project1", "hash-abc", "task-1", "IN_PROGRESS")
+        repository.record_task_update("project1", "hash-abc", "task-1", "SUCCEEDED")
+
+        assert (temp_dir / "project1" / "manifest.journal.jsonl").read_text() == ""
+        snapshot = json.loads((temp_dir / "project1" / "manifest.json").read_text())
+        assert snapshot["journal_seq"] == 3
+        assert snapshot["asset_specs"]["hash-abc"]["task_graph"][0]["status"] == "SUCCEEDED"
+
+        plain = TaskRepository(base_path=str(temp_dir)).get_asset_record("project1", "hash-abc")
+        assert plain.task_graph[0].status == "SUCCEEDED"
+
+    def test_replay_skips_compacted_records(self, journal_repo, temp_dir):
+        """Records left behind by an interrupted compaction are not applied twice."""
+        journal_repo.record_task_update("project1", "hash-abc", "task-1", "SUCCEEDED")
+        journal = (temp_dir / "project1" / "manifest.journal.jsonl").read_bytes()
+
+        journal_repo.compact("project1")
+        (temp_dir / "project1" / "manifest.journal.jsonl").write_bytes(journal)
+
+        asset = TaskRepository(base_path=str(temp_dir), journal=True).get_asset_record("project1", "hash-abc")
+        assert len(asset.history) == 2
+        assert len(asset.task_graph) == 1
+
+    def test_concurrent_writers(self, journal_repo, temp_dir):
+        """Writers in separate repository instances are serialized."""
+        other = TaskRepository(base_path=str(temp_dir), journal=True, compact_every=7)
+
+        def update(i):
+            repository = journal_repo if i % 2 else other
+            repository.record_task_update("project1", "hash-abc", "task-1", f"STEP-{i}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(update, range(40)))
+
+        asset = TaskRepository(base_path=str(temp_dir), journal=True).get_asset_record("project1", "hash-abc")
+        assert len(asset.history) == 41
+        assert {entry.new_status for entry in asset.history[1:]} == {f"STEP-{i}" for i in range(40)}
+
+
 class TestPendingAssets:
     """Tests for listing pending assets."""
 
@@ -304,6 +304,25 @@ class TestListAnimations:
         assert result["count"] == 10
         assert result["total"] == 100
 
+    def test_list_animations_with_query(self):
+        """Test searching animations by free text."""
+        from vendor_connectors.meshy.animations import AnimationMeta
+        from vendor_connectors.meshy.tools import list_animations
+
+        mock_animations = {
+            1: AnimationMeta(1, "Punch", "Fighting", "Punching", "https://example.com/1.gif"),
+            2: AnimationMeta(2, "Sword_Slash", "Fighting", "AttackingwithWeapon", "https://example.com/2.gif"),
+            3: AnimationMeta(3, "Walk", "WalkAndRun", "Walking", "https://example.com/3.gif"),
+        }
+
+        with patch("vendor_connectors.meshy.animations.ANIMATIONS", mock_animations):
+            result = list_animations(query="sword attack", limit=1)
+
+        assert result["count"] == 1
+        assert result["total"] == 1
+        assert result["animations"][0]["name"] == "Sword_Slash"
+        assert result["animations"][0]["score"] > 0
+
 
 class TestCheckTaskStatus:
     """Tests for check_task_status function."""
@@ -0,0 +1,284 @@
+"""Tests for the vector store and embedding engine."""
+
+from __future__ import annotations
+
+import importlib.util
+
+import numpy as np
+import pytest
+
+from vendor_connectors.meshy.persistence import vector_store
+from vendor_connectors.meshy.persistence.vector_store import (
+    EmbeddingCache,
+    GenerationRecord,
+    VectorStore,
+    get_embedding,
+    get_embeddings,
+)
+
+
+class _FakeEncoder:
+    """Deterministic stand-in for a SentenceTransformer that records its batches."""
+
+    def __init__(self, dim=4):
+        self.dim = dim
+        self.batches: list[list[str]] = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True):
+        self.batches.append(list(texts))
+        return np.array([[len(text), *[float(ord(text[0]))] * (self.dim - 1)] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def default_cache(monkeypatch):
+    """Isolate the process-wide embedding cache."""
+    instance = EmbeddingCache()
+    monkeypatch.setattr(vector_store, "_default_cache", instance)
+    return instance
+
+
+@pytest.fixture
+def encoder(monkeypatch):
+    """Register a fake encoder under the model name "fake"."""
+    instance = _FakeEncoder()
+    monkeypatch.setitem(vector_store._encoders, "fake", instance)
+    return instance
+
+
+@pytest.fixture
+def cache():
+    """Fresh in-memory embedding cache."""
+    return EmbeddingCache()
+
+
+class TestGetEmbeddings:
+    """Tests for batched, cached embeddings."""
+
+    def test_encodes_misses_in_one_batch(self, encoder, cache):
+        """Distinct uncached texts are encoded together, duplicates once."""
+        vectors = get_embeddings(["otter", "beaver", "otter"], model="fake", cache=cache)
+
+        assert encoder.batches == [["otter", "beaver"]]
+        assert vectors[0] == vectors[2] == [5.0, 111.0, 111.0, 111.0]
+        assert vectors[1][0] == 6.0
+
+    def test_cached_texts_skip_encoder(self, encoder, cache):
+        """Only texts not seen before reach the encoder."""
+        get_embeddings(["otter"], model="fake", cache=cache)
+        get_embeddings(["otter", "heron"], model="fake", cache=cache)
+
+        assert encoder.batches == [["otter"], ["heron"]]
+
+    def test_cache_keys_include_model(self, encoder, cache, monkeypatch):
+        """The same text embedded by another model is encoded again."""
+        other = _FakeEncoder()
+        monkeypatch.setitem(vector_store._encoders, "other", other)
+
+        get_embeddings(["otter"], model="fake", cache=cache)
+        get_embeddings(["otter"], model="other", cache=cache)
+
+        assert other.batches == [["otter"]]
+
+    def test_lru_eviction(self, encoder):
+        """The least recently used embedding is evicted first."""
+        small = EmbeddingCache(max_size=2)
+        get_embeddings(["a", "b"], model="fake", cache=small)
+        get_embeddings(["a"], model="fake", cache=small)
+        get_embeddings(["c"], model="fake", cache=small)
+
+        assert len(small) == 2
+        get_embeddings(["a", "b"], model="fake", cache=small)
+        assert encoder.batches[-1] == ["b"]
+
+    def test_disk_cache_survives_instances(self, encoder, tmp_path):
+        """Embeddings persisted on disk are reused by a new cache."""
+        first = EmbeddingCache(tmp_path / "embeddings.db")
+        expected = get_embeddings(["otter"], model="fake", cache=first)
+        first.close()
+
+        second = EmbeddingCache(tmp_path / "embeddings.db")
+        assert get_embeddings(["otter"], model="fake", cache=second) == expected
+        assert encoder.batches == [["otter"]]
+        second.close()
+
+    def test_get_embedding_uses_shared_cache(self, encoder):
+        """get_embedding goes through the process-wide encoder and cache."""
+        assert get_embedding("kingfisher", model="fake") == [10.0, 107.0, 107.0, 107.0]
+        assert get_embedding("kingfisher", model="fake") == [10.0, 107.0, 107.0, 107.0]
+        assert encoder.batches == [["kingfisher"]]
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("sentence_transformers") is not None,
+        reason="sentence-transformers is installed",
+    )
+    def test_returns_none_without_sentence_transformers(self, cache):
+        """Without sentence-transformers nothing is embedded."""
+        assert get_embeddings(["otter"], model="missing-model", cache=cache) is None
+
+
+class TestRecordGenerations:
+    """Tests for VectorStore.record_generations."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Vector store in a temporary database."""
+        with VectorStore(tmp_path / "assets.db") as instance:
+            yield instance
+
+    def test_records_batch_in_order(self, store, encoder):
+        """New records are inserted and embedded in one batch."""
+        records = store.record_generations(
+            [
+                GenerationRecord(spec_hash="h1", prompt="otter", project="river"),
+                GenerationRecord(spec_hash="h2", prompt="beaver", metadata={"size": "large"}),
+            ],
+            model="fake",
+        )
+
+        assert [record.spec_hash for record in records] == ["h1", "h2"]
+        assert encoder.batches == [["otter", "beaver"]]
+        assert records[0].embedding == [5.0, 111.0, 111.0, 111.0]
+        assert store.get_by_spec_hash("h1").project == "river"
+        assert store.get_by_spec_hash("h2").metadata == {"size": "large"}
+
+    def test_idempotent_by_spec_hash(self, store, encoder):
+        """Existing and repeated spec hashes return the stored record."""
+        existing = store.record_generation("h1", "otter")
+
+        records = store.record_generations(
+            [
+                GenerationRecord(spec_hash="h1", prompt="ignored"),
+                GenerationRecord(spec_hash="h2", prompt="heron", embedding=[1.0, 2.0, 3.0, 4.0]),
+                GenerationRecord(spec_hash="h2", prompt="heron again"),
+            ],
+            model="fake",
+        )
+
+        assert records[0].id == existing.id
+        assert records[0].prompt == "otter"
+        assert records[1] is records[2]
+        assert records[1].embedding == [1.0, 2.0, 3.0, 4.0]
+        assert encoder.batches == []
+
+    def test_concurrent_insert_while_embedding(self, store, encoder, monkeypatch):
+        """A spec hash recorded by another writer mid-batch is returned, not re-inserted."""
+        encode = encoder.encode
+
+        def encode_and_race(texts, **kwargs):
+            store.record_generation("h2", "heron from elsewhere")
+            return encode(texts, **kwargs)
+
+        monkeypatch.setattr(encoder, "encode", encode_and_race)
+
+        records = store.record_generations(
+            [GenerationRecord(spec_hash="h1", prompt="otter"), GenerationRecord(spec_hash="h2", prompt="heron")],
+            model="fake",
+        )
+
+        assert [record.spec_hash for record in records] == ["h1", "h2"]
+        assert records[1].prompt == "heron from elsewhere"
+        assert store.get_by_spec_hash("h1").prompt == "otter"
+
+    def test_without_embedding(self, store, encoder):
+        """embed=False leaves embeddings empty."""
+        records = store.record_generations([GenerationRecord(spec_hash="h1", prompt="otter")], embed=False)
+
+        assert records[0].embedding is None
+        assert encoder.batches == []
+
+
+@pytest.mark.skipif(vector_store._HAS_VECTOR, reason="sqlite-vec handles similarity search")
+class TestNumpySearch:
+    """Tests for the NumPy similarity search used without sqlite-vec."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Vector store with 3-dimensional embeddings."""
+        with VectorStore(tmp_path / "assets.db", embedding_dim=3) as instance:
+            instance.record_generations(
+                [
+                    GenerationRecord(spec_hash="x", prompt="x axis", project="a", embedding=[1.0, 0.0, 0.0]),
+                    GenerationRecord(spec_hash="xy", prompt="diagonal", project="b", embedding=[1.0, 1.0, 0.0]),
+                    GenerationRecord(spec_hash="y", prompt="y axis", project="a", embedding=[0.0, 2.0, 0.0]),
+                    GenerationRecord(spec_hash="z", prompt="z axis", project="b", embedding=[0.0, 0.0, 1.0]),
+                ],
+                embed=False,
+            )
+            yield instance
+
+    def test_stores_float32_blobs(self, store):
+        """Embeddings are stored as float32 blobs."""
+        row = store._get_conn().execute("SELECT embedding FROM generation_vectors ORDER BY id LIMIT 1").fetchone()
+        assert np.frombuffer(row["embedding"], dtype=np.float32).tolist() == [1.0, 0.0, 0.0]
+
+    def test_ranks_by_cosine_similarity(self, store):
+        """Results are ordered by cosine similarity, highest first."""
+        results = store.search_similar([1.0, 0.1, 0.0], limit=3)
+
+        assert [result.record.spec_hash for result in results] == ["x", "xy", "y"]
+        assert results[0].score == pytest.approx(0.995, abs=1e-3)
+        assert results[0].distance == pytest.approx(1 - results[0].score)
+
+    def test_project_filter(self, store):
+        """Only the requested project is searched."""
+        results = store.search_similar([1.0, 0.1, 0.0], limit=5, project="b")
+
+        assert [result.record.spec_hash for result in results] == ["xy", "z"]
+
+    def test_sees_later_inserts(self, store):
+        """Embeddings recorded after the first search are searchable."""
+        store.search_similar([1.0, 0.0, 0.0], limit=1)
+        store.record_generation("neg-z", "down", project="a", embedding=[0.0, 0.0, -1.0])
+
+        assert store.search_similar([0.0, 0.0, -1.0], limit=1)[0].record.spec_hash == "neg-z"
+
+    def test_ignores_rolled_back_inserts(self, store):
+        """Embeddings from a rolled-back transaction never reach the matrix."""
+        store.search_similar([1.0, 0.0, 0.0], limit=1)
+
+        with pytest.raises(RuntimeError), store._transaction() as conn:
+            store._insert_embeddings(conn, [(999, "a", [0.0, 0.0, -1.0])])
+            raise RuntimeError("abort")
+
+        results = store.search_similar([0.0, 0.0, -1.0], limit=4)
+        assert len(results) == 4
+        assert all(result.record.id != 999 for result in results)
+
+    def test_sees_other_writers(self, store, tmp_path):
+        """Embeddings written through another connection are picked up."""
+        store.search_similar([1.0, 0.0, 0.0], limit=1)
+
+        with VectorStore(tmp_path / "assets.db", embedding_dim=3) as other:
+            other.record_generation("neg-z", "down", project="a", embedding=[0.0, 0.0, -1.0])
+
+        assert store.search_similar([0.0, 0.0, -1.0], limit=1)[0].record.spec_hash == "neg-z"
+
+    def test_checks_database_only_after_other_commits(self, store, tmp_path, monkeypatch):
+        """The stored embeddings are only counted after another connection commits."""
+        checks = []
+        stored_state = store._stored_vectors_state
+        monkeypatch.setattr(store, "_stored_vectors_state", lambda: checks.append(1) or stored_state())
+
+        store.search_similar([1.0, 0.0, 0.0], limit=1)
+        store.record_generation("neg-z", "down", project="a", embedding=[0.0, 0.0, -1.0])
+        store.update_status("x", "completed")
+        store.search_similar([1.0, 0.0, 0.0], limit=1)
+        assert checks == []
+
+        matrix = store._matrix
+        with VectorStore(tmp_path / "assets.db", embedding_dim=3) as other:
+            other.update_status("y", "completed")
+        store.search_similar([1.0, 0.0, 0.0], limit=1)
+        store.search_similar([1.0, 0.0, 0.0], limit=1)
+
+        assert checks == [1]
+        assert store._matrix is matrix
+
+    def test_rejects_wrong_dimension(self, store):
+        """Queries of the wrong dimension return nothing."""
+        assert store.search_similar([1.0, 0.0], limit=3) == []
+
+    def test_reopened_store(self, store, tmp_path):
+        """A new store loads the matrix from the stored blobs."""
+        with VectorStore(tmp_path / "assets.db", embedding_dim=3) as reopened:
+            assert reopened.search_similar([0.0, 0.0, 1.0], limit=1)[0].record.spec_hash == "z"
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 import os
+import time
 
 from unittest.mock import MagicMock, patch
 
@@ -14,9 +16,11 @@ from vendor_connectors.anthropic import (
     AnthropicError,
     ContentBlock,
     Message,
+    MessageBatch,
     MessageRole,
     Model,
     Usage,
+    add_cache_breakpoints,
 )
 
 
@@ -249,3 +253,317 @@ class TestClaudeModels:
             assert isinstance(model_id, str)
             assert isinstance(description, str)
             assert len(description) > 0
+
+
+MESSAGE_PAYLOAD = {
+    "id": "msg_123",
+    "type": "message",
+    "role": "assistant",
+    "content": [{"type": "text", "text": "Hello!"}],
+    "model": "claude-sonnet-4-20250514",
+    "usage": {"input_tokens": 10, "output_tokens": 5},
+}
+
+
+def _json_response(payload, headers=None):
+    """Build a successful httpx response mock."""
+    response = MagicMock()
+    response.status_code = 200
+    response.is_success = True
+    response.json.return_value = payload
+    response.headers = headers or {}
+    return response
+
+
+def _batch_payload(status, results_url=None):
+    """Build a message batch payload."""
+    return {
+        "id": "msgbatch_1",
+        "type": "message_batch",
+        "processing_status": status,
+        "request_counts": {"processing": 0, "succeeded": 2, "errored": 0},
+        "results_url": results_url,
+    }
+
+
+class TestMessageBatches:
+    """Tests for the Message Batches API."""
+
+    def test_create_message_batch(self):
+        """create_message_batch should post custom_id/params entries."""
+        import httpx
+
+        mock_client = MagicMock()
+        mock_client.request.return_value = _json_response(_batch_payload("in_progress"))
+
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            batch = connector.create_message_batch(
+                [
+                    AnthropicConnector.batch_request(
+                        "req-1",
+                        model="claude-sonnet-4-20250514",
+                        max_tokens=64,
+                        messages=[{"role": "user", "content": "Hi"}],
+                    )
+                ]
+            )
+
+            assert isinstance(batch, MessageBatch)
+            assert batch.processing_status == "in_progress"
+            call_args = mock_client.request.call_args
+            assert call_args.args[1].endswith("/v1/messages/batches")
+            entry = call_args.kwargs["json"]["requests"][0]
+            assert entry["custom_id"] == "req-1"
+            assert entry["params"] == {
+                "model": "claude-sonnet-4-20250514",
+                "max_tokens": 64,
+                "messages": [{"role": "user", "content": "Hi"}],
+            }
+
+    def test_create_message_batch_empty(self):
+        """An empty batch should be rejected before any request."""
+        connector = AnthropicConnector(api_key="test-key")
+        with pytest.raises(ValueError, match="at least one request"):
+            connector.create_message_batch([])
+
+    def test_wait_for_message_batch(self):
+        """wait_for_message_batch should poll until processing ends."""
+        import httpx
+
+        mock_client = MagicMock()
+        mock_client.request.side_effect = [
+            _json_response(_batch_payload("in_progress")),
+            _json_response(_batch_payload("ended", "https://api.anthropic.com/v1/messages/batches/msgbatch_1/results")),
+        ]
+
+        with (
+            patch.object(httpx, "Client", return_value=mock_client),
+            patch("vendor_connectors.anthropic.time.sleep") as mock_sleep,
+        ):
+            connector = AnthropicConnector(api_key="test-key")
+            batch = connector.wait_for_message_batch("msgbatch_1", poll_interval=5)
+
+            assert batch.ended
+            assert mock_client.request.call_count == 2
+            mock_sleep.assert_called_once_with(5)
+
+    def test_wait_for_message_batch_timeout(self):
+        """wait_for_message_batch should give up after the timeout."""
+        import httpx
+
+        mock_client = MagicMock()
+        mock_client.request.return_value = _json_response(_batch_payload("in_progress"))
+
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            with pytest.raises(TimeoutError):
+                connector.wait_for_message_batch("msgbatch_1", poll_interval=10, timeout=1)
+
+    def test_iter_message_batch_results(self):
+        """Results should be streamed line by line from the results URL."""
+        import httpx
+
+        lines = [
+            json.dumps({"custom_id": "req-1", "result": {"type": "succeeded", "message": MESSAGE_PAYLOAD}}),
+            "",
+            json.dumps({"custom_id": "req-2", "result": {"type": "errored", "error": {"type": "invalid_request"}}}),
+        ]
+        stream_response = MagicMock()
+        stream_response.is_success = True
+        stream_response.iter_lines.return_value = iter(lines)
+
+        mock_client = MagicMock()
+        mock_client.stream.return_value.__enter__.return_value = stream_response
+
+        results_url = "https://api.anthropic.com/v1/messages/batches/msgbatch_1/results"
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            batch = MessageBatch.model_validate(_batch_payload("ended", results_url))
+            results = list(connector.iter_message_batch_results(batch))
+
+            assert [r.custom_id for r in results] == ["req-1", "req-2"]
+            assert results[0].message.text == "Hello!"
+            assert not results[1].succeeded
+            assert results[1].message is None
+            assert mock_client.stream.call_args.args == ("GET", results_url)
+
+    def test_iter_message_batch_results_not_ended(self):
+        """Results of a batch still processing should not be requested."""
+        connector = AnthropicConnector(api_key="test-key")
+        batch = MessageBatch.model_validate(_batch_payload("in_progress"))
+        with pytest.raises(AnthropicError, match="no results yet"):
+            list(connector.iter_message_batch_results(batch))
+
+
+class TestCreateMessages:
+    """Tests for concurrent message creation."""
+
+    def test_create_messages_preserves_order(self):
+        """Results should come back in request order, with failures inline."""
+        import httpx
+
+        def respond(method, url, **kwargs):
+            if kwargs["json"]["messages"][0]["content"] == "fail":
+                msg = "boom"
+                raise httpx.HTTPError(msg)
+            return _json_response({**MESSAGE_PAYLOAD, "id": kwargs["json"]["messages"][0]["content"]})
+
+        mock_client = MagicMock()
+        mock_client.request.side_effect = respond
+
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            results = connector.create_messages(
+                [
+                    {
+                        "model": "claude-sonnet-4-20250514",
+                        "max_tokens": 16,
+                        "messages": [{"role": "user", "content": c}],
+                    }
+                    for c in ("a", "fail", "c")
+                ],
+                max_concurrency=3,
+            )
+
+            assert results[0].id == "a"
+            assert isinstance(results[1], AnthropicError)
+            assert results[2].id == "c"
+
+    def test_exhausted_rate_limit_waits_for_reset(self):
+        """A response reporting no remaining requests should pause the next one."""
+        import httpx
+
+        reset = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 30))
+        mock_client = MagicMock()
+        mock_client.request.return_value = _json_response(
+            MESSAGE_PAYLOAD,
+            headers={
+                "anthropic-ratelimit-requests-remaining": "0",
+                "anthropic-ratelimit-requests-reset": reset,
+            },
+        )
+
+        with (
+            patch.object(httpx, "Client", return_value=mock_client),
+            patch("vendor_connectors.anthropic.time.sleep") as mock_sleep,
+        ):
+            connector = AnthropicConnector(api_key="test-key")
+            kwargs = {
+                "model": "claude-sonnet-4-20250514",
+                "max_tokens": 16,
+                "messages": [{"role": "user", "content": "Hi"}],
+            }
+            connector.create_message(**kwargs)
+            mock_sleep.assert_not_called()
+
+            connector.create_message(**kwargs)
+            mock_sleep.assert_called_once()
+            assert 0 < mock_sleep.call_args.args[0] <= 31
+
+
+class TestPromptCaching:
+    """Tests for automatic prompt caching breakpoints."""
+
+    def test_long_system_prompt_gets_breakpoint(self):
+        """A long string system prompt becomes a cached text block."""
+        body = {"messages": [], "system": "x" * 5000}
+
+        add_cache_breakpoints(body)
+
+        assert body["system"] == [{"type": "text", "text": "x" * 5000, "cache_control": {"type": "ephemeral"}}]
+
+    def test_short_prefix_unchanged(self):
+        """Prefixes below the cacheable length are left alone."""
+        body = {"messages": [], "system": "Be brief."}
+
+        add_cache_breakpoints(body)
+
+        assert body["system"] == "Be brief."
+
+    def test_long_tools_get_breakpoint_without_mutating_input(self):
+        """The last tool is marked on a copy of the caller's definitions."""
+        tools = [{"name": f"tool_{i}", "description": "d" * 1000, "input_schema": {}} for i in range(5)]
+        body = {"messages": [], "tools": tools, "system": "short"}
+
+        add_cache_breakpoints(body)
+
+        assert body["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in tools[-1]
+        assert body["system"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_explicit_breakpoints_respected(self):
+        """Requests with their own cache_control are not modified."""
+        system = [{"type": "text", "text": "x" * 5000}]
+        messages = [
+            {"role": "user", "content": [{"type": "text", "text": "Hi", "cache_control": {"type": "ephemeral"}}]}
+        ]
+        body = {"messages": messages, "system": system}
+
+        add_cache_breakpoints(body)
+
+        assert body["system"] is system
+
+    def test_create_message_caches_by_default(self):
+        """create_message adds breakpoints unless disabled."""
+        import httpx
+
+        mock_client = MagicMock()
+        mock_client.request.return_value = _json_response(MESSAGE_PAYLOAD)
+        kwargs = {
+            "model": "claude-sonnet-4-20250514",
+            "max_tokens": 16,
+            "messages": [{"role": "user", "content": "Hi"}],
+            "system": "x" * 5000,
+        }
+
+        with patch.object(httpx, "Client", return_value=mock_client):
+            AnthropicConnector(api_key="test-key").create_message(**kwargs)
+            assert isinstance(mock_client.request.call_args.kwargs["json"]["system"], list)
+
+            AnthropicConnector(api_key="test-key", cache_prompts=False).create_message(**kwargs)
+            assert mock_client.request.call_args.kwargs["json"]["system"] == "x" * 5000
+
+
+class TestCountTokensCache:
+    """Tests for count_tokens memoization."""
+
+    def test_identical_content_counted_once(self):
+        """Repeated counts for the same content reuse the first result."""
+        import httpx
+
+        mock_client = MagicMock()
+        mock_client.request.return_value = _json_response({"input_tokens": 42})
+
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            messages = [{"role": "user", "content": "Hi"}]
+
+            assert connector.count_tokens("claude-sonnet-4-20250514", messages, system="sys") == 42
+            assert connector.count_tokens("claude-sonnet-4-20250514", list(messages), system="sys") == 42
+            assert mock_client.request.call_count == 1
+
+            connector.count_tokens("claude-sonnet-4-20250514", messages, system="other")
+            connector.count_tokens("claude-sonnet-4-20250514", messages, system="sys", use_cache=False)
+            assert mock_client.request.call_count == 3
+
+    def test_cache_is_bounded(self):
+        """The least recently used count is evicted once the cache is full."""
+        import httpx
+
+        mock_client = MagicMock()
+        mock_client.request.return_value = _json_response({"input_tokens": 1})
+
+        with (
+            patch.object(httpx, "Client", return_value=mock_client),
+            patch("vendor_connectors.anthropic.TOKEN_COUNT_CACHE_SIZE", 2),
+        ):
+            connector = AnthropicConnector(api_key="test-key")
+            for content in ("a", "b", "a", "c"):
+                connector.count_tokens("claude-sonnet-4-20250514", [{"role": "user", "content": content}])
+            assert mock_client.request.call_count == 3
+
+            connector.count_tokens("claude-sonnet-4-20250514", [{"role": "user", "content": "a"}])
+            assert mock_client.request.call_count == 3
+            connector.count_tokens("claude-sonnet-4-20250514", [{"role": "user", "content": "b"}])
+            assert mock_client.request.call_count == 4
@@ -0,0 +1,185 @@
+"""Tests for streamed Anthropic messages."""
+
+from __future__ import annotations
+
+import json
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from vendor_connectors.anthropic import (
+    AnthropicConnector,
+    AnthropicError,
+    AnthropicRateLimitError,
+    MessageStreamEvent,
+)
+from vendor_connectors.anthropic.streaming import MessageAssembler, iter_sse_events
+
+
+_RealClient = httpx.Client
+_RealAsyncClient = httpx.AsyncClient
+
+
+def _sse(*events):
+    """Encode (event type, data) pairs as a server-sent event stream."""
+    return "".join(f"event: {event_type}\ndata: {json.dumps(data)}\n\n" for event_type, data in events)
+
+
+STREAM_EVENTS = [
+    (
+        "message_start",
+        {
+            "type": "message_start",
+            "message": {
+                "id": "msg_1",
+                "type": "message",
+                "role": "assistant",
+                "content": [],
+                "model": "claude-sonnet-4-20250514",
+                "stop_reason": None,
+                "usage": {"input_tokens": 12, "output_tokens": 1},
+            },
+        },
+    ),
+    ("ping", {"type": "ping"}),
+    ("content_block_start", {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}),
+    (
+        "content_block_delta",
+        {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hello"}},
+    ),
+    (
+        "content_block_delta",
+        {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": " world"}},
+    ),
+    ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+    (
+        "content_block_start",
+        {
+            "type": "content_block_start",
+            "index": 1,
+            "content_block": {"type": "tool_use", "id": "toolu_1", "name": "lookup", "input": {}},
+        },
+    ),
+    (
+        "content_block_delta",
+        {"type": "content_block_delta", "index": 1, "delta": {"type": "input_json_delta", "partial_json": '{"q": '}},
+    ),
+    (
+        "content_block_delta",
+        {"type": "content_block_delta", "index": 1, "delta": {"type": "input_json_delta", "partial_json": '"cats"}'}},
+    ),
+    ("content_block_stop", {"type": "content_block_stop", "index": 1}),
+    (
+        "message_delta",
+        {"type": "message_delta", "delta": {"stop_reason": "tool_use"}, "usage": {"output_tokens": 20}},
+    ),
+    ("message_stop", {"type": "message_stop"}),
+]
+
+MESSAGE_KWARGS = {
+    "model": "claude-sonnet-4-20250514",
+    "max_tokens": 64,
+    "messages": [{"role": "user", "content": "Hi"}],
+}
+
+
+def _handler(body, status_code=200, requests=None):
+    """Build a transport handler that answers with an event stream."""
+
+    def handle(request):
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(status_code, text=body, headers={"content-type": "text/event-stream"})
+
+    return handle
+
+
+class TestSSEParsing:
+    """Tests for server-sent event decoding."""
+
+    def test_multiline_data_and_comments(self):
+        """Data lines are joined and comments ignored."""
+        lines = [": keep-alive", "event: message_delta", 'data: {"type": "message_delta",', 'data: "delta": {}}', ""]
+
+        assert list(iter_sse_events(lines)) == [("message_delta", {"type": "message_delta", "delta": {}})]
+
+    def test_trailing_event_without_blank_line(self):
+        """An event at the very end of the stream is still dispatched."""
+        lines = ['data: {"type": "message_stop"}']
+
+        assert list(iter_sse_events(lines)) == [("message_stop", {"type": "message_stop"})]
+
+
+class TestMessageAssembler:
+    """Tests for assembling streamed events into a Message."""
+
+    def test_assembles_text_and_tool_use(self):
+        """Deltas are exposed and folded into the final message."""
+        assembler = MessageAssembler()
+        events = [assembler.feed(event_type, data) for event_type, data in STREAM_EVENTS]
+        events = [event for event in events if event is not None]
+
+        assert "ping" not in [event.type for event in events]
+        assert [event.text for event in events if event.text] == ["Hello", " world"]
+        assert "".join(event.partial_json for event in events if event.partial_json) == '{"q": "cats"}'
+
+        message = events[-1].message
+        assert message is assembler.message
+        assert message.text == "Hello world"
+        assert message.content[1].input == {"q": "cats"}
+        assert message.stop_reason == "tool_use"
+        assert message.usage.input_tokens == 12
+        assert message.usage.output_tokens == 20
+
+    def test_overloaded_error_event(self):
+        """Overloaded stream errors surface as rate limit errors."""
+        assembler = MessageAssembler()
+
+        with pytest.raises(AnthropicRateLimitError) as exc_info:
+            assembler.feed("error", {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}})
+
+        assert exc_info.value.error_type == "overloaded_error"
+
+
+class TestStreamMessage:
+    """Tests for AnthropicConnector.stream_message."""
+
+    def test_stream_message(self):
+        """Events are streamed and the request asks for a stream."""
+        requests = []
+        transport = httpx.MockTransport(_handler(_sse(*STREAM_EVENTS), requests=requests))
+
+        with patch.object(httpx, "Client", side_effect=lambda **kwargs: _RealClient(transport=transport, **kwargs)):
+            connector = AnthropicConnector(api_key="test-key")
+            events = list(connector.stream_message(**MESSAGE_KWARGS))
+
+        assert all(isinstance(event, MessageStreamEvent) for event in events)
+        assert events[0].type == "message_start"
+        assert events[-1].message.text == "Hello world"
+        assert json.loads(requests[0].content)["stream"] is True
+        assert requests[0].headers["x-api-key"] == "test-key"
+
+    def test_stream_message_http_error(self):
+        """Error responses are raised before any event is yielded."""
+        body = json.dumps({"type": "error", "error": {"type": "invalid_request_error", "message": "bad"}})
+        transport = httpx.MockTransport(_handler(body, status_code=400))
+
+        with patch.object(httpx, "Client", side_effect=lambda **kwargs: _RealClient(transport=transport, **kwargs)):
+            connector = AnthropicConnector(api_key="test-key")
+            with pytest.raises(AnthropicError, match="bad"):
+                list(connector.stream_message(**MESSAGE_KWARGS))
+
+    async def test_astream_message(self):
+        """The async variant yields the same events."""
+        transport = httpx.MockTransport(_handler(_sse(*STREAM_EVENTS)))
+
+        with patch.object(
+            httpx, "AsyncClient", side_effect=lambda **kwargs: _RealAsyncClient(transport=transport, **kwargs)
+        ):
+            connector = AnthropicConnector(api_key="test-key")
+            events = [event async for event in connector.astream_message(**MESSAGE_KWARGS)]
+
+        assert [event.text for event in events if event.text] == ["Hello", " world"]
+        assert events[-1].message.content[1].name == "lookup"
@@ -0,0 +1,292 @@
+"""Tests for streaming, resumable downloads."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from vendor_connectors import downloads
+from vendor_connectors.downloads import (
+    PARTIAL_META_SUFFIX,
+    PARTIAL_SUFFIX,
+    Downloader,
+    DownloadError,
+    file_sha256,
+)
+
+
+PAYLOAD = bytes(range(256)) * 40
+URL = "https://example.com/model.glb"
+ETAG = '"v1"'
+
+
+class _RangeServer:
+    """Mock transport handler serving PAYLOAD with optional Range support."""
+
+    def __init__(self, payload=PAYLOAD, *, etag=ETAG, honor_range=True, truncate_first=0, fail_first=0):
+        self.payload = payload
+        self.etag = etag
+        self.honor_range = honor_range
+        self.truncate_first = truncate_first
+        self.fail_first = fail_first
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail_first:
+            self.fail_first -= 1
+            return httpx.Response(503)
+
+        start = 0
+        range_header = request.headers.get("Range")
+        if_range = request.headers.get("If-Range")
+        if if_range is not None and if_range != self.etag:
+            # Changed since the validator was issued: send the whole file
+            range_header = None
+        if range_header and self.honor_range:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            if start >= len(self.payload):
+                return httpx.Response(416, headers={"Content-Range": f"bytes */{len(self.payload)}"})
+
+        body = self.payload[start:]
+        if range_header and self.honor_range:
+            status = 206
+            headers = {"Content-Range": f"bytes {start}-{len(self.payload) - 1}/{len(self.payload)}"}
+        else:
+            status = 200
+            headers = {"Content-Length": str(len(self.payload))}
+        if self.etag:
+            headers["ETag"] = self.etag
+
+        if self.truncate_first:
+            # Connection drops after half the body
+            self.truncate_first -= 1
+            body = body[: len(body) // 2]
+
+        return httpx.Response(status, headers=headers, content=body)
+
+
+def _write_partial(tmp_path, data, url=URL, validator=ETAG):
+    """Leave a partial model.glb download behind, as an interrupted run would."""
+    (tmp_path / f"model.glb{PARTIAL_SUFFIX}").write_bytes(data)
+    if validator is not None:
+        meta = {"url": url, "validator": validator}
+        (tmp_path / f"model.glb{PARTIAL_SUFFIX}{PARTIAL_META_SUFFIX}").write_text(json.dumps(meta))
+
+
+def _downloader(server, **kwargs):
+    return Downloader(client=httpx.Client(transport=httpx.MockTransport(server)), chunk_size=1000, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    """Skip retry backoff sleeps."""
+    with patch.object(downloads.time, "sleep"):
+        yield
+
+
+class TestDownloader:
+    """Tests for Downloader."""
+
+    def test_streams_to_disk(self, tmp_path):
+        """Files are written in full and the partial file is moved into place."""
+        output = tmp_path / "nested" / "model.glb"
+
+        size = _downloader(_RangeServer()).download("https://example.com/model.glb", str(output))
+
+        assert size == len(PAYLOAD)
+        assert output.read_bytes() == PAYLOAD
+        assert not (tmp_path / "nested" / f"model.glb{PARTIAL_SUFFIX}").exists()
+
+    def test_resumes_partial_file(self, tmp_path):
+        """An existing partial file is continued with a Range request."""
+        output = tmp_path / "model.glb"
+        _write_partial(tmp_path, PAYLOAD[:1500])
+        server = _RangeServer()
+
+        _downloader(server).download(URL, str(output))
+
+        assert server.requests[0].headers["Range"] == "bytes=1500-"
+        assert server.requests[0].headers["If-Range"] == ETAG
+        assert output.read_bytes() == PAYLOAD
+        assert not (tmp_path / f"model.glb{PARTIAL_SUFFIX}{PARTIAL_META_SUFFIX}").exists()
+
+    def test_restarts_changed_artifact(self, tmp_path):
+        """A partial file of an older version is replaced, not extended."""
+        output = tmp_path / "model.glb"
+        _write_partial(tmp_path, b"old version bytes", validator='"v0"')
+
+        _downloader(_RangeServer()).download(URL, str(output))
+
+        assert output.read_bytes() == PAYLOAD
+
+    def test_restarts_partial_from_other_url(self, tmp_path):
+        """A partial file recorded for another URL is not resumed."""
+        output = tmp_path / "model.glb"
+        _write_partial(tmp_path, PAYLOAD[:1500], url="https://example.com/other.glb")
+        server = _RangeServer()
+
+        _downloader(server).download(URL, str(output))
+
+        assert "Range" not in server.requests[0].headers
+        assert output.read_bytes() == PAYLOAD
+
+    def test_restarts_without_validator(self, tmp_path):
+        """Partial files without a recorded validator start over."""
+        output = tmp_path / "model.glb"
+        _write_partial(tmp_path, b"same-length junk", validator=None)
+        server = _RangeServer(etag=None, truncate_first=1)
+
+        _downloader(server).download(URL, str(output))
+
+        # Neither the stale partial nor the truncated first attempt is resumed
+        assert all("Range" not in request.headers for request in server.requests)
+        assert output.read_bytes() == PAYLOAD
+
+    def test_restarts_when_range_ignored(self, tmp_path):
+        """A 200 reply to a Range request replaces the partial file."""
+        output = tmp_path / "model.glb"
+        _write_partial(tmp_path, b"stale bytes")
+
+        _downloader(_RangeServer(honor_range=False)).download("https://example.com/model.glb", str(output))
+
+        assert output.read_bytes() == PAYLOAD
+
+    def test_complete_partial_file(self, tmp_path):
+        """A 416 for a partial file that already holds everything finishes it."""
+        output = tmp_path / "model.glb"
+        _write_partial(tmp_path, PAYLOAD)
+        server = _RangeServer()
+
+        size = _downloader(server).download(URL, str(output))
+
+        assert server.requests[0].headers["Range"] == f"bytes={len(PAYLOAD)}-"
+
+        assert size == len(PAYLOAD)
+        assert output.read_bytes() == PAYLOAD
+
+    def test_resumes_after_truncation(self, tmp_path):
+        """A truncated transfer is resumed from where it stopped."""
+        output = tmp_path / "model.glb"
+        server = _RangeServer(truncate_first=1)
+
+        _downloader(server).download("https://example.com/model.glb", str(output))
+
+        assert len(server.requests) == 2
+        assert server.requests[1].headers["Range"] == f"bytes={len(PAYLOAD) // 2}-"
+        assert output.read_bytes() == PAYLOAD
+
+    def test_retries_server_errors(self, tmp_path):
+        """5xx responses are retried."""
+        output = tmp_path / "model.glb"
+        server = _RangeServer(fail_first=2)
+
+        _downloader(server).download("https://example.com/model.glb", str(output))
+
+        assert len(server.requests) == 3
+        assert output.read_bytes() == PAYLOAD
+
+    def test_gives_up_after_retries(self, tmp_path):
+        """Persistent failures raise DownloadError."""
+        with pytest.raises(DownloadError, match="after 3 attempts"):
+            _downloader(_RangeServer(fail_first=10), retries=2).download(
+                "https://example.com/model.glb", str(tmp_path / "model.glb")
+            )
+
+    def test_client_errors_are_not_retried(self, tmp_path):
+        """4xx responses raise immediately."""
+        requests = []
+
+        def not_found(request):
+            requests.append(request)
+            return httpx.Response(404)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            _downloader(not_found).download("https://example.com/missing.glb", str(tmp_path / "missing.glb"))
+        assert len(requests) == 1
+
+    def test_verifies_checksum(self, tmp_path):
+        """Matching checksums pass; mismatches raise and discard the file."""
+        output = tmp_path / "model.glb"
+        digest = hashlib.sha256(PAYLOAD).hexdigest()
+        downloader = _downloader(_RangeServer())
+
+        assert downloader.download("https://example.com/model.glb", str(output), sha256=digest.upper()) == len(PAYLOAD)
+        assert file_sha256(str(output)) == digest
+
+        with pytest.raises(DownloadError, match="Checksum mismatch"):
+            downloader.download("https://example.com/model.glb", str(tmp_path / "bad.glb"), sha256="0" * 64)
+        assert not (tmp_path / "bad.glb").exists()
+        assert not (tmp_path / f"bad.glb{PARTIAL_SUFFIX}").exists()
+
+    def test_verifies_size(self, tmp_path):
+        """Unexpected sizes raise DownloadError."""
+        with pytest.raises(DownloadError, match="expected 10"):
+            _downloader(_RangeServer()).download(
+                "https://example.com/model.glb", str(tmp_path / "model.glb"), expected_size=10
+            )
+
+    def test_download_many(self, tmp_path):
+        """Batch downloads report sizes and errors per output path."""
+
+        def handler(request):
+            if request.url.path == "/missing.glb":
+                return httpx.Response(404)
+            return httpx.Response(200, content=request.url.path.encode())
+
+        items = [(f"https://example.com/{name}", str(tmp_path / name)) for name in ("a.glb", "b.png", "missing.glb")]
+
+        results = _downloader(handler).download_many(items, max_workers=3)
+
+        assert list(results) == [path for _, path in items]
+        assert results[items[0][1]] == len(b"/a.glb")
+        assert (tmp_path / "b.png").read_bytes() == b"/b.png"
+        assert isinstance(results[items[2][1]], httpx.HTTPStatusError)
+
+    def test_download_many_verifies_items(self, tmp_path):
+        """Per-item sizes and checksums are checked like in download."""
+
+        def handler(request):
+            return httpx.Response(200, content=request.url.path.encode())
+
+        good = str(tmp_path / "a.glb")
+        bad = str(tmp_path / "b.glb")
+        items = [
+            ("https://example.com/a.glb", good, len(b"/a.glb"), hashlib.sha256(b"/a.glb").hexdigest()),
+            ("https://example.com/b.glb", bad, None, "0" * 64),
+        ]
+
+        results = _downloader(handler).download_many(items)
+
+        assert results[good] == len(b"/a.glb")
+        assert isinstance(results[bad], DownloadError)
+        assert not (tmp_path / "b.glb").exists()
+
+    def test_download_many_rejects_duplicate_paths(self, tmp_path):
+        """Two items writing the same file are refused before anything is fetched."""
+        handler = _RangeServer()
+        items = [
+            ("https://example.com/a.glb", str(tmp_path / "model.glb")),
+            ("https://example.com/b.glb", str(tmp_path / "sub" / ".." / "model.glb")),
+        ]
+
+        with pytest.raises(ValueError, match="Duplicate output path"):
+            _downloader(handler).download_many(items)
+
+        assert handler.requests == []
+
+    def test_closes_own_client_only(self):
+        """Injected clients are left open."""
+        client = httpx.Client(transport=httpx.MockTransport(_RangeServer()))
+        Downloader(client=client).close()
+        assert not client.is_closed
+
+        downloader = Downloader()
+        owned = downloader.client
+        downloader.close()
+        assert owned.is_closed
@@ -28,6 +28,11 @@ class _ImmediateResponse:
 class _StubProjectsAPI:
     def __init__(self):
         self.update_calls: list[dict[str, Any]] = []
+        self.get_calls: list[str] = []
+
+    def getBillingInfo(self, name: str):
+        self.get_calls.append(name)
+        return _ImmediateResponse({"name": name, "billingAccountName": "billingAccounts/OLD"})
 
     def updateBillingInfo(self, name: str, body: dict[str, Any]):
         self.update_calls.append({"name": name, "body": body})
@@ -167,3 +172,26 @@ def test_list_billing_account_projects_handles_prefixing():
         {"name": "billingAccounts/123456-AAAA"},
         {"name": "billingAccounts/123456-AAAA", "pageToken": "p1"},
     ]
+
+
+def test_get_project_billing_info_uses_cache():
+    service = _StubBillingService(account_responses=[], project_responses=[])
+    connector = _TestGoogleBilling(service)
+
+    connector.get_project_billing_info("demo-project")
+    cached = connector.get_project_billing_info("demo-project", use_cache=True)
+
+    assert cached["billingAccountName"] == "billingAccounts/OLD"
+    assert service.projects().get_calls == ["projects/demo-project"]
+
+
+def test_update_project_billing_info_refreshes_cache():
+    service = _StubBillingService(account_responses=[], project_responses=[])
+    connector = _TestGoogleBilling(service)
+
+    connector.get_project_billing_info("demo-project")
+    connector.update_project_billing_info("demo-project", "1234-ABCD")
+
+    cached = connector.get_project_billing_info("demo-project", use_cache=True)
+    assert cached["billingAccountName"] == "billingAccounts/1234-ABCD"
+    assert len(service.projects().get_calls) == 1
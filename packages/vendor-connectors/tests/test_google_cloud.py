@@ -260,6 +260,101 @@ class TestIAM:
 
         assert result["bindings"][0]["role"] == "roles/viewer"
 
+    @pytest.fixture
+    def iam_service(self, google_connector):
+        """Resource Manager service whose setIamPolicy echoes the policy with a new etag."""
+        mock_service = MagicMock()
+        mock_projects = mock_service.projects.return_value
+        mock_projects.getIamPolicy.return_value.execute.side_effect = lambda: {
+            "bindings": [{"role": "roles/owner", "members": ["user:owner@example.com"]}],
+            "etag": "etag-0",
+        }
+
+        def set_iam_policy(resource, body):
+            request = MagicMock()
+            request.execute.return_value = {**body["policy"], "etag": f"{body['policy']['etag']}+"}
+            return request
+
+        mock_projects.setIamPolicy.side_effect = set_iam_policy
+        google_connector.get_cloud_resource_manager_service = MagicMock(return_value=mock_service)
+        return mock_projects
+
+    def test_get_iam_policy_cache(self, google_connector, iam_service):
+        """Test cached policy reads skip the API."""
+        google_connector.get_iam_policy("test-project")
+        cached = google_connector.get_iam_policy("test-project", use_cache=True)
+        cached["bindings"].clear()
+
+        assert iam_service.getIamPolicy.call_count == 1
+        assert google_connector.get_iam_policy("test-project", use_cache=True)["bindings"]
+
+    def test_add_iam_binding_reuses_written_policy(self, google_connector, iam_service):
+        """Test repeated bindings read once and write with the latest etag."""
+        google_connector.add_iam_binding("test-project", "roles/viewer", "user:a@example.com")
+        result = google_connector.add_iam_binding("test-project", "roles/viewer", "user:b@example.com")
+
+        assert iam_service.getIamPolicy.call_count == 1
+        assert iam_service.setIamPolicy.call_args.kwargs["body"]["policy"]["etag"] == "etag-0+"
+        viewer = next(b for b in result["bindings"] if b["role"] == "roles/viewer")
+        assert viewer["members"] == ["user:a@example.com", "user:b@example.com"]
+
+    def test_modify_iam_bindings_single_write(self, google_connector, iam_service):
+        """Test many changes to one resource are applied in one write."""
+        result = google_connector.modify_iam_bindings(
+            "test-project",
+            add=[("roles/viewer", "user:a@example.com"), ("roles/editor", "group:eng@example.com")],
+            remove=[("roles/owner", "user:owner@example.com")],
+        )
+
+        assert iam_service.setIamPolicy.call_count == 1
+        assert {b["role"] for b in result["bindings"]} == {"roles/viewer", "roles/editor"}
+
+    def test_modify_iam_bindings_retries_on_conflict(self, google_connector, iam_service):
+        """Test a stale etag triggers a refetch and a second write."""
+        from googleapiclient.errors import HttpError
+
+        conflict = MagicMock()
+        conflict.status = 409
+        conflict_request = MagicMock()
+        conflict_request.execute.side_effect = HttpError(conflict, b"Conflict")
+        echo = iam_service.setIamPolicy.side_effect
+        attempts = []
+
+        def set_iam_policy(resource, body):
+            attempts.append(body)
+            return conflict_request if len(attempts) == 1 else echo(resource, body)
+
+        iam_service.setIamPolicy.side_effect = set_iam_policy
+
+        result = google_connector.modify_iam_bindings("test-project", add=[("roles/viewer", "user:a@example.com")])
+
+        assert iam_service.getIamPolicy.call_count == 2
+        assert iam_service.setIamPolicy.call_count == 2
+        assert any(b["role"] == "roles/viewer" for b in result["bindings"])
+
+    def test_modify_iam_bindings_confirms_noop_against_live_policy(self, google_connector, iam_service):
+        """Test a no-op against the cache is confirmed with a fresh read before skipping the write."""
+        google_connector.get_iam_policy("test-project")
+
+        google_connector.modify_iam_bindings("test-project", add=[("roles/owner", "user:owner@example.com")])
+
+        assert iam_service.getIamPolicy.call_count == 2
+        iam_service.setIamPolicy.assert_not_called()
+
+    def test_bulk_add_iam_bindings(self, google_connector, iam_service):
+        """Test bulk bindings take one read and one write per resource."""
+        result = google_connector.bulk_add_iam_bindings(
+            [
+                ("project-a", "roles/viewer", "user:a@example.com"),
+                ("project-b", "roles/viewer", "user:a@example.com"),
+                ("project-a", "roles/editor", "user:b@example.com"),
+            ]
+        )
+
+        assert set(result) == {"project-a", "project-b"}
+        assert iam_service.getIamPolicy.call_count == 2
+        assert iam_service.setIamPolicy.call_count == 2
+
     def test_list_service_accounts(self, google_connector):
         """Test listing service accounts."""
         mock_service = MagicMock()
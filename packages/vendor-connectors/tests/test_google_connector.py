@@ -229,6 +229,35 @@ class TestGoogleConnector:
         assert "team@example.com" in result
         assert result["team@example.com"]["primaryEmail"] == "team@example.com"
 
+    @patch.object(GoogleConnector, "get_admin_directory_service")
+    def test_list_users_pushes_filters_to_query(self, mock_get_service, base_connector_kwargs):
+        """Ensure suspension and a single allowed OU are pushed into the Directory query."""
+        mock_users = mock_get_service.return_value.users.return_value
+        mock_users.list.return_value.execute.return_value = {
+            "users": [
+                {"primaryEmail": "eng@example.com", "orgUnitPath": "/Engineering"},
+                {"primaryEmail": "child@example.com", "orgUnitPath": "/Engineering/Platform"},
+            ]
+        }
+
+        connector = GoogleConnector(service_account_info=_service_account(), **base_connector_kwargs)
+        result = connector.list_users(ou_allow_list="Engineering")
+
+        assert mock_users.list.call_args.kwargs["query"] == "isSuspended=false orgUnitPath='/Engineering'"
+        # orgUnitPath queries also match child OUs, so the exact match is still applied locally
+        assert [user["primaryEmail"] for user in result] == ["eng@example.com"]
+
+    @patch.object(GoogleConnector, "get_admin_directory_service")
+    def test_list_users_skips_query_when_unfiltered(self, mock_get_service, base_connector_kwargs):
+        """Ensure no query is sent when nothing can be pushed down."""
+        mock_users = mock_get_service.return_value.users.return_value
+        mock_users.list.return_value.execute.return_value = {"users": []}
+
+        connector = GoogleConnector(service_account_info=_service_account(), **base_connector_kwargs)
+        connector.list_users(ou_allow_list=["/A", "/B"], include_suspended=True)
+
+        assert "query" not in mock_users.list.call_args.kwargs
+
     def test_specialized_connector_exports_match_available_operations(self, base_connector_kwargs):
         """Specialized Google connectors expose the operations their entry points advertise."""
         service_account = _service_account()
@@ -245,3 +274,21 @@ class TestGoogleConnector:
         assert hasattr(full, "list_projects")
         assert hasattr(full, "list_users")
         assert hasattr(full, "list_billing_accounts")
+
+
+def test_get_service_with_custom_scopes_is_cached():
+    """Services built with custom scopes are cached separately."""
+    with (
+        patch("vendor_connectors.google.service_account.Credentials.from_service_account_info") as from_info,
+        patch("vendor_connectors.google.build") as build,
+    ):
+        connector = GoogleConnector(service_account_info=_service_account())
+
+        first = connector.get_licensing_service(subject="admin@example.com")
+        second = connector.get_licensing_service(subject="admin@example.com")
+
+        assert first is second
+        build.assert_called_once()
+        from_info.assert_called_once()
+        assert from_info.call_args.kwargs["scopes"] == ["https://www.googleapis.com/auth/apps.licensing"]
+        from_info.return_value.with_subject.assert_called_once_with("admin@example.com")
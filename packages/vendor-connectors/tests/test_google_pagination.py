@@ -0,0 +1,130 @@
+"""Tests for lazy Google API pagination."""
+
+from __future__ import annotations
+
+from itertools import islice
+from unittest.mock import MagicMock
+
+from vendor_connectors.google.pagination import iter_items, project_fields
+
+
+def _paged_method(pages):
+    """Build a list method mock that returns the given pages in order."""
+    method = MagicMock()
+    method.return_value.http = MagicMock(spec=[])
+    method.return_value.execute.side_effect = pages
+    return method
+
+
+class TestProjectFields:
+    """Tests for partial-response selectors."""
+
+    def test_project_fields(self):
+        """Test item fields are nested under the items path."""
+        assert project_fields("users", "primaryEmail,name") == "nextPageToken,users(primaryEmail,name)"
+
+    def test_project_fields_none(self):
+        """Test no selector is built without fields."""
+        assert project_fields("users", None) is None
+
+
+class TestIterItems:
+    """Tests for iter_items."""
+
+    def test_iterates_all_pages(self):
+        """Test items from every page are yielded in order, without unset params."""
+        method = _paged_method(
+            [
+                {"users": [{"id": 1}, {"id": 2}], "nextPageToken": "t1"},
+                {"users": [{"id": 3}]},
+            ]
+        )
+
+        result = list(iter_items(method, "users", customer="my_customer", domain=None, query=""))
+
+        assert [u["id"] for u in result] == [1, 2, 3]
+        assert method.call_args_list[0].kwargs == {"customer": "my_customer"}
+        assert method.call_args_list[1].kwargs == {"customer": "my_customer", "pageToken": "t1"}
+
+    def test_is_lazy(self):
+        """Test pages are only requested as items are consumed."""
+        method = _paged_method(
+            [
+                {"users": [{"id": 1}, {"id": 2}], "nextPageToken": "t1"},
+                {"users": [{"id": 3}]},
+            ]
+        )
+
+        result = list(islice(iter_items(method, "users"), 2))
+
+        assert len(result) == 2
+        assert method.return_value.execute.call_count == 1
+
+    def test_fields_keep_page_token(self):
+        """Test partial-response selectors always keep the page token."""
+        method = _paged_method([{"items": []}])
+
+        list(iter_items(method, "items", fields="items(name)"))
+
+        assert method.call_args.kwargs["fields"] == "nextPageToken,items(name)"
+
+    def test_extract(self):
+        """Test custom extraction for nested responses."""
+        method = _paged_method([{"items": {"a": {"instances": [{"id": 1}]}, "b": {}}}])
+
+        result = list(
+            iter_items(
+                method,
+                "items",
+                extract=lambda r: [i for zone in r["items"].values() for i in zone.get("instances", [])],
+            )
+        )
+
+        assert result == [{"id": 1}]
+
+    def test_prefetch(self):
+        """Test prefetching yields the same items across pages."""
+        method = _paged_method(
+            [
+                {"users": [{"id": 1}], "nextPageToken": "t1"},
+                {"users": [{"id": 2}], "nextPageToken": "t2"},
+                {"users": [{"id": 3}]},
+            ]
+        )
+
+        result = list(iter_items(method, "users", prefetch=True))
+
+        assert [u["id"] for u in result] == [1, 2, 3]
+        assert method.return_value.execute.call_count == 3
+
+    def test_prefetch_without_credentials_is_synchronous(self):
+        """Test pages are fetched on the caller's thread when no private transport can be built."""
+        method = _paged_method(
+            [
+                {"users": [{"id": 1}], "nextPageToken": "t1"},
+                {"users": [{"id": 2}]},
+            ]
+        )
+
+        items = iter_items(method, "users", prefetch=True)
+        next(items)
+
+        assert method.return_value.execute.call_count == 1
+        assert [u["id"] for u in items] == [2]
+        assert all(call.kwargs == {} for call in method.return_value.execute.call_args_list)
+
+    def test_prefetch_uses_private_transport(self):
+        """Test background fetches do not share the caller's transport."""
+        method = MagicMock()
+        method.return_value.http.credentials = MagicMock()
+        method.return_value.execute.side_effect = [
+            {"users": [{"id": 1}], "nextPageToken": "t1"},
+            {"users": [{"id": 2}]},
+        ]
+
+        result = list(iter_items(method, "users", prefetch=True))
+
+        assert [u["id"] for u in result] == [1, 2]
+        first_call, second_call = method.return_value.execute.call_args_list
+        assert first_call.kwargs == {}
+        assert second_call.kwargs["http"] is not None
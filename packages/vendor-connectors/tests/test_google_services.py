@@ -284,3 +284,123 @@ class TestCloudKMS:
         result = google_connector.create_kms_key("test-project", "us", "kr1", "new-key")
 
         assert "new-key" in result["name"]
+
+
+def _http_error(status):
+    """Build an HttpError with the given status code."""
+    from googleapiclient.errors import HttpError
+
+    mock_resp = MagicMock()
+    mock_resp.status = status
+    return HttpError(mock_resp, b"error")
+
+
+class TestProjectResources:
+    """Tests for project resource probes and sweeps."""
+
+    @pytest.fixture
+    def probed_connector(self, google_connector):
+        """Connector whose services report resources only in 'busy-project'."""
+        compute = MagicMock()
+        compute.instances.return_value.aggregatedList.return_value.execute.return_value = {"items": {}}
+        google_connector.get_compute_service = MagicMock(return_value=compute)
+
+        gke = MagicMock()
+        gke.projects.return_value.locations.return_value.clusters.return_value.list.return_value.execute.return_value = {}
+        google_connector.get_container_service = MagicMock(return_value=gke)
+
+        storage = MagicMock()
+
+        def list_buckets(project, maxResults):
+            request = MagicMock()
+            request.execute.return_value = {"items": [{"name": "b"}]} if project == "busy-project" else {}
+            return request
+
+        storage.buckets.return_value.list.side_effect = list_buckets
+        google_connector.get_storage_service = MagicMock(return_value=storage)
+
+        sql = MagicMock()
+        sql.instances.return_value.list.return_value.execute.side_effect = _http_error(403)
+        google_connector.get_sqladmin_service = MagicMock(return_value=sql)
+
+        pubsub = MagicMock()
+        pubsub.projects.return_value.topics.return_value.list.return_value.execute.return_value = {}
+        google_connector.get_pubsub_service = MagicMock(return_value=pubsub)
+
+        return google_connector
+
+    def test_probe_requests_single_item_page(self, probed_connector):
+        """Test probes request one item and stop at the first hit."""
+        assert probed_connector.project_has_resources("busy-project", "storage") is True
+
+        storage = probed_connector.get_storage_service.return_value
+        storage.buckets.return_value.list.assert_called_once_with(project="busy-project", maxResults=1)
+
+    def test_probe_compute_stops_at_first_hit(self, probed_connector):
+        """Test the compute probe pages only until an instance is found."""
+        compute = probed_connector.get_compute_service.return_value
+        compute.instances.return_value.aggregatedList.return_value.execute.side_effect = [
+            {"items": {"zones/a": {"warning": {}}}, "nextPageToken": "t1"},
+            {"items": {"zones/b": {"instances": [{"name": "vm"}]}}, "nextPageToken": "t2"},
+        ]
+
+        assert probed_connector.project_has_resources("p", "compute") is True
+        assert compute.instances.return_value.aggregatedList.return_value.execute.call_count == 2
+
+    def test_probe_caches_403(self, probed_connector):
+        """Test a denied API is cached per project and treated as empty."""
+        sql = probed_connector.get_sqladmin_service.return_value
+
+        assert probed_connector.project_has_resources("p", "sql") is False
+        assert probed_connector.project_has_resources("p", "sql") is False
+        assert sql.instances.return_value.list.call_count == 1
+
+    def test_probe_unknown_resource_type(self, probed_connector):
+        """Test unknown resource types are rejected."""
+        with pytest.raises(ValueError, match="Unknown resource type"):
+            probed_connector.project_has_resources("p", "spanner")
+
+    def test_is_project_empty_continues_after_403(self, probed_connector):
+        """Test a 403 on one API does not skip the remaining checks."""
+        probed_connector.get_sqladmin_service.return_value.instances.return_value.list.return_value.execute.side_effect = None
+        probed_connector.get_compute_service.return_value.instances.return_value.aggregatedList.return_value.execute.side_effect = _http_error(
+            403
+        )
+
+        assert probed_connector.is_project_empty("busy-project") is False
+
+    def test_is_project_empty(self, probed_connector):
+        """Test a project with no resources is reported empty."""
+        assert probed_connector.is_project_empty("idle-project") is True
+
+    def test_sweep_empty_projects(self, probed_connector):
+        """Test the concurrent sweep reports emptiness per project."""
+        result = probed_connector.sweep_empty_projects(["busy-project", "idle-project"], max_workers=4)
+
+        assert result == {"busy-project": False, "idle-project": True}
+
+    def test_sweep_propagates_errors(self, probed_connector):
+        """Test non-403 errors abort the sweep."""
+        gke = probed_connector.get_container_service.return_value
+        gke.projects.return_value.locations.return_value.clusters.return_value.list.return_value.execute.side_effect = (
+            _http_error(500)
+        )
+
+        with pytest.raises(Exception, match="error"):
+            probed_connector.sweep_empty_projects(["idle-project"], max_workers=2)
+
+    def test_find_inactive_projects(self, probed_connector):
+        """Test inactive projects combine lifecycle state and resource sweeps."""
+        projects = {
+            "busy-project": {"projectId": "busy-project", "lifecycleState": "ACTIVE"},
+            "idle-project": {"projectId": "idle-project", "lifecycleState": "ACTIVE"},
+            "doomed-project": {"projectId": "doomed-project", "lifecycleState": "DELETE_REQUESTED"},
+        }
+
+        result = probed_connector.find_inactive_projects(projects=projects, max_workers=4)
+
+        reasons = {p["projectId"]: p["inactive_reason"] for p in result}
+        assert reasons == {
+            "doomed-project": "lifecycle_state=DELETE_REQUESTED",
+            "idle-project": "no_resources",
+        }
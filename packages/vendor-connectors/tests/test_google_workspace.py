@@ -300,3 +300,136 @@ class TestWorkspaceOrgUnits:
 
         assert len(result) == 2
         assert result[0]["name"] == "Engineering"
+
+
+class _StubBatch:
+    """Batch request stub that executes each queued request in turn."""
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self._requests:
+            try:
+                response = request.execute()
+            except Exception as e:
+                self._callback(request_id, None, e)
+            else:
+                self._callback(request_id, response, None)
+
+
+class TestWorkspaceLicenses:
+    """Tests for Workspace license operations."""
+
+    @pytest.fixture
+    def licensing_service(self, google_connector):
+        """Licensing service whose products return canned pages or errors."""
+        from googleapiclient.errors import HttpError
+
+        not_found = MagicMock()
+        not_found.status = 404
+        pages = {
+            ("Google-Apps", None): {"items": [{"skuId": "a1"}], "nextPageToken": "next"},
+            ("Google-Apps", "next"): {"items": [{"skuId": "a2"}]},
+            ("Google-Vault", None): {"items": [{"skuId": "v1"}]},
+        }
+
+        def list_for_product(productId, customerId, pageToken=None):
+            request = MagicMock()
+            if (productId, pageToken) in pages:
+                request.execute.return_value = pages[(productId, pageToken)]
+            else:
+                request.execute.side_effect = HttpError(not_found, b"Not found")
+            return request
+
+        service = MagicMock()
+        service.new_batch_http_request.side_effect = _StubBatch
+        service.licenseAssignments.return_value.listForProduct.side_effect = list_for_product
+        google_connector.get_licensing_service = MagicMock(return_value=service)
+        return service
+
+    def test_list_available_licenses(self, google_connector, licensing_service):
+        """Test products are paged together in batched rounds."""
+        result = google_connector.list_available_licenses()
+
+        assert sorted((lic["productId"], lic["skuId"]) for lic in result) == [
+            ("Google-Apps", "a1"),
+            ("Google-Apps", "a2"),
+            ("Google-Vault", "v1"),
+        ]
+        # One round for every product, a second round only for the paged product
+        assert licensing_service.new_batch_http_request.call_count == 2
+        assert licensing_service.licenseAssignments.return_value.listForProduct.call_count == 7
+
+    def test_unavailable_products_cached_per_customer(self, google_connector, licensing_service):
+        """Test 404 products are skipped on later calls for the same customer."""
+        google_connector.list_available_licenses()
+        list_for_product = licensing_service.licenseAssignments.return_value.listForProduct
+        list_for_product.reset_mock()
+
+        google_connector.list_available_licenses()
+
+        requested = {call.kwargs["productId"] for call in list_for_product.call_args_list}
+        assert requested == {"Google-Apps", "Google-Vault"}
+
+        list_for_product.reset_mock()
+        google_connector.list_available_licenses(customer_id="C0other")
+
+        assert len({call.kwargs["productId"] for call in list_for_product.call_args_list}) == 6
+
+    def test_forbidden_products_retried(self, google_connector, licensing_service):
+        """Test 403 products are skipped for the call but asked again next time."""
+        from googleapiclient.errors import HttpError
+
+        forbidden = MagicMock()
+        forbidden.status = 403
+        list_for_product = licensing_service.licenseAssignments.return_value.listForProduct
+        list_for_product.side_effect = lambda **kwargs: MagicMock(
+            execute=MagicMock(side_effect=HttpError(forbidden, b"Forbidden"))
+        )
+
+        assert google_connector.list_available_licenses(product_id="Google-Vault") == []
+        assert google_connector.list_available_licenses(product_id="Google-Vault") == []
+        assert list_for_product.call_count == 2
+
+    def test_get_license_summary(self, google_connector, licensing_service):
+        """Test license summary counts assignments by product and SKU."""
+        result = google_connector.get_license_summary()
+
+        assert result == {
+            "Google-Apps/a1": {"assigned": 1},
+            "Google-Apps/a2": {"assigned": 1},
+            "Google-Vault/v1": {"assigned": 1},
+        }
+
+
+class TestWorkspaceLazyListing:
+    """Tests for lazy Workspace iteration."""
+
+    def test_iter_users_projects_fields(self, google_connector):
+        """Test iter_users requests only the selected user fields."""
+        mock_service = MagicMock()
+        mock_users = mock_service.users.return_value
+        mock_users.list.return_value.execute.return_value = {"users": [{"primaryEmail": "user1@example.com"}]}
+        google_connector.get_admin_directory_service = MagicMock(return_value=mock_service)
+
+        result = list(google_connector.iter_users(fields="primaryEmail"))
+
+        assert result == [{"primaryEmail": "user1@example.com"}]
+        assert mock_users.list.call_args.kwargs["fields"] == "nextPageToken,users(primaryEmail)"
+
+    def test_iter_group_members_roles(self, google_connector):
+        """Test iter_group_members joins the role filter."""
+        mock_service = MagicMock()
+        mock_members = mock_service.members.return_value
+        mock_members.list.return_value.execute.return_value = {"members": [{"email": "a@example.com"}]}
+        google_connector.get_admin_directory_service = MagicMock(return_value=mock_service)
+
+        result = list(google_connector.iter_group_members("group@example.com", roles=["OWNER", "MANAGER"]))
+
+        assert len(result) == 1
+        assert mock_members.list.call_args.kwargs == {"groupKey": "group@example.com", "roles": "OWNER,MANAGER"}
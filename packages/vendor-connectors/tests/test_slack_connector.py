@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from itertools import islice
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from slack_sdk.errors import SlackApiError
+
 from vendor_connectors.slack import SlackConnector
 
 
@@ -55,20 +60,61 @@ class TestSlackConnector:
         assert ts == "1234567890.123456"
         mock_bot_client.chat_postMessage.assert_called_once()
 
-    @patch("vendor_connectors.slack.SlackConnector._call_api")
+    @patch("vendor_connectors.slack.WebClient")
+    def test_send_message_reuses_bot_channels(self, mock_webclient_class, base_connector_kwargs):
+        """Test repeated sends list the bot's channels once."""
+        mock_bot_client = MagicMock()
+        mock_bot_client.users_conversations.return_value = {"channels": [{"name": "general", "id": "C12345"}]}
+        mock_bot_client.chat_postMessage.return_value = {"ts": "1234567890.123456"}
+        mock_webclient_class.side_effect = [MagicMock(), mock_bot_client]
+
+        connector = SlackConnector(token="test-token", bot_token="bot-token", **base_connector_kwargs)
+
+        for _ in range(3):
+            connector.send_message(channel_name="general", text="Test message")
+
+        assert mock_bot_client.users_conversations.call_count == 1
+        assert mock_bot_client.chat_postMessage.call_count == 3
+
+    @patch("vendor_connectors.slack.sleep")
+    @patch("vendor_connectors.slack.WebClient")
+    def test_send_message_refreshes_bot_channels(self, mock_webclient_class, mock_sleep, base_connector_kwargs):
+        """Test a channel missing from the cached memberships triggers one refresh."""
+        mock_bot_client = MagicMock()
+        mock_bot_client.users_conversations.side_effect = [
+            {"channels": [{"name": "general", "id": "C12345"}]},
+            {"channels": [{"name": "general", "id": "C12345"}, {"name": "new", "id": "C67890"}]},
+            {"channels": [{"name": "general", "id": "C12345"}, {"name": "new", "id": "C67890"}]},
+        ]
+        mock_bot_client.chat_postMessage.return_value = {"ts": "1234567890.123456"}
+        mock_webclient_class.side_effect = [MagicMock(), mock_bot_client]
+
+        connector = SlackConnector(token="test-token", bot_token="bot-token", **base_connector_kwargs)
+        connector.get_bot_channels()
+
+        connector.send_message(channel_name="new", text="Test message")
+        with pytest.raises(RuntimeError, match="Bot not in channel missing"):
+            connector.send_message(channel_name="missing", text="Test message")
+
+        assert mock_bot_client.chat_postMessage.call_args.kwargs["channel"] == "C67890"
+        assert mock_bot_client.users_conversations.call_count == 3
+
+    @patch("vendor_connectors.slack.SlackConnector._iter_api")
     @patch("vendor_connectors.slack.WebClient")
     def test_list_users_filters_deleted(
         self,
         mock_webclient_class,
-        mock_call_api,
+        mock_iter_api,
         base_connector_kwargs,
     ):
         """Ensure list_users filters deleted and bot accounts."""
-        mock_call_api.return_value = {
-            "U1": {"id": "U1", "deleted": False, "is_bot": False, "is_app_user": False},
-            "U2": {"id": "U2", "deleted": True, "is_bot": False, "is_app_user": False},
-            "U3": {"id": "U3", "deleted": False, "is_bot": True, "is_app_user": False},
-        }
+        mock_iter_api.return_value = iter(
+            [
+                {"id": "U1", "deleted": False, "is_bot": False, "is_app_user": False},
+                {"id": "U2", "deleted": True, "is_bot": False, "is_app_user": False},
+                {"id": "U3", "deleted": False, "is_bot": True, "is_app_user": False},
+            ]
+        )
 
         mock_user_client = MagicMock()
         mock_bot_client = MagicMock()
@@ -86,27 +132,25 @@ class TestSlackConnector:
         )
 
         assert list(users.keys()) == ["U1"]
-        mock_call_api.assert_called_once_with(
+        mock_iter_api.assert_called_once_with(
             "users_list",
-            group_by="members",
+            "members",
+            prefetch=False,
             include_locale=True,
             limit=200,
             team_id="T123",
         )
 
-    @patch("vendor_connectors.slack.SlackConnector._call_api")
+    @patch("vendor_connectors.slack.SlackConnector._iter_api")
     @patch("vendor_connectors.slack.WebClient")
     def test_list_usergroups_filters_ids(
         self,
         mock_webclient_class,
-        mock_call_api,
+        mock_iter_api,
         base_connector_kwargs,
     ):
         """Ensure list_usergroups filters to the requested IDs."""
-        mock_call_api.return_value = {
-            "S1": {"id": "S1", "name": "Ops"},
-            "S2": {"id": "S2", "name": "Eng"},
-        }
+        mock_iter_api.return_value = iter([{"id": "S1", "name": "Ops"}, {"id": "S2", "name": "Eng"}])
 
         mock_user_client = MagicMock()
         mock_bot_client = MagicMock()
@@ -123,28 +167,25 @@ class TestSlackConnector:
         )
 
         assert groups == {"S1": {"id": "S1", "name": "Ops"}}
-        mock_call_api.assert_called_once_with(
+        mock_iter_api.assert_called_once_with(
             "usergroups_list",
-            group_by="usergroups",
+            "usergroups",
             include_disabled=True,
             include_count=True,
             include_users=True,
             team_id="T123",
         )
 
-    @patch("vendor_connectors.slack.SlackConnector._call_api")
+    @patch("vendor_connectors.slack.SlackConnector._iter_api")
     @patch("vendor_connectors.slack.WebClient")
     def test_list_conversations_channels_only(
         self,
         mock_webclient_class,
-        mock_call_api,
+        mock_iter_api,
         base_connector_kwargs,
     ):
         """Ensure list_conversations can filter to Slack channels."""
-        mock_call_api.return_value = {
-            "C1": {"id": "C1", "is_channel": True},
-            "G1": {"id": "G1", "is_channel": False},
-        }
+        mock_iter_api.return_value = iter([{"id": "C1", "is_channel": True}, {"id": "G1", "is_channel": False}])
 
         mock_user_client = MagicMock()
         mock_bot_client = MagicMock()
@@ -162,12 +203,106 @@ class TestSlackConnector:
         )
 
         assert conversations == {"C1": {"id": "C1", "is_channel": True}}
-        mock_call_api.assert_called_once_with(
+        mock_iter_api.assert_called_once_with(
             "conversations_list",
-            group_by="channels",
+            "channels",
+            prefetch=False,
             exclude_archived=True,
             limit=50,
             team_id="T123",
             types="private_channel,public_channel",
             cursor="cursor123",
         )
+
+
+def _pages(items_key, pages):
+    """Build Slack list responses linked by next_cursor."""
+    responses = []
+    for index, items in enumerate(pages):
+        cursor = f"cursor-{index + 1}" if index + 1 < len(pages) else ""
+        responses.append({items_key: items, "response_metadata": {"next_cursor": cursor}})
+    return responses
+
+
+class TestSlackPagination:
+    """Tests for cursor-following Slack listings."""
+
+    @pytest.fixture
+    def connector(self, base_connector_kwargs):
+        with patch("vendor_connectors.slack.WebClient"):
+            connector = SlackConnector(token="test-token", bot_token="bot-token", **base_connector_kwargs)
+        connector.web_client = MagicMock()
+        return connector
+
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self):
+        with patch("vendor_connectors.slack.sleep") as mock_sleep:
+            yield mock_sleep
+
+    def test_call_api_follows_cursor(self, connector):
+        """Test grouped calls collect every page."""
+        connector.web_client.users_list.side_effect = _pages("members", [[{"id": "U1"}, {"id": "U2"}], [{"id": "U3"}]])
+
+        users = connector._call_api("users_list", group_by="members", limit=2)
+
+        assert list(users) == ["U1", "U2", "U3"]
+        calls = connector.web_client.users_list.call_args_list
+        assert calls[0].kwargs == {"limit": 2}
+        assert calls[1].kwargs == {"limit": 2, "cursor": "cursor-1"}
+
+    def test_call_api_without_group_by_returns_raw_response(self, connector):
+        """Test ungrouped calls make a single request."""
+        connector.web_client.conversations_history.return_value = {"messages": [], "has_more": True}
+
+        response = connector._call_api("conversations_history", channel="C1")
+
+        assert response == {"messages": [], "has_more": True}
+        connector.web_client.conversations_history.assert_called_once_with(channel="C1")
+
+    def test_iter_users_is_lazy_and_filters_per_page(self, connector):
+        """Test users stream page by page and stop when the caller stops."""
+        connector.web_client.users_list.side_effect = _pages(
+            "members",
+            [[{"id": "U1"}, {"id": "B1", "is_bot": True}], [{"id": "U2"}], [{"id": "U3"}]],
+        )
+
+        users = list(
+            islice(connector.iter_users(include_deleted=False, include_bots=False, include_app_users=False), 2)
+        )
+
+        assert [user["id"] for user in users] == ["U1", "U2"]
+        assert connector.web_client.users_list.call_count == 2
+
+    def test_list_conversations_prefetch(self, connector):
+        """Test prefetching returns every page."""
+        connector.web_client.conversations_list.side_effect = _pages(
+            "channels", [[{"id": "C1", "is_channel": True}], [{"id": "C2", "is_channel": True}]]
+        )
+
+        conversations = connector.list_conversations(channels_only=True, prefetch=True)
+
+        assert list(conversations) == ["C1", "C2"]
+
+    def test_calls_are_paced_by_tier(self, connector, mock_sleep):
+        """Test successive tier 2 calls are spaced three seconds apart."""
+        connector.web_client.users_list.side_effect = _pages("members", [[{"id": "U1"}], [{"id": "U2"}]])
+
+        connector._call_api("users_list", group_by="members")
+
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(3.0, abs=0.5)
+
+    def test_rate_limited_call_is_retried(self, connector, mock_sleep):
+        """Test ratelimited responses are retried after Retry-After."""
+        rate_limited = MagicMock()
+        rate_limited.__getitem__.side_effect = {"error": "ratelimited"}.__getitem__
+        rate_limited.headers = {"Retry-After": "2"}
+        connector.web_client.team_info.side_effect = [
+            SlackApiError("ratelimited", rate_limited),
+            {"team": {"id": "T1"}},
+        ]
+
+        response = connector._call_api("team_info")
+
+        assert response == {"team": {"id": "T1"}}
+        mock_sleep.assert_called_once_with(2)
@@ -0,0 +1,173 @@
+"""Tests for asynchronous Slack delivery."""
+
+from __future__ import annotations
+
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from slack_sdk.errors import SlackApiError
+
+from vendor_connectors.slack import AsyncSlackDispatcher, SlackConnector, SlackDeliveryResult, SlackMessage
+
+
+_real_sleep = asyncio.sleep
+
+
+class _FakeAsyncClient:
+    """Records chat.postMessage calls; slow for texts starting with 'slow'."""
+
+    def __init__(self, failures=None):
+        self.calls: list[tuple[str, str]] = []
+        self._failures = dict(failures or {})
+
+    async def chat_postMessage(self, channel, text, **kwargs):
+        if text.startswith("slow"):
+            await _real_sleep(0.01)
+        failure = self._failures.pop(text, None)
+        if failure is not None:
+            raise failure
+        self.calls.append((channel, text))
+        return {"ok": True, "ts": f"{channel}-{len(self.calls)}"}
+
+
+def _slack_error(error, retry_after=None):
+    response = {"ok": False, "error": error}
+    response = MagicMock(**{"get.side_effect": response.get, "__getitem__.side_effect": response.__getitem__})
+    response.headers = {"Retry-After": str(retry_after)} if retry_after is not None else {}
+    return SlackApiError(error, response)
+
+
+@pytest.fixture
+def mock_sleep():
+    with patch("vendor_connectors.slack.delivery.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
+class TestAsyncSlackDispatcher:
+    """Tests for AsyncSlackDispatcher."""
+
+    async def test_preserves_per_channel_order(self, mock_sleep):
+        """Test messages to one channel arrive in submission order."""
+        client = _FakeAsyncClient()
+        dispatcher = AsyncSlackDispatcher(client)
+
+        results = await dispatcher.send_all(
+            [
+                SlackMessage(channel="C1", text="slow-1"),
+                SlackMessage(channel="C2", text="fast-1"),
+                SlackMessage(channel="C1", text="fast-2"),
+                SlackMessage(channel="C2", text="fast-2"),
+            ]
+        )
+
+        assert all(result.ok for result in results)
+        assert [text for channel, text in client.calls if channel == "C1"] == ["slow-1", "fast-2"]
+        # C2 is not held up by the slow message on C1
+        assert client.calls[0] == ("C2", "fast-1")
+
+    async def test_paces_messages_per_channel(self, mock_sleep):
+        """Test successive posts to one channel wait about a second."""
+        dispatcher = AsyncSlackDispatcher(_FakeAsyncClient())
+
+        await dispatcher.send_all([SlackMessage(channel="C1", text="a"), SlackMessage(channel="C1", text="b")])
+
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(1.0, abs=0.2)
+
+    async def test_retries_rate_limited_messages(self, mock_sleep):
+        """Test ratelimited posts are retried after Retry-After."""
+        client = _FakeAsyncClient(failures={"a": _slack_error("ratelimited", retry_after=3)})
+        dispatcher = AsyncSlackDispatcher(client)
+
+        (result,) = await dispatcher.send_all([SlackMessage(channel="C1", text="a")])
+
+        assert result.ok
+        assert result.attempts == 2
+        mock_sleep.assert_any_call(3)
+
+    async def test_reports_api_errors(self, mock_sleep):
+        """Test other API errors become failed results."""
+        client = _FakeAsyncClient(failures={"a": _slack_error("is_archived")})
+        dispatcher = AsyncSlackDispatcher(client)
+
+        results = await dispatcher.send_all(
+            [SlackMessage(channel="C1", text="a"), SlackMessage(channel="C1", text="b")]
+        )
+
+        assert results[0] == SlackDeliveryResult(channel="C1", ok=False, error="is_archived", attempts=1)
+        assert results[1].ok
+
+    async def test_reports_transport_errors(self, mock_sleep):
+        """Test connection errors fail only their own message."""
+        client = _FakeAsyncClient(failures={"a": ConnectionError("Connection reset by peer")})
+        dispatcher = AsyncSlackDispatcher(client)
+
+        results = await dispatcher.send_all(
+            [
+                SlackMessage(channel="C1", text="a"),
+                SlackMessage(channel="C1", text="b"),
+                SlackMessage(channel="C2", text="c"),
+            ]
+        )
+
+        assert results[0] == SlackDeliveryResult(channel="C1", ok=False, error="Connection reset by peer", attempts=1)
+        assert results[1].ok
+        assert results[2].ok
+
+    async def test_reports_aiohttp_errors(self, mock_sleep):
+        """Test aiohttp client errors and timeouts become failed results without losing the others."""
+        aiohttp = pytest.importorskip("aiohttp")
+        client = _FakeAsyncClient(
+            failures={"a": aiohttp.ClientConnectionError("Cannot connect to host slack.com"), "c": TimeoutError()}
+        )
+        logger = MagicMock()
+        dispatcher = AsyncSlackDispatcher(client, logger=logger)
+
+        results = await dispatcher.send_all(
+            [
+                SlackMessage(channel="C1", text="a"),
+                SlackMessage(channel="C1", text="b"),
+                SlackMessage(channel="C2", text="c"),
+                SlackMessage(channel="C3", text="d"),
+            ]
+        )
+
+        assert results[0] == SlackDeliveryResult(
+            channel="C1", ok=False, error="Cannot connect to host slack.com", attempts=1
+        )
+        assert results[2] == SlackDeliveryResult(channel="C2", ok=False, error="TimeoutError", attempts=1)
+        assert results[1].ok
+        assert results[3].ok
+        assert sorted(client.calls) == [("C1", "b"), ("C3", "d")]
+        assert logger.warning.call_count == 2
+
+
+class TestSlackConnectorBroadcast:
+    """Tests for SlackConnector bulk delivery."""
+
+    @patch("vendor_connectors.slack.sleep")
+    @patch("vendor_connectors.slack.WebClient")
+    def test_broadcast_message(self, mock_webclient_class, mock_throttle_sleep, base_connector_kwargs, mock_sleep):
+        """Test broadcasts resolve channel names and report missing channels."""
+        mock_bot_client = MagicMock()
+        mock_bot_client.users_conversations.side_effect = [
+            {"channels": [{"name": "general", "id": "C1"}], "response_metadata": {"next_cursor": "n1"}},
+            {"channels": [{"name": "alerts", "id": "C2"}], "response_metadata": {"next_cursor": ""}},
+        ]
+        mock_webclient_class.side_effect = [MagicMock(), mock_bot_client]
+        connector = SlackConnector(token="test-token", bot_token="bot-token", **base_connector_kwargs)
+        client = _FakeAsyncClient()
+        connector.get_async_bot_client = MagicMock(return_value=client)
+
+        results = connector.broadcast_message(["general", "alerts", "missing"], "Deploy finished")
+
+        assert results["general"].ok
+        assert results["alerts"].ok
+        assert results["missing"] == SlackDeliveryResult(channel="missing", ok=False, error="not_in_channel")
+        assert sorted(client.calls) == [("C1", "Deploy finished"), ("C2", "Deploy finished")]
+        # Channel pages go through the shared pagination and pacing path
+        assert mock_bot_client.users_conversations.call_args_list[1].kwargs == {"cursor": "n1"}
+        mock_throttle_sleep.assert_called_once()
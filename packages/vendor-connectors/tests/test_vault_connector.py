@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import threading
+import time
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from hvac.exceptions import VaultError
 
@@ -258,3 +263,302 @@ class TestVaultConnector:
 
         with pytest.raises(RuntimeError):
             connector.generate_aws_credentials(role_name="prod")
+
+
+class TestVaultSecretWalk:
+    """Tests for concurrent KV listing."""
+
+    @pytest.fixture
+    def connector(self, base_connector_kwargs):
+        connector = VaultConnector(
+            vault_url="https://vault.example.com", vault_token="test-token", **base_connector_kwargs
+        )
+        connector._vault_client = MagicMock()
+        connector._vault_token_expiration = datetime(2099, 1, 1, tzinfo=timezone.utc)
+
+        kv_v2 = connector._vault_client.secrets.kv.v2
+        listings = {
+            "": ["team/", "root-secret"],
+            "team/": ["a", "b", "nested/"],
+            "team/nested/": ["c"],
+        }
+        kv_v2.list_secrets.side_effect = lambda path, mount_point: {"data": {"keys": listings.get(path, [])}}
+
+        def read(path, mount_point):
+            if path == "team/b":
+                raise VaultError("forbidden")
+            return {"data": {"data": {"name": path}}}
+
+        kv_v2.read_secret_version.side_effect = read
+        return connector
+
+    def test_list_secrets_skips_unreadable(self, connector):
+        """Test concurrent listing returns every readable secret."""
+        secrets = connector.list_secrets(max_workers=4)
+
+        assert secrets == {
+            "root-secret": {"name": "root-secret"},
+            "team/a": {"name": "team/a"},
+            "team/nested/c": {"name": "team/nested/c"},
+        }
+
+    def test_list_secrets_respects_max_depth(self, connector):
+        """Test directories deeper than max_depth are not listed."""
+        secrets = connector.list_secrets(max_depth=1)
+
+        assert sorted(secrets) == ["root-secret", "team/a"]
+
+    def test_list_secrets_paths_only_reads_lazily(self, connector):
+        """Test paths_only lists paths without reading, then reads on access."""
+        kv_v2 = connector._vault_client.secrets.kv.v2
+
+        secrets = connector.list_secrets(paths_only=True)
+
+        assert sorted(secrets) == ["root-secret", "team/a", "team/b", "team/nested/c"]
+        kv_v2.read_secret_version.assert_not_called()
+
+        assert secrets["team/a"] == {"name": "team/a"}
+        assert secrets["team/a"] == {"name": "team/a"}
+        assert secrets["team/b"] is None
+        assert kv_v2.read_secret_version.call_count == 2
+        with pytest.raises(KeyError):
+            secrets["missing"]
+
+
+class TestVaultSecretSearch:
+    """Tests for matcher searches in get_secret."""
+
+    @pytest.fixture
+    def connector(self, base_connector_kwargs):
+        connector = VaultConnector(
+            vault_url="https://vault.example.com", vault_token="test-token", **base_connector_kwargs
+        )
+        connector._vault_client = MagicMock()
+        connector._vault_token_expiration = datetime(2099, 1, 1, tzinfo=timezone.utc)
+
+        kv_v2 = connector._vault_client.secrets.kv.v2
+        keys = [f"svc-{i}" for i in range(20)]
+        kv_v2.list_secrets.side_effect = lambda path, mount_point: {"data": {"keys": keys if path == "apps" else []}}
+        kv_v2.read_secret_version.side_effect = lambda path, mount_point: {
+            "data": {"data": {"service": path.rsplit("/", 1)[-1], "owner": "platform"}}
+        }
+        return connector
+
+    def test_search_reads_each_secret_at_most_once(self, connector):
+        """Test matcher searches never re-read secrets."""
+        kv_v2 = connector._vault_client.secrets.kv.v2
+
+        secret = connector.get_secret(path="apps", matchers={"service": "svc-7"}, max_workers=1)
+
+        assert secret == {"service": "svc-7", "owner": "platform"}
+        read_paths = [call.kwargs["path"] for call in kv_v2.read_secret_version.call_args_list]
+        assert len(read_paths) == len(set(read_paths))
+        assert len(read_paths) < 20
+
+    def test_search_returns_earliest_match(self, connector):
+        """Test the first match in walk order wins even when later reads finish first."""
+        kv_v2 = connector._vault_client.secrets.kv.v2
+        read = kv_v2.read_secret_version.side_effect
+
+        def slow_first(path, mount_point):
+            if path == "apps/svc-0":
+                time.sleep(0.05)
+            return read(path, mount_point)
+
+        kv_v2.read_secret_version.side_effect = slow_first
+
+        secret = connector.get_secret(path="apps", matchers={"owner": "platform"}, max_workers=4)
+
+        assert secret["service"] == "svc-0"
+
+    def test_walk_order_matches_sequential_walk(self, connector):
+        """Test ordered walks yield breadth-first, whatever order requests finish in."""
+        kv_v2 = connector._vault_client.secrets.kv.v2
+        listings = {"a/": ["b", "sub/"], "a/sub/": ["c"]}
+        kv_v2.list_secrets.side_effect = lambda path, mount_point: {"data": {"keys": listings.get(path, [])}}
+        read = kv_v2.read_secret_version.side_effect
+
+        def slow_z(path, mount_point):
+            if path == "z":
+                time.sleep(0.05)
+            return read(path, mount_point)
+
+        kv_v2.read_secret_version.side_effect = slow_z
+
+        def walk(ordered):
+            return [
+                path
+                for path, _ in connector._walk_secrets(
+                    ["a/", "z"], mount_point="secret", max_workers=4, ordered=ordered
+                )
+            ]
+
+        assert walk(ordered=True) == ["z", "a/b", "a/sub/c"]
+        assert walk(ordered=False)[-1] == "z"
+
+    def test_search_without_match_returns_none(self, connector):
+        """Test searches that match nothing read every secret once."""
+        kv_v2 = connector._vault_client.secrets.kv.v2
+
+        assert connector.get_secret(path="apps", matchers={"service": "missing"}) is None
+        assert kv_v2.read_secret_version.call_count == 20
+
+    def test_search_uses_index(self, connector):
+        """Test indexed searches re-read only the candidate secret."""
+        kv_v2 = connector._vault_client.secrets.kv.v2
+        connector.get_secret(path="apps", matchers={"service": "missing"})
+        kv_v2.read_secret_version.reset_mock()
+        kv_v2.list_secrets.reset_mock()
+
+        secret = connector.get_secret(path="apps", matchers={"service": "svc-12"}, use_index=True)
+
+        assert secret["service"] == "svc-12"
+        kv_v2.read_secret_version.assert_called_once_with(path="apps/svc-12", mount_point="secret")
+        kv_v2.list_secrets.assert_not_called()
+
+    def test_index_never_stores_values(self, connector):
+        """Test the index keeps only fingerprints."""
+        connector.get_secret(path="apps", matchers={"service": "missing"})
+
+        fingerprints = connector._secret_index[("secret", "apps/svc-3")]
+        assert "svc-3" not in fingerprints
+        assert VaultConnector._fingerprint("service", "svc-3") in fingerprints
+
+
+class TestVaultLifecycle:
+    """Tests for token renewal and AWS credential leasing."""
+
+    @pytest.fixture
+    def connector(self, base_connector_kwargs):
+        connector = VaultConnector(
+            vault_url="https://vault.example.com", vault_token="test-token", **base_connector_kwargs
+        )
+        connector._vault_client = MagicMock()
+        connector._vault_token_expiration = datetime(2099, 1, 1, tzinfo=timezone.utc)
+        yield connector
+        connector.close()
+
+    @staticmethod
+    def _expiring_in(seconds):
+        expire_time = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+        return {"data": {"expire_time": expire_time.isoformat()}}
+
+    def test_renew_token_extends_expiration(self, connector):
+        """Test renewal refreshes the tracked expiration without re-authenticating."""
+        client = connector._vault_client
+        client.auth.token.lookup_self.return_value = self._expiring_in(3600)
+
+        with patch("vendor_connectors.vault.hvac.Client") as mock_hvac_class:
+            connector.renew_token()
+
+        client.auth.token.renew_self.assert_called_once()
+        mock_hvac_class.assert_not_called()
+        assert connector._seconds_until_expiration() > 3000
+
+    def test_renew_token_reauthenticates_at_max_ttl(self, connector):
+        """Test a token that cannot be extended is replaced."""
+        connector._vault_client.auth.token.lookup_self.return_value = self._expiring_in(10)
+        new_client = MagicMock()
+        new_client.is_authenticated.return_value = True
+        new_client.auth.token.lookup_self.return_value = self._expiring_in(3600)
+
+        with patch("vendor_connectors.vault.hvac.Client", return_value=new_client):
+            connector.renew_token()
+
+        assert connector._vault_client is new_client
+
+    def test_background_renewal(self, connector):
+        """Test the renewal thread renews a token that is about to expire."""
+        client = connector._vault_client
+        connector._vault_token_expiration = datetime.now(timezone.utc) + timedelta(seconds=5)
+        renewed = threading.Event()
+
+        def renew_self():
+            renewed.set()
+
+        client.auth.token.renew_self.side_effect = renew_self
+        client.auth.token.lookup_self.return_value = self._expiring_in(3600)
+
+        with patch("vendor_connectors.vault.MIN_RENEWAL_INTERVAL_SECONDS", 0.01):
+            connector.start_token_renewal(renew_margin_seconds=60)
+            assert renewed.wait(timeout=5)
+            connector.stop_token_renewal()
+
+        assert connector._renewal_thread is None
+
+    def test_background_renewal_survives_connection_errors(self, connector):
+        """Test a transient connection error does not stop the renewal thread."""
+        client = connector._vault_client
+        connector._vault_token_expiration = datetime.now(timezone.utc) + timedelta(seconds=5)
+        renewed = threading.Event()
+        attempts = []
+
+        def renew_self():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise requests.ConnectionError("Vault unreachable")
+            renewed.set()
+
+        client.auth.token.renew_self.side_effect = renew_self
+        client.auth.token.lookup_self.return_value = self._expiring_in(3600)
+
+        with patch("vendor_connectors.vault.MIN_RENEWAL_INTERVAL_SECONDS", 0.01):
+            connector.start_token_renewal(renew_margin_seconds=60)
+            assert renewed.wait(timeout=5)
+            connector.stop_token_renewal()
+
+        assert len(attempts) == 2
+
+    def test_tokens_without_ttl_never_expire(self, connector):
+        """Test root-style tokens are not re-validated on every access."""
+        connector._vault_client.auth.token.lookup_self.return_value = {"data": {"expire_time": None, "ttl": 0}}
+
+        connector._set_token_expiration()
+
+        assert connector._is_token_valid()
+        assert connector._seconds_until_expiration() == float("inf")
+
+    def test_aws_credentials_are_cached_per_role(self, connector):
+        """Test leased credentials are reused until near the end of their lease."""
+        aws = connector._vault_client.secrets.aws
+        aws.generate_credentials.side_effect = lambda name, **kwargs: {
+            "lease_duration": 3600,
+            "data": {"access_key": f"AKIA-{name}"},
+        }
+
+        first = connector.generate_aws_credentials(role_name="prod")
+        second = connector.generate_aws_credentials(role_name="prod")
+        other = connector.generate_aws_credentials(role_name="dev")
+
+        assert first == second == {"access_key": "AKIA-prod"}
+        assert other == {"access_key": "AKIA-dev"}
+        assert aws.generate_credentials.call_count == 2
+
+    def test_aws_credentials_without_cache(self, connector):
+        """Test use_cache=False always leases new credentials."""
+        aws = connector._vault_client.secrets.aws
+        aws.generate_credentials.return_value = {"lease_duration": 3600, "data": {"access_key": "AKIA"}}
+
+        connector.generate_aws_credentials(role_name="prod", use_cache=False)
+        connector.generate_aws_credentials(role_name="prod", use_cache=False)
+
+        assert aws.generate_credentials.call_count == 2
+
+    def test_aws_credentials_refresh_ahead(self, connector):
+        """Test credentials near lease end are served while a replacement is leased."""
+        aws = connector._vault_client.secrets.aws
+        aws.generate_credentials.side_effect = [
+            {"lease_duration": 3600, "data": {"access_key": "AKIA-1"}},
+            {"lease_duration": 3600, "data": {"access_key": "AKIA-2"}},
+        ]
+        connector.generate_aws_credentials(role_name="prod")
+        key = ("aws", "prod", None, None)
+        leased = connector._aws_credentials[key]
+        connector._aws_credentials[key] = replace(leased, refresh_at=0.0)
+
+        assert connector.generate_aws_credentials(role_name="prod") == {"access_key": "AKIA-1"}
+        connector._background_executor.shutdown(wait=True)
+        connector._background_executor = None
+
+        assert connector.generate_aws_credentials(role_name="prod") == {"access_key": "AKIA-2"}
+        assert aws.generate_credentials.call_count == 2
@@ -25,9 +25,10 @@ class TestZoomConnector:
         assert connector.client_secret == "test-client-secret"
         assert connector.account_id == "test-account-id"
 
-    @patch("vendor_connectors.zoom.requests.post")
-    def test_get_access_token_success(self, mock_post, base_connector_kwargs):
+    @patch("vendor_connectors.zoom.requests.Session")
+    def test_get_access_token_success(self, mock_session_class, base_connector_kwargs):
         """Test successful access token retrieval."""
+        mock_post = mock_session_class.return_value.post
         mock_response = MagicMock()
         mock_response.json.return_value = {"access_token": "test-access-token"}
         mock_response.raise_for_status = MagicMock()
@@ -44,9 +45,10 @@ class TestZoomConnector:
         assert token == "test-access-token"
         mock_post.assert_called_once()
 
-    @patch("vendor_connectors.zoom.requests.post")
-    def test_get_access_token_failure(self, mock_post, base_connector_kwargs):
+    @patch("vendor_connectors.zoom.requests.Session")
+    def test_get_access_token_failure(self, mock_session_class, base_connector_kwargs):
         """Test failed access token retrieval."""
+        mock_post = mock_session_class.return_value.post
         import requests
 
         mock_post.side_effect = requests.exceptions.RequestException("Connection error")
@@ -61,10 +63,11 @@ class TestZoomConnector:
         with pytest.raises(RuntimeError, match="Failed to get Zoom access token"):
             connector.get_access_token()
 
-    @patch("vendor_connectors.zoom.requests.get")
-    @patch("vendor_connectors.zoom.requests.post")
-    def test_get_zoom_users(self, mock_post, mock_get, base_connector_kwargs):
+    @patch("vendor_connectors.zoom.requests.Session")
+    def test_get_zoom_users(self, mock_session_class, base_connector_kwargs):
         """Test getting Zoom users."""
+        mock_post = mock_session_class.return_value.post
+        mock_get = mock_session_class.return_value.get
         mock_token_response = MagicMock()
         mock_token_response.json.return_value = {"access_token": "test-token"}
         mock_token_response.raise_for_status = MagicMock()
@@ -93,9 +96,10 @@ class TestZoomConnector:
         assert "user2@example.com" in users
         assert len(users) == 2
 
-    @patch("vendor_connectors.zoom.requests.post")
-    def test_create_zoom_user(self, mock_post, base_connector_kwargs):
+    @patch("vendor_connectors.zoom.requests.Session")
+    def test_create_zoom_user(self, mock_session_class, base_connector_kwargs):
         """Test creating a Zoom user."""
+        mock_post = mock_session_class.return_value.post
         mock_token_response = MagicMock()
         mock_token_response.json.return_value = {"access_token": "test-token"}
         mock_token_response.raise_for_status = MagicMock()
@@ -116,10 +120,11 @@ class TestZoomConnector:
         assert result is True
         assert mock_post.call_count == 2
 
-    @patch("vendor_connectors.zoom.requests.get")
-    @patch("vendor_connectors.zoom.requests.post")
-    def test_list_users(self, mock_post, mock_get, base_connector_kwargs):
+    @patch("vendor_connectors.zoom.requests.Session")
+    def test_list_users(self, mock_session_class, base_connector_kwargs):
         """Test list_users method (alias for get_zoom_users)."""
+        mock_post = mock_session_class.return_value.post
+        mock_get = mock_session_class.return_value.get
         mock_token_response = MagicMock()
         mock_token_response.json.return_value = {"access_token": "test-token"}
         mock_token_response.raise_for_status = MagicMock()
@@ -145,10 +150,11 @@ class TestZoomConnector:
         users = connector.list_users()
         assert "user1@example.com" in users
 
-    @patch("vendor_connectors.zoom.requests.get")
-    @patch("vendor_connectors.zoom.requests.post")
-    def test_get_user(self, mock_post, mock_get, base_connector_kwargs):
+    @patch("vendor_connectors.zoom.requests.Session")
+    def test_get_user(self, mock_session_class, base_connector_kwargs):
         """Test getting a specific user."""
+        mock_post = mock_session_class.return_value.post
+        mock_get = mock_session_class.return_value.get
         mock_token_response = MagicMock()
         mock_token_response.json.return_value = {"access_token": "test-token"}
         mock_token_response.raise_for_status = MagicMock()
@@ -175,10 +181,11 @@ class TestZoomConnector:
         assert user["email"] == "user1@example.com"
         assert user["id"] == "123"
 
-    @patch("vendor_connectors.zoom.requests.get")
-    @patch("vendor_connectors.zoom.requests.post")
-    def test_list_meetings(self, mock_post, mock_get, base_connector_kwargs):
+    @patch("vendor_connectors.zoom.requests.Session")
+    def test_list_meetings(self, mock_session_class, base_connector_kwargs):
         """Test listing meetings for a user."""
+        mock_post = mock_session_class.return_value.post
+        mock_get = mock_session_class.return_value.get
         mock_token_response = MagicMock()
         mock_token_response.json.return_value = {"access_token": "test-token"}
         mock_token_response.raise_for_status = MagicMock()
@@ -205,10 +212,11 @@ class TestZoomConnector:
         assert len(meetings) == 2
         assert meetings[0]["id"] == "111"
 
-    @patch("vendor_connectors.zoom.requests.get")
-    @patch("vendor_connectors.zoom.requests.post")
-    def test_get_meeting(self, mock_post, mock_get, base_connector_kwargs):
+    @patch("vendor_connectors.zoom.requests.Session")
+    def test_get_meeting(self, mock_session_class, base_connector_kwargs):
         """Test getting a specific meeting."""
+        mock_post = mock_session_class.return_value.post
+        mock_get = mock_session_class.return_value.get
         mock_token_response = MagicMock()
         mock_token_response.json.return_value = {"access_token": "test-token"}
         mock_token_response.raise_for_status = MagicMock()
@@ -233,3 +241,169 @@ class TestZoomConnector:
         meeting = connector.get_meeting("111")
         assert meeting["id"] == "111"
         assert meeting["topic"] == "Team Meeting"
+
+
+class TestZoomAccessTokenCache:
+    """Tests for OAuth token caching."""
+
+    @pytest.fixture
+    def session(self):
+        with patch("vendor_connectors.zoom.requests.Session") as mock_session_class:
+            yield mock_session_class.return_value
+
+    @pytest.fixture
+    def connector(self, session, base_connector_kwargs):
+        return ZoomConnector(
+            client_id="test-client-id",
+            client_secret="test-client-secret",
+            account_id="test-account-id",
+            **base_connector_kwargs,
+        )
+
+    @staticmethod
+    def _token_response(token, expires_in=3600):
+        response = MagicMock()
+        response.json.return_value = {"access_token": token, "expires_in": expires_in}
+        return response
+
+    def test_token_is_reused_across_calls(self, connector, session):
+        """Test one token request serves many API calls."""
+        session.post.return_value = self._token_response("token-1")
+        session.get.return_value.json.return_value = {"id": "123"}
+
+        connector.get_user("a@example.com")
+        connector.get_user("b@example.com")
+
+        assert session.post.call_count == 1
+        assert session.get.call_args.kwargs["headers"]["Authorization"] == "Bearer token-1"
+
+    def test_token_is_refreshed_before_expiry(self, connector, session):
+        """Test tokens inside the expiry margin are refreshed."""
+        session.post.side_effect = [self._token_response("token-1", expires_in=30), self._token_response("token-2")]
+
+        assert connector.get_access_token() == "token-1"
+        assert connector.get_access_token() == "token-2"
+        assert connector.get_access_token() == "token-2"
+        assert session.post.call_count == 2
+
+    def test_rejected_token_is_refreshed_and_retried(self, connector, session):
+        """Test a 401 triggers one token refresh and a retry."""
+        session.post.side_effect = [self._token_response("token-1"), self._token_response("token-2")]
+        unauthorized = MagicMock(status_code=401)
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"id": "123"}
+        session.get.side_effect = [unauthorized, ok]
+
+        assert connector.get_user("a@example.com") == {"id": "123"}
+        assert session.get.call_args.kwargs["headers"]["Authorization"] == "Bearer token-2"
+
+    def test_concurrent_callers_share_one_refresh(self, connector, session):
+        """Test concurrent threads do not stampede the token endpoint."""
+        from concurrent.futures import ThreadPoolExecutor
+        from threading import Event
+
+        release = Event()
+
+        def slow_token(*args, **kwargs):
+            release.wait(timeout=5)
+            return self._token_response("token-1")
+
+        session.post.side_effect = slow_token
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(connector.get_access_token) for _ in range(8)]
+            release.set()
+            tokens = [future.result() for future in futures]
+
+        assert tokens == ["token-1"] * 8
+        assert session.post.call_count == 1
+
+
+class TestZoomBulkOperations:
+    """Tests for bulk user provisioning and rate limiting."""
+
+    @pytest.fixture
+    def session(self):
+        with patch("vendor_connectors.zoom.requests.Session") as mock_session_class:
+            session = mock_session_class.return_value
+            session.post.return_value.json.return_value = {"access_token": "token-1", "expires_in": 3600}
+            yield session
+
+    @pytest.fixture
+    def connector(self, session, base_connector_kwargs):
+        return ZoomConnector(
+            client_id="test-client-id",
+            client_secret="test-client-secret",
+            account_id="test-account-id",
+            **base_connector_kwargs,
+        )
+
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self):
+        with patch("vendor_connectors.zoom.sleep") as mock_sleep:
+            yield mock_sleep
+
+    def test_remove_zoom_users_reports_per_user(self, connector, session):
+        """Test bulk removal returns a result for every user."""
+        import requests
+
+        def delete(url, **kwargs):
+            response = MagicMock(status_code=204)
+            if url.endswith("bad@example.com"):
+                response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
+            return response
+
+        session.delete.side_effect = delete
+
+        results = connector.remove_zoom_users(["a@example.com", "bad@example.com", "b@example.com", "a@example.com"])
+
+        assert results == {"a@example.com": True, "bad@example.com": False, "b@example.com": True}
+        assert session.delete.call_count == 3
+        assert session.post.call_count == 1
+        assert len(connector.errors) == 1
+
+    def test_create_zoom_users(self, connector, session):
+        """Test bulk creation posts one request per unique user."""
+        results = connector.create_zoom_users(
+            [
+                {"email": "a@example.com", "first_name": "A", "last_name": "One"},
+                {"email": "b@example.com", "first_name": "B", "last_name": "Two"},
+            ],
+            max_workers=2,
+        )
+
+        assert results == {"a@example.com": True, "b@example.com": True}
+        created = [call.kwargs["json"]["user_info"]["email"] for call in session.post.call_args_list[1:]]
+        assert sorted(created) == ["a@example.com", "b@example.com"]
+
+    def test_rate_limited_requests_are_retried(self, connector, session, mock_sleep):
+        """Test 429 responses are retried after Retry-After."""
+        limited = MagicMock(status_code=429, headers={"Retry-After": "2"})
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"id": "123"}
+        session.get.side_effect = [limited, ok]
+
+        assert connector.get_user("a@example.com") == {"id": "123"}
+        mock_sleep.assert_any_call(2.0)
+
+    def test_daily_limit_is_not_retried(self, connector, session):
+        """Test exhausted daily limits are surfaced instead of waited on."""
+        import requests
+
+        limited = MagicMock(status_code=429, headers={"Retry-After": "2026-01-02T00:00:00Z"})
+        limited.raise_for_status.side_effect = requests.exceptions.HTTPError("429")
+        session.get.return_value = limited
+
+        with pytest.raises(RuntimeError, match="Failed to get Zoom user"):
+            connector.get_user("a@example.com")
+        assert session.get.call_count == 1
+
+    def test_requests_are_paced_per_category(self, connector, session, mock_sleep):
+        """Test back-to-back requests in one category are spaced by its rate."""
+        connector.rate_limits["light"] = 2.0
+
+        connector.get_user("a@example.com")
+        connector.get_user("b@example.com")
+
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.5, abs=0.1)